@@ -430,8 +430,6 @@ class AST:
                 pos += tmp_l[i][2] + 2
                 i += 1
 
-            print(pos)
-
             if i == len(tmp_l):
                 return buf + ', '.join([tmp[0] for tmp in tmp_l]) + ']', False, pos - 1 if i > 0 else pos + 1
             else:
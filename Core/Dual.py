@@ -0,0 +1,416 @@
+from __future__ import annotations
+
+import math
+from functools import partial
+from itertools import repeat
+from operator import add, mul, neg, sub, truediv
+from typing import final, List, Optional, Tuple, Callable
+
+
+@final
+class Dual:
+    """
+    Batch of dual numbers with several tangent directions.
+
+    Dual numbers are kept in structure of arrays layout as intervals are.
+    That is, values are a flat list, and each tangent direction is another flat list of the same size, so that each
+    step of the chain rule is a chain of ``map`` calls over the whole batch, which runs entirely in C.
+    Batch of size 1 is broadcast against batch of any size.
+    Tangent which is identically 0 is ``None``, so that constants and directions which do not depend on a variable cost
+    nothing.
+    With one direction per variable, the tangents are the gradient, that is, the full gradient is computed in a single
+    pass.
+
+    **Reference**
+        * https://en.wikipedia.org/wiki/Automatic_differentiation#Forward_accumulation
+        * https://en.wikipedia.org/wiki/Dual_number
+
+    :ivar __v: Values.
+    :ivar __d: Tangents of each direction.
+    """
+
+    def __init__(self, v: list, d: List[Optional[List[float]]]) -> None:
+        self.__v: list = v
+        self.__d: List[Optional[List[float]]] = d
+
+    def __len__(self) -> int:
+        return len(self.__v)
+
+    def __str__(self) -> str:
+        tan: List[List[float]] = [self.tan(i) for i in range(self.dim)]
+        pt: List[str] = [' + '.join([str(v)] + [f'{t[j]}e{i + 1}' for i, t in enumerate(tan)])
+                         for j, v in enumerate(self.__v)]
+
+        return pt[0] if len(pt) == 1 else '{' + ', '.join(pt) + '}'
+
+    @classmethod
+    def const(cls, x: float, dim: int) -> Dual:
+        """
+        Make batch of single constant.
+
+        :param x: Value of constant.
+        :type x: float
+        :param dim: # of tangent directions.
+        :type dim: int
+
+        :return: Batch of single dual number whose tangents are all 0.
+        :rtype: Dual
+        """
+        return Dual([x], [None] * dim)
+
+    @property
+    def v(self) -> list:
+        return self.__v
+
+    @property
+    def d(self) -> List[Optional[List[float]]]:
+        return self.__d
+
+    @property
+    def dim(self) -> int:
+        return len(self.__d)
+
+    def tan(self, i: int) -> List[float]:
+        """
+        Getter for tangent of direction.
+
+        Unlike ``Dual.d``, tangent which is identically 0 is filled with 0.
+
+        :param i: Index of direction.
+        :type i: int
+
+        :return: Tangent of the direction.
+        :rtype: List[float]
+        """
+        if self.__d[i] is None:
+            return [0.0] * len(self)
+
+        return self.__d[i] * len(self) if len(self.__d[i]) < len(self) else self.__d[i]
+
+
+class DualArith:
+    """
+    Dual number arithmetic toolbox.
+
+    Each operation computes values and then applies the chain rule to each tangent direction.
+    Partial derivatives are computed once per operation and shared by all directions.
+    Thus, the cost of an operation is a few ``map`` calls for values and partial derivatives, plus a single ``map`` call
+    of multiplication for each direction which is not identically 0.
+    Partial derivatives are computed by chains of ``map`` calls over the whole batch.
+    If the chain raises due to an item out of domain, overflow, or complex value, it falls back to the computation of
+    each item, where such items become nan.
+    """
+
+    def __new__(cls, *args, **kwargs) -> None:
+        raise NotImplementedError
+
+    @classmethod
+    def ext(cls, x: list, sz: int) -> list:
+        """
+        Broadcast list to size.
+
+        :param x: List to be broadcast. Its size must be 1 or the target size.
+        :type x: list
+        :param sz: Target size.
+        :type sz: int
+
+        :return: Broadcast list.
+        :rtype: list
+        """
+        return x * sz if len(x) < sz else x
+
+    @classmethod
+    def __at(cls, f: Callable[..., list], *args: float) -> float:
+        """
+        Compute partial derivative at single point.
+
+        This method is private and called internally as a helper of ``DualArith.deriv``.
+
+        :param f: Chain computing partial derivatives over batch.
+        :type f: Callable[..., list]
+        :param args: Point where partial derivative is to be computed.
+        :type args: float
+
+        :return: Partial derivative at the point. nan if the chain raises.
+        :rtype: float
+        """
+        try:
+            return f(*[[it] for it in args])[0]
+        except (ArithmeticError, ValueError, TypeError):
+            return math.nan
+
+    @classmethod
+    def deriv(cls, f: Callable[..., list], *args: list) -> list:
+        """
+        Compute partial derivatives over batch.
+
+        The chain is tried on the whole batch first.
+        Only if it raises, it falls back to ``DualArith.__at`` for each item.
+
+        :param f: Chain computing partial derivatives over batch.
+        :type f: Callable[..., list]
+        :param args: Flat lists of the same size where partial derivatives are to be computed.
+        :type args: list
+
+        :return: Partial derivatives.
+        :rtype: list
+        """
+        try:
+            return f(*args)
+        except (ArithmeticError, ValueError, TypeError):
+            return list(map(partial(cls.__at, f), *args))
+
+    @classmethod
+    def chain(cls, v: list, *args: Tuple[Optional[list], Dual]) -> Dual:
+        """
+        Apply the chain rule.
+
+        Tangent of each direction is the sum of the tangents of operands multiplied by the partial derivatives wrt.
+        them.
+        Partial derivative ``None`` stands for 1, so that the tangent of operand is taken as it is.
+        Tangents which are identically 0 are skipped, and if all of them are skipped, the result is also identically 0.
+
+        :param v: Values of the result.
+        :type v: list
+        :param args: Pairs of partial derivative and operand. There must be at least one pair.
+        :type args: Tuple[Optional[list], Dual]
+
+        :return: Values with tangents of the result.
+        :rtype: Dual
+        """
+        sz: int = len(v)
+        d: List[Optional[List[float]]] = []
+
+        for i in range(args[0][1].dim):
+            acc: Optional[List[float]] = None
+
+            for df, x in args:
+                if x.d[i] is None:
+                    continue
+
+                term: List[float] = cls.ext(x.d[i], sz) if df is None else \
+                    list(map(mul, cls.ext(df, sz), cls.ext(x.d[i], sz)))
+                acc = term if acc is None else list(map(add, acc, term))
+
+            d.append(acc)
+
+        return Dual(v, d)
+
+    @classmethod
+    def lift(cls, x: Dual, v: list, f: Callable[[list, list], list]) -> Dual:
+        """
+        Apply the chain rule to function of single operand.
+
+        Derivatives are computed by ``DualArith.deriv`` only if some tangent of operand is not identically 0.
+        Thus, function of constant costs nothing more than its values.
+
+        :param x: Operand.
+        :type x: Dual
+        :param v: Values of the function, which is of the same size with operand.
+        :type v: list
+        :param f: Chain computing derivatives from values of operand and function.
+        :type f: Callable[[list, list], list]
+
+        :return: Values with tangents of the function.
+        :rtype: Dual
+        """
+        if all(t is None for t in x.d):
+            return Dual(v, list(x.d))
+
+        return cls.chain(v, (cls.deriv(f, x.v, v), x))
+
+    @classmethod
+    def mask(cls, x: Dual) -> Dual:
+        """
+        Replace tangents at the points whose values are nan with nan.
+
+        Partial derivatives are computed from the rules of functions regardless of their values.
+        Thus, at the point where the value is replaced with nan, e.g. real logarithm of negative number, the tangent
+        may still be finite or even complex, and this method makes it consistent with the value.
+        Tangent which is identically 0 is left as it is.
+
+        :param x: Batch to be masked.
+        :type x: Dual
+
+        :return: Masked batch.
+        :rtype: Dual
+        """
+        out: List[bool] = [it != it for it in x.v]
+
+        if not any(out):
+            return x
+
+        return Dual(x.v, [None if t is None else [math.nan if o else it for o, it in zip(out, cls.ext(t, len(x)))]
+                          for t in x.d])
+
+    @classmethod
+    def bcast(cls, *args: Dual) -> Tuple[List[list], int]:
+        """
+        Broadcast values of batches to common size.
+
+        :param args: Batches to be broadcast.
+        :type args: Dual
+
+        :return: Values of each batch in common size and the common size.
+        :rtype: Tuple[List[list], int]
+
+        :raise ValueError: If batches are of different sizes.
+        """
+        sz: int = max(map(len, args))
+
+        if any(len(x) not in (1, sz) for x in args):
+            raise ValueError
+
+        return [cls.ext(x.v, sz) for x in args], sz
+
+    @classmethod
+    def __div(cls, a: float, b: float) -> float:
+        """
+        Division of values.
+
+        Division by 0 is +-inf with the sign of the dividend, or nan if the dividend is 0 or nan.
+
+        This method is private and called internally as a helper of ``DualArith.div``.
+
+        :param a: Dividend.
+        :type a: float
+        :param b: Divisor.
+        :type b: float
+
+        :return: Quotient.
+        :rtype: float
+        """
+        try:
+            return a / b
+        except ZeroDivisionError:
+            return math.nan if a == 0 or a != a else math.copysign(math.inf, a) * math.copysign(1.0, b)
+
+    @classmethod
+    def neg(cls, x: Dual) -> Dual:
+        """
+        Negation of dual numbers.
+
+        :param x: Operand.
+        :type x: Dual
+
+        :return: Negated dual numbers.
+        :rtype: Dual
+        """
+        return Dual(list(map(neg, x.v)), [None if t is None else list(map(neg, t)) for t in x.d])
+
+    @classmethod
+    def add(cls, x: Dual, y: Dual) -> Dual:
+        """
+        Sum of dual numbers.
+
+        Both of partial derivatives are 1.
+
+        :param x: Left operand.
+        :type x: Dual
+        :param y: Right operand.
+        :type y: Dual
+
+        :return: Sum of dual numbers.
+        :rtype: Dual
+        """
+        (a, b), _ = cls.bcast(x, y)
+
+        return cls.chain(list(map(add, a, b)), (None, x), (None, y))
+
+    @classmethod
+    def sub(cls, x: Dual, y: Dual) -> Dual:
+        """
+        Difference of dual numbers.
+
+        Partial derivatives are 1 and -1, resp.
+
+        :param x: Left operand.
+        :type x: Dual
+        :param y: Right operand.
+        :type y: Dual
+
+        :return: Difference of dual numbers.
+        :rtype: Dual
+        """
+        (a, b), _ = cls.bcast(x, y)
+
+        return cls.chain(list(map(sub, a, b)), (None, x), ([-1.0], y))
+
+    @classmethod
+    def mul(cls, x: Dual, y: Dual) -> Dual:
+        """
+        Product of dual numbers.
+
+        Partial derivatives are the other operands.
+
+        :param x: Left operand.
+        :type x: Dual
+        :param y: Right operand.
+        :type y: Dual
+
+        :return: Product of dual numbers.
+        :rtype: Dual
+        """
+        (a, b), _ = cls.bcast(x, y)
+
+        return cls.chain(list(map(mul, a, b)), (b, x), (a, y))
+
+    @classmethod
+    def div(cls, x: Dual, y: Dual) -> Tuple[Dual, bool]:
+        """
+        Quotient of dual numbers.
+
+        Partial derivatives are ``1 / y`` and ``-(x / y) / y``, resp.
+        Division by 0 follows the rules of ``DualArith.__div``.
+
+        :param x: Dividend.
+        :type x: Dual
+        :param y: Divisor.
+        :type y: Dual
+
+        :return: Quotient of dual numbers and flag for division by 0.
+        :rtype: Tuple[Dual, bool]
+        """
+        (a, b), _ = cls.bcast(x, y)
+
+        try:
+            v: list = list(map(truediv, a, b))
+            dx: list = list(map(truediv, repeat(1.0), b))
+            dy: list = list(map(neg, map(truediv, v, b)))
+            pole: bool = False
+        except ZeroDivisionError:
+            v: list = list(map(cls.__div, a, b))
+            dx: list = list(map(cls.__div, repeat(1.0), b))
+            dy: list = list(map(neg, map(cls.__div, v, b)))
+            pole: bool = True
+
+        return cls.chain(v, (dx, x), (dy, y)), pole
+
+    @classmethod
+    def pow(cls, x: Dual, y: Dual, v: list) -> Dual:
+        """
+        Power of dual numbers.
+
+        Partial derivatives are ``y * x^(y - 1)`` and ``x^y * log(x)``, resp.
+        Values are computed by the caller, since the rules of power are those of ``Exponential.Power``.
+        Tangents at the points where the values are nan, e.g. real power of negative base, are nan.
+        The latter one is computed only if some tangent of exponent is not identically 0, so that power of variable to
+        constant exponent does not suffer from logarithm of negative base.
+
+        :param x: Base.
+        :type x: Dual
+        :param y: Exponent.
+        :type y: Dual
+        :param v: Values of power.
+        :type v: list
+
+        :return: Power of dual numbers.
+        :rtype: Dual
+        """
+        (a, b), _ = cls.bcast(x, y)
+        dx: list = cls.deriv(lambda s, t: list(map(mul, t, map(pow, s, map(sub, t, repeat(1.0))))), a, b)
+
+        if all(t is None for t in y.d):
+            return cls.mask(cls.chain(v, (dx, x)))
+
+        return cls.mask(cls.chain(v, (dx, x), (cls.deriv(lambda s, f: list(map(mul, f, map(math.log, s))), a, v), y)))
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from collections import ChainMap, deque
+from typing import Dict, Final, List, Set, Deque, Optional, Tuple, Union
 
-from Core import AST, Type, Token, TypeSystem
+from Core import AST, Dual, Interval, Polynomial, Symbolic, Tape, Type, Token, TypeSystem
 from Error import *
+from Function import Precision
 from Util import Printer
 from Operator import *
+from Warning import Warning
 
 
 class Interp:
@@ -18,17 +21,36 @@ class Interp:
     **Reference**
         * https://en.wikipedia.org/wiki/Singleton_pattern
 
+    :cvar __POLY_DEG: Maximum degree of polynomial recognized by ``Interp.poly``.
     :cvar __inst: Singleton object.
 
     :ivar __expr: AST to be interpreted.
     :ivar __line: Original user input string.
+    :ivar __t_env: Type environment of the session. It maps variables to their types.
+    :ivar __def: Definitions of variables. It maps variables to the assignment chain which defines them.
+    :ivar __def_t: Types of variables where their assignment chains start, if the chains are collapsed.
+    :ivar __ref: Variables referred in the definition of each variable.
+    :ivar __dep: Variables whose definitions refer to each variable. It is the reverse of ``__ref``.
+    :ivar __pending: Assignments in the current line which are not committed to the type environment yet.
+    :ivar __replay: Flag for re-checking definitions of dependent variables.
+    :ivar __sym: Builder of derivative ASTs. It is shared by all derivatives, so that they share common subexpressions.
+    :ivar __deriv: Cache of derivatives. It maps pairs of infix expression and variable to derivatives.
     """
+    __POLY_DEG: Final[int] = 32
     __inst: Interp = None
-    __t_env: Dict[int, TypeSystem.T] = {2: 3}
 
     def __init__(self) -> None:
         self.__expr: AST.AST = None
         self.__line: str = ''
+        self.__t_env: Dict[int, TypeSystem.T] = {}
+        self.__def: Dict[int, List[Token.Op]] = {}
+        self.__def_t: Dict[int, TypeSystem.T] = {}
+        self.__ref: Dict[int, Set[int]] = {}
+        self.__dep: Dict[int, Set[int]] = {}
+        self.__pending: List[Token.Op] = []
+        self.__replay: bool = False
+        self.__sym: Symbolic.Builder = Symbolic.Builder()
+        self.__deriv: Dict[Tuple[str, str], AST.AST] = {}
 
     def __chk_t(self) -> None:
         """
@@ -37,10 +59,186 @@ class Interp:
         It just calls its helper ``Interp.__chk_t_hlpr``.
         For detailed description of simplification, refer to the comments in ``Interp.__chk_t_hlpr``.
 
+        Type environment of the session is not modified until the whole AST passes type check.
+        Assignments are written to a scratch layer on top of the session environment, and committed at the end.
+        Thus a line with type error leaves the session untouched.
+
         This method is private and called internally as the first step of interpreting chain.
         For detailed description for interpreting chain, refer to the comments of ``Interp.interp``.
         """
-        self.__chk_t_hlpr(self.__expr.rt, self.__t_env)
+        self.__pending.clear()
+        self.__chk_t_hlpr(self.__expr.rt, ChainMap({}, self.__t_env))
+
+        for rt in self.__pending:
+            self.__bind(rt)
+
+        self.__pending.clear()
+
+    def __bind(self, rt: Token.Op) -> None:
+        """
+        Commit assignment to the type environment of the session.
+
+        Plain assignment starts a new definition of the variable, while compound assignment extends the definition.
+        Along with the type, it records which variables the definition refers to.
+        If the definition so far refers to no other variable, its type is known for good, and re-checking cannot change
+        it.
+        Then the chain is collapsed to the compound assignment alone, starting from the type of the variable before it.
+        Thus the chain does not grow with repeated compound assignments.
+        If the type of the variable changes, only the definitions depending on it are re-checked.
+
+        This method is private and called internally as a helper of ``Interp.__chk_t``.
+
+        :param rt: Assignment token to be committed.
+        :type rt: Token.Op
+        """
+        var: int = rt.chd[0].v
+        old_t: Optional[TypeSystem.T] = self.__t_env.get(var)
+        ref: Set[int] = set()
+
+        self.__ref_hlpr(rt.chd[1], ref)
+        ref.discard(var)
+
+        if rt.v == Assign.Asgn:
+            for it in self.__ref.get(var, ()):
+                self.__dep[it].discard(var)
+
+            self.__def[var] = [rt]
+            self.__def_t.pop(var, None)
+            self.__ref[var] = ref
+        elif not self.__ref.get(var) and old_t is not None:
+            self.__def[var] = [rt]
+            self.__def_t[var] = old_t
+            self.__ref[var] = ref
+        else:
+            self.__def.setdefault(var, []).append(rt)
+            self.__ref.setdefault(var, set()).update(ref)
+
+        for it in ref:
+            self.__dep.setdefault(it, set()).add(var)
+
+        self.__t_env[var] = rt.t
+
+        if old_t is not None and not self.__same_t(old_t, rt.t):
+            self.__propagate(var)
+
+    def __propagate(self, var: int) -> None:
+        """
+        Re-check definitions which depend on the variable whose type is changed.
+
+        It visits dependent variables in breadth first order.
+        The propagation stops at the variable whose type does not change after re-checking.
+        Each variable is re-checked at most once, so cyclic definitions terminate.
+
+        This method is private and called internally as a helper of ``Interp.__bind``.
+
+        :param var: Variable whose type is changed.
+        :type var: int
+        """
+        q: Deque[int] = deque(self.__dep.get(var, ()))
+        visited: Set[int] = {var}
+
+        while q:
+            dep: int = q.popleft()
+
+            if dep in visited:
+                continue
+
+            visited.add(dep)
+            old_t: Optional[TypeSystem.T] = self.__t_env.get(dep)
+            new_t: Optional[TypeSystem.T] = self.__rechk(dep)
+
+            if new_t is None:
+                # Definition is no longer well typed, so the variable falls back to symbol.
+                self.__t_env.pop(dep, None)
+            else:
+                self.__t_env[dep] = new_t
+
+            if not self.__same_t(old_t, new_t):
+                q.extend(self.__dep.get(dep, ()))
+
+    def __same_t(self, t1: Optional[TypeSystem.T], t2: Optional[TypeSystem.T]) -> bool:
+        """
+        Check whether two types are structurally identical.
+
+        Comparison operators of types only compare item type and fold of lists, so a tensor whose shape changes would
+        be taken as unchanged.
+        Base types are singletons and compared by identity, and so is None standing for the absence of type.
+        Tensor types are compared by item type and interned shape, which is a single identity comparison.
+        Array types are compared by item type, fold and the types of their items if they are known.
+
+        This method is private and called internally as a helper of ``Interp.__bind`` and ``Interp.__propagate``.
+
+        :param t1: Type to be compared.
+        :type t1: Optional[TypeSystem.T]
+        :param t2: Type to be compared.
+        :type t2: Optional[TypeSystem.T]
+
+        :return: True if two types are structurally identical. False otherwise.
+        :rtype: bool
+        """
+        if t1 is t2:
+            return True
+        elif t1 is None or t2 is None or type(t1) != type(t2) or t1.base:
+            return False
+        elif type(t1) == TypeSystem.Tens:
+            return t1.shape is t2.shape and self.__same_t(t1.chd_t, t2.chd_t)
+        elif t1.fold != t2.fold or not self.__same_t(t1.chd_t, t2.chd_t):
+            return False
+        elif t1.dim is None or t2.dim is None:
+            return t1.dim is t2.dim
+        else:
+            return len(t1.dim) == len(t2.dim) and all(map(self.__same_t, t1.dim, t2.dim))
+
+    def __rechk(self, var: int) -> Optional[TypeSystem.T]:
+        """
+        Re-check the definition of variable against current type environment.
+
+        The assignment chain defining the variable is replayed in order.
+        If the chain is collapsed, it starts from the type recorded by ``Interp.__bind``.
+
+        This method is private and called internally as a helper of ``Interp.__propagate``.
+
+        :param var: Variable to be re-checked.
+        :type var: int
+
+        :return: New type of the variable. None if the definition does not pass type check anymore.
+        :rtype: Optional[TypeSystem.T]
+        """
+        t_env: ChainMap = ChainMap({var: self.__def_t[var]} if var in self.__def_t else {}, self.__t_env)
+        self.__replay = True
+
+        try:
+            for rt in self.__def[var]:
+                t_env = self.__chk_t_hlpr(rt.chd[1], t_env)
+                rt.chd[0].t = t_env.get(var, TypeSystem.Sym.inst())
+
+                if rt.v.chk_t(rt, t_env) is None:
+                    return None
+        except Error.InterpErr:
+            return None
+        finally:
+            self.__replay = False
+
+        return t_env.get(var)
+
+    def __ref_hlpr(self, rt: Token.Tok, ref: Set[int]) -> None:
+        """
+        Collect variables referred in partial AST.
+
+        This method is private and called internally as a helper of ``Interp.__bind``.
+
+        :param rt: Root of partial AST to be searched.
+        :type rt: Token.Tok
+        :param ref: Set where found variables are to be collected.
+        :type ref: Set[int]
+        """
+        if type(rt) == Token.Var:
+            ref.add(rt.v)
+        elif type(rt) == Token.Poly:
+            ref.add(rt.v.var)
+        elif type(rt) in [Token.Op, Token.Fun, Token.List]:
+            for tok in rt.chd:
+                self.__ref_hlpr(tok, ref)
 
     def __chk_t_hlpr(self, rt: Token.Tok, t_env: Dict[int, TypeSystem.T]) -> Dict[int, TypeSystem.T]:
         """
@@ -82,9 +280,20 @@ class Interp:
 
             return t_env
         elif tok_t == Token.Var:
-            # find: TypeSystem.T = t_env.get(rt.v)
+            rt.t = t_env.get(rt.v, TypeSystem.Sym.inst())
 
-            rt.t = TypeSystem.Sym.inst()
+            return t_env
+        elif tok_t == Token.Poly:
+            # Polynomial with complex coefficient is complex over real variable, and has no interval rule.
+            t: TypeSystem.T = t_env.get(rt.v.var, TypeSystem.Sym.inst())
+            cmplx: bool = any(type(c) == complex for c in rt.v.coef)
+
+            if type(t) == TypeSystem.Real:
+                rt.t = TypeSystem.Cmplx.inst() if cmplx else t
+            elif type(t) in [TypeSystem.Cmplx, TypeSystem.Sym] or (type(t) == TypeSystem.Interval and not cmplx):
+                rt.t = t
+            else:
+                raise Exception('type error')
 
             return t_env
         elif tok_t == Token.List:
@@ -108,7 +317,20 @@ class Interp:
 
             t_env = rt.v.chk_t(rt, t_env)
 
-            if not t_env:
+            if t_env is None:
+                raise InterpreterError.TErr(23, *self.__expr.str_pos(rt), rt, rt.v.sgn(), rt.v.__name__.upper())
+
+            if rt.v.__base__ == Assign.AsgnOp and not self.__replay:
+                self.__pending.append(rt)
+
+            return t_env
+        elif tok_t == Token.Fun:
+            for tok in rt.chd:
+                t_env = self.__chk_t_hlpr(tok, t_env)
+
+            t_env = rt.v.chk_t(rt, t_env)
+
+            if t_env is None:
                 raise InterpreterError.TErr(23, *self.__expr.str_pos(rt), rt, rt.v.sgn(), rt.v.__name__.upper())
 
             return t_env
@@ -120,6 +342,86 @@ class Interp:
 
             return t_env
 
+    def __ival_hlpr(self, rt: Token.Tok, env: Dict[int, Interval.Ival],
+                    warn: List[Warning.InterpWarn]) -> Interval.Ival:
+        """
+        Evaluate partial AST over batches of intervals.
+
+        Numbers are degenerate intervals, and variables are looked up from the environment.
+        Operators and functions are evaluated by their ``ival`` methods after their operands.
+
+        This method is private and called internally as a helper of ``Interp.eval_ival``.
+
+        :param rt: Root of partial AST to be evaluated.
+        :type rt: Token.Tok
+        :param env: Batches of intervals bound to variables.
+        :type env: Dict[int, Interval.Ival]
+        :param warn: List where generated warnings are to be collected.
+        :type warn: List[Warning.InterpWarn]
+
+        :return: Enclosure of partial AST.
+        :rtype: Interval.Ival
+        """
+        tok_t: type = type(rt)
+
+        if tok_t == Token.Num:
+            return Interval.Ival.point(rt.v)
+        elif tok_t == Token.Var:
+            return env[rt.v]
+        elif tok_t == Token.Poly:
+            return rt.v.ival(env[rt.v.var])[0]
+        elif tok_t in [Token.Op, Token.Fun] and hasattr(rt.v, 'ival'):
+            res, res_warn = rt.v.ival(*[self.__ival_hlpr(tok, env, warn) for tok in rt.chd])
+            warn += res_warn
+
+            return res
+        else:
+            raise Exception('type error')
+
+    def __dual_hlpr(self, rt: Token.Tok, env: Dict[int, Dual.Dual], dim: int,
+                    warn: List[Warning.InterpWarn]) -> Dual.Dual:
+        """
+        Evaluate partial AST over batches of dual numbers.
+
+        Numbers are constants whose tangents are all 0, and variables are looked up from the environment.
+        Operators and functions are evaluated by their ``dual`` methods after their operands.
+
+        This method is private and called internally as a helper of ``Interp.eval_dual``.
+
+        :param rt: Root of partial AST to be evaluated.
+        :type rt: Token.Tok
+        :param env: Batches of dual numbers bound to variables.
+        :type env: Dict[int, Dual.Dual]
+        :param dim: # of tangent directions.
+        :type dim: int
+        :param warn: List where generated warnings are to be collected.
+        :type warn: List[Warning.InterpWarn]
+
+        :return: Value with tangents of partial AST.
+        :rtype: Dual.Dual
+        """
+        tok_t: type = type(rt)
+
+        if tok_t == Token.Num:
+            return Dual.Dual.const(rt.v, dim)
+        elif tok_t == Token.Var:
+            return env[rt.v]
+        elif tok_t == Token.Poly:
+            return rt.v.dual(env[rt.v.var])[0]
+        elif tok_t in [Token.Op, Token.Fun] and hasattr(rt.v, 'dual'):
+            # Plain loop keeps a single frame per level, so that deep AST does not exceed recursion limit.
+            arg: List[Dual.Dual] = []
+
+            for tok in rt.chd:
+                arg.append(self.__dual_hlpr(tok, env, dim, warn))
+
+            res, res_warn = rt.v.dual(*arg)
+            warn += res_warn
+
+            return res
+        else:
+            raise Exception('type error')
+
     def __debug_hlpr(self, rt: Token.Tok, cnt: int) -> int:
         buf: Type.BufT = Type.BufT.DEBUG  # Debug buffer.
         tok_t: type = type(rt)
@@ -322,6 +624,531 @@ class Interp:
 
         return cls.__inst
 
+    def clr(self) -> None:
+        """
+        Clear the type environment of the session.
+        """
+        self.__t_env.clear()
+        self.__def.clear()
+        self.__def_t.clear()
+        self.__ref.clear()
+        self.__dep.clear()
+        self.__deriv.clear()
+        self.__sym = Symbolic.Builder()
+
+    def eval_ival(self, expr: AST.AST, env: Dict[str, Interval.Ival]) -> Tuple[Interval.Ival,
+                                                                            List[Warning.InterpWarn]]:
+        """
+        Evaluate AST over batches of intervals.
+
+        Variables in the environment are typed as interval, and the others as symbol.
+        Thus type checker rejects AST with free variable or operator and function without interval rules, before
+        evaluation.
+        Then AST is evaluated bottom up, where each node is a chain of ``map`` calls over the whole batch.
+        Thus bounding a formula over a million boxes is a single pass over AST.
+        The result encloses all the values of the formula over the boxes, that is, over all points whose coordinates
+        are in the intervals of the same position in the batches.
+        Note that each occurrence of a variable is bounded independently, so the enclosure may be wider than the exact
+        range of the formula.
+
+        Arbitrary precision mode is turned off while evaluating, since bounds are floats.
+        Type environment of the session is not modified.
+
+        **Reference**
+            * https://en.wikipedia.org/wiki/Interval_arithmetic#Dependency_problem
+
+        :param expr: AST to be evaluated.
+        :type expr: AST.AST
+        :param env: Batches of intervals bound to variables. Batch of size 1 is broadcast.
+        :type env: Dict[str, Interval.Ival]
+
+        :return: Enclosure of AST and list of generated warnings.
+        :rtype: Tuple[Interval.Ival, List[Warning.InterpWarn]]
+        """
+        self.__expr = expr
+        self.__line = expr.line
+        ref: Set[int] = set()
+        self.__ref_hlpr(expr.rt, ref)
+        var: Dict[int, Interval.Ival] = {k: env[AST.AST.var_name(k)] for k in ref if AST.AST.var_name(k) in env}
+
+        self.__pending.clear()
+        self.__chk_t_hlpr(expr.rt, {k: TypeSystem.Interval.inst() for k in var})
+        self.__pending.clear()
+
+        if type(expr.rt.t) not in [TypeSystem.Real, TypeSystem.Interval]:
+            raise Exception('type error')
+
+        prec: Optional[int] = Precision.PrecFun.prec()
+        warn: List[Warning.InterpWarn] = []
+        Precision.PrecFun.set_prec(None)
+
+        try:
+            return self.__ival_hlpr(expr.rt, var, warn), warn
+        finally:
+            Precision.PrecFun.set_prec(prec)
+
+    def eval_dual(self, expr: AST.AST, env: Dict[str, Dual.Dual]) -> Tuple[Dual.Dual, List[Warning.InterpWarn]]:
+        """
+        Evaluate AST over batches of dual numbers.
+
+        It is forward mode automatic differentiation.
+        Variables in the environment are typed as real, and the others as symbol.
+        Thus type checker rejects AST with free variable before evaluation.
+        Then AST is evaluated bottom up, where each node computes its values and the tangents of each direction by the
+        chain rule.
+        Thus values and directional derivatives of a formula over a batch of points are computed in a single pass over
+        AST, while finite differences need two passes for each direction and lose about half of the digits.
+        Operators and functions without derivative rules raise error at evaluation.
+
+        Arbitrary precision mode is turned off while evaluating, since tangents are floats.
+        Type environment of the session is not modified.
+
+        **Reference**
+            * https://en.wikipedia.org/wiki/Automatic_differentiation
+
+        :param expr: AST to be evaluated.
+        :type expr: AST.AST
+        :param env: Batches of dual numbers bound to variables. Batch of size 1 is broadcast.
+                    All of them must have the same # of tangent directions.
+        :type env: Dict[str, Dual.Dual]
+
+        :return: Value with tangents of AST and list of generated warnings.
+        :rtype: Tuple[Dual.Dual, List[Warning.InterpWarn]]
+
+        :raise ValueError: If batches have different # of tangent directions.
+        """
+        self.__expr = expr
+        self.__line = expr.line
+        ref: Set[int] = set()
+        self.__ref_hlpr(expr.rt, ref)
+        var: Dict[int, Dual.Dual] = {k: env[AST.AST.var_name(k)] for k in ref if AST.AST.var_name(k) in env}
+        dim: int = next(iter(env.values())).dim if env else 0
+
+        if any(x.dim != dim for x in env.values()):
+            raise ValueError('All batches must have the same # of tangent directions, but they are ' +
+                             ', '.join([f'{k}: {x.dim}' for k, x in env.items()]) + '.')
+
+        self.__pending.clear()
+        self.__chk_t_hlpr(expr.rt, {k: TypeSystem.Real.inst() for k in var})
+        self.__pending.clear()
+
+        if type(expr.rt.t) != TypeSystem.Real:
+            raise Exception('type error')
+
+        prec: Optional[int] = Precision.PrecFun.prec()
+        warn: List[Warning.InterpWarn] = []
+        Precision.PrecFun.set_prec(None)
+
+        try:
+            return self.__dual_hlpr(expr.rt, var, dim, warn), warn
+        finally:
+            Precision.PrecFun.set_prec(prec)
+
+    def grad(self, expr: AST.AST, env: Dict[str, Union[float, List[float]]]) -> Tuple[Dual.Dual,
+                                                                                   List[Warning.InterpWarn]]:
+        """
+        Compute values and gradient of AST over batch of points.
+
+        Each variable in the environment is seeded with its own tangent direction, whose tangent is 1 for the variable
+        and 0 for the others.
+        Thus the full gradient comes from a single batched evaluation by ``Interp.eval_dual``.
+        Since seeds are identically 0 except one direction, the cost of each direction is proportional to the part of
+        AST depending on its variable.
+
+        :param expr: AST to be evaluated.
+        :type expr: AST.AST
+        :param env: Points bound to variables. Batch of size 1 is broadcast.
+        :type env: Dict[str, Union[float, List[float]]]
+
+        :return: Values with gradient of AST and list of generated warnings.
+                 The i-th tangent direction is the partial derivative wrt. the i-th variable of the environment.
+        :rtype: Tuple[Dual.Dual, List[Warning.InterpWarn]]
+        """
+        seed: Dict[str, Dual.Dual] = {}
+
+        for i, (k, x) in enumerate(env.items()):
+            seed[k] = Dual.Dual(x if type(x) == list else [x], [None] * i + [[1.0]] + [None] * (len(env) - i - 1))
+
+        return self.eval_dual(expr, seed)
+
+    def compile(self, expr: AST.AST, var: List[str]) -> Tape.Tape:
+        """
+        Compile AST into tape of reverse mode automatic differentiation.
+
+        Given variables are typed as real, and the others as symbol.
+        Thus type checker rejects AST with free variable before compiling.
+        Variables are appended to the tape first in the given order, and then AST is visited in post order and each
+        token is appended to the tape.
+        The visit is iterative, so that AST of formula with thousands of terms does not exceed recursion limit.
+        Tokens shared by several parents, as in ASTs built by ``Interp.diff``, are appended only once.
+        Operators and functions without derivative rules are rejected.
+        For the use of tape, refer to the comments of ``Tape.Tape``.
+
+        Type environment of the session is not modified.
+
+        :param expr: AST to be compiled.
+        :type expr: AST.AST
+        :param var: Names of variables.
+        :type var: List[str]
+
+        :return: Compiled tape.
+        :rtype: Tape.Tape
+        """
+        self.__expr = expr
+        self.__line = expr.line
+        ref: Set[int] = set()
+        self.__ref_hlpr(expr.rt, ref)
+
+        self.__pending.clear()
+        self.__chk_t_hlpr(expr.rt, {k: TypeSystem.Real.inst() for k in ref if AST.AST.var_name(k) in var})
+        self.__pending.clear()
+
+        if type(expr.rt.t) != TypeSystem.Real:
+            raise Exception('type error')
+
+        tape: Tape.Tape = Tape.Tape()
+        slot: Dict[int, int] = {}  # Slots of visited tokens, indexed by their ids.
+        stk: List[Tuple[Token.Tok, bool]] = [(expr.rt, False)]  # Stack of tokens with flag for visited operands.
+
+        for name in var:
+            tape.var(name)
+
+        while stk:
+            tok, done = stk.pop()
+            tok_t: type = type(tok)
+
+            if id(tok) in slot:
+                continue
+            elif tok_t == Token.Num:
+                slot[id(tok)] = tape.const(tok.v)
+            elif tok_t == Token.Var:
+                slot[id(tok)] = tape.var(AST.AST.var_name(tok.v))
+            elif tok_t == Token.Poly:
+                slot[id(tok)] = tape.push(tok.v, [tape.var(AST.AST.var_name(tok.v.var))])
+            elif tok_t not in [Token.Op, Token.Fun] or not hasattr(tok.v, 'dual'):
+                raise Exception('type error')
+            elif done:
+                slot[id(tok)] = tape.push(tok.v, [slot[id(it)] for it in tok.chd])
+            else:
+                stk.append((tok, True))
+                stk.extend((it, False) for it in reversed(tok.chd))
+
+        return tape
+
+    def diff(self, expr: AST.AST, var: str) -> AST.AST:
+        """
+        Build derivative of AST wrt. variable symbolically.
+
+        Variables are typed as real, and type checker rejects AST which is not real before differentiation.
+        Other variables than the given one are taken as constants, that is, the result is partial derivative.
+        AST is rebuilt by the builder first, so that the derivative can share the tokens of the original formula.
+        Then the derivative of each token is built in post order by the chain rule, with the partial derivatives wrt.
+        operands from the ``diff`` methods of operators and functions.
+        The visit is iterative, so that AST of formula with thousands of terms does not exceed recursion limit.
+        Derivative which is identically 0 is not built at all, so subtrees not depending on the variable cost nothing.
+
+        All tokens are built by the builder of the session, which simplifies each token as it is made and shares common
+        subexpressions.
+        For the rules of simplification, refer to the comments of ``Symbolic.Builder``.
+        Thus the derivative is a DAG sharing subexpressions with the original formula and with the other derivatives,
+        and compiling it by ``Interp.compile`` evaluates each of them once.
+        Further, derivatives are cached by the infix expression of AST and the variable, so that building derivative of
+        the same formula again costs nothing.
+        Operators and functions without derivative rules are rejected.
+
+        Type environment of the session is not modified.
+
+        **Reference**
+            * https://en.wikipedia.org/wiki/Symbolic_differentiation
+
+        :param expr: AST to be differentiated.
+        :type expr: AST.AST
+        :param var: Name of variable.
+        :type var: str
+
+        :return: Derivative of AST.
+        :rtype: AST.AST
+        """
+        key: Tuple[str, str] = (str(expr), var)
+
+        if key in self.__deriv:
+            return self.__deriv[key]
+
+        self.__expr = expr
+        self.__line = expr.line
+        ref: Set[int] = set()
+        self.__ref_hlpr(expr.rt, ref)
+
+        self.__pending.clear()
+        self.__chk_t_hlpr(expr.rt, {k: TypeSystem.Real.inst() for k in ref})
+        self.__pending.clear()
+
+        if type(expr.rt.t) != TypeSystem.Real:
+            raise Exception('type error')
+
+        b: Symbolic.Builder = self.__sym
+        rt: Token.Tok = b.build(expr.rt)
+        d: Dict[int, Optional[Token.Tok]] = {}  # Derivatives of visited tokens, indexed by their ids.
+        stk: List[Tuple[Token.Tok, bool]] = [(rt, False)]  # Stack of tokens with flag for visited operands.
+
+        while stk:
+            tok, done = stk.pop()
+            tok_t: type = type(tok)
+
+            if id(tok) in d:
+                continue
+            elif tok_t == Token.Num:
+                d[id(tok)] = None
+            elif tok_t == Token.Var:
+                d[id(tok)] = b.num(1) if AST.AST.var_name(tok.v) == var else None
+            elif tok_t == Token.Poly:
+                d[id(tok)] = b.poly(Polynomial.PolyArith.deriv(tok.v)) if AST.AST.var_name(tok.v.var) == var else None
+            elif tok_t not in [Token.Op, Token.Fun] or not hasattr(tok.v, 'diff'):
+                raise Exception('type error')
+            elif done:
+                dx: List[Optional[Token.Tok]] = [d[id(it)] for it in tok.chd]
+                d[id(tok)] = None if all(it is None for it in dx) else b.chain(*zip(tok.v.diff(tok, b), dx))
+            else:
+                stk.append((tok, True))
+                stk.extend((it, False) for it in reversed(tok.chd))
+
+        self.__deriv[key] = AST.AST(b.num(0) if d[id(rt)] is None else d[id(rt)], expr.line)
+
+        return self.__deriv[key]
+
+    def __poly_hlpr(self, rt: Token.Op, arg: List[Polynomial.UniPoly]) -> Optional[Polynomial.UniPoly]:
+        """
+        Recognize operator of polynomials as polynomial.
+
+        Operator of polynomials is polynomial if it is one of followings.
+            1. ``Add``, ``Sub``, ``Plus`` and ``Minus`` of polynomials of the same variable.
+            2. ``Mul`` of polynomials of the same variable, one of which is monomial ``c * x ** k``.
+            3. ``Div`` of polynomial by nonzero constant.
+            4. ``Pow`` of monomial to nonnegative integer constant.
+        The result must not exceed ``__POLY_DEG`` in degree, since evaluation of polynomial of high degree costs more
+        than a few calls of ``Pow``.
+        Products and powers of polynomials with several terms are not expanded, since expanded form of factored
+        polynomial such as ``(x + 1) ** 20`` suffers from cancellation and changes values.
+        Instead, their operands are replaced by polynomial tokens separately.
+
+        This method is private and called internally as a helper of ``Interp.poly``.
+
+        :param rt: Operator to be recognized.
+        :type rt: Token.Op
+        :param arg: Polynomials of operands.
+        :type arg: List[Polynomial.UniPoly]
+
+        :return: Polynomial of operator. None if it is not polynomial.
+        :rtype: Optional[Polynomial.UniPoly]
+        """
+        try:
+            if rt.v == Binary.Add:
+                res: Polynomial.UniPoly = Polynomial.PolyArith.add(*arg)
+            elif rt.v == Binary.Sub:
+                res: Polynomial.UniPoly = Polynomial.PolyArith.sub(*arg)
+            elif rt.v == Binary.Mul:
+                if max(arg[0].deg, 0) + max(arg[1].deg, 0) > self.__POLY_DEG or \
+                        all(sum(map(bool, it.coef)) > 1 for it in arg):
+                    return None
+
+                res: Polynomial.UniPoly = Polynomial.PolyArith.mul(*arg)
+            elif rt.v == Unary.Plus:
+                res: Polynomial.UniPoly = arg[0]
+            elif rt.v == Unary.Minus:
+                res: Polynomial.UniPoly = Polynomial.PolyArith.neg(arg[0])
+            elif rt.v == Binary.Div and arg[1].deg == 0:
+                res: Polynomial.UniPoly = Polynomial.PolyArith.scale(arg[0], 1 / arg[1].coef[0])
+            elif rt.v == Binary.Pow and arg[1].deg <= 0:
+                n = arg[1].coef[0] if arg[1].coef else 0
+
+                if type(n) == complex or n < 0 or not float(n).is_integer() or sum(map(bool, arg[0].coef)) > 1 or \
+                        max(arg[0].deg, 0) * n > self.__POLY_DEG:
+                    return None
+
+                res: Polynomial.UniPoly = Polynomial.PolyArith.pow(arg[0], int(n))
+            else:
+                return None
+        except ValueError:
+            # Polynomials of different variables.
+            return None
+
+        return res
+
+    def poly(self, expr: AST.AST) -> AST.AST:
+        """
+        Replace polynomial subtrees of AST by polynomial tokens.
+
+        First, polynomial of each token is found in post order.
+        Numbers are constant polynomials, variables are polynomials of degree 1, and operators are recognized by
+        ``Interp.__poly_hlpr``.
+        Then each maximal polynomial subtree rooted at operator is replaced by a single polynomial token, which is
+        evaluated by Horner's method.
+        Constant subtree is folded into number instead.
+        Thus ``x ** 4 + 3 * x ** 2 - x`` is evaluated by 4 multiply-adds, rather than by 2 calls of ``Pow`` and 3
+        arithmetic operators.
+        On the other hand, ``(x + 1) ** 20`` keeps ``Pow`` whose base ``x + 1`` is replaced, so that the values of
+        factored polynomials do not change.
+        Tokens whose operands are not replaced are reused, so the result shares them with the original AST.
+        The visits are iterative, so that AST of formula with thousands of terms does not exceed recursion limit.
+
+        Type environment of the session is not modified.
+
+        **Reference**
+            * https://en.wikipedia.org/wiki/Horner%27s_method
+
+        :param expr: AST whose polynomial subtrees are to be replaced.
+        :type expr: AST.AST
+
+        :return: AST with polynomial tokens.
+        :rtype: AST.AST
+        """
+        poly: Dict[int, Optional[Polynomial.UniPoly]] = {}  # Polynomials of visited tokens, indexed by their ids.
+        stk: List[Tuple[Token.Tok, bool]] = [(expr.rt, False)]  # Stack of tokens with flag for visited operands.
+
+        while stk:
+            tok, done = stk.pop()
+            tok_t: type = type(tok)
+
+            if id(tok) in poly:
+                continue
+            elif tok_t == Token.Num:
+                poly[id(tok)] = Polynomial.PolyArith.const(tok.v)
+            elif tok_t == Token.Var:
+                poly[id(tok)] = Polynomial.UniPoly(tok.v, [0, 1])
+            elif tok_t == Token.Poly:
+                poly[id(tok)] = tok.v
+            elif tok_t not in [Token.Op, Token.Fun, Token.List]:
+                poly[id(tok)] = None
+            elif done:
+                arg: List[Optional[Polynomial.UniPoly]] = [poly[id(it)] for it in tok.chd]
+                poly[id(tok)] = self.__poly_hlpr(tok, arg) if tok_t == Token.Op and None not in arg else None
+            else:
+                stk.append((tok, True))
+                stk.extend((it, False) for it in reversed(tok.chd))
+
+        res: Dict[int, Token.Tok] = {}  # Replaced tokens, indexed by the ids of the original tokens.
+        stk = [(expr.rt, False)]
+
+        while stk:
+            tok, done = stk.pop()
+            tok_t: type = type(tok)
+
+            if id(tok) in res:
+                continue
+            elif tok_t == Token.Op and poly[id(tok)] is not None:
+                p: Polynomial.UniPoly = poly[id(tok)]
+                res[id(tok)] = Token.Poly(p, tok.pos) if p.deg > 0 else Token.Num(p.coef[0] if p.coef else 0, tok.pos)
+            elif tok_t not in [Token.Op, Token.Fun, Token.List]:
+                res[id(tok)] = tok
+            elif not done:
+                stk.append((tok, True))
+                stk.extend((it, False) for it in reversed(tok.chd))
+            elif all(res[id(it)] is it for it in tok.chd):
+                res[id(tok)] = tok
+            else:
+                if tok_t == Token.Op:
+                    new: Token.Tok = Token.Op(tok.v, tok.pos)
+                elif tok_t == Token.Fun:
+                    new: Token.Tok = Token.Fun(tok.v, tok.pos)
+                    new.argc = tok.argc
+                else:
+                    new: Token.Tok = Token.List(tok.pos, tok.argc)
+
+                for it in tok.chd:
+                    new.add_chd(res[id(it)])
+
+                res[id(tok)] = new
+
+        return AST.AST(res[id(expr.rt)], expr.line)
+
+    def __spoly_hlpr(self, rt: Token.Op, arg: List[Polynomial.MultiSparPoly]) -> Optional[Polynomial.MultiSparPoly]:
+        """
+        Recognize operator of sparse polynomials as sparse polynomial.
+
+        Operator of polynomials is polynomial if it is one of followings.
+            1. ``Add``, ``Sub``, ``Mul``, ``Plus`` and ``Minus`` of polynomials.
+            2. ``Div`` of polynomial by nonzero constant.
+            3. ``Pow`` of polynomial to nonnegative integer constant.
+        Unlike ``Interp.__poly_hlpr``, polynomials may be of different variables and there is no limit of degree.
+
+        This method is private and called internally as a helper of ``Interp.expand``.
+
+        :param rt: Operator to be recognized.
+        :type rt: Token.Op
+        :param arg: Polynomials of operands.
+        :type arg: List[Polynomial.MultiSparPoly]
+
+        :return: Polynomial of operator. None if it is not polynomial.
+        :rtype: Optional[Polynomial.MultiSparPoly]
+        """
+        if rt.v == Binary.Add:
+            return Polynomial.SparPolyArith.add(*arg)
+        elif rt.v == Binary.Sub:
+            return Polynomial.SparPolyArith.sub(*arg)
+        elif rt.v == Binary.Mul:
+            return Polynomial.SparPolyArith.mul(*arg)
+        elif rt.v == Unary.Plus:
+            return arg[0]
+        elif rt.v == Unary.Minus:
+            return Polynomial.SparPolyArith.neg(arg[0])
+        elif rt.v == Binary.Div and arg[1].deg == 0:
+            return Polynomial.SparPolyArith.scale(arg[0], 1 / next(iter(arg[1].coef.values())))
+        elif rt.v == Binary.Pow and arg[1].deg <= 0:
+            n = next(iter(arg[1].coef.values())) if arg[1].coef else 0
+
+            if type(n) == complex or n < 0 or not float(n).is_integer():
+                return None
+
+            return Polynomial.SparPolyArith.pow(arg[0], int(n))
+        else:
+            return None
+
+    def expand(self, expr: AST.AST) -> Optional[Polynomial.MultiSparPoly]:
+        """
+        Expand AST into sparse multivariate polynomial.
+
+        Polynomial of each token is found in post order.
+        Numbers are constant polynomials, variables are polynomials of degree 1, polynomial tokens are converted, and
+        operators are recognized by ``Interp.__spoly_hlpr``.
+        Like terms are combined as they are found, and only the terms which are present are kept.
+        Thus formula of many terms in several variables is simplified into its canonical form without densifying, and
+        it is evaluated over batch by ``MultiSparPoly.eval``, sharing the powers of each variable among the terms.
+        The visit is iterative, so that AST of formula with thousands of terms does not exceed recursion limit.
+
+        Type environment of the session is not modified.
+
+        :param expr: AST to be expanded.
+        :type expr: AST.AST
+
+        :return: Expanded polynomial. None if AST is not polynomial.
+        :rtype: Optional[Polynomial.MultiSparPoly]
+        """
+        poly: Dict[int, Optional[Polynomial.MultiSparPoly]] = {}  # Polynomials of visited tokens, indexed by their ids.
+        stk: List[Tuple[Token.Tok, bool]] = [(expr.rt, False)]  # Stack of tokens with flag for visited operands.
+
+        while stk:
+            tok, done = stk.pop()
+            tok_t: type = type(tok)
+
+            if id(tok) in poly:
+                continue
+            elif tok_t == Token.Num:
+                poly[id(tok)] = Polynomial.SparPolyArith.const(tok.v)
+            elif tok_t == Token.Var:
+                poly[id(tok)] = Polynomial.SparPolyArith.gen(tok.v)
+            elif tok_t == Token.Poly:
+                poly[id(tok)] = Polynomial.SparPolyArith.from_uni(tok.v)
+            elif tok_t != Token.Op:
+                poly[id(tok)] = None
+            elif done:
+                arg: List[Optional[Polynomial.MultiSparPoly]] = [poly[id(it)] for it in tok.chd]
+                poly[id(tok)] = self.__spoly_hlpr(tok, arg) if None not in arg else None
+            else:
+                stk.append((tok, True))
+                stk.extend((it, False) for it in reversed(tok.chd))
+
+        return poly[id(expr.rt)]
+
     def interp(self, expr: AST.AST, debug: bool = False) -> AST.AST:
         """
         Type check AST and interpret it.
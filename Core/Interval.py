@@ -0,0 +1,950 @@
+from __future__ import annotations
+
+import math
+from functools import partial
+from itertools import repeat
+from operator import add, and_, eq, ge, gt, le, lt, mul, neg, sub, truediv
+from typing import final, Final, List, Tuple, Union, Callable, Iterable
+
+
+@final
+class Ival:
+    """
+    Batch of closed intervals.
+
+    Intervals are kept in structure of arrays layout.
+    That is, lower and upper bounds are two flat lists of floats, so that each interval operation is a chain of ``map``
+    calls over the whole batch, which runs entirely in C.
+    Batch of size 1 is broadcast against batch of any size.
+    Entire real line is ``[-inf, inf]``, and empty interval, which arises when the whole interval is out of domain, is
+    ``[nan, nan]``.
+
+    :ivar __lo: Lower bounds.
+    :ivar __hi: Upper bounds.
+    """
+
+    def __init__(self, lo: List[float], hi: List[float]) -> None:
+        self.__lo: List[float] = lo
+        self.__hi: List[float] = hi
+
+    def __len__(self) -> int:
+        return len(self.__lo)
+
+    def __str__(self) -> str:
+        box: List[str] = [f'[{lo}, {hi}]' for lo, hi in zip(self.__lo, self.__hi)]
+
+        return box[0] if len(box) == 1 else '{' + ', '.join(box) + '}'
+
+    @classmethod
+    def point(cls, x: Union[int, float]) -> Ival:
+        """
+        Make batch of single degenerate interval.
+
+        Float is taken as it is.
+        Integer which cannot be represented as float exactly is enclosed by the adjacent floats.
+
+        :param x: Point to be enclosed.
+        :type x: Union[int, float]
+
+        :return: Batch of single interval enclosing the point.
+        :rtype: Ival
+        """
+        try:
+            f: float = float(x)
+        except OverflowError:
+            f: float = math.copysign(math.inf, x)
+
+        return Ival([f if f <= x else math.nextafter(f, -math.inf)], [f if f >= x else math.nextafter(f, math.inf)])
+
+    @property
+    def lo(self) -> List[float]:
+        return self.__lo
+
+    @property
+    def hi(self) -> List[float]:
+        return self.__hi
+
+
+class IvalArith:
+    """
+    Interval arithmetic toolbox.
+
+    Every operation returns intervals which enclose all the values of the operation over the parameter intervals.
+    Since Python has no directed rounding, the enclosure is guaranteed by outward rounding with ``math.nextafter``.
+    Arithmetic operators are correctly rounded, so their bounds are moved outward by 1 ulp.
+    Exception is the operation of two single points, whose rounding error is recovered exactly by error-free
+    transformations, that is, two-sum for addition and two-product for multiplication and division.
+    The result is moved only to the side of the exact value, and not at all if the operation is exact.
+    Thus constant subtrees such as ``1 + 2`` or ``6 / 2`` give single points, which keep the rules for integer points.
+    Bounds computed by function kernels are moved outward by the # of ulps given by the caller, which must be no less
+    than the error of the kernel. (2 ulps for ``math`` functions.)
+    Monotone functions are bounded by their values at the end points, and periodic functions additionally check
+    whether an extremum or a pole lies in the interval.
+    Such checks are done in floating point with slack, so that they never miss but may report extremum or pole which is
+    very close to the interval.
+
+    **Reference**
+        * https://en.wikipedia.org/wiki/Interval_arithmetic
+        * https://doi.org/10.1137/1.9780898717716
+
+    :cvar __FUDGE: Relative slack for the check of extrema and poles.
+    :cvar __WRAP: Bound of end points for the check of extrema and poles.
+    :cvar __SPLIT: Splitter of Veltkamp's splitting for two-product.
+    :cvar __EXACT: Range of magnitude of products where two-product neither underflows nor overflows.
+    """
+    __FUDGE: Final[float] = 2 ** -50
+    __WRAP: Final[float] = 2.0 ** 60
+    __SPLIT: Final[float] = 2.0 ** 27 + 1
+    __EXACT: Final[Tuple[float, float]] = (2.0 ** -969, 2.0 ** 995)
+
+    def __new__(cls, *args, **kwargs) -> None:
+        raise NotImplementedError
+
+    @classmethod
+    def dn(cls, x: Iterable[float], ulp: int = 1) -> List[float]:
+        """
+        Round bounds down.
+
+        :param x: Bounds to be rounded.
+        :type x: Iterable[float]
+        :param ulp: # of ulps to be moved. (Default: 1)
+        :type ulp: int
+
+        :return: Rounded bounds.
+        :rtype: List[float]
+        """
+        for _ in range(ulp):
+            x = map(math.nextafter, x, repeat(-math.inf))
+
+        return list(x)
+
+    @classmethod
+    def up(cls, x: Iterable[float], ulp: int = 1) -> List[float]:
+        """
+        Round bounds up.
+
+        :param x: Bounds to be rounded.
+        :type x: Iterable[float]
+        :param ulp: # of ulps to be moved. (Default: 1)
+        :type ulp: int
+
+        :return: Rounded bounds.
+        :rtype: List[float]
+        """
+        for _ in range(ulp):
+            x = map(math.nextafter, x, repeat(math.inf))
+
+        return list(x)
+
+    @classmethod
+    def __two_sum(cls, a: float, b: float, s: float) -> float:
+        """
+        Rounding error of sum.
+
+        By Knuth's two-sum, ``(a - (s - t)) + (b - t)`` with ``t = s - a`` is exactly ``a + b - s`` for rounded sum s.
+        If the sum overflows or some term is not finite, the error is nan.
+
+        This method is private and called internally as a helper of ``IvalArith.add`` and ``IvalArith.sub``.
+
+        :param a: Term.
+        :type a: float
+        :param b: Term.
+        :type b: float
+        :param s: Rounded sum.
+        :type s: float
+
+        :return: Rounding error.
+        :rtype: float
+        """
+        t: float = s - a
+
+        return (a - (s - t)) + (b - t)
+
+    @classmethod
+    def __two_prod(cls, a: float, b: float, p: float) -> float:
+        """
+        Rounding error of product.
+
+        By Dekker's two-product, factors are split into halves of 26 bits by Veltkamp's splitting, and the error
+        ``a * b - p`` is summed from the products of the halves, which are all exact.
+        If the product is 0, it is exact only if some factor is 0.
+        If the product underflows or overflows, the error is not exact and it is nan.
+
+        This method is private and called internally as a helper of ``IvalArith.mul`` and ``IvalArith.__two_div``.
+
+        :param a: Factor.
+        :type a: float
+        :param b: Factor.
+        :type b: float
+        :param p: Rounded product.
+        :type p: float
+
+        :return: Rounding error.
+        :rtype: float
+        """
+        if p == 0:
+            return 0.0 if a == 0 or b == 0 else math.nan
+        elif not cls.__EXACT[0] <= abs(p) <= cls.__EXACT[1]:
+            return math.nan
+
+        t: float = cls.__SPLIT * a
+        ah: float = t - (t - a)
+        al: float = a - ah
+        t = cls.__SPLIT * b
+        bh: float = t - (t - b)
+        bl: float = b - bh
+
+        return ((ah * bh - p) + ah * bl + al * bh) + al * bl
+
+    @classmethod
+    def __two_div(cls, a: float, b: float, q: float) -> float:
+        """
+        Sign of rounding error of quotient.
+
+        The residual ``a - q * b`` is exact by two-product, and the exact quotient is ``q + (a - q * b) / b``.
+        Thus the residual multiplied by the sign of divisor has the same sign with the rounding error.
+        If the residual is not exact, the result is nan.
+
+        This method is private and called internally as a helper of ``IvalArith.recip`` and ``IvalArith.div``.
+
+        :param a: Dividend.
+        :type a: float
+        :param b: Divisor, which is nonzero.
+        :type b: float
+        :param q: Rounded quotient.
+        :type q: float
+
+        :return: Value with the same sign with the rounding error.
+        :rtype: float
+        """
+        p: float = q * b
+        r: float = (a - p) - cls.__two_prod(q, b, p)
+
+        return r if b > 0 else -r
+
+    @classmethod
+    def __pt(cls, res: Ival, op: Callable[[float, float], float], err: Callable[[float, float, float], float],
+             x: Tuple[List[float], List[float]], y: Tuple[List[float], List[float]]) -> Ival:
+        """
+        Round operation of single points by its exact rounding error.
+
+        Result of the operation of two single points is moved only if it is on the wrong side of the exact value, so
+        that exact operation gives a single point.
+        Other intervals are kept as they are, which are already rounded by 1 ulp.
+        Points are detected by a single ``map`` call for each operand, so batch without points costs almost nothing.
+        Error which is not known exactly is nan, and then the result is moved to both sides.
+
+        This method is private and called internally as a helper of arithmetic operations.
+
+        :param res: Result of the operation rounded by 1 ulp.
+        :type res: Ival
+        :param op: Operation of bounds.
+        :type op: Callable[[float, float], float]
+        :param err: Rounding error of operation, or value with the same sign.
+        :type err: Callable[[float, float, float], float]
+        :param x: Lower and upper bounds of the first operand.
+        :type x: Tuple[List[float], List[float]]
+        :param y: Lower and upper bounds of the second operand.
+        :type y: Tuple[List[float], List[float]]
+
+        :return: Result of the operation.
+        :rtype: Ival
+        """
+        if not (any(map(eq, *x)) and any(map(eq, *y))):
+            return res
+
+        lo, hi = list(res.lo), list(res.hi)
+
+        for i, (a, b, c, d) in enumerate(zip(*x, *y)):
+            if a == b and c == d and math.isfinite(a) and math.isfinite(c):
+                v: float = op(a, c)
+                e: float = err(a, c, v)
+                lo[i] = v if e >= 0 else math.nextafter(v, -math.inf)
+                hi[i] = v if e <= 0 else math.nextafter(v, math.inf)
+
+        return Ival(lo, hi)
+
+    @classmethod
+    def __bcast(cls, *args: Ival) -> List[Tuple[List[float], List[float]]]:
+        """
+        Broadcast batches to common size.
+
+        This method is private and called internally as a helper of binary operations.
+
+        :param args: Batches to be broadcast.
+        :type args: Ival
+
+        :return: Lower and upper bounds of each batch in common size.
+        :rtype: List[Tuple[List[float], List[float]]]
+
+        :raise ValueError: If batches are of different sizes.
+        """
+        sz: int = max(map(len, args))
+        res: List[Tuple[List[float], List[float]]] = []
+
+        for x in args:
+            if len(x) == sz:
+                res.append((x.lo, x.hi))
+            elif len(x) == 1:
+                res.append((x.lo * sz, x.hi * sz))
+            else:
+                raise ValueError
+
+        return res
+
+    @classmethod
+    def __finite(cls, *args: List[float]) -> bool:
+        """
+        Check whether all bounds are finite.
+
+        Finite sum certifies that there is neither nan nor inf, so the check is a single C level loop for each list.
+
+        This method is private and called internally as a helper of binary operations.
+
+        :param args: Bounds to be checked.
+        :type args: List[float]
+
+        :return: True if all bounds are finite. False otherwise.
+        :rtype: bool
+        """
+        return all(math.isfinite(sum(x)) for x in args)
+
+    @classmethod
+    def __zero(cls, lo: List[float], hi: List[float]) -> bool:
+        """
+        Check whether some interval contains 0.
+
+        This method is private and called internally as a helper of ``IvalArith.recip`` and ``IvalArith.div``.
+
+        :param lo: Lower bounds.
+        :type lo: List[float]
+        :param hi: Upper bounds.
+        :type hi: List[float]
+
+        :return: True if some interval contains 0. False otherwise.
+        :rtype: bool
+        """
+        return any(map(and_, map(le, lo, repeat(0.0)), map(ge, hi, repeat(0.0))))
+
+    @classmethod
+    def __prod(cls, a: float, b: float) -> float:
+        """
+        Product of bounds.
+
+        Unlike floating point multiplication, product of 0 and +-inf is 0.
+        This is because bound +-inf stands for unbounded interval, not for the point at infinity.
+
+        This method is private and called internally as a helper of ``IvalArith.__mul``.
+
+        :param a: Bound to be multiplied.
+        :type a: float
+        :param b: Bound to be multiplied.
+        :type b: float
+
+        :return: Product of bounds.
+        :rtype: float
+        """
+        return 0.0 if a == 0 or b == 0 else a * b
+
+    @classmethod
+    def __mul(cls, a: float, b: float, c: float, d: float) -> Tuple[float, float]:
+        """
+        Multiply intervals with unbounded or empty one.
+
+        This method is private and called internally as a helper of ``IvalArith.mul``.
+
+        :param a: Lower bound of the first interval.
+        :type a: float
+        :param b: Upper bound of the first interval.
+        :type b: float
+        :param c: Lower bound of the second interval.
+        :type c: float
+        :param d: Upper bound of the second interval.
+        :type d: float
+
+        :return: Lower and upper bound of product before rounding.
+        :rtype: Tuple[float, float]
+        """
+        if math.isnan(a) or math.isnan(c):
+            return math.nan, math.nan
+
+        p: Tuple[float, ...] = (cls.__prod(a, c), cls.__prod(a, d), cls.__prod(b, c), cls.__prod(b, d))
+
+        return min(p), max(p)
+
+    @classmethod
+    def __recip(cls, lo: float, hi: float) -> Tuple[float, float]:
+        """
+        Reciprocal of interval which may contain 0.
+
+        Reciprocal of interval has following computation rules.
+            1. If the interval is empty or ``[0, 0]``, the result is empty.
+            2. If 0 is the lower bound, the result is ``[1 / hi, inf]``.
+            3. If 0 is the upper bound, the result is ``[-inf, 1 / lo]``.
+            4. If 0 is in the interior, the result is the entire line.
+            5. Otherwise, the result is ``[1 / hi, 1 / lo]``.
+
+        This method is private and called internally as a helper of ``IvalArith.recip``.
+
+        :param lo: Lower bound.
+        :type lo: float
+        :param hi: Upper bound.
+        :type hi: float
+
+        :return: Lower and upper bound of reciprocal before rounding.
+        :rtype: Tuple[float, float]
+        """
+        if math.isnan(lo) or lo == hi == 0:
+            return math.nan, math.nan
+        elif lo == 0:
+            return 1 / hi, math.inf
+        elif hi == 0:
+            return -math.inf, 1 / lo
+        elif lo < 0 < hi:
+            return -math.inf, math.inf
+        else:
+            return 1 / hi, 1 / lo
+
+    @classmethod
+    def __at(cls, f: Callable[[float], float], edge: Callable[[float], float], x: float) -> float:
+        """
+        Evaluate kernel at bound, falling back to its limit.
+
+        This method is private and called internally as a helper of ``IvalArith.pow``.
+
+        :param f: Kernel to be evaluated.
+        :type f: Callable[[float], float]
+        :param edge: Limit of kernel where it overflows or hits the boundary of its domain.
+        :type edge: Callable[[float], float]
+        :param x: Bound where kernel is to be evaluated.
+        :type x: float
+
+        :return: Value of kernel.
+        :rtype: float
+        """
+        try:
+            return f(x)
+        except (ValueError, OverflowError):
+            return edge(x)
+
+    @classmethod
+    def __safe(cls, f: Callable[[float], float], x: List[float], edge: Callable[[float], float]) -> List[float]:
+        """
+        Evaluate kernel at bounds.
+
+        The whole list is evaluated by one ``map`` call of the kernel.
+        Only if it raises, it falls back to ``IvalArith.__at`` for each bound.
+
+        This method is private and called internally as a helper of ``IvalArith.pow``.
+
+        :param f: Kernel to be evaluated.
+        :type f: Callable[[float], float]
+        :param x: Bounds where kernel is to be evaluated.
+        :type x: List[float]
+        :param edge: Limit of kernel where it overflows or hits the boundary of its domain.
+        :type edge: Callable[[float], float]
+
+        :return: Values of kernel.
+        :rtype: List[float]
+        """
+        try:
+            return list(map(f, x))
+        except (ValueError, OverflowError):
+            return list(map(partial(cls.__at, f, edge), x))
+
+    @classmethod
+    def __wrap(cls, x: Ival) -> Tuple[List[float], List[float], List[bool]]:
+        """
+        Prepare bounds for the check of extrema and poles.
+
+        Bounds are clipped to ``[-2^60, 2^60]`` so that they are finite.
+        Since the slack of the check exceeds the period there, the check still reports every extremum and pole.
+        Empty intervals are replaced with ``[0, 0]`` and marked.
+
+        This method is private and called internally as a helper of ``IvalArith.periodic`` and ``IvalArith.branch``.
+
+        :param x: Intervals to be prepared.
+        :type x: Ival
+
+        :return: Prepared lower and upper bounds, and marks of empty intervals.
+        :rtype: Tuple[List[float], List[float], List[bool]]
+        """
+        lo: List[float] = list(map(min, map(max, x.lo, repeat(-cls.__WRAP)), repeat(cls.__WRAP)))
+        hi: List[float] = list(map(min, map(max, x.hi, repeat(-cls.__WRAP)), repeat(cls.__WRAP)))
+        empty: List[bool] = list(map(math.isnan, lo))
+
+        if any(empty):
+            lo = [0.0 if e else it for it, e in zip(lo, empty)]
+            hi = [0.0 if e else it for it, e in zip(hi, empty)]
+
+        return lo, hi, empty
+
+    @classmethod
+    def __hit(cls, lo: List[float], hi: List[float], c: float, p: float) -> List[bool]:
+        """
+        Check whether intervals contain some point of the form ``c + kp`` for integer k.
+
+        It checks whether there is integer in ``[(lo - c) / p, (hi - c) / p]``, whose end points are moved outward by
+        the relative slack.
+        Thus it never misses such point.
+
+        This method is private and called internally as a helper of ``IvalArith.periodic`` and ``IvalArith.branch``.
+
+        :param lo: Lower bounds. They must be finite.
+        :type lo: List[float]
+        :param hi: Upper bounds. They must be finite.
+        :type hi: List[float]
+        :param c: Offset of points.
+        :type c: float
+        :param p: Period of points.
+        :type p: float
+
+        :return: Flags for the intervals containing such point.
+        :rtype: List[bool]
+        """
+        a: List[float] = list(map(truediv, map(sub, lo, repeat(c)), repeat(p)))
+        b: List[float] = list(map(truediv, map(sub, hi, repeat(c)), repeat(p)))
+        a = list(map(sub, a, map(mul, map(add, map(abs, a), repeat(1.0)), repeat(cls.__FUDGE))))
+        b = list(map(add, b, map(mul, map(add, map(abs, b), repeat(1.0)), repeat(cls.__FUDGE))))
+
+        return list(map(ge, map(math.floor, b), map(math.ceil, a)))
+
+    @classmethod
+    def where(cls, flag: List[bool], x: Ival, y: Ival) -> Ival:
+        """
+        Select intervals by flags.
+
+        :param flag: Flags for intervals to be selected from y.
+        :type flag: List[bool]
+        :param x: Intervals to be selected where flag is False.
+        :type x: Ival
+        :param y: Intervals to be selected where flag is True. It may be a batch of size 1.
+        :type y: Ival
+
+        :return: Selected intervals.
+        :rtype: Ival
+        """
+        if not any(flag):
+            return x
+
+        (a, b), (c, d) = cls.__bcast(x, y)
+
+        return Ival([u if f else v for f, u, v in zip(flag, c, a)], [u if f else v for f, u, v in zip(flag, d, b)])
+
+    @classmethod
+    def neg(cls, x: Ival) -> Ival:
+        """
+        Negate intervals.
+
+        It is exact, so no rounding is needed.
+
+        :param x: Intervals to be negated.
+        :type x: Ival
+
+        :return: Negated intervals.
+        :rtype: Ival
+        """
+        return Ival(list(map(neg, x.hi)), list(map(neg, x.lo)))
+
+    @classmethod
+    def add(cls, x: Ival, y: Ival) -> Ival:
+        """
+        Add intervals.
+
+        The result is ``[a + c, b + d]`` for ``[a, b] + [c, d]``.
+
+        :param x: Augend intervals.
+        :type x: Ival
+        :param y: Addend intervals.
+        :type y: Ival
+
+        :return: Sum of intervals.
+        :rtype: Ival
+        """
+        (a, b), (c, d) = cls.__bcast(x, y)
+
+        return cls.__pt(Ival(cls.dn(map(add, a, c)), cls.up(map(add, b, d))), add, cls.__two_sum, (a, b), (c, d))
+
+    @classmethod
+    def sub(cls, x: Ival, y: Ival) -> Ival:
+        """
+        Subtract intervals.
+
+        The result is ``[a - d, b - c]`` for ``[a, b] - [c, d]``.
+
+        :param x: Minuend intervals.
+        :type x: Ival
+        :param y: Subtrahend intervals.
+        :type y: Ival
+
+        :return: Difference of intervals.
+        :rtype: Ival
+        """
+        (a, b), (c, d) = cls.__bcast(x, y)
+
+        return cls.__pt(Ival(cls.dn(map(sub, a, d)), cls.up(map(sub, b, c))), sub,
+                        lambda s, t, v: cls.__two_sum(s, -t, v), (a, b), (c, d))
+
+    @classmethod
+    def mul(cls, x: Ival, y: Ival) -> Ival:
+        """
+        Multiply intervals.
+
+        The result is the hull of 4 products of bounds.
+        If all bounds are finite, each product is one ``map`` call of ``*``.
+        Otherwise, it is computed by the private helper, which takes product of 0 and +-inf as 0.
+
+        :param x: Multiplicand intervals.
+        :type x: Ival
+        :param y: Multiplier intervals.
+        :type y: Ival
+
+        :return: Product of intervals.
+        :rtype: Ival
+        """
+        (a, b), (c, d) = cls.__bcast(x, y)
+
+        if cls.__finite(a, b, c, d):
+            p: List[List[float]] = [list(map(mul, a, c)), list(map(mul, a, d)), list(map(mul, b, c)),
+                                    list(map(mul, b, d))]
+
+            return cls.__pt(Ival(cls.dn(map(min, *p)), cls.up(map(max, *p))), mul, cls.__two_prod, (a, b), (c, d))
+
+        lo, hi = zip(*map(cls.__mul, a, b, c, d))
+
+        return Ival(cls.dn(lo), cls.up(hi))
+
+    @classmethod
+    def recip(cls, x: Ival) -> Tuple[Ival, bool]:
+        """
+        Reciprocal of intervals.
+
+        If no interval contains 0, the result is ``[1 / b, 1 / a]`` for ``[a, b]``, which is two ``map`` calls of
+        ``/``.
+        Otherwise, it is computed by the private helper implementing the computation rules.
+
+        :param x: Intervals whose reciprocal is to be computed.
+        :type x: Ival
+
+        :return: Reciprocal of intervals and flag for some interval containing 0.
+        :rtype: Tuple[Ival, bool]
+        """
+        if not cls.__zero(x.lo, x.hi):
+            res: Ival = Ival(cls.dn(map(truediv, repeat(1.0), x.hi)), cls.up(map(truediv, repeat(1.0), x.lo)))
+
+            return cls.__pt(res, truediv, cls.__two_div, ([1.0] * len(x), [1.0] * len(x)), (x.lo, x.hi)), False
+
+        lo, hi = zip(*map(cls.__recip, x.lo, x.hi))
+
+        return Ival(cls.dn(lo), cls.up(hi)), True
+
+    @classmethod
+    def div(cls, x: Ival, y: Ival) -> Tuple[Ival, bool]:
+        """
+        Divide intervals.
+
+        If all bounds are finite and no divisor contains 0, the result is the hull of 4 quotients of bounds.
+        Otherwise, it is the product of dividend and reciprocal of divisor.
+
+        :param x: Dividend intervals.
+        :type x: Ival
+        :param y: Divisor intervals.
+        :type y: Ival
+
+        :return: Quotient of intervals and flag for some divisor containing 0.
+        :rtype: Tuple[Ival, bool]
+        """
+        (a, b), (c, d) = cls.__bcast(x, y)
+
+        if cls.__finite(a, b, c, d) and not cls.__zero(c, d):
+            q: List[List[float]] = [list(map(truediv, a, c)), list(map(truediv, a, d)), list(map(truediv, b, c)),
+                                    list(map(truediv, b, d))]
+
+            res: Ival = Ival(cls.dn(map(min, *q)), cls.up(map(max, *q)))
+
+            return cls.__pt(res, truediv, cls.__two_div, (a, b), (c, d)), False
+
+        inv, pole = cls.recip(y)
+
+        return cls.mul(x, inv), pole
+
+    @classmethod
+    def clip(cls, x: Ival, a: float, b: float) -> Tuple[Ival, bool]:
+        """
+        Restrict intervals to the domain ``[a, b]``.
+
+        Intervals which do not meet the domain become empty.
+        Signed zeros are normalized to 0 so that kernels do not regard -0 as negative.
+
+        :param x: Intervals to be restricted.
+        :type x: Ival
+        :param a: Lower bound of domain.
+        :type a: float
+        :param b: Upper bound of domain.
+        :type b: float
+
+        :return: Restricted intervals and flag for some interval not contained in the domain.
+        :rtype: Tuple[Ival, bool]
+        """
+        out: bool = any(map(lt, x.lo, repeat(a))) or any(map(gt, x.hi, repeat(b)))
+        lo: List[float] = list(map(add, map(max, x.lo, repeat(a)), repeat(0.0)))
+        hi: List[float] = list(map(add, map(min, x.hi, repeat(b)), repeat(0.0)))
+
+        if any(map(gt, lo, hi)):
+            lo, hi = zip(*[(math.nan, math.nan) if l > h else (l, h) for l, h in zip(lo, hi)])
+            lo, hi = list(lo), list(hi)
+
+        return Ival(lo, hi), out
+
+    @classmethod
+    def gap(cls, x: Ival, r: float) -> bool:
+        """
+        Check whether some interval meets the open interval ``(-r, r)``.
+
+        It is the domain check of functions defined only for ``|x| >= r``.
+
+        :param x: Intervals to be checked.
+        :type x: Ival
+        :param r: Radius of the open interval.
+        :type r: float
+
+        :return: True if some interval meets the open interval. False otherwise.
+        :rtype: bool
+        """
+        return any(map(and_, map(lt, x.lo, repeat(r)), map(gt, x.hi, repeat(-r))))
+
+    @classmethod
+    def mono(cls, f: Callable[[List[float]], List[float]], x: Ival, inc: bool = True, ulp: int = 2,
+             rng: Tuple[float, float] = (-math.inf, math.inf)) -> Ival:
+        """
+        Apply monotone function to intervals.
+
+        The result is ``[f(a), f(b)]`` for increasing function and ``[f(b), f(a)]`` for decreasing function, moved
+        outward by the given # of ulps and clipped to the range of the function.
+        Intervals must be in the domain of the function.
+
+        :param f: Kernel of function which maps list of points to list of values.
+        :type f: Callable[[List[float]], List[float]]
+        :param x: Intervals where function is to be applied.
+        :type x: Ival
+        :param inc: Flag for increasing function. (Default: True)
+        :type inc: bool
+        :param ulp: # of ulps to be moved. (Default: 2)
+        :type ulp: int
+        :param rng: Range of function. (Default: (-inf, inf))
+        :type rng: Tuple[float, float]
+
+        :return: Image of intervals.
+        :rtype: Ival
+        """
+        lo, hi = (f(x.lo), f(x.hi)) if inc else (f(x.hi), f(x.lo))
+        lo, hi = cls.dn(lo, ulp), cls.up(hi, ulp)
+
+        if rng[0] > -math.inf:
+            lo = list(map(max, lo, repeat(rng[0])))
+
+        if rng[1] < math.inf:
+            hi = list(map(min, hi, repeat(rng[1])))
+
+        return Ival(lo, hi)
+
+    @classmethod
+    def even(cls, f: Callable[[List[float]], List[float]], x: Ival, ulp: int = 2,
+             rng: Tuple[float, float] = (-math.inf, math.inf)) -> Ival:
+        """
+        Apply even function which is increasing on ``[0, inf]`` to intervals.
+
+        The function is applied to ``[mig(x), mag(x)]`` where mignitude is the least absolute value in the interval and
+        magnitude is the largest one.
+        Here, mignitude of ``[a, b]`` is ``max(a, -b, 0)`` and magnitude is ``max(-a, b)``.
+
+        :param f: Kernel of function which maps list of points to list of values.
+        :type f: Callable[[List[float]], List[float]]
+        :param x: Intervals where function is to be applied.
+        :type x: Ival
+        :param ulp: # of ulps to be moved. (Default: 2)
+        :type ulp: int
+        :param rng: Range of function. (Default: (-inf, inf))
+        :type rng: Tuple[float, float]
+
+        :return: Image of intervals.
+        :rtype: Ival
+        """
+        mig: List[float] = list(map(max, x.lo, map(neg, x.hi), repeat(0.0)))
+        mag: List[float] = list(map(max, map(neg, x.lo), x.hi))
+
+        return cls.mono(f, Ival(mig, mag), True, ulp, rng)
+
+    @classmethod
+    def periodic(cls, f: Callable[[List[float]], List[float]], x: Ival, top: float, ulp: int = 2,
+                 rng: Tuple[float, float] = (-1.0, 1.0)) -> Ival:
+        """
+        Apply periodic function with period 2pi to intervals.
+
+        The function must be monotone between its maximum at ``top + 2kpi`` and minimum at ``top + pi + 2kpi``.
+        The result is the hull of values at the end points, and it is extended to the maximum or minimum if the interval
+        contains one of them.
+        Thus it is 4 ``map`` calls for the end points and the extrema check is a few more.
+
+        :param f: Kernel of function which maps list of points to list of values.
+        :type f: Callable[[List[float]], List[float]]
+        :param x: Intervals where function is to be applied.
+        :type x: Ival
+        :param top: Point where the function attains its maximum.
+        :type top: float
+        :param ulp: # of ulps to be moved. (Default: 2)
+        :type ulp: int
+        :param rng: Minimum and maximum of function. (Default: (-1, 1))
+        :type rng: Tuple[float, float]
+
+        :return: Image of intervals.
+        :rtype: Ival
+        """
+        lo, hi, empty = cls.__wrap(x)
+        top_tb: Tuple[float, float] = (-math.inf, rng[1])  # Upper bound indexed by whether maximum is in interval.
+        bot_tb: Tuple[float, float] = (math.inf, rng[0])  # Lower bound indexed by whether minimum is in interval.
+        fa: List[float] = f(lo)
+        fb: List[float] = f(hi)
+        top_hit: List[bool] = cls.__hit(lo, hi, top, 2 * math.pi)
+        bot_hit: List[bool] = cls.__hit(lo, hi, top + math.pi, 2 * math.pi)
+        lo = cls.dn(map(min, fa, fb), ulp)
+        hi = cls.up(map(max, fa, fb), ulp)
+        lo = list(map(max, repeat(rng[0]), map(min, lo, map(bot_tb.__getitem__, bot_hit))))
+        hi = list(map(min, repeat(rng[1]), map(max, hi, map(top_tb.__getitem__, top_hit))))
+
+        return cls.where(empty, Ival(lo, hi), Ival([math.nan], [math.nan]))
+
+    @classmethod
+    def branch(cls, f: Callable[[List[float]], List[float]], x: Ival, pole: float, inc: bool = True,
+               ulp: int = 2) -> Tuple[Ival, bool]:
+        """
+        Apply function with poles at ``pole + kpi`` which is monotone between them to intervals.
+
+        If the interval contains no pole, it is bounded as ``IvalArith.mono`` does.
+        Otherwise, the result is the entire line.
+
+        :param f: Kernel of function which maps list of points to list of values.
+        :type f: Callable[[List[float]], List[float]]
+        :param x: Intervals where function is to be applied.
+        :type x: Ival
+        :param pole: Pole of function.
+        :type pole: float
+        :param inc: Flag for increasing function. (Default: True)
+        :type inc: bool
+        :param ulp: # of ulps to be moved. (Default: 2)
+        :type ulp: int
+
+        :return: Image of intervals and flag for some interval containing pole.
+        :rtype: Tuple[Ival, bool]
+        """
+        lo, hi, empty = cls.__wrap(x)
+        hit: List[bool] = cls.__hit(lo, hi, pole, math.pi)
+        res: Ival = cls.mono(f, Ival(lo, hi), inc, ulp)
+        res = cls.where(hit, res, Ival([-math.inf], [math.inf]))
+
+        return cls.where(empty, res, Ival([math.nan], [math.nan])), any(hit)
+
+    @classmethod
+    def exp(cls, x: Ival) -> Ival:
+        """
+        Exponential of intervals.
+
+        :param x: Intervals whose exponential is to be computed.
+        :type x: Ival
+
+        :return: Exponential of intervals.
+        :rtype: Ival
+        """
+        return cls.mono(partial(cls.__safe, math.exp, edge=lambda t: math.inf), x, rng=(0.0, math.inf))
+
+    @classmethod
+    def log(cls, x: Ival) -> Tuple[Ival, bool]:
+        """
+        Natural logarithm of intervals.
+
+        Intervals are restricted to ``[0, inf]`` first, and the logarithm of 0 is -inf.
+
+        :param x: Intervals whose logarithm is to be computed.
+        :type x: Ival
+
+        :return: Logarithm of intervals and flag for some interval not contained in the domain.
+        :rtype: Tuple[Ival, bool]
+        """
+        x, out = cls.clip(x, 0.0, math.inf)
+
+        return cls.mono(partial(cls.__safe, math.log, edge=lambda t: -math.inf), x), out
+
+    @classmethod
+    def __pt_pow(cls, x: Ival, n: int, res: Ival) -> Ival:
+        """
+        Replace power of integer points by exact values.
+
+        If the base is a single integer point m and ``|m|^n`` has at most 53 bits, the power is computed exactly in
+        integer arithmetic.
+        Thus powers of constants, such as the exponent ``3 ** 1`` in ``x ** 3 ** 1``, stay single points.
+
+        This method is private and called internally as a helper of ``IvalArith.pow``.
+
+        :param x: Base intervals.
+        :type x: Ival
+        :param n: Positive integer exponent.
+        :type n: int
+        :param res: Enclosure of power computed by the kernel.
+        :type res: Ival
+
+        :return: Enclosure of power.
+        :rtype: Ival
+        """
+        if not any(map(eq, x.lo, x.hi)):
+            return res
+
+        lo, hi = list(res.lo), list(res.hi)
+
+        for i, (a, b) in enumerate(zip(x.lo, x.hi)):
+            if a == b and math.isfinite(a) and a == int(a) and abs(int(a)).bit_length() * n <= 53:
+                lo[i] = hi[i] = float(int(a) ** n)
+
+        return Ival(lo, hi)
+
+    @classmethod
+    def pow(cls, x: Ival, y: Ival) -> Tuple[Ival, bool, bool]:
+        """
+        Power of intervals.
+
+        Power has following computation rules.
+            1. If exponent is a single integer point n which is positive, the result is ``[a^n, b^n]`` for odd n and
+               ``[mig^n, mag^n]`` for even n.
+            2. If exponent is a single integer point n which is negative, the result is reciprocal of ``x^(-n)``.
+            3. If exponent is a single integer point 0, the result is 1.
+            4. Otherwise, the result is ``exp(y * log(x))``, where bases are restricted to ``[0, inf]``.
+        For the rule 1 and 2, power of integer point base is exact if it has at most 53 bits.
+
+        :param x: Base intervals.
+        :type x: Ival
+        :param y: Exponent intervals.
+        :type y: Ival
+
+        :return: Power of intervals, flag for some base not contained in the domain, and flag for some base containing
+                 pole.
+        :rtype: Tuple[Ival, bool, bool]
+        """
+        if len(y) == 1 and y.lo[0] == y.hi[0] and math.isfinite(y.lo[0]) and y.lo[0] == int(y.lo[0]):
+            n: int = int(y.lo[0])
+
+            if n == 0:
+                return Ival([1.0] * len(x), [1.0] * len(x)), False, False
+
+            kern: Callable[[List[float]], List[float]] = \
+                partial(cls.__safe, partial(pow, exp=abs(n)), edge=lambda t: -math.inf if t < 0 and n % 2 else math.inf)
+            res: Ival = cls.__pt_pow(x, abs(n), cls.mono(kern, x) if n % 2 else cls.even(kern, x, rng=(0.0, math.inf)))
+
+            if n > 0:
+                return res, False, False
+
+            res, pole = cls.recip(res)
+
+            return res, False, pole
+
+        base, out = cls.log(x)
+
+        return cls.exp(cls.mul(y, base)), out, False
@@ -4,10 +4,11 @@ from typing import List, TextIO
 
 from Core import Parser, Type, AST, Interpreter, SystemManager, ErrorManager, DB, WarningManager, TypeChecker
 from Error import Error
+from Function import Precision
 from Util import Printer
 
 
-def main(debug: bool = False, verb: bool = False, to: TextIO = sys.stdout) -> None:
+def main(debug: bool = False, verb: bool = False, to: TextIO = sys.stdout, prec: int = None) -> None:
     """
     Main routine for tiny calculator.
 
@@ -36,7 +37,13 @@ def main(debug: bool = False, verb: bool = False, to: TextIO = sys.stdout) -> No
     :type debug: bool
     :param to: File where the result is to be printed out. (Default: sys.stdout)
     :type to: TextIO
+    :param prec: # of significant digits in arbitrary precision mode. If it is None, numerics are floating point.
+                 (Default: None)
+    :type prec: int
     """
+    # Set precision.
+    Precision.PrecFun.set_prec(prec)
+
     if debug:
         # Attach signal handler.
         try:
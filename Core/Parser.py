@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import math
+from decimal import Decimal
 from typing import List, final, Union, Dict
 
 from Core import Token, AST, Type, WarningManager
@@ -8,6 +9,7 @@ from Error import *
 from Warning import *
 from Operator import *
 from Function import *
+from Function import Error as ErrFun  # Not exported by ``Function`` since it collides with ``Error`` package.
 from Util import Printer
 from Util.Macro import *
 
@@ -40,9 +42,17 @@ class Parser:
         self.__postfix: List[Token.Tok] = []
         self.__tmp_stk: List[Token.Tok] = []
 
+        # Functions are leaves of function toolboxes, which may be split further by the rules they support.
         for fun_category in Function.Fun.__subclasses__():
-            for fun in fun_category.__subclasses__():
-                self.__kword_tb[fun.__name__] = fun
+            fun_l: List[type] = fun_category.__subclasses__()
+
+            while fun_l:
+                fun: type = fun_l.pop()
+
+                if fun.__subclasses__():
+                    fun_l += fun.__subclasses__()
+                else:
+                    self.__kword_tb[fun.__name__] = fun
 
         for const in Type.Const:
             self.__kword_tb[const.name] = const.value
@@ -61,6 +71,24 @@ class Parser:
         self.__infix.clear()
         self.__postfix.clear()
 
+    def __real(self, s: str) -> Union[float, Decimal]:
+        """
+        Parse real numeric.
+
+        If arbitrary precision mode is on, it is parsed as ``Decimal`` exactly, so that it is not rounded to the
+        nearest floating point number.
+        Otherwise, it is parsed as float.
+
+        This method is private and called internally as a helper of ``Parser.__lexer``.
+
+        :param s: String to be parsed.
+        :type s: str
+
+        :return: Parsed numeric.
+        :rtype: Union[float, Decimal]
+        """
+        return Decimal(s) if Precision.PrecFun.prec() else float(s)
+
     def __lexer(self) -> None:
         """
         Lexer(lexical analyzer) for parsing.
@@ -114,7 +142,7 @@ class Parser:
                     # If there is nothing more, we are done.
                     parsed: int = int(self.__line[start:pos])  # Parsed numeric.
 
-                    if is_bigint(parsed):
+                    if is_bigint(parsed) and not Precision.PrecFun.prec():
                         WarningManager.WarnManager.inst().push(ParserWarning.NumWarn(58, start))
 
                     self.__add_tok(Token.Num(parsed, start))
@@ -131,9 +159,9 @@ class Parser:
                     if pos == len(self.__line) or not (
                             is_dot(self.__line[pos]) or is_exp(self.__line[pos]) or is_imag(self.__line[pos])):
                         # If there is no additional exponentation, stop.
-                        parsed: float = float(self.__line[start:pos])  # Parsed numeric.
+                        parsed: Union[float, Decimal] = self.__real(self.__line[start:pos])  # Parsed numeric.
 
-                        if math.isinf(parsed):
+                        if type(parsed) == float and math.isinf(parsed):
                             WarningManager.WarnManager.inst().push(ParserWarning.NumWarn(59, start))
 
                         self.__add_tok(Token.Num(parsed, start))
@@ -142,9 +170,9 @@ class Parser:
                     elif is_dot(self.__line[pos]):
                         # Decimal point cannot appear more than once.
                         pos -= 1
-                        parsed: float = float(self.__line[start:pos])  # Parsed numeric.
+                        parsed: Union[float, Decimal] = self.__real(self.__line[start:pos])  # Parsed numeric.
 
-                        if math.isinf(parsed):
+                        if type(parsed) == float and math.isinf(parsed):
                             WarningManager.WarnManager.inst().push(ParserWarning.NumWarn(59, start))
 
                         self.__add_tok(Token.Num(parsed, start))
@@ -155,9 +183,9 @@ class Parser:
                         # Additional exponent must be followed by integer.
                         if pos == len(self.__line):
                             pos -= 1
-                            parsed: float = float(self.__line[start:pos])  # Parsed numeric.
+                            parsed: Union[float, Decimal] = self.__real(self.__line[start:pos])  # Parsed numeric.
 
-                            if math.isinf(parsed):
+                            if type(parsed) == float and math.isinf(parsed):
                                 WarningManager.WarnManager.inst().push(ParserWarning.NumWarn(59, start))
 
                             self.__add_tok(Token.Num(parsed, start))
@@ -166,9 +194,9 @@ class Parser:
                         elif is_sgn(self.__line[pos]):
                             if pos + 1 == len(self.__line[pos]) or not is_digit(self.__line[pos + 1]):
                                 pos -= 1
-                                parsed: float = float(self.__line[start:pos])  # Parsed numeric.
+                                parsed: Union[float, Decimal] = self.__real(self.__line[start:pos])  # Parsed numeric.
 
-                                if math.isinf(parsed):
+                                if type(parsed) == float and math.isinf(parsed):
                                     WarningManager.WarnManager.inst().push(ParserWarning.NumWarn(59, start))
 
                                 self.__add_tok(Token.Num(parsed, start))
@@ -178,9 +206,9 @@ class Parser:
                             pos += 1
                         elif not is_digit(self.__line[pos]):
                             pos -= 1
-                            parsed: float = float(self.__line[start:pos])  # Parsed numeric.
+                            parsed: Union[float, Decimal] = self.__real(self.__line[start:pos])  # Parsed numeric.
 
-                            if math.isinf(parsed):
+                            if type(parsed) == float and math.isinf(parsed):
                                 WarningManager.WarnManager.inst().push(ParserWarning.NumWarn(59, start))
 
                             self.__add_tok(Token.Num(parsed, start))
@@ -193,9 +221,9 @@ class Parser:
 
                         if pos == len(self.__line) or not is_imag(self.__line[pos]):
                             # If there is nothing more, we are done.
-                            parsed: float = float(self.__line[start:pos])  # Parsed numeric.
+                            parsed: Union[float, Decimal] = self.__real(self.__line[start:pos])  # Parsed numeric.
 
-                            if math.isinf(parsed):
+                            if type(parsed) == float and math.isinf(parsed):
                                 WarningManager.WarnManager.inst().push(ParserWarning.NumWarn(59, start))
 
                             self.__add_tok(Token.Num(parsed, start))
@@ -203,9 +231,9 @@ class Parser:
                             continue
                         else:
                             # If there is imaginary unit, parse it.
-                            parsed: float = float(self.__line[start:pos])  # Parsed numeric.
+                            parsed: Union[float, Decimal] = self.__real(self.__line[start:pos])  # Parsed numeric.
 
-                            if math.isinf(parsed):
+                            if type(parsed) == float and math.isinf(parsed):
                                 WarningManager.WarnManager.inst().push(ParserWarning.NumWarn(59, start))
 
                             self.__add_tok(Token.Num(complex(0, parsed), start))
@@ -214,9 +242,9 @@ class Parser:
                             continue
                     else:
                         # If there is imaginary unit, parse it.
-                        parsed: float = float(self.__line[start:pos])  # Parsed numeric.
+                        parsed: Union[float, Decimal] = self.__real(self.__line[start:pos])  # Parsed numeric.
 
-                        if math.isinf(parsed):
+                        if type(parsed) == float and math.isinf(parsed):
                             WarningManager.WarnManager.inst().push(ParserWarning.NumWarn(59, start))
 
                         self.__add_tok(Token.Num(complex(0, parsed), start))
@@ -232,7 +260,7 @@ class Parser:
                         pos -= 1
                         parsed: int = int(self.__line[start:pos])  # Parsed numeric.
 
-                        if is_bigint(parsed):
+                        if is_bigint(parsed) and not Precision.PrecFun.prec():
                             WarningManager.WarnManager.inst().push(ParserWarning.NumWarn(58, start))
 
                         self.__add_tok(Token.Num(parsed, start))
@@ -243,7 +271,7 @@ class Parser:
                             pos -= 1
                             parsed: int = int(self.__line[start:pos])  # Parsed numeric.
 
-                            if is_bigint(parsed):
+                            if is_bigint(parsed) and not Precision.PrecFun.prec():
                                 WarningManager.WarnManager.inst().push(ParserWarning.NumWarn(58, start))
 
                             self.__add_tok(Token.Num(parsed, start))
@@ -255,7 +283,7 @@ class Parser:
                         pos -= 1
                         parsed: int = int(self.__line[start:pos])  # Parsed numeric.
 
-                        if is_bigint(parsed):
+                        if is_bigint(parsed) and not Precision.PrecFun.prec():
                             WarningManager.WarnManager.inst().push(ParserWarning.NumWarn(58, start))
 
                         self.__add_tok(Token.Num(parsed, start))
@@ -268,9 +296,9 @@ class Parser:
 
                     if pos == len(self.__line) or not is_imag(self.__line[pos]):
                         # If there is nothing more, we are done.
-                        parsed: float = float(self.__line[start:pos])  # Parsed numeric.
+                        parsed: Union[float, Decimal] = self.__real(self.__line[start:pos])  # Parsed numeric.
 
-                        if math.isinf(parsed):
+                        if type(parsed) == float and math.isinf(parsed):
                             WarningManager.WarnManager.inst().push(ParserWarning.NumWarn(59, start))
 
                         self.__add_tok(Token.Num(parsed, start))
@@ -278,9 +306,9 @@ class Parser:
                         continue
                     else:
                         # If there is imaginary unit, parse it.
-                        parsed: float = float(self.__line[start:pos])  # Parsed numeric.
+                        parsed: Union[float, Decimal] = self.__real(self.__line[start:pos])  # Parsed numeric.
 
-                        if math.isinf(parsed):
+                        if type(parsed) == float and math.isinf(parsed):
                             WarningManager.WarnManager.inst().push(ParserWarning.NumWarn(59, start))
 
                         self.__add_tok(Token.Num(complex(0, parsed), start))
@@ -291,7 +319,7 @@ class Parser:
                     # If there is imaginary unit, parse it.
                     parsed: int = int(self.__line[start:pos])  # Parsed numeric.
 
-                    if is_bigint(parsed):
+                    if is_bigint(parsed) and not Precision.PrecFun.prec():
                         WarningManager.WarnManager.inst().push(ParserWarning.NumWarn(59, start))
                         parsed = math.inf
 
@@ -326,14 +354,14 @@ class Parser:
                 if pos == len(self.__line) or not (
                         is_dot(self.__line[pos]) or is_exp(self.__line[pos]) or is_imag(self.__line[pos])):
                     # If there is no additional exponentation, stop.
-                    self.__add_tok(Token.Num(float(self.__line[start:pos]), start))
+                    self.__add_tok(Token.Num(self.__real(self.__line[start:pos]), start))
 
                     continue
                 elif is_dot(self.__line[pos]):
                     # Decimal point cannot appear more than once.
-                    parsed: float = float(self.__line[start:pos])  # Parsed numeric.
+                    parsed: Union[float, Decimal] = self.__real(self.__line[start:pos])  # Parsed numeric.
 
-                    if math.isinf(parsed):
+                    if type(parsed) == float and math.isinf(parsed):
                         WarningManager.WarnManager.inst().push(ParserWarning.NumWarn(59, start))
 
                     self.__add_tok(Token.Num(parsed, start))
@@ -344,9 +372,9 @@ class Parser:
                     # Additional exponent must be followed by integer.
                     if pos == len(self.__line):
                         pos -= 1
-                        parsed: float = float(self.__line[start:pos])  # Parsed numeric.
+                        parsed: Union[float, Decimal] = self.__real(self.__line[start:pos])  # Parsed numeric.
 
-                        if math.isinf(parsed):
+                        if type(parsed) == float and math.isinf(parsed):
                             WarningManager.WarnManager.inst().push(ParserWarning.NumWarn(59, start))
 
                         self.__add_tok(Token.Num(parsed, start))
@@ -355,9 +383,9 @@ class Parser:
                     elif is_sgn(self.__line[pos]):
                         if pos + 1 == len(self.__line[pos]) or not is_digit(self.__line[pos + 1]):
                             pos -= 1
-                            parsed: float = float(self.__line[start:pos])  # Parsed numeric.
+                            parsed: Union[float, Decimal] = self.__real(self.__line[start:pos])  # Parsed numeric.
 
-                            if math.isinf(parsed):
+                            if type(parsed) == float and math.isinf(parsed):
                                 WarningManager.WarnManager.inst().push(ParserWarning.NumWarn(59, start))
 
                             self.__add_tok(Token.Num(parsed, start))
@@ -367,9 +395,9 @@ class Parser:
                         pos += 1
                     elif not is_digit(self.__line[pos]):
                         pos -= 1
-                        parsed: float = float(self.__line[start:pos])  # Parsed numeric.
+                        parsed: Union[float, Decimal] = self.__real(self.__line[start:pos])  # Parsed numeric.
 
-                        if math.isinf(parsed):
+                        if type(parsed) == float and math.isinf(parsed):
                             WarningManager.WarnManager.inst().push(ParserWarning.NumWarn(59, start))
 
                         self.__add_tok(Token.Num(parsed, start))
@@ -382,9 +410,9 @@ class Parser:
 
                     if pos == len(self.__line) or not is_imag(self.__line[pos]):
                         # If there is nothing more, we are done.
-                        parsed: float = float(self.__line[start:pos])  # Parsed numeric.
+                        parsed: Union[float, Decimal] = self.__real(self.__line[start:pos])  # Parsed numeric.
 
-                        if math.isinf(parsed):
+                        if type(parsed) == float and math.isinf(parsed):
                             WarningManager.WarnManager.inst().push(ParserWarning.NumWarn(59, start))
 
                         self.__add_tok(Token.Num(parsed, start))
@@ -392,9 +420,9 @@ class Parser:
                         continue
                     else:
                         # If there is imaginary unit, parse it.
-                        parsed: float = float(self.__line[start:pos])  # Parsed numeric.
+                        parsed: Union[float, Decimal] = self.__real(self.__line[start:pos])  # Parsed numeric.
 
-                        if math.isinf(parsed):
+                        if type(parsed) == float and math.isinf(parsed):
                             WarningManager.WarnManager.inst().push(ParserWarning.NumWarn(59, start))
 
                         self.__add_tok(Token.Num(complex(0, parsed), start))
@@ -431,6 +459,10 @@ class Parser:
                 if type(find) == bool:
                     self.__add_tok(Token.Bool(find, start))
                 elif type(find) == float:
+                    # Constants are computed again in the target precision if arbitrary precision mode is on.
+                    if Precision.PrecFun.prec():
+                        find = Precision.PrecFun.const(self.__line[start:pos])
+
                     self.__add_tok(Token.Num(find, start))
                 elif type(find) == type:
                     self.__add_tok(Token.Fun(find, start))
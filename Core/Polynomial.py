@@ -1,5 +1,15 @@
-from typing import final, List, Tuple
+from __future__ import annotations
+
+import cmath
+import math
+import sys
 from functools import reduce
+from itertools import chain, repeat
+from operator import add, and_, attrgetter, le, lshift, mul, neg, rshift, sub, truediv
+from typing import final, Any, Callable, Dict, Final, List, Optional, Tuple, Union
+
+from Core import AST, Dual, Interval
+from Warning import Warning
 
 
 class Poly:
@@ -19,15 +29,123 @@ class NilPoly(Poly):
 
 @final
 class UniPoly(Poly):
-    def __init__(self, var: int, coef: List[int]) -> None:
+    """
+    Univariate polynomial.
+
+    Coefficients are in ascending order of degree, that is, the i-th coefficient is that of ``x^i``.
+    Zero polynomial has no coefficient and its degree is -1.
+    Polynomial of degree at most 0 is constant, and it can be combined with polynomial of any variable.
+
+    Polynomial is evaluated as a function of its variable.
+    Thus it provides ``eval``, ``ival`` and ``dual`` as functions do, and it can be a slot of ``Tape.Tape``.
+
+    :ivar __var: Key of variable. None for constant.
+    :ivar __coef: Coefficients in ascending order of degree.
+    :ivar __deg: Degree.
+    """
+
+    def __init__(self, var: Optional[int], coef: list) -> None:
         super().__init__()
-        self.__var: int = var
-        self.__coef: List[int] = coef
+        self.__var: Optional[int] = var
+        self.__coef: list = coef
         self.__deg: int = len(self.__coef) - 1
 
     def __del__(self) -> None:
         pass
 
+    def __str__(self) -> str:
+        x: str = AST.AST.var_name(self.__var) if self.__var is not None else 'x'
+        buf: str = ''  # Buffer for terms.
+
+        for k in range(self.__deg, -1, -1):
+            c = self.__coef[k]
+
+            if c == 0:
+                continue
+
+            if type(c) == complex:
+                sgn, c = '+', f'({c})'
+            else:
+                sgn, c = '-' if c < 0 else '+', abs(c)
+
+            mono: str = '' if k == 0 else x if k == 1 else f'{x} ** {k}'  # Monomial of the term.
+            term: str = str(c) if not mono else mono if c == 1 else f'{c} * {mono}'
+            buf += (sgn if sgn == '-' else '') + term if not buf else f' {sgn} {term}'
+
+        return buf if buf else '0'
+
+    @property
+    def var(self) -> Optional[int]:
+        return self.__var
+
+    @property
+    def coef(self) -> list:
+        return self.__coef
+
+    @property
+    def deg(self) -> int:
+        return self.__deg
+
+    def eval(self, x: list) -> Tuple[list, List[Warning.InterpWarn]]:
+        """
+        Evaluate polynomial over batch.
+
+        It is evaluated by Horner's method.
+        For the rules, refer to the comments of ``PolyArith.horner``.
+        Since it has no pole and no domain, it generates no warning.
+
+        :param x: Points where polynomial is to be evaluated.
+        :type x: list
+
+        :return: Computed values and list of generated warnings.
+        :rtype: Tuple[list, List[Warning.InterpWarn]]
+        """
+        return PolyArith.horner(self.__coef, x), []
+
+    def ival(self, x: Interval.Ival) -> Tuple[Interval.Ival, List[Warning.InterpWarn]]:
+        """
+        Evaluate polynomial over intervals.
+
+        It is evaluated by Horner's method in interval arithmetic, which encloses the exact range but may be wider than
+        it, since each step bounds the variable independently.
+
+        :param x: Intervals where polynomial is to be evaluated.
+        :type x: Interval.Ival
+
+        :return: Enclosure of the result and list of generated warnings.
+        :rtype: Tuple[Interval.Ival, List[Warning.InterpWarn]]
+        """
+        if self.__deg <= 0:
+            res: Interval.Ival = Interval.Ival.point(self.__coef[0] if self.__coef else 0)
+
+            return Interval.Ival(res.lo * len(x), res.hi * len(x)), []
+
+        res: Interval.Ival = Interval.Ival.point(self.__coef[-1])
+
+        for c in reversed(self.__coef[:-1]):
+            res = Interval.IvalArith.mul(res, x)
+
+            if c != 0:
+                res = Interval.IvalArith.add(res, Interval.Ival.point(c))
+
+        return res, []
+
+    def dual(self, x: Dual.Dual) -> Tuple[Dual.Dual, List[Warning.InterpWarn]]:
+        """
+        Evaluate polynomial over dual numbers.
+
+        Values and derivatives are evaluated by Horner's method, where the coefficients of derivative are computed
+        only if some tangent of operand is not identically 0.
+
+        :param x: Points where polynomial is to be evaluated.
+        :type x: Dual.Dual
+
+        :return: Computed values with tangents and list of generated warnings.
+        :rtype: Tuple[Dual.Dual, List[Warning.InterpWarn]]
+        """
+        return Dual.DualArith.lift(x, PolyArith.horner(self.__coef, x.v),
+                                   lambda s, f: PolyArith.horner(PolyArith.deriv(self).coef, s)), []
+
 
 @final
 class UniSparPoly(Poly):
@@ -55,11 +173,1503 @@ class MultiPoly(Poly):
 
 @final
 class MultiSparPoly(Poly):
-    def __init__(self, var: List[int], coef: List[int]) -> None:
+    """
+    Sparse multivariate polynomial.
+
+    Terms are kept in a dictionary from exponents to nonzero coefficients, where the exponents are tuple whose i-th
+    item is the exponent of the i-th variable.
+    Thus the coefficient of a monomial is found in O(1), and only the terms which are present cost storage, so that
+    ``x ** 100 * y + 1`` has two terms rather than a dense array of 202 coefficients.
+    Variables are in ascending order of their keys, so polynomials of the same variables share the layout of
+    exponents.
+    Zero polynomial has no term and its degree is -1, and constant polynomial may have no variable.
+
+    Dictionary has no order of terms.
+    For canonical form, terms are sorted by monomial ordering on demand by ``SparPolyArith.terms``.
+
+    :ivar __var: Keys of variables in ascending order.
+    :ivar __coef: Coefficients indexed by exponents.
+    :ivar __deg: Total degree.
+    """
+
+    def __init__(self, var: List[int], coef: Dict[Tuple[int, ...], Union[int, float, complex]]) -> None:
         super().__init__()
-        self.__var: int = var
-        self.__coef: List[Tuple[int, List[int]]] = coef
-        self.__deg: int = max(deg)
+        self.__var: List[int] = var
+        self.__coef: Dict[Tuple[int, ...], Union[int, float, complex]] = coef
+        self.__deg: int = max(map(sum, coef), default=-1)
 
     def __del__(self) -> None:
         pass
+
+    def __len__(self) -> int:
+        return len(self.__coef)
+
+    def __str__(self) -> str:
+        x: List[str] = [AST.AST.var_name(v) for v in self.__var]
+        buf: str = ''  # Buffer for terms.
+
+        for e, c in SparPolyArith.terms(self):
+            if type(c) == complex:
+                sgn, c = '+', f'({c})'
+            else:
+                sgn, c = '-' if c < 0 else '+', abs(c)
+
+            # Monomial of the term.
+            mono: str = ' * '.join(x[i] if k == 1 else f'{x[i]} ** {k}' for i, k in enumerate(e) if k > 0)
+            term: str = str(c) if not mono else mono if c == 1 else f'{c} * {mono}'
+            buf += (sgn if sgn == '-' else '') + term if not buf else f' {sgn} {term}'
+
+        return buf if buf else '0'
+
+    @property
+    def var(self) -> List[int]:
+        return self.__var
+
+    @property
+    def coef(self) -> Dict[Tuple[int, ...], Union[int, float, complex]]:
+        return self.__coef
+
+    @property
+    def deg(self) -> int:
+        return self.__deg
+
+    def eval(self, *x: list) -> Tuple[list, List[Warning.InterpWarn]]:
+        """
+        Evaluate polynomial over batch.
+
+        For the rules, refer to the comments of ``SparPolyArith.eval``.
+        Since it has no pole and no domain, it generates no warning.
+
+        :param x: Points of each variable where polynomial is to be evaluated.
+        :type x: list
+
+        :return: Computed values and list of generated warnings.
+        :rtype: Tuple[list, List[Warning.InterpWarn]]
+        """
+        return SparPolyArith.eval(self, *x), []
+
+
+class PolyArith:
+    """
+    Polynomial arithmetic toolbox.
+
+    Operations on coefficients are chains of ``map`` calls over slices of coefficient lists, so that the inner loops
+    run entirely in C.
+    Results are normalized, that is, trailing zero coefficients are stripped.
+    Integer coefficients stay integer as long as the operation is exact.
+
+    Evaluation is vectorized over batches.
+    That is, the variable is a batch of points, and each coefficient is either a scalar or a batch of the same size,
+    which stands for a batch of polynomials of the same degree.
+    Batch of size 1 is broadcast.
+    Each step of Horner's method is a single multiply-add over the whole batch, so polynomial of degree n costs n steps
+    regardless of the size of the batch, while the original formula calls ``Pow`` for each power.
+
+    Multiplication is adaptive to the degrees and the coefficients.
+    Small ones are multiplied by schoolbook multiplication, mid-range ones by Karatsuba multiplication, and large ones
+    by FFT, while integer coefficients are multiplied exactly by Kronecker substitution.
+
+    Roots are found in batch.
+    Polynomials of moderate degree are solved as eigenvalues of companion matrices, and those of high degree by Aberth
+    method, where all roots of all polynomials of the same degree are updated at once.
+
+    **Reference**
+        * https://en.wikipedia.org/wiki/Horner%27s_method
+        * https://en.wikipedia.org/wiki/Estrin%27s_scheme
+        * https://en.wikipedia.org/wiki/Polynomial_long_division
+        * https://en.wikipedia.org/wiki/Multiplication_algorithm#Polynomial_multiplication
+
+    :cvar __KARATSUBA: Minimum length of the shorter coefficients where Karatsuba multiplication is used.
+    :cvar __FFT: Minimum length of the shorter coefficients where FFT is used.
+    :cvar __KRONECKER: Minimum length of the shorter integer coefficients where Kronecker substitution is used.
+    :cvar __EIG: Maximum degree where roots are found as eigenvalues of companion matrices.
+    :cvar __QR_ITER: Maximum # of QR steps for each eigenvalue.
+    :cvar __ABERTH_ITER: Maximum # of iterations of Aberth method.
+    :cvar __EPS: Machine epsilon.
+    """
+    __KARATSUBA: Final[int] = 64
+    __FFT: Final[int] = 128
+    __KRONECKER: Final[int] = 16
+    __EIG: Final[int] = 2
+    __QR_ITER: Final[int] = 60
+    __ABERTH_ITER: Final[int] = 100
+    __EPS: Final[float] = sys.float_info.epsilon
+
+    def __new__(cls, *args, **kwargs) -> None:
+        raise NotImplementedError
+
+    @classmethod
+    def __trim(cls, coef: list) -> list:
+        """
+        Strip trailing zero coefficients.
+
+        This method is private and called internally as a helper of the operations.
+
+        :param coef: Coefficients to be stripped. It is modified in place.
+        :type coef: list
+
+        :return: Stripped coefficients.
+        :rtype: list
+        """
+        while coef and coef[-1] == 0:
+            coef.pop()
+
+        return coef
+
+    @classmethod
+    def __var(cls, p: UniPoly, q: UniPoly) -> Optional[int]:
+        """
+        Find common variable of polynomials.
+
+        Constant polynomial takes the variable of the other one.
+
+        This method is private and called internally as a helper of the operations.
+
+        :param p: First polynomial.
+        :type p: UniPoly
+        :param q: Second polynomial.
+        :type q: UniPoly
+
+        :return: Common variable.
+        :rtype: Optional[int]
+
+        :raise ValueError: If polynomials are of different variables.
+        """
+        if p.deg <= 0 or p.var == q.var:
+            return q.var if q.var is not None else p.var
+        elif q.deg <= 0:
+            return p.var
+        else:
+            raise ValueError
+
+    @classmethod
+    def __quo(cls, a: Union[int, float, complex], b: Union[int, float, complex]) -> Union[int, float, complex]:
+        """
+        Quotient of coefficients.
+
+        Quotient of integers is integer if it is exact.
+
+        This method is private and called internally as a helper of ``PolyArith.divmod``.
+
+        :param a: Dividend.
+        :type a: Union[int, float, complex]
+        :param b: Divisor.
+        :type b: Union[int, float, complex]
+
+        :return: Quotient.
+        :rtype: Union[int, float, complex]
+        """
+        return a // b if type(a) == int and type(b) == int and a % b == 0 else a / b
+
+    @classmethod
+    def __col(cls, c: Union[int, float, complex, list], sz: int):
+        """
+        Iterate coefficient over batch.
+
+        Scalar is repeated, and batch is broadcast.
+
+        This method is private and called internally as a helper of the evaluations.
+
+        :param c: Coefficient.
+        :type c: Union[int, float, complex, list]
+        :param sz: Size of batch.
+        :type sz: int
+
+        :return: Iterable over the batch.
+        """
+        return Dual.DualArith.ext(c, sz) if type(c) == list else repeat(c)
+
+    @classmethod
+    def __sz(cls, coef: list, x: list) -> int:
+        """
+        Find size of batch.
+
+        This method is private and called internally as a helper of the evaluations.
+
+        :param coef: Coefficients, each of which is scalar or batch.
+        :type coef: list
+        :param x: Points.
+        :type x: list
+
+        :return: Size of batch.
+        :rtype: int
+
+        :raise ValueError: If batches are of different sizes.
+        """
+        sz: int = max([len(x)] + [len(c) for c in coef if type(c) == list])
+
+        if len(x) not in (1, sz) or any(type(c) == list and len(c) not in (1, sz) for c in coef):
+            raise ValueError
+
+        return sz
+
+    @classmethod
+    def const(cls, c: Union[int, float, complex], var: Optional[int] = None) -> UniPoly:
+        """
+        Make constant polynomial.
+
+        :param c: Value of constant.
+        :type c: Union[int, float, complex]
+        :param var: Key of variable. (Default: None)
+        :type var: Optional[int]
+
+        :return: Constant polynomial. Zero polynomial if c is 0.
+        :rtype: UniPoly
+        """
+        return UniPoly(var, cls.__trim([c]))
+
+    @classmethod
+    def neg(cls, p: UniPoly) -> UniPoly:
+        """
+        Negate polynomial.
+
+        :param p: Polynomial to be negated.
+        :type p: UniPoly
+
+        :return: Negated polynomial.
+        :rtype: UniPoly
+        """
+        return UniPoly(p.var, list(map(neg, p.coef)))
+
+    @classmethod
+    def add(cls, p: UniPoly, q: UniPoly) -> UniPoly:
+        """
+        Add polynomials.
+
+        :param p: Augend polynomial.
+        :type p: UniPoly
+        :param q: Addend polynomial.
+        :type q: UniPoly
+
+        :return: Sum of polynomials.
+        :rtype: UniPoly
+
+        :raise ValueError: If polynomials are of different variables.
+        """
+        var: Optional[int] = cls.__var(p, q)
+        a, b = (p.coef, q.coef) if p.deg >= q.deg else (q.coef, p.coef)
+
+        return UniPoly(var, cls.__trim(list(map(add, a[:len(b)], b)) + a[len(b):]))
+
+    @classmethod
+    def sub(cls, p: UniPoly, q: UniPoly) -> UniPoly:
+        """
+        Subtract polynomials.
+
+        :param p: Minuend polynomial.
+        :type p: UniPoly
+        :param q: Subtrahend polynomial.
+        :type q: UniPoly
+
+        :return: Difference of polynomials.
+        :rtype: UniPoly
+
+        :raise ValueError: If polynomials are of different variables.
+        """
+        return cls.add(p, cls.neg(q))
+
+    @classmethod
+    def scale(cls, p: UniPoly, c: Union[int, float, complex]) -> UniPoly:
+        """
+        Multiply polynomial by scalar.
+
+        :param p: Polynomial to be multiplied.
+        :type p: UniPoly
+        :param c: Scalar.
+        :type c: Union[int, float, complex]
+
+        :return: Multiplied polynomial.
+        :rtype: UniPoly
+        """
+        return UniPoly(p.var, cls.__trim(list(map(mul, p.coef, repeat(c)))))
+
+    @classmethod
+    def __acc(cls, res: list, x: list, ofs: int, op: Optional[Callable[[Any, Any], Any]] = None) -> None:
+        """
+        Accumulate coefficients into slice.
+
+        This method is private and called internally as a helper of ``PolyArith.karatsuba``.
+
+        :param res: Coefficients to be accumulated into. It is modified in place.
+        :type res: list
+        :param x: Coefficients to accumulate.
+        :type x: list
+        :param ofs: Offset of the slice.
+        :type ofs: int
+        :param op: Accumulating operation. None for addition. (Default: None)
+        :type op: Optional[Callable[[Any, Any], Any]]
+        """
+        res[ofs:ofs + len(x)] = map(add if op is None else op, res[ofs:ofs + len(x)], x)
+
+    @classmethod
+    def __padd(cls, a: list, b: list) -> list:
+        """
+        Sum of coefficients of different lengths.
+
+        This method is private and called internally as a helper of ``PolyArith.karatsuba``.
+
+        :param a: Longer coefficients.
+        :type a: list
+        :param b: Shorter coefficients.
+        :type b: list
+
+        :return: Sum of coefficients.
+        :rtype: list
+        """
+        return list(map(add, a, b)) + a[len(b):]
+
+    @classmethod
+    def __dft(cls, x: list, inv: bool) -> List[complex]:
+        """
+        Discrete Fourier transform.
+
+        It is iterative radix-2 Cooley-Tukey FFT, where the input is permuted in bit reversed order first and then
+        butterflies of each stage are applied.
+        Butterflies of each stage are vectorized either over blocks, by strided slices, or over twiddles, by contiguous
+        slices, whichever needs fewer ``map`` calls.
+        Thus, a transform of size n costs O(sqrt(n) log(n)) ``map`` calls, while the arithmetic runs entirely in C.
+        Inverse transform is not scaled.
+
+        This method is private and called internally as a helper of ``PolyArith.fft``.
+
+        :param x: Input of size of power of 2.
+        :type x: list
+        :param inv: Flag for inverse transform.
+        :type inv: bool
+
+        :return: Transform of the input.
+        :rtype: List[complex]
+        """
+        n: int = len(x)
+        rev: List[int] = [0]
+
+        while len(rev) < n:
+            rev = [*map(mul, rev, repeat(2))]
+            rev += [*map(add, rev, repeat(1))]
+
+        a: List[complex] = list(map(complex, map(x.__getitem__, rev)))
+        ang: float = (2 if inv else -2) * math.pi / n
+        w: List[complex] = list(map(cmath.rect, repeat(1.0), map(mul, range(n // 2), repeat(ang))))
+        m: int = 2
+
+        while m <= n:
+            h: int = m // 2
+            tw: List[complex] = w[::n // m]
+
+            if h <= n // m:
+                for j in range(h):
+                    u: List[complex] = a[j::m]
+                    v: List[complex] = list(map(mul, a[j + h::m], repeat(tw[j])))
+                    a[j::m] = map(add, u, v)
+                    a[j + h::m] = map(sub, u, v)
+            else:
+                for k in range(0, n, m):
+                    u: List[complex] = a[k:k + h]
+                    v: List[complex] = list(map(mul, a[k + h:k + m], tw))
+                    a[k:k + h] = map(add, u, v)
+                    a[k + h:k + m] = map(sub, u, v)
+
+            m *= 2
+
+        return a
+
+    @classmethod
+    def __pack(cls, c: List[int], nb: int) -> int:
+        """
+        Pack integer coefficients into single integer.
+
+        Each coefficient takes a slot of ``nb`` bytes, and the packed integer is the value of the polynomial at
+        ``2^(8 * nb)``.
+        Each coefficient is offset by the half of the slot to be nonnegative so that the slots are joined as bytes,
+        and the offsets are subtracted at once afterwards.
+
+        This method is private and called internally as a helper of ``PolyArith.kronecker``.
+
+        :param c: Coefficients. Their moduli must be less than the half of the slot.
+        :type c: List[int]
+        :param nb: Size of slot in bytes.
+        :type nb: int
+
+        :return: Packed integer.
+        :rtype: int
+        """
+        off: int = 1 << (8 * nb - 1)
+        raw: bytes = b''.join(map(int.to_bytes, map(add, c, repeat(off)), repeat(nb), repeat('little')))
+
+        return int.from_bytes(raw, 'little') - int.from_bytes(off.to_bytes(nb, 'little') * len(c), 'little')
+
+    @classmethod
+    def school(cls, a: list, b: list) -> list:
+        """
+        Product of coefficients by schoolbook multiplication.
+
+        Each nonzero coefficient of the shorter one adds a scaled slice of the longer one by a single ``map`` call.
+        Thus, it costs O(n) ``map`` calls of size O(m) for coefficients of lengths n <= m.
+
+        :param a: Multiplicand coefficients. It must be nonempty.
+        :type a: list
+        :param b: Multiplier coefficients. It must be nonempty.
+        :type b: list
+
+        :return: Coefficients of the product, which may have trailing zeros.
+        :rtype: list
+        """
+        a, b = (a, b) if len(a) >= len(b) else (b, a)
+        res: list = [0] * (len(a) + len(b) - 1)
+
+        for i, c in enumerate(b):
+            if c != 0:
+                res[i:i + len(a)] = map(add, res[i:i + len(a)], map(mul, a, repeat(c)))
+
+        return res
+
+    @classmethod
+    def karatsuba(cls, a: list, b: list) -> list:
+        """
+        Product of coefficients by Karatsuba multiplication.
+
+        Coefficients are split into the lower and upper halves, and the product is assembled from three half size
+        products, ``a0 * b0``, ``a1 * b1`` and ``(a0 + a1) * (b0 + b1)``, so that it costs O(n^1.585) operations.
+        If the shorter one fits in the lower half of the longer one, only the longer one is split into two products.
+        Below ``PolyArith.__KARATSUBA``, it falls back to ``PolyArith.school``.
+        It is exact for integer coefficients.
+
+        **Reference**
+            * https://en.wikipedia.org/wiki/Karatsuba_algorithm
+
+        :param a: Multiplicand coefficients. It must be nonempty.
+        :type a: list
+        :param b: Multiplier coefficients. It must be nonempty.
+        :type b: list
+
+        :return: Coefficients of the product, which may have trailing zeros.
+        :rtype: list
+        """
+        a, b = (a, b) if len(a) >= len(b) else (b, a)
+
+        if len(b) < cls.__KARATSUBA:
+            return cls.school(a, b)
+
+        m: int = (len(a) + 1) // 2
+        res: list = [0] * (len(a) + len(b) - 1)
+
+        if len(b) <= m:
+            cls.__acc(res, cls.karatsuba(a[:m], b), 0)
+            cls.__acc(res, cls.karatsuba(a[m:], b), m)
+
+            return res
+
+        lo: list = cls.karatsuba(a[:m], b[:m])
+        hi: list = cls.karatsuba(a[m:], b[m:])
+        mid: list = cls.karatsuba(cls.__padd(a[:m], a[m:]), cls.__padd(b[:m], b[m:]))
+        cls.__acc(res, lo, 0)
+        cls.__acc(res, hi, 2 * m)
+        cls.__acc(res, mid, m)
+        cls.__acc(res, lo, m, sub)
+        cls.__acc(res, hi, m, sub)
+
+        return res
+
+    @classmethod
+    def fft(cls, a: list, b: list) -> list:
+        """
+        Product of coefficients by FFT.
+
+        Coefficients are padded to the power of 2 not less than the length of the product, and the product is the
+        inverse transform of the pointwise product of the transforms.
+        For real coefficients, both are packed into the real and imaginary parts of a single complex input, so that it
+        costs one forward and one inverse transform.
+        That is, if ``Z`` is the transform of ``a + ib``, the transform of the product is
+        ``(Z[k]^2 - conj(Z[-k])^2) / 4i``.
+        Otherwise, it costs two forward and one inverse transform.
+        It costs O(n log(n)) operations, but it is subject to rounding errors of the magnitude of
+        ``eps * max(|a|) * max(|b|) * log(n)``, so the result is float or complex even for integer coefficients.
+
+        **Reference**
+            * https://en.wikipedia.org/wiki/Cooley%E2%80%93Tukey_FFT_algorithm
+            * https://en.wikipedia.org/wiki/Convolution_theorem
+
+        :param a: Multiplicand coefficients. It must be nonempty.
+        :type a: list
+        :param b: Multiplier coefficients. It must be nonempty.
+        :type b: list
+
+        :return: Coefficients of the product, which may have trailing zeros.
+        :rtype: list
+        """
+        sz: int = len(a) + len(b) - 1
+        n: int = 1 << (sz - 1).bit_length()
+        a, b = a + [0] * (n - len(a)), b + [0] * (n - len(b))
+
+        if any(type(c) == complex for c in a) or any(type(c) == complex for c in b):
+            res: List[complex] = cls.__dft(list(map(mul, cls.__dft(a, False), cls.__dft(b, False))), True)
+
+            return list(map(mul, res[:sz], repeat(1 / n)))
+
+        z: List[complex] = cls.__dft(list(map(complex, a, b)), False)
+        zc: List[complex] = list(map(complex.conjugate, z[:1] + z[:0:-1]))
+        res: List[complex] = cls.__dft(list(map(mul, map(sub, map(mul, z, z), map(mul, zc, zc)), repeat(-0.25j))), True)
+
+        return list(map(mul, map(attrgetter('real'), res[:sz]), repeat(1 / n)))
+
+    @classmethod
+    def kronecker(cls, a: List[int], b: List[int]) -> List[int]:
+        """
+        Product of integer coefficients by Kronecker substitution.
+
+        Coefficients are packed into single integers by ``PolyArith.__pack``, that is, the polynomials are evaluated at
+        a large power of 2, whose slots are wide enough to hold any coefficient of the product with sign.
+        Then the product of polynomials is unpacked from the product of the integers, which is multiplied by the
+        Karatsuba multiplication of big integers in C.
+        Like ``PolyArith.__pack``, each coefficient of the product is offset by the half of the slot to be nonnegative,
+        so that the slots are split as bytes without borrows.
+        It is exact, and unlike the number theoretic transform, it needs neither modular reduction nor Chinese
+        remaindering for large coefficients.
+
+        **Reference**
+            * https://en.wikipedia.org/wiki/Kronecker_substitution
+            * https://doi.org/10.1145/1576702.1576706
+
+        :param a: Multiplicand coefficients. It must be nonempty.
+        :type a: List[int]
+        :param b: Multiplier coefficients. It must be nonempty.
+        :type b: List[int]
+
+        :return: Coefficients of the product, which may have trailing zeros.
+        :rtype: List[int]
+        """
+        sz: int = len(a) + len(b) - 1
+        bound: int = min(len(a), len(b)) * max(map(abs, a)) * max(map(abs, b))
+        nb: int = (bound.bit_length() + 9) // 8
+        off: int = 1 << (8 * nb - 1)
+        prod: int = cls.__pack(a, nb) * cls.__pack(b, nb) + int.from_bytes(off.to_bytes(nb, 'little') * sz, 'little')
+        raw: bytes = prod.to_bytes(nb * sz, 'little')
+        slot = map(raw.__getitem__, map(slice, range(0, nb * sz, nb), range(nb, nb * sz + nb, nb)))
+
+        return list(map(sub, map(int.from_bytes, slot, repeat('little')), repeat(off)))
+
+    @classmethod
+    def conv(cls, a: list, b: list) -> list:
+        """
+        Product of coefficients.
+
+        The algorithm is chosen by the coefficients and the length of the shorter one, ``n``.
+        Computation rules are as follows:
+            1. If all coefficients are integers, it is ``PolyArith.kronecker`` if n >= ``PolyArith.__KRONECKER``.
+               Otherwise, it is ``PolyArith.school``. Either way, it is exact.
+            2. Otherwise, it is ``PolyArith.school`` if n < ``PolyArith.__KARATSUBA``, ``PolyArith.karatsuba`` if
+               n < ``PolyArith.__FFT``, and ``PolyArith.fft`` otherwise.
+        Thresholds are the crossovers measured by ``BenchManager.bench_polymul``.
+
+        :param a: Multiplicand coefficients. It must be nonempty.
+        :type a: list
+        :param b: Multiplier coefficients. It must be nonempty.
+        :type b: list
+
+        :return: Coefficients of the product, which may have trailing zeros.
+        :rtype: list
+        """
+        n: int = min(len(a), len(b))
+
+        if all(type(c) == int for c in a) and all(type(c) == int for c in b):
+            return cls.kronecker(a, b) if n >= cls.__KRONECKER else cls.school(a, b)
+        elif n < cls.__KARATSUBA:
+            return cls.school(a, b)
+        else:
+            return cls.karatsuba(a, b) if n < cls.__FFT else cls.fft(a, b)
+
+    @classmethod
+    def mul(cls, p: UniPoly, q: UniPoly) -> UniPoly:
+        """
+        Multiply polynomials.
+
+        The algorithm is chosen by ``PolyArith.conv`` according to the degrees and the coefficients.
+
+        :param p: Multiplicand polynomial.
+        :type p: UniPoly
+        :param q: Multiplier polynomial.
+        :type q: UniPoly
+
+        :return: Product of polynomials.
+        :rtype: UniPoly
+
+        :raise ValueError: If polynomials are of different variables.
+        """
+        var: Optional[int] = cls.__var(p, q)
+
+        if p.deg < 0 or q.deg < 0:
+            return UniPoly(var, [])
+
+        return UniPoly(var, cls.__trim(cls.conv(p.coef, q.coef)))
+
+    @classmethod
+    def divmod(cls, p: UniPoly, q: UniPoly) -> Tuple[UniPoly, UniPoly]:
+        """
+        Divide polynomials with remainder.
+
+        It is long division, where each step subtracts a scaled copy of the divisor by a single ``map`` call.
+        The remainder has lower degree than the divisor.
+
+        :param p: Dividend polynomial.
+        :type p: UniPoly
+        :param q: Divisor polynomial.
+        :type q: UniPoly
+
+        :return: Quotient and remainder.
+        :rtype: Tuple[UniPoly, UniPoly]
+
+        :raise ZeroDivisionError: If divisor is zero polynomial.
+        :raise ValueError: If polynomials are of different variables.
+        """
+        if q.deg < 0:
+            raise ZeroDivisionError
+
+        var: Optional[int] = cls.__var(p, q)
+        r: list = list(p.coef)
+        quot: list = [0] * max(p.deg - q.deg + 1, 0)
+
+        for k in range(p.deg - q.deg, -1, -1):
+            t = cls.__quo(r[k + q.deg], q.coef[-1])
+            quot[k] = t
+
+            if t != 0:
+                r[k:k + q.deg] = map(sub, r[k:k + q.deg], map(mul, q.coef[:-1], repeat(t)))
+
+            r[k + q.deg] = 0
+
+        return UniPoly(var, cls.__trim(quot)), UniPoly(var, cls.__trim(r[:max(q.deg, 0)]))
+
+    @classmethod
+    def pow(cls, p: UniPoly, n: int) -> UniPoly:
+        """
+        Raise polynomial to nonnegative integer power.
+
+        It uses repeated squaring, so it takes O(log n) multiplications.
+
+        :param p: Base polynomial.
+        :type p: UniPoly
+        :param n: Exponent.
+        :type n: int
+
+        :return: Power of polynomial.
+        :rtype: UniPoly
+        """
+        res: UniPoly = cls.const(1, p.var)
+
+        while n:
+            if n & 1:
+                res = cls.mul(res, p)
+
+            n >>= 1
+
+            if n:
+                p = cls.mul(p, p)
+
+        return res
+
+    @classmethod
+    def compose(cls, p: UniPoly, q: UniPoly) -> UniPoly:
+        """
+        Compose polynomials.
+
+        The result is ``p(q(x))``, which is computed by Horner's method over polynomials.
+
+        :param p: Outer polynomial.
+        :type p: UniPoly
+        :param q: Inner polynomial.
+        :type q: UniPoly
+
+        :return: Composition of polynomials.
+        :rtype: UniPoly
+        """
+        res: UniPoly = UniPoly(q.var, [])
+
+        for c in reversed(p.coef):
+            res = cls.add(cls.mul(res, q), cls.const(c, q.var))
+
+        return res
+
+    @classmethod
+    def deriv(cls, p: UniPoly) -> UniPoly:
+        """
+        Differentiate polynomial.
+
+        :param p: Polynomial to be differentiated.
+        :type p: UniPoly
+
+        :return: Derivative of polynomial.
+        :rtype: UniPoly
+        """
+        return UniPoly(p.var, cls.__trim(list(map(mul, range(1, len(p.coef)), p.coef[1:]))))
+
+    @classmethod
+    def horner(cls, coef: list, x: list) -> list:
+        """
+        Evaluate polynomial by Horner's method.
+
+        Each step is a multiply-add ``res * x + c`` over the whole batch, and zero coefficient skips the addition.
+        Thus ``x ** 4 + 3 * x ** 2 - x`` costs 4 multiplications and 2 additions.
+
+        :param coef: Coefficients in ascending order of degree, each of which is scalar or batch.
+        :type coef: list
+        :param x: Points where polynomial is to be evaluated.
+        :type x: list
+
+        :return: Computed values.
+        :rtype: list
+
+        :raise ValueError: If batches are of different sizes.
+        """
+        sz: int = cls.__sz(coef, x)
+
+        if not coef:
+            return [0] * sz
+
+        x = Dual.DualArith.ext(x, sz)
+        res: list = Dual.DualArith.ext(coef[-1], sz) if type(coef[-1]) == list else [coef[-1]] * sz
+
+        for c in reversed(coef[:-1]):
+            if type(c) != list and c == 0:
+                res = list(map(mul, res, x))
+            else:
+                res = list(map(add, map(mul, res, x), cls.__col(c, sz)))
+
+        return res
+
+    @classmethod
+    def estrin(cls, coef: list, x: list) -> list:
+        """
+        Evaluate polynomial by Estrin's scheme.
+
+        Coefficients are paired into linear polynomials ``c_2i + c_2i+1 * x``, which are paired again in ``x^2``, and so
+        on, squaring the variable at each level.
+        It has the same # of multiply-adds with Horner's method, but the steps of each level are independent, and
+        the rounding errors are accumulated over only O(log n) levels.
+
+        :param coef: Coefficients in ascending order of degree, each of which is scalar or batch.
+        :type coef: list
+        :param x: Points where polynomial is to be evaluated.
+        :type x: list
+
+        :return: Computed values.
+        :rtype: list
+
+        :raise ValueError: If batches are of different sizes.
+        """
+        sz: int = cls.__sz(coef, x)
+
+        if not coef:
+            return [0] * sz
+
+        lv: list = list(coef)  # Coefficients of the current level.
+        p: list = Dual.DualArith.ext(x, sz)  # Power of the variable of the current level.
+
+        while len(lv) > 1:
+            nxt: list = [list(map(add, cls.__col(lv[i], sz), map(mul, cls.__col(lv[i + 1], sz), p)))
+                         for i in range(0, len(lv) - 1, 2)]
+
+            if len(lv) % 2:
+                nxt.append(lv[-1])
+
+            lv = nxt
+
+            if len(lv) > 1:
+                p = list(map(mul, p, p))
+
+        return Dual.DualArith.ext(lv[0], sz) if type(lv[0]) == list else [lv[0]] * sz
+
+    @classmethod
+    def __ratio(cls, a: complex, b: complex) -> complex:
+        """
+        Quotient which is 0 for 0 divisor.
+
+        This method is private and called internally as a helper of ``PolyArith.aberth``.
+
+        :param a: Dividend.
+        :type a: complex
+        :param b: Divisor.
+        :type b: complex
+
+        :return: Quotient.
+        :rtype: complex
+        """
+        return a / b if b != 0 else 0j
+
+    @classmethod
+    def __cos(cls, a: complex, r: float) -> complex:
+        """
+        Cosine of Givens rotation which is 1 for 0 norm.
+
+        This method is private and called internally as a helper of ``PolyArith.eig``.
+
+        :param a: Entry to be kept.
+        :type a: complex
+        :param r: Norm of the entries to be rotated.
+        :type r: float
+
+        :return: Cosine of rotation.
+        :rtype: complex
+        """
+        return a / r if r != 0 else 1 + 0j
+
+    @classmethod
+    def __shift(cls, a: complex, b: complex, c: complex, d: complex) -> complex:
+        """
+        Wilkinson shift.
+
+        It is the eigenvalue of ``[[a, b], [c, d]]`` closer to d.
+
+        This method is private and called internally as a helper of ``PolyArith.eig``.
+
+        :param a: Upper left entry.
+        :type a: complex
+        :param b: Upper right entry.
+        :type b: complex
+        :param c: Lower left entry.
+        :type c: complex
+        :param d: Lower right entry.
+        :type d: complex
+
+        :return: Shift.
+        :rtype: complex
+        """
+        h: complex = (a + d) / 2
+        disc: complex = cmath.sqrt((a - d) * (a - d) / 4 + b * c)
+
+        return h + disc if abs(h + disc - d) <= abs(h - disc - d) else h - disc
+
+    @classmethod
+    def eig(cls, coef: List[list]) -> List[List[complex]]:
+        """
+        Find roots of polynomials as eigenvalues of companion matrices.
+
+        Polynomials are stacked, that is, each entry of the companion matrix is a batch over the polynomials, so that
+        each step of QR algorithm is a chain of ``map`` calls over the whole batch as in ``Dual.Dual``.
+        Companion matrix is upper Hessenberg, so each QR step is a sweep of Givens rotations with Wilkinson shift, and
+        only the leading block which is not deflated yet is updated.
+        The last eigenvalue of the block is deflated once the subdiagonal entry is negligible in all polynomials of the
+        batch, or after ``PolyArith.__QR_ITER`` steps.
+        Each tenth step takes an exceptional shift to break cycles.
+        Variable is scaled by the geometric mean of the moduli of the roots first, which balances the companion matrix.
+        It costs O(n^3) operations for degree n, but it is backward stable.
+
+        **Reference**
+            * https://en.wikipedia.org/wiki/Companion_matrix
+            * https://en.wikipedia.org/wiki/QR_algorithm
+            * https://doi.org/10.1090/S0025-5718-1995-1262279-2
+
+        :param coef: Batches of coefficients of polynomials of the same degree, in ascending order of degree. Leading
+                     coefficients must be nonzero.
+        :type coef: List[list]
+
+        :return: Batches of roots. The k-th batch is the k-th root of each polynomial.
+        :rtype: List[List[complex]]
+        """
+        n: int = len(coef) - 1
+        sz: int = len(coef[0])
+        zero: List[complex] = [0j] * sz
+        h: List[List[List[complex]]] = [[zero] * n for _ in range(n)]
+
+        rad: List[float] = [r if r > 0 else 1.0 for r in map(pow, map(abs, map(truediv, coef[0], coef[n])),
+                                                             repeat(1 / n))]
+
+        # Companion matrix of the polynomial of the scaled variable ``x / rad``, whose roots are of unit modulus on
+        # average.
+        for i in range(n):
+            c = map(mul, map(truediv, coef[i], coef[n]), map(pow, rad, repeat(i - n)))
+            h[i][n - 1] = list(map(complex, map(neg, c)))
+
+            if i > 0:
+                h[i][i - 1] = [1 + 0j] * sz
+
+        res: List[Optional[List[complex]]] = [None] * n
+        hi: int = n - 1
+        it: int = 0
+
+        while hi > 0:
+            tol = map(mul, map(add, map(abs, h[hi][hi]), map(abs, h[hi - 1][hi - 1])), repeat(cls.__EPS))
+
+            if it >= cls.__QR_ITER or all(map(le, map(abs, h[hi][hi - 1]), tol)):
+                res[hi] = h[hi][hi]
+                hi -= 1
+                it = 0
+
+                continue
+
+            it += 1
+
+            if it % 10 == 0:
+                mu: List[complex] = list(map(add, h[hi][hi], map(abs, h[hi][hi - 1])))
+            else:
+                mu: List[complex] = list(map(cls.__shift, h[hi - 1][hi - 1], h[hi - 1][hi], h[hi][hi - 1], h[hi][hi]))
+
+            for i in range(hi + 1):
+                h[i][i] = list(map(sub, h[i][i], mu))
+
+            rot: List[Tuple[List[complex], List[complex], List[complex], List[complex]]] = []
+
+            # Apply rotations to rows from the left, reducing to upper triangular.
+            for k in range(hi):
+                x, y = h[k][k], h[k + 1][k]
+                r: List[float] = list(map(math.hypot, map(abs, x), map(abs, y)))
+                c: List[complex] = list(map(cls.__cos, x, r))
+                s: List[complex] = list(map(cls.__ratio, y, r))
+                cc: List[complex] = list(map(complex.conjugate, c))
+                sc: List[complex] = list(map(complex.conjugate, s))
+
+                for j in range(k, hi + 1):
+                    a, b = h[k][j], h[k + 1][j]
+                    h[k][j] = list(map(add, map(mul, cc, a), map(mul, sc, b)))
+                    h[k + 1][j] = list(map(sub, map(mul, c, b), map(mul, s, a)))
+
+                h[k + 1][k] = zero
+                rot.append((c, s, cc, sc))
+
+            # Apply the adjoint rotations to columns from the right, recovering upper Hessenberg form.
+            for k, (c, s, cc, sc) in enumerate(rot):
+                for i in range(k + 2):
+                    a, b = h[i][k], h[i][k + 1]
+                    h[i][k] = list(map(add, map(mul, a, c), map(mul, b, s)))
+                    h[i][k + 1] = list(map(sub, map(mul, b, cc), map(mul, a, sc)))
+
+            for i in range(hi + 1):
+                h[i][i] = list(map(add, h[i][i], mu))
+
+        res[0] = h[0][0]
+
+        return [list(map(mul, r, rad)) for r in res]
+
+    @classmethod
+    def aberth(cls, coef: List[list]) -> List[List[complex]]:
+        """
+        Find roots of polynomials by Aberth method.
+
+        All roots of all polynomials are updated at once, that is, they are laid out in a single batch, where the roots
+        of each polynomial are contiguous, and each coefficient is repeated for all roots of its polynomial.
+        Thus values and derivatives are computed by ``PolyArith.horner`` over the whole batch, and the sum of
+        ``1 / (z_i - z_j)`` over the other roots of the same polynomial is accumulated by rotating the roots within each
+        polynomial, which costs n ``map`` chains for degree n.
+        Then each root is updated by ``z - w / (1 - w * S)`` where ``w = p(z) / p'(z)``.
+        Initial guesses are equally spaced on the circle whose radius is the geometric mean of the moduli of the roots,
+        with an offset of angle to break symmetry of real coefficients.
+        Polynomial is converged once the residual of each root is within the rounding error of Horner's method, and
+        converged polynomials are dropped from the batch.
+        Iteration stops once all polynomials are converged, or after ``PolyArith.__ABERTH_ITER`` iterations.
+        It costs O(n^2) operations per iteration, and it converges cubically to simple roots.
+
+        **Reference**
+            * https://en.wikipedia.org/wiki/Aberth_method
+            * https://doi.org/10.1007/BF02207694
+
+        :param coef: Batches of coefficients of polynomials of the same degree, in ascending order of degree. Leading
+                     and constant coefficients must be nonzero.
+        :type coef: List[list]
+
+        :return: Batches of roots. The k-th batch is the k-th root of each polynomial.
+        :rtype: List[List[complex]]
+        """
+        n: int = len(coef) - 1
+        sz: int = len(coef[0])
+        col: List[list] = [list(chain.from_iterable(map(repeat, c, repeat(n)))) for c in coef]
+        d_col: List[list] = [list(map(mul, c, repeat(k))) for k, c in enumerate(col[1:], 1)]
+        a_col: List[list] = [list(map(abs, c)) for c in col]
+        base: List[int] = list(chain.from_iterable(map(repeat, range(0, sz * n, n), repeat(n))))
+        rad = map(pow, map(abs, map(truediv, col[0], col[n])), repeat(1 / n))
+        z: List[complex] = list(map(mul, rad, [cmath.rect(1.0, 2 * math.pi * k / n + 0.4) for k in range(n)] * sz))
+
+        res: List[complex] = [0j] * (sz * n)
+        act: List[int] = list(range(sz))  # Polynomials which are not converged yet.
+
+        for _ in range(cls.__ABERTH_ITER):
+            p: List[complex] = cls.horner(col, z)
+            bound = map(mul, cls.horner(a_col, list(map(abs, z))), repeat(4 * n * cls.__EPS))
+            ok: List[bool] = list(map(le, map(abs, p), bound))
+
+            if all(ok):
+                break
+
+            done: List[bool] = [all(ok[i:i + n]) for i in range(0, len(ok), n)]
+
+            # Converged polynomials are dropped, so the rest of the iterations costs only the slow ones.
+            if any(done):
+                keep: List[int] = [j for j, f in enumerate(done) if not f]
+
+                for j in (j for j, f in enumerate(done) if f):
+                    res[act[j] * n:act[j] * n + n] = z[j * n:j * n + n]
+
+                sel: List[int] = list(chain.from_iterable(range(j * n, j * n + n) for j in keep))
+                col, d_col, a_col = [[list(map(c.__getitem__, sel)) for c in it] for it in (col, d_col, a_col)]
+                z, p = list(map(z.__getitem__, sel)), list(map(p.__getitem__, sel))
+                act = [act[j] for j in keep]
+                base = list(chain.from_iterable(map(repeat, range(0, len(keep) * n, n), repeat(n))))
+
+            try:
+                w: List[complex] = list(map(truediv, p, cls.horner(d_col, z)))
+            except ZeroDivisionError:
+                w: List[complex] = list(map(cls.__ratio, p, cls.horner(d_col, z)))
+
+            acc: List[complex] = [0j] * len(z)
+
+            for s in range(1, n):
+                other = map(z.__getitem__, map(add, base, [*range(s, n), *range(s)] * len(act)))  # Roots rotated by s.
+                diff: List[complex] = list(map(sub, z, other))
+
+                try:
+                    acc = list(map(add, acc, map(truediv, repeat(1.0), diff)))
+                except ZeroDivisionError:
+                    acc = list(map(add, acc, map(cls.__ratio, repeat(1.0), diff)))
+
+            try:
+                corr: List[complex] = list(map(truediv, w, map(sub, repeat(1.0), map(mul, w, acc))))
+            except ZeroDivisionError:
+                corr: List[complex] = w
+
+            z = list(map(sub, z, corr))
+
+        for j, i in enumerate(act):
+            res[i * n:i * n + n] = z[j * n:j * n + n]
+
+        return [res[k::n] for k in range(n)]
+
+    @classmethod
+    def roots_batch(cls, coef: List[list]) -> List[List[complex]]:
+        """
+        Find roots of many polynomials.
+
+        Computation rules are as follows:
+            1. Trailing zero coefficients are stripped, so the degree is that of the last nonzero coefficient.
+            2. Each leading zero coefficient is a root 0, which is exact, and it is stripped as well.
+            3. Zero and constant polynomials have no root.
+            4. Polynomials of the same degree after stripping are solved in a single stacked computation.
+               It is ``PolyArith.eig`` if the degree is at most ``PolyArith.__EIG``, and ``PolyArith.aberth`` otherwise.
+        Roots of each polynomial are sorted by real part and then by imaginary part, so that they do not depend on the
+        algorithm.
+
+        :param coef: Coefficients of each polynomial in ascending order of degree.
+        :type coef: List[list]
+
+        :return: Roots of each polynomial, with multiplicity.
+        :rtype: List[List[complex]]
+        """
+        res: List[List[complex]] = []
+        grp: Dict[Tuple[int, int], List[int]] = {}  # Polynomials indexed by # of zero roots and degree.
+
+        for i, c in enumerate(coef):
+            hi: int = len(c)
+
+            while hi > 0 and c[hi - 1] == 0:
+                hi -= 1
+
+            lo: int = 0
+
+            while lo < hi and c[lo] == 0:
+                lo += 1
+
+            res.append([0j] * lo)
+
+            if hi - lo > 1:
+                grp.setdefault((lo, hi - lo - 1), []).append(i)
+
+        for (lo, n), idx in grp.items():
+            batch: List[list] = [[coef[i][lo + k] for i in idx] for k in range(n + 1)]
+
+            for i, r in zip(idx, zip(*(cls.eig(batch) if n <= cls.__EIG else cls.aberth(batch)))):
+                res[i] += r
+
+        return [sorted(r, key=lambda z: (z.real, z.imag)) for r in res]
+
+    @classmethod
+    def roots(cls, p: UniPoly) -> List[complex]:
+        """
+        Find roots of polynomial.
+
+        For the rules, refer to the comments of ``PolyArith.roots_batch``.
+
+        :param p: Polynomial whose roots are to be found.
+        :type p: UniPoly
+
+        :return: Roots with multiplicity.
+        :rtype: List[complex]
+        """
+        return cls.roots_batch([p.coef])[0]
+
+
+class SparPolyArith:
+    """
+    Sparse multivariate polynomial arithmetic toolbox.
+
+    Operations are on the dictionaries of terms, so they cost in proportion to the # of terms rather than to the
+    degrees.
+    Operands of different variables are aligned to the union of their variables first.
+    Results are normalized, that is, terms whose coefficients are 0 are dropped.
+    Integer coefficients stay integer as long as the operation is exact.
+
+    Multiplication packs each exponents into a single integer, with a field of fixed width for each variable, so that
+    the exponents of a product of monomials is the sum of the packed integers.
+    The width is wide enough for the total degree of the product, so no field overflows into the next one.
+    Thus exponents of all products of a term with the other polynomial are computed by a single ``map`` call.
+
+    Evaluation is vectorized over batches.
+    Powers of each variable are computed once and shared by the terms, and each term costs a single multiplication
+    for each of its variables over the whole batch.
+
+    **Reference**
+        * https://en.wikipedia.org/wiki/Monomial_order
+        * https://doi.org/10.1016/j.jsc.2010.08.004
+
+    :cvar __ORDER: Sort keys of monomial orderings.
+    """
+    __ORDER: Final[Dict[str, Callable[[Tuple[int, ...]], Any]]] = {
+        'lex': lambda e: e,
+        'grlex': lambda e: (sum(e), e),
+        'grevlex': lambda e: (sum(e), tuple(map(neg, reversed(e))))
+    }
+
+    def __new__(cls, *args, **kwargs) -> None:
+        raise NotImplementedError
+
+    @classmethod
+    def __trim(cls, coef: Dict[Tuple[int, ...], Union[int, float, complex]]) -> Dict[Tuple[int, ...], Any]:
+        """
+        Drop terms whose coefficients are 0.
+
+        This method is private and called internally as a helper of the operations.
+
+        :param coef: Terms to be dropped.
+        :type coef: Dict[Tuple[int, ...], Union[int, float, complex]]
+
+        :return: Terms without zero coefficients.
+        :rtype: Dict[Tuple[int, ...], Any]
+        """
+        return coef if all(coef.values()) else {e: c for e, c in coef.items() if c != 0}
+
+    @classmethod
+    def __align(cls, p: MultiSparPoly, q: MultiSparPoly) -> Tuple[List[int], Dict[Tuple[int, ...], Any],
+                                                                  Dict[Tuple[int, ...], Any]]:
+        """
+        Align polynomials to the union of their variables.
+
+        Exponents of each polynomial are scattered into the positions of its variables in the union, and the other
+        positions are filled with 0.
+        Polynomial whose variables are the union already is not copied.
+
+        This method is private and called internally as a helper of the operations.
+
+        :param p: First polynomial.
+        :type p: MultiSparPoly
+        :param q: Second polynomial.
+        :type q: MultiSparPoly
+
+        :return: Union of variables and the terms of aligned polynomials.
+        :rtype: Tuple[List[int], Dict[Tuple[int, ...], Any], Dict[Tuple[int, ...], Any]]
+        """
+        if p.var == q.var:
+            return p.var, p.coef, q.coef
+
+        var: List[int] = sorted(set(p.var) | set(q.var))
+        res: List[Dict[Tuple[int, ...], Any]] = []
+
+        for it in (p, q):
+            if it.var == var:
+                res.append(it.coef)
+                continue
+
+            pos: List[int] = [var.index(v) for v in it.var]
+            coef: Dict[Tuple[int, ...], Any] = {}
+
+            for e, c in it.coef.items():
+                buf: List[int] = [0] * len(var)
+
+                for i, k in zip(pos, e):
+                    buf[i] = k
+
+                coef[tuple(buf)] = c
+
+            res.append(coef)
+
+        return var, res[0], res[1]
+
+    @classmethod
+    def const(cls, c: Union[int, float, complex], var: List[int] = None) -> MultiSparPoly:
+        """
+        Make constant polynomial.
+
+        :param c: Value of constant.
+        :type c: Union[int, float, complex]
+        :param var: Keys of variables in ascending order. (Default: [])
+        :type var: List[int]
+
+        :return: Constant polynomial. Zero polynomial if c is 0.
+        :rtype: MultiSparPoly
+        """
+        var = var if var else []
+
+        return MultiSparPoly(var, {(0,) * len(var): c} if c != 0 else {})
+
+    @classmethod
+    def gen(cls, var: int) -> MultiSparPoly:
+        """
+        Make polynomial of single variable.
+
+        :param var: Key of variable.
+        :type var: int
+
+        :return: Polynomial ``x`` of the variable.
+        :rtype: MultiSparPoly
+        """
+        return MultiSparPoly([var], {(1,): 1})
+
+    @classmethod
+    def from_uni(cls, p: UniPoly) -> MultiSparPoly:
+        """
+        Convert univariate polynomial into sparse multivariate polynomial.
+
+        Zero coefficients are dropped.
+
+        :param p: Polynomial to be converted.
+        :type p: UniPoly
+
+        :return: Converted polynomial.
+        :rtype: MultiSparPoly
+        """
+        if p.deg <= 0:
+            return cls.const(p.coef[0] if p.coef else 0)
+
+        return MultiSparPoly([p.var], {(k,): c for k, c in enumerate(p.coef) if c != 0})
+
+    @classmethod
+    def terms(cls, p: MultiSparPoly, order: str = 'grlex') -> List[Tuple[Tuple[int, ...], Any]]:
+        """
+        Sort terms by monomial ordering.
+
+        Terms are in descending order, that is, the leading term comes first.
+        Supported orderings are as follows:
+            1. lex: Lexicographic order of exponents.
+            2. grlex: Total degree first, and lex for the ties.
+            3. grevlex: Total degree first, and the smaller exponent of the last variable for the ties.
+        Since the variables are sorted, sorted terms are a canonical form of polynomial.
+
+        :param p: Polynomial whose terms are to be sorted.
+        :type p: MultiSparPoly
+        :param order: Monomial ordering. (Default: 'grlex')
+        :type order: str
+
+        :return: Pairs of exponents and coefficient in descending order.
+        :rtype: List[Tuple[Tuple[int, ...], Any]]
+
+        :raise ValueError: If the ordering is not supported.
+        """
+        if order not in cls.__ORDER:
+            raise ValueError
+
+        key: Callable[[Tuple[int, ...]], Any] = cls.__ORDER[order]
+
+        return sorted(p.coef.items(), key=lambda it: key(it[0]), reverse=True)
+
+    @classmethod
+    def neg(cls, p: MultiSparPoly) -> MultiSparPoly:
+        """
+        Negate polynomial.
+
+        :param p: Polynomial to be negated.
+        :type p: MultiSparPoly
+
+        :return: Negated polynomial.
+        :rtype: MultiSparPoly
+        """
+        return MultiSparPoly(p.var, dict(zip(p.coef.keys(), map(neg, p.coef.values()))))
+
+    @classmethod
+    def add(cls, p: MultiSparPoly, q: MultiSparPoly) -> MultiSparPoly:
+        """
+        Add polynomials.
+
+        Terms of the shorter one are merged into a copy of the longer one.
+
+        :param p: Augend polynomial.
+        :type p: MultiSparPoly
+        :param q: Addend polynomial.
+        :type q: MultiSparPoly
+
+        :return: Sum of polynomials.
+        :rtype: MultiSparPoly
+        """
+        var, a, b = cls.__align(p, q)
+        a, b = (a, b) if len(a) >= len(b) else (b, a)
+        res: Dict[Tuple[int, ...], Any] = dict(a)
+        get: Callable = res.get
+
+        for e, c in b.items():
+            res[e] = get(e, 0) + c
+
+        return MultiSparPoly(var, cls.__trim(res))
+
+    @classmethod
+    def sub(cls, p: MultiSparPoly, q: MultiSparPoly) -> MultiSparPoly:
+        """
+        Subtract polynomials.
+
+        :param p: Minuend polynomial.
+        :type p: MultiSparPoly
+        :param q: Subtrahend polynomial.
+        :type q: MultiSparPoly
+
+        :return: Difference of polynomials.
+        :rtype: MultiSparPoly
+        """
+        return cls.add(p, cls.neg(q))
+
+    @classmethod
+    def scale(cls, p: MultiSparPoly, c: Union[int, float, complex]) -> MultiSparPoly:
+        """
+        Multiply polynomial by constant.
+
+        :param p: Polynomial to be scaled.
+        :type p: MultiSparPoly
+        :param c: Constant factor.
+        :type c: Union[int, float, complex]
+
+        :return: Scaled polynomial.
+        :rtype: MultiSparPoly
+        """
+        return MultiSparPoly(p.var, cls.__trim(dict(zip(p.coef.keys(), map(mul, p.coef.values(), repeat(c))))))
+
+    @classmethod
+    def mul(cls, p: MultiSparPoly, q: MultiSparPoly) -> MultiSparPoly:
+        """
+        Multiply polynomials.
+
+        Exponents are packed into integers with fields of ``w`` bits, where ``w`` is the bit length of the total
+        degree of the product.
+        Then each term of the shorter one is multiplied with all terms of the longer one by a ``map`` call for the
+        exponents and another for the coefficients, and the products are accumulated into a dictionary indexed by the
+        packed exponents.
+        Finally, the exponents are unpacked only for the terms of the product.
+
+        :param p: Multiplicand polynomial.
+        :type p: MultiSparPoly
+        :param q: Multiplier polynomial.
+        :type q: MultiSparPoly
+
+        :return: Product of polynomials.
+        :rtype: MultiSparPoly
+        """
+        var, a, b = cls.__align(p, q)
+
+        if not a or not b:
+            return MultiSparPoly(var, {})
+
+        a, b = (a, b) if len(a) >= len(b) else (b, a)
+        w: int = max((p.deg + q.deg).bit_length(), 1)
+        sft: List[int] = list(range(0, w * len(var), w))  # Offsets of fields.
+        key: List[int] = [sum(map(lshift, e, sft)) for e in a]
+        val: list = list(a.values())
+        res: Dict[int, Any] = {}
+        get: Callable = res.get
+
+        for e, c in b.items():
+            for k, v in zip(map(add, key, repeat(sum(map(lshift, e, sft)))), map(mul, val, repeat(c))):
+                res[k] = get(k, 0) + v
+
+        mask: int = (1 << w) - 1
+
+        return MultiSparPoly(var, {tuple(map(and_, map(rshift, repeat(k), sft), repeat(mask))): v
+                                   for k, v in res.items() if v != 0})
+
+    @classmethod
+    def pow(cls, p: MultiSparPoly, n: int) -> MultiSparPoly:
+        """
+        Power of polynomial to nonnegative integer.
+
+        It is computed by repeated squaring.
+
+        :param p: Base polynomial.
+        :type p: MultiSparPoly
+        :param n: Nonnegative integer exponent.
+        :type n: int
+
+        :return: Power of polynomial.
+        :rtype: MultiSparPoly
+        """
+        res: MultiSparPoly = cls.const(1, p.var)
+
+        while n > 0:
+            if n & 1:
+                res = cls.mul(res, p)
+
+            n >>= 1
+
+            if n > 0:
+                p = cls.mul(p, p)
+
+        return res
+
+    @classmethod
+    def deriv(cls, p: MultiSparPoly, var: int) -> MultiSparPoly:
+        """
+        Partial derivative of polynomial.
+
+        :param p: Polynomial to be differentiated.
+        :type p: MultiSparPoly
+        :param var: Key of variable wrt. which it is differentiated.
+        :type var: int
+
+        :return: Partial derivative.
+        :rtype: MultiSparPoly
+        """
+        if var not in p.var:
+            return MultiSparPoly(p.var, {})
+
+        i: int = p.var.index(var)
+
+        return MultiSparPoly(p.var, {e[:i] + (e[i] - 1,) + e[i + 1:]: c * e[i] for e, c in p.coef.items() if e[i] > 0})
+
+    @classmethod
+    def eval(cls, p: MultiSparPoly, *x: list) -> list:
+        """
+        Evaluate polynomial over batch.
+
+        Powers of each variable up to its maximum exponent are computed by repeated multiplication once.
+        Then each term is the product of its coefficient and the powers of its variables, and the terms are summed.
+        Thus the cost is a few ``map`` calls for each term and for each power, regardless of the size of the batch.
+        Batch of size 1 is broadcast.
+
+        :param p: Polynomial to be evaluated.
+        :type p: MultiSparPoly
+        :param x: Points of each variable, in the order of the variables of the polynomial.
+        :type x: list
+
+        :return: Computed values.
+        :rtype: list
+
+        :raise ValueError: If the # of batches is not that of variables, or batches are of different sizes.
+        """
+        if len(x) != len(p.var):
+            raise ValueError
+
+        sz: int = max(map(len, x), default=1)
+
+        if any(len(it) not in (1, sz) for it in x):
+            raise ValueError
+
+        pw: List[List[list]] = []  # Powers of each variable. The k-th one is of power k + 1.
+
+        for i, it in enumerate(x):
+            it = Dual.DualArith.ext(it, sz)
+            pw.append([it])
+
+            for _ in range(max((e[i] for e in p.coef), default=0) - 1):
+                pw[-1].append(list(map(mul, pw[-1][-1], it)))
+
+        res: list = [0] * sz
+
+        for e, c in p.coef.items():
+            term: Optional[list] = None
+
+            for i, k in enumerate(e):
+                if k > 0:
+                    term = pw[i][k - 1] if term is None else list(map(mul, term, pw[i][k - 1]))
+
+            res = list(map(add, res, repeat(c) if term is None else map(mul, term, repeat(c))))
+
+        return res
@@ -0,0 +1,479 @@
+from __future__ import annotations
+
+from typing import final, Dict, List, Optional, Tuple, Union
+
+from Core import Polynomial, Token
+from Function import Function
+from Operator import Binary, Operator, Unary
+
+
+@final
+class Builder:
+    """
+    Builder of simplified and shared ASTs.
+
+    Every token is built by smart constructors, which simplify the token before it is made.
+    Simplification is local, that is, each constructor looks only at its operands, which are already simplified.
+    The rules are listed in the comments of each constructor.
+    Note that rules like ``0 * x = 0`` ignore the case where x is nan or inf, as symbolic simplifiers do.
+
+    Further, tokens are hash consed.
+    That is, tokens with the same operator or function and the same operands are built only once, and later requests
+    get the token built before.
+    Since operands are also hash consed, two tokens are the same iff they have the same operator or function and the
+    ids of their operands are the same.
+    Thus, common subexpressions are shared automatically, and AST built by the builder is a DAG rather than a tree.
+    Compiling the DAG into tape evaluates each shared token only once.
+
+    **Reference**
+        * https://en.wikipedia.org/wiki/Hash_consing
+        * https://en.wikipedia.org/wiki/Common_subexpression_elimination
+
+    :ivar __tb: Table of built tokens, indexed by their structures.
+    """
+
+    def __init__(self) -> None:
+        self.__tb: Dict[tuple, Token.Tok] = {}
+
+    def __len__(self) -> int:
+        return len(self.__tb)
+
+    def __get(self, key: tuple, tok: Token.Tok) -> Token.Tok:
+        """
+        Find token with structure from the table.
+
+        If it is not in the table, the given token is registered.
+
+        This method is private and called internally as a helper of the constructors.
+
+        :param key: Structure of token.
+        :type key: tuple
+        :param tok: Token to be registered if not found.
+        :type tok: Token.Tok
+
+        :return: Found or registered token.
+        :rtype: Token.Tok
+        """
+        return self.__tb.setdefault(key, tok)
+
+    def __node(self, v: Union[Operator.Op, Function.Fun], *args: Token.Tok) -> Token.Tok:
+        """
+        Build operator or function token without simplification.
+
+        This method is private and called internally as a helper of the constructors.
+
+        :param v: Operator or function.
+        :type v: Union[Operator.Op, Function.Fun]
+        :param args: Operands.
+        :type args: Token.Tok
+
+        :return: Built token.
+        :rtype: Token.Tok
+        """
+        key: tuple = (v, *map(id, args))
+
+        if key in self.__tb:
+            return self.__tb[key]
+
+        if issubclass(v, Operator.Op):
+            tok: Token.Tok = Token.Op(v)
+        else:
+            tok: Token.Tok = Token.Fun(v)
+            tok.argc = len(args)
+
+        for it in args:
+            tok.add_chd(it)
+
+        return self.__get(key, tok)
+
+    @classmethod
+    def is_num(cls, x: Token.Tok, v: Union[int, float, complex] = None) -> bool:
+        """
+        Check whether token is number.
+
+        :param x: Token to be checked.
+        :type x: Token.Tok
+        :param v: Value of number to be compared. If None, any number passes. (Default: None)
+        :type v: Union[int, float, complex]
+
+        :return: True if token is number with the value. False otherwise.
+        :rtype: bool
+        """
+        return type(x) == Token.Num and (v is None or x.v == v)
+
+    @classmethod
+    def __is_op(cls, x: Token.Tok, v: type) -> bool:
+        """
+        Check whether token is operator.
+
+        This method is private and called internally as a helper of the constructors.
+
+        :param x: Token to be checked.
+        :type x: Token.Tok
+        :param v: Operator to be compared.
+        :type v: type
+
+        :return: True if token is the operator. False otherwise.
+        :rtype: bool
+        """
+        return type(x) == Token.Op and x.v == v
+
+    def num(self, x: Union[int, float, complex]) -> Token.Num:
+        """
+        Build number token.
+
+        Numbers are hashed by their types and representations, so that 0 and -0.0 are different.
+
+        :param x: Value of number.
+        :type x: Union[int, float, complex]
+
+        :return: Built token.
+        :rtype: Token.Num
+        """
+        return self.__get((Token.Num, type(x), repr(x)), Token.Num(x))
+
+    def var(self, k: int) -> Token.Var:
+        """
+        Build variable token.
+
+        :param k: Key of variable.
+        :type k: int
+
+        :return: Built token.
+        :rtype: Token.Var
+        """
+        return self.__get((Token.Var, k), Token.Var(k))
+
+    def poly(self, p: Polynomial.UniPoly) -> Token.Tok:
+        """
+        Build polynomial token.
+
+        Polynomials are hashed by their variables and coefficients, and polynomial of degree at most 0 is built as
+        number.
+
+        :param p: Polynomial.
+        :type p: Polynomial.UniPoly
+
+        :return: Built token.
+        :rtype: Token.Tok
+        """
+        if p.deg <= 0:
+            return self.num(p.coef[0] if p.coef else 0)
+
+        return self.__get((Token.Poly, p.var, *map(repr, p.coef)), Token.Poly(p))
+
+    def neg(self, x: Token.Tok) -> Token.Tok:
+        """
+        Build negation.
+
+        Negation of x has following simplification rules.
+            1. If x is number, it is folded.
+            2. If x is ``-y``, the result is y.
+            3. If x is ``y - z``, the result is ``z - y``.
+
+        :param x: Operand.
+        :type x: Token.Tok
+
+        :return: Built token.
+        :rtype: Token.Tok
+        """
+        if self.is_num(x):
+            return self.num(-x.v)
+        elif self.__is_op(x, Unary.Minus):
+            return x.chd[0]
+        elif self.__is_op(x, Binary.Sub):
+            return self.__node(Binary.Sub, x.chd[1], x.chd[0])
+        else:
+            return self.__node(Unary.Minus, x)
+
+    def add(self, x: Token.Tok, y: Token.Tok) -> Token.Tok:
+        """
+        Build sum.
+
+        Sum of x and y has following simplification rules.
+            1. If x and y are numbers, it is folded.
+            2. If x or y is 0, the result is the other one.
+            3. If y is ``-z``, the result is ``x - z``, and if x is ``-z``, the result is ``y - z``.
+            4. If x and y are the same, the result is ``2 * x``.
+
+        :param x: Left operand.
+        :type x: Token.Tok
+        :param y: Right operand.
+        :type y: Token.Tok
+
+        :return: Built token.
+        :rtype: Token.Tok
+        """
+        if self.is_num(x) and self.is_num(y):
+            return self.num(x.v + y.v)
+        elif self.is_num(x, 0):
+            return y
+        elif self.is_num(y, 0):
+            return x
+        elif self.__is_op(y, Unary.Minus):
+            return self.sub(x, y.chd[0])
+        elif self.__is_op(x, Unary.Minus):
+            return self.sub(y, x.chd[0])
+        elif x is y:
+            return self.mul(self.num(2), x)
+        else:
+            return self.__node(Binary.Add, x, y)
+
+    def sub(self, x: Token.Tok, y: Token.Tok) -> Token.Tok:
+        """
+        Build difference.
+
+        Difference of x and y has following simplification rules.
+            1. If x and y are numbers, it is folded.
+            2. If y is 0, the result is x, and if x is 0, the result is ``-y``.
+            3. If x and y are the same, the result is 0.
+            4. If y is ``-z``, the result is ``x + z``.
+
+        :param x: Left operand.
+        :type x: Token.Tok
+        :param y: Right operand.
+        :type y: Token.Tok
+
+        :return: Built token.
+        :rtype: Token.Tok
+        """
+        if self.is_num(x) and self.is_num(y):
+            return self.num(x.v - y.v)
+        elif self.is_num(y, 0):
+            return x
+        elif self.is_num(x, 0):
+            return self.neg(y)
+        elif x is y:
+            return self.num(0)
+        elif self.__is_op(y, Unary.Minus):
+            return self.add(x, y.chd[0])
+        else:
+            return self.__node(Binary.Sub, x, y)
+
+    def mul(self, x: Token.Tok, y: Token.Tok) -> Token.Tok:
+        """
+        Build product.
+
+        Product of x and y has following simplification rules.
+            1. If x and y are numbers, it is folded.
+            2. If x or y is 0, the result is 0.
+            3. If x or y is 1, the result is the other one.
+               If x or y is -1, the result is negation of the other one.
+            4. If y is number, the operands are swapped, so that number comes first.
+            5. If x is number and y is ``c * z`` or ``c / z`` for number c, the numbers are folded.
+            6. If x or y is negation, the negation is pulled out.
+
+        :param x: Left operand.
+        :type x: Token.Tok
+        :param y: Right operand.
+        :type y: Token.Tok
+
+        :return: Built token.
+        :rtype: Token.Tok
+        """
+        if self.is_num(x) and self.is_num(y):
+            return self.num(x.v * y.v)
+        elif self.is_num(x, 0) or self.is_num(y, 0):
+            return self.num(0)
+        elif self.is_num(x, 1):
+            return y
+        elif self.is_num(y, 1):
+            return x
+        elif self.is_num(x, -1):
+            return self.neg(y)
+        elif self.is_num(y, -1):
+            return self.neg(x)
+        elif self.is_num(y):
+            return self.mul(y, x)
+        elif self.is_num(x) and self.__is_op(y, Binary.Mul) and self.is_num(y.chd[0]):
+            return self.mul(self.num(x.v * y.chd[0].v), y.chd[1])
+        elif self.is_num(x) and self.__is_op(y, Binary.Div) and self.is_num(y.chd[0]):
+            return self.div(self.num(x.v * y.chd[0].v), y.chd[1])
+        elif self.__is_op(x, Unary.Minus):
+            return self.neg(self.mul(x.chd[0], y))
+        elif self.__is_op(y, Unary.Minus):
+            return self.neg(self.mul(x, y.chd[0]))
+        else:
+            return self.__node(Binary.Mul, x, y)
+
+    def div(self, x: Token.Tok, y: Token.Tok) -> Token.Tok:
+        """
+        Build quotient.
+
+        Quotient of x and y has following simplification rules.
+            1. If x and y are numbers and y is not 0, it is folded.
+            2. If x is 0, the result is 0.
+            3. If y is 1, the result is x, and if y is -1, the result is ``-x``.
+            4. If x and y are the same, the result is 1.
+            5. If x or y is negation, the negation is pulled out.
+
+        :param x: Dividend.
+        :type x: Token.Tok
+        :param y: Divisor.
+        :type y: Token.Tok
+
+        :return: Built token.
+        :rtype: Token.Tok
+        """
+        if self.is_num(x) and self.is_num(y) and y.v != 0:
+            return self.num(x.v / y.v)
+        elif self.is_num(x, 0):
+            return self.num(0)
+        elif self.is_num(y, 1):
+            return x
+        elif self.is_num(y, -1):
+            return self.neg(x)
+        elif x is y:
+            return self.num(1)
+        elif self.__is_op(x, Unary.Minus):
+            return self.neg(self.div(x.chd[0], y))
+        elif self.__is_op(y, Unary.Minus):
+            return self.neg(self.div(x, y.chd[0]))
+        else:
+            return self.__node(Binary.Div, x, y)
+
+    def pow(self, x: Token.Tok, y: Token.Tok) -> Token.Tok:
+        """
+        Build power.
+
+        Power of x to y has following simplification rules.
+            1. If x and y are numbers, x is positive or y is integer, and the result is finite real, it is folded.
+            2. If y is 0, the result is 1, and if y is 1, the result is x.
+            3. If x is 1, the result is 1.
+
+        :param x: Base.
+        :type x: Token.Tok
+        :param y: Exponent.
+        :type y: Token.Tok
+
+        :return: Built token.
+        :rtype: Token.Tok
+        """
+        if self.is_num(x) and self.is_num(y) and type(x.v) != complex and type(y.v) != complex and \
+                (x.v > 0 or (float(y.v).is_integer() and (x.v != 0 or y.v > 0))):
+            try:
+                return self.num(x.v ** y.v)
+            except OverflowError:
+                pass
+
+        if self.is_num(y, 0) or self.is_num(x, 1):
+            return self.num(1)
+        elif self.is_num(y, 1):
+            return x
+        else:
+            return self.__node(Binary.Pow, x, y)
+
+    def op(self, v: type, *args: Token.Tok) -> Token.Tok:
+        """
+        Build operator token.
+
+        Arithmetic operators are built by their constructors, and the others are built without simplification.
+
+        :param v: Operator.
+        :type v: type
+        :param args: Operands.
+        :type args: Token.Tok
+
+        :return: Built token.
+        :rtype: Token.Tok
+        """
+        if v == Binary.Add:
+            return self.add(*args)
+        elif v == Binary.Sub:
+            return self.sub(*args)
+        elif v == Binary.Mul:
+            return self.mul(*args)
+        elif v == Binary.Div:
+            return self.div(*args)
+        elif v == Binary.Pow:
+            return self.pow(*args)
+        elif v == Unary.Minus:
+            return self.neg(*args)
+        elif v == Unary.Plus:
+            return args[0]
+        else:
+            return self.__node(v, *args)
+
+    def fun(self, v: type, *args: Token.Tok) -> Token.Fun:
+        """
+        Build function token.
+
+        Functions are not folded even if their parameters are numbers, so that values like ``Log[2]`` stay exact.
+
+        :param v: Function.
+        :type v: type
+        :param args: Parameters.
+        :type args: Token.Tok
+
+        :return: Built token.
+        :rtype: Token.Fun
+        """
+        return self.__node(v, *args)
+
+    def build(self, rt: Token.Tok) -> Token.Tok:
+        """
+        Rebuild AST by the builder.
+
+        Each token is rebuilt by the constructors after its operands, so that the result is simplified and shares the
+        tokens built before.
+        The visit is iterative, so that AST of formula with thousands of terms does not exceed recursion limit.
+        Original AST is not modified.
+
+        :param rt: Root of AST to be rebuilt.
+        :type rt: Token.Tok
+
+        :return: Root of rebuilt AST.
+        :rtype: Token.Tok
+
+        :raise TypeError: If AST has token other than number, variable, polynomial, operator and function.
+        """
+        res: Dict[int, Token.Tok] = {}  # Rebuilt tokens, indexed by the ids of the original tokens.
+        stk: List[Tuple[Token.Tok, bool]] = [(rt, False)]  # Stack of tokens with flag for visited operands.
+
+        while stk:
+            tok, done = stk.pop()
+            tok_t: type = type(tok)
+
+            if id(tok) in res:
+                continue
+            elif tok_t == Token.Num:
+                res[id(tok)] = self.num(tok.v)
+            elif tok_t == Token.Var:
+                res[id(tok)] = self.var(tok.v)
+            elif tok_t == Token.Poly:
+                res[id(tok)] = self.poly(tok.v)
+            elif tok_t not in [Token.Op, Token.Fun]:
+                raise TypeError
+            elif done:
+                arg: List[Token.Tok] = [res[id(it)] for it in tok.chd]
+                res[id(tok)] = self.op(tok.v, *arg) if tok_t == Token.Op else self.fun(tok.v, *arg)
+            else:
+                stk.append((tok, True))
+                stk.extend((it, False) for it in reversed(tok.chd))
+
+        return res[id(rt)]
+
+    def chain(self, *args: Tuple[Optional[Token.Tok], Optional[Token.Tok]]) -> Optional[Token.Tok]:
+        """
+        Build the chain rule.
+
+        Derivative is the sum of the derivatives of operands multiplied by the partial derivatives wrt. them.
+        Derivative ``None`` stands for 0, and such pairs are skipped.
+        If all of them are skipped, the result is also None.
+
+        :param args: Pairs of partial derivative and derivative of operand.
+        :type args: Tuple[Optional[Token.Tok], Optional[Token.Tok]]
+
+        :return: Built derivative.
+        :rtype: Optional[Token.Tok]
+        """
+        acc: Optional[Token.Tok] = None
+
+        for df, dx in args:
+            if dx is None or df is None:
+                continue
+
+            term: Token.Tok = self.mul(df, dx)
+            acc = term if acc is None else self.add(acc, term)
+
+        return acc
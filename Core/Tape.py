@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+from array import array
+from operator import add, mul
+from typing import final, Dict, List, Optional, Tuple, Union
+
+from Core import Dual, Polynomial
+from Function import Precision
+from Warning import Warning
+
+
+@final
+class Tape:
+    """
+    Tape of reverse mode automatic differentiation.
+
+    AST is compiled into a linear program of slots in post order, so that operands of each slot precede it.
+    Each slot is a leaf, which is a constant or a variable, or an operator or function applied to the previous slots.
+    Polynomial is also a slot, which is applied to the slot of its variable.
+    The structure of the program is kept in flat arrays of machine integers rather than in tokens.
+    That is, operands of all slots are concatenated into a single array, and the operands of each slot are found by
+    the offsets of the slot.
+    Variables occurring several times share a single slot.
+
+    Forward sweep evaluates slots in order, recording values and the partial derivatives of each slot wrt. its operands.
+    Partial derivatives are computed by the ``dual`` methods of operators and functions, seeding each operand with its
+    own tangent direction, so the derivative rules are shared with forward mode.
+    Then backward sweep visits slots in reverse order and propagates adjoints to operands.
+    Thus the full gradient costs a single forward and a single backward sweep regardless of the # of variables, while
+    forward mode and finite differences need work proportional to the # of variables.
+    Values are batches, and batch of size 1 is broadcast.
+    Slots which do not depend on any variable record no partial derivative.
+
+    **Reference**
+        * https://en.wikipedia.org/wiki/Automatic_differentiation#Reverse_accumulation
+        * https://doi.org/10.1137/1.9780898717761
+
+    :ivar __fun: Operator, function or polynomial of each slot. None for leaves.
+    :ivar __arg: Operand slots of all slots, concatenated.
+    :ivar __ofs: Offsets of operands of each slot in ``__arg``, with the end offset at the last.
+    :ivar __act: Flag of each slot whether it depends on some variable.
+    :ivar __var: Slots of variables.
+    :ivar __val: Values of each slot. Values of constants are fixed, and the others are recorded by forward sweep.
+    :ivar __part: Partial derivatives of each operand recorded by forward sweep. None if identically 0.
+    :ivar __out: Slot of the root of AST.
+    """
+
+    def __init__(self) -> None:
+        self.__fun: List[Optional[Union[type, Polynomial.UniPoly]]] = []
+        self.__arg: array = array('l')
+        self.__ofs: array = array('l', [0])
+        self.__act: array = array('b')
+        self.__var: Dict[str, int] = {}
+        self.__val: List[Optional[list]] = []
+        self.__part: List[Optional[list]] = []
+        self.__out: int = -1
+
+    def __len__(self) -> int:
+        return len(self.__fun)
+
+    def __new_slot(self, fun: Optional[Union[type, Polynomial.UniPoly]], act: bool, val: Optional[list]) -> int:
+        """
+        Append slot to the tape.
+
+        This method is private and called internally as a helper of ``Tape.const``, ``Tape.var`` and ``Tape.push``.
+
+        :param fun: Operator, function or polynomial of the slot.
+        :type fun: Optional[Union[type, Polynomial.UniPoly]]
+        :param act: Flag for the slot depending on some variable.
+        :type act: bool
+        :param val: Value of the slot.
+        :type val: Optional[list]
+
+        :return: Index of the slot.
+        :rtype: int
+        """
+        self.__fun.append(fun)
+        self.__ofs.append(len(self.__arg))
+        self.__act.append(act)
+        self.__val.append(val)
+        self.__out = len(self.__fun) - 1
+
+        return self.__out
+
+    def const(self, x: float) -> int:
+        """
+        Append constant to the tape.
+
+        :param x: Value of constant.
+        :type x: float
+
+        :return: Index of the slot.
+        :rtype: int
+        """
+        return self.__new_slot(None, False, [x])
+
+    def var(self, name: str) -> int:
+        """
+        Append variable to the tape.
+
+        If the variable is already in the tape, it is not appended again.
+
+        :param name: Name of variable.
+        :type name: str
+
+        :return: Index of the slot.
+        :rtype: int
+        """
+        if name not in self.__var:
+            self.__var[name] = self.__new_slot(None, True, None)
+
+        self.__out = self.__var[name]
+
+        return self.__out
+
+    def push(self, fun: Union[type, Polynomial.UniPoly], arg: List[int]) -> int:
+        """
+        Append operator, function or polynomial to the tape.
+
+        Operands must be in the tape already.
+
+        :param fun: Operator, function or polynomial.
+        :type fun: Union[type, Polynomial.UniPoly]
+        :param arg: Slots of operands.
+        :type arg: List[int]
+
+        :return: Index of the slot.
+        :rtype: int
+        """
+        self.__arg.extend(arg)
+        self.__part.extend([None] * len(arg))
+
+        return self.__new_slot(fun, any(self.__act[i] for i in arg), None)
+
+    def fwd(self, env: Dict[str, Union[float, List[float]]],
+            record: bool = True) -> Tuple[list, List[Warning.InterpWarn]]:
+        """
+        Run forward sweep.
+
+        Slots are evaluated in order by the ``dual`` methods of their operators and functions.
+        If recording, each operand depending on some variable is seeded with its own tangent direction, so that the
+        tangents of the result are the partial derivatives wrt. the operands.
+        Otherwise, operands are seeded with no direction, which is plain evaluation.
+        Arbitrary precision mode is turned off while evaluating, since partial derivatives are floats.
+
+        :param env: Points bound to variables. All variables in the tape must be bound. Batch of size 1 is broadcast.
+        :type env: Dict[str, Union[float, List[float]]]
+        :param record: Flag for recording partial derivatives for backward sweep. (Default: True)
+        :type record: bool
+
+        :return: Values of the root and list of generated warnings.
+        :rtype: Tuple[list, List[Warning.InterpWarn]]
+        """
+        for name, i in self.__var.items():
+            self.__val[i] = env[name] if type(env[name]) == list else [env[name]]
+
+        prec: Optional[int] = Precision.PrecFun.prec()
+        warn: List[Warning.InterpWarn] = []
+        Precision.PrecFun.set_prec(None)
+
+        try:
+            for i in range(len(self.__fun)):
+                if self.__fun[i] is None:
+                    continue
+
+                lo, hi = self.__ofs[i], self.__ofs[i + 1]
+
+                if not (record and self.__act[i]):
+                    res, res_warn = self.__fun[i].dual(*[Dual.Dual(self.__val[j], []) for j in self.__arg[lo:hi]])
+                    self.__val[i] = res.v
+                    warn += res_warn
+
+                    continue
+
+                # Each active operand is seeded with the direction of its position.
+                seed: List[Dual.Dual] = []
+
+                for k, j in enumerate(self.__arg[lo:hi]):
+                    d: List[Optional[List[float]]] = [None] * (hi - lo)
+
+                    if self.__act[j]:
+                        d[k] = [1.0]
+
+                    seed.append(Dual.Dual(self.__val[j], d))
+
+                res, res_warn = self.__fun[i].dual(*seed)
+                self.__val[i] = res.v
+                self.__part[lo:hi] = res.d
+                warn += res_warn
+        finally:
+            Precision.PrecFun.set_prec(prec)
+
+        return self.__val[self.__out], warn
+
+    def bwd(self) -> Dict[str, List[float]]:
+        """
+        Run backward sweep.
+
+        Adjoint of the root is 1, and adjoint of each slot is the sum of the adjoints of the slots using it multiplied
+        by the partial derivatives.
+        Slots are visited in reverse order, so the adjoint of each slot is complete when it is visited.
+        Adjoint of a slot is released right after it is propagated.
+        Forward sweep with recording must precede it.
+
+        :return: Partial derivatives of the root wrt. each variable.
+        :rtype: Dict[str, List[float]]
+        """
+        sz: int = len(self.__val[self.__out])
+        adj: List[Optional[list]] = [None] * len(self.__fun)
+        adj[self.__out] = [1.0]
+
+        for i in range(self.__out, -1, -1):
+            if adj[i] is None or self.__fun[i] is None:
+                continue
+
+            a: list = adj[i]
+            adj[i] = None
+
+            for e in range(self.__ofs[i], self.__ofs[i + 1]):
+                if self.__part[e] is None:
+                    continue
+
+                j: int = self.__arg[e]
+                n: int = max(len(a), len(self.__part[e]))
+                term: list = list(map(mul, Dual.DualArith.ext(a, n), Dual.DualArith.ext(self.__part[e], n)))
+
+                if adj[j] is None:
+                    adj[j] = term
+                else:
+                    n = max(n, len(adj[j]))
+                    adj[j] = list(map(add, Dual.DualArith.ext(adj[j], n), Dual.DualArith.ext(term, n)))
+
+        return {name: [0.0] * sz if adj[i] is None else Dual.DualArith.ext(adj[i], sz)
+                for name, i in self.__var.items()}
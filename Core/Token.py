@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import List, final, Union, Any, Dict
 
-from Core import AST, TypeSystem, TypeChecker
+from Core import AST, Polynomial, TypeSystem, TypeChecker
 from Function import *
 from Operator import *
 
@@ -211,6 +211,24 @@ class Var(Tok):
         return AST.AST.var_name(super().v)
 
 
+@final
+class Poly(Tok):
+    """
+    Polynomial token class.
+
+    Value of token is univariate polynomial, and the token stands for the polynomial of its variable.
+    Thus it is a leaf, which depends on the variable of the polynomial.
+    """
+
+    def __init__(self, v: Polynomial.UniPoly, pos: int = None) -> None:
+        super().__init__(v, pos)
+
+    def v_str(self) -> str:
+        buf: str = str(super().v)
+
+        return buf if ' ' not in buf else f'({buf})'
+
+
 @final
 class Fun(Tok):
     """
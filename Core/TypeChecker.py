@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from typing import final, List, Tuple, Optional, Set, Dict
+import pickle
+from copy import copy
+from multiprocessing import Pool
+from typing import final, Final, List, Tuple, Optional, Set, Dict, Union
 
 from Core import AST, Token, TypeSystem, Type
 from Operator import *
 from Util import Printer
-from copy import copy
 
 
 @final
@@ -30,6 +32,10 @@ class FVar:
     def __update(cls) -> None:
         cls.__cnt += 1
 
+    @classmethod
+    def rst(cls) -> None:
+        cls.__cnt = 0
+
     @property
     def v(self) -> int:
         return self.__v
@@ -84,6 +90,10 @@ class TVar:
     def __update(cls) -> None:
         cls.__cnt += 1
 
+    @classmethod
+    def rst(cls) -> None:
+        cls.__cnt = 0
+
     @property
     def v(self) -> int:
         return self.__v
@@ -94,311 +104,173 @@ class TVar:
 
 
 @final
-class FConst:
-    __idx_map: List[Tuple[int, int]] = []
-    __idx_src: List[Tuple[int, int]] = []
-    __merge_it: List[int] = []
-
-    def __init__(self, var: List[FVar], offset: List[Optional[int]]) -> None:
-        self.__var: List[FVar] = var
-        self.__offset: List[Optional[int]] = offset
-        self.__eq: bool = offset[0] is None
-
-    # Debugging
-    # latter remove
-    def __str__(self) -> str:
-        buf: str = '{'
+class FUnion:
+    """
+    Union-find over fold variables with integer offsets.
 
-        for i in range(len(self.__var)):
-            buf += f'{self.__var[i].v}:{self.__offset[i]}, '
+    Each node keeps its offset to its parent, so the difference constraint x - y = c between two nodes in the same
+    set can be read off after path compression in near constant time.
+    Absolute constraints x = c are encoded as x - ZERO = c against the distinguished node ``ZERO``.
 
-        return buf[:-2] + '}'
+    :cvar ZERO: Node standing for constant 0.
 
-    def __add__(self, other: FConst) -> FConst:
-        assert self.__eq == other.eq == False
+    :ivar __par: Parent of each node.
+    :ivar __off: Offset of each node to its parent.
+    :ivar __sz: Size of each set. Only valid for roots.
+    """
+    ZERO: Final[int] = -1
 
-        merged_var: List[FVar] = []
-        merged_offset: List[int] = []
-        i: int = 0
-        j: int = 0
-
-        while i < len(self.__var) and j < len(other.var):
-            while i < len(self.__var) and self.__var[i] < other.var[j]:
-                merged_var.append(self.__var[i])
-                merged_offset.append(self.__offset[i])
-                i += 1
-
-            if i == len(self.__var):
-                continue
-
-            while j < len(other.var) and self.__var[i] > other.var[j]:
-                merged_var.append(other.var[j])
-                merged_offset.append(other.offset[j])
-                j += 1
-
-        if i == len(self.__var):
-            merged_var += other.var[j:]
-            merged_offset += other.offset[j:]
-        else:
-            merged_var += self.__var[i:]
-            merged_offset += self.__offset[i:]
-
-        return FConst(merged_var, merged_offset)
-
-    def __mul__(self, other: FConst) -> Tuple[bool, Optional[FConst]]:
-        if self.__eq:
-            if other.eq:
-                return self.__mul_eq_eq_hlper(other)
-            else:
-                return self.__mul_eq_neq_hlpr(other)
-        else:
-            if other.eq:
-                return other * self
-            else:
-                return self.__mul_neq_neq_hlpr(other)
-
-    def __mul_eq_eq_hlper(self, other: FConst) -> Tuple[bool, Optional[FConst]]:
-        i: int = 0
-        j: int = 0
-        cnt: int = 0
-        new_var: List[FVar] = []
-        new_offset: List[Optional[int]] = []
+    def __init__(self) -> None:
+        self.__par: Dict[int, int] = {}
+        self.__off: Dict[int, int] = {}
+        self.__sz: Dict[int, int] = {}
 
-        self.__idx_map.clear()
-        self.__idx_src.clear()
-        self.__merge_it.clear()
+    def find(self, x: int) -> Tuple[int, int]:
+        """
+        Find root of node.
 
-        while i < len(self.__var) and j < len(other.var):
-            while i < len(self.__var) and self.__var[i] < other.var[j]:
-                new_var.append(self.__var[i])
-                self.__idx_src.append((-1, i))
-                i += 1
+        If the node is not seen before, it is registered as a new singleton set.
 
-            if i == len(self.__var):
-                continue
+        :param x: Node to be searched.
+        :type x: int
 
-            if self.__var[i] == other.var[j]:
-                self.__idx_map.append((i, j))
-                self.__idx_src.append((0, cnt))
-                cnt += 1
-                i += 1
-            else:
-                self.__idx_src.append((1, j))
+        :return: Root of the node and the offset of the node to the root.
+        :rtype: Tuple[int, int]
+        """
+        if x not in self.__par:
+            self.__par[x] = x
+            self.__off[x] = 0
+            self.__sz[x] = 1
 
-            new_var.append(other.var[j])
-            j += 1
+            return x, 0
 
-        if not self.__idx_map:
-            return True, None
+        path: List[int] = []
+        rt: int = x
 
-        if i == len(self.__var):
-            self.__idx_src += [(1, k + j) for k in range(len(other.var[j:]))]
-            new_var += other.var[j:]
-        else:
-            self.__idx_src += [(-1, k + i) for k in range(len(self.__var[i:]))]
-            new_var += self.__var[i:]
+        while self.__par[rt] != rt:
+            path.append(rt)
+            rt = self.__par[rt]
 
-        assert len(self.__idx_src) == len(new_var)
+        acc: int = 0
 
-        # Equal ref
-        if self.__idx_map[0][0] == 0:
-            if self.__idx_map[0][1] == 0:
-                for idx in self.__idx_map[1:]:
-                    if self.__offset[idx[0]] != other.offset[idx[1]]:
-                        return False, None
-
-                for idx in self.__idx_src:
-                    if idx[0] == -1:
-                        new_offset.append(self.__offset[idx[1]])
-                    elif idx[0] == 0:
-                        new_offset.append(other.offset[self.__idx_map[idx[1]][1]])
-                    else:
-                        new_offset.append(other.offset[idx[1]])
-
-                return True, FConst(new_var, new_offset)
-            # Self ref and other offset
-            else:
-                addi: int = other.offset[self.__idx_map[0][1]]
+        for node in reversed(path):
+            acc += self.__off[node]
+            self.__off[node] = acc
+            self.__par[node] = rt
 
-                for idx in self.__idx_map[1:]:
-                    if other.offset[idx[1]] - self.__offset[idx[0]] != addi:
-                        return False, None
+        return rt, self.__off[x] if path else 0
 
-                for idx in self.__idx_src:
-                    if idx[0] == -1:
-                        new_offset.append(self.__offset[idx[1]] + addi)
-                    elif idx[0] == 0:
-                        new_offset.append(other.offset[self.__idx_map[idx[1]][1]])
-                    else:
-                        new_offset.append(other.offset[idx[1]])
+    def union(self, x: int, y: int, d: int) -> bool:
+        """
+        Add difference constraint x - y = d.
 
-                return True, FConst(new_var, new_offset)
-        else:
-            # other ref and self offset
-            if self.__idx_map[0][1] == 0:
-                addi: int = self.__offset[self.__idx_map[0][0]]
-
-                for idx in self.__idx_map[1:]:
-                    if self.__offset[idx[0]] - other.offset[idx[1]] != addi:
-                        return False, None
-
-                for idx in self.__idx_src:
-                    if idx[0] == -1:
-                        new_offset.append(self.__offset[idx[1]])
-                    elif idx[0] == 0:
-                        new_offset.append(self.__offset[self.__idx_map[idx[1]][0]])
-                    else:
-                        new_offset.append(other.offset[idx[1]] + addi)
-
-                return True, FConst(new_var, new_offset)
-            else:
-                if self.__var[0] < other.var[0]:
-                    addi: int = self.__offset[self.__idx_map[0][0]] - other.offset[self.__idx_map[0][1]]
-
-                    for idx in self.__idx_map[1:]:
-                        if self.__offset[idx[0]] - other.offset[idx[1]] != addi:
-                            return False, None
-
-                    for idx in self.__idx_src:
-                        if idx[0] == -1:
-                            new_offset.append(self.__offset[idx[1]])
-                        elif idx[0] == 0:
-                            new_offset.append(self.__offset[self.__idx_map[idx[1]][0]])
-                        else:
-                            if idx[1] == 0:
-                                new_offset.append(addi)
-                            else:
-                                new_offset.append(other.offset[idx[1]] + addi)
-
-                    return True, FConst(new_var, new_offset)
-                else:
-                    addi: int = other.offset[self.__idx_map[0][1]] - self.__offset[self.__idx_map[0][0]]
-
-                    for idx in self.__idx_map[1:]:
-                        if other.offset[idx[1]] - self.__offset[idx[0]] != addi:
-                            return False, None
-
-                    for idx in self.__idx_src:
-                        if idx[0] == -1:
-                            if idx[1] == 0:
-                                new_offset.append(addi)
-                            else:
-                                new_offset.append(self.__offset[idx[1]] + addi)
-                        elif idx[0] == 0:
-                            new_offset.append(other.offset[self.__idx_map[idx[1]][1]])
-                        else:
-                            new_offset.append(other.offset[idx[1]])
-
-                    return True, FConst(new_var, new_offset)
-
-    def __mul_neq_neq_hlpr(self, other: FConst) -> Tuple[bool, Optional[FConst]]:
-        i: int = 0
-        j: int = 0
-        new_var: List[FVar] = []
-        new_offset: List[Optional[int]] = []
-        disjoint: bool = True
+        :param x: LHS node.
+        :type x: int
+        :param y: RHS node.
+        :type y: int
+        :param d: Difference.
+        :type d: int
 
-        while i < len(self.__var) and j < len(other.var):
-            while i < len(self.__var) and self.__var[i] < other.var[j]:
-                new_var.append(self.__var[i])
-                new_offset.append(self.__offset[i])
-                i += 1
+        :return: True if the constraint is consistent with the ones added so far. False otherwise.
+        :rtype: bool
+        """
+        rx, ox = self.find(x)
+        ry, oy = self.find(y)
 
-            if i == len(self.__var):
-                continue
+        if rx == ry:
+            return ox - oy == d
 
-            if self.__var[i] == other.var[j]:
-                if self.__offset[i] != other.offset[j]:
-                    return False, None
+        if self.__sz[rx] > self.__sz[ry]:
+            rx, ry, ox, oy, d = ry, rx, oy, ox, -d
 
-                i += 1
-                disjoint = False
+        self.__par[rx] = ry
+        self.__off[rx] = d - ox + oy
+        self.__sz[ry] += self.__sz[rx]
 
-            new_var.append(other.var[j])
-            new_offset.append(other.offset[j])
-            j += 1
+        return True
 
-        return (True, None) if disjoint else (True, FConst(new_var, new_offset))
 
-    def __mul_eq_neq_hlpr(self, other: FConst) -> Tuple[bool, Optional[FConst]]:
-        i: int = 0
-        j: int = 0
-        cnt: int = 0
-        new_var: List[FVar] = []
-        new_offset: List[Optional[int]] = []
+@final
+class FConst:
+    def __init__(self, var: List[FVar], offset: List[Optional[int]]) -> None:
+        self.__var: List[FVar] = var
+        self.__offset: List[Optional[int]] = offset
+        self.__eq: bool = offset[0] is None
 
-        self.__idx_map.clear()
-        self.__idx_src.clear()
-        self.__merge_it.clear()
+    # Debugging
+    # latter remove
+    def __str__(self) -> str:
+        buf: str = '{'
 
-        while i < len(self.__var) and j < len(other.var):
-            while i < len(self.__var) and self.__var[i] < other.var[j]:
-                new_var.append(self.__var[i])
-                self.__idx_src.append((-1, i))
-                i += 1
+        for i in range(len(self.__var)):
+            buf += f'{self.__var[i].v}:{self.__offset[i]}, '
 
-            if i == len(self.__var):
-                continue
+        return buf[:-2] + '}'
 
-            if self.__var[i] == other.var[j]:
-                self.__idx_map.append((i, j))
-                self.__idx_src.append((0, cnt))
-                cnt += 1
-                i += 1
-            else:
-                self.__idx_src.append((1, j))
+    def __add__(self, other: FConst) -> FConst:
+        assert self.__eq == other.eq == False
 
-            new_var.append(other.var[j])
-            j += 1
+        merged: Dict[int, Tuple[FVar, int]] = {var.v: (var, off) for var, off in zip(self.__var, self.__offset)}
 
-        if not self.__idx_map:
-            return True, None
+        for var, off in zip(other.var, other.offset):
+            merged.setdefault(var.v, (var, off))
 
-        if i == len(self.__var):
-            self.__idx_src += [(1, k + j) for k in range(len(other.var[j:]))]
-            new_var += other.var[j:]
-        else:
-            self.__idx_src += [(-1, k + i) for k in range(len(self.__var[i:]))]
-            new_var += self.__var[i:]
+        return FConst([merged[v][0] for v in sorted(merged)], [merged[v][1] for v in sorted(merged)])
 
-        assert len(self.__idx_src) == len(new_var)
+    @classmethod
+    def solve(cls, const_l: List[FConst]) -> Optional[List[FConst]]:
+        """
+        Solve fold constraints.
+
+        Every constraint is a set of difference constraints between fold variables and its reference.
+        Here, the reference is the first variable for equality constraint and constant 0 for the other.
+        They are fed into a single union-find with offsets, so the whole list is solved in near linear time.
+        Then each connected component is read back in normal form.
+        That is, components bound to constant 0 are merged into one absolute constraint, and the others become
+        equality constraints referencing their smallest variable.
+
+        :param const_l: Fold constraints to be solved.
+        :type const_l: List[FConst]
+
+        :return: Equality constraints followed by absolute constraint, if any. None if constraints are inconsistent.
+        :rtype: Optional[List[FConst]]
+        """
+        uf: FUnion = FUnion()
+        var_map: Dict[int, FVar] = {}
+        absolute: bool = False
+
+        for const in const_l:
+            ref: int = const.var[0].v if const.eq else FUnion.ZERO
+            absolute |= not const.eq
+
+            for var, off in zip(const.var, const.offset):
+                var_map.setdefault(var.v, var)
+
+                if off is None:
+                    uf.find(var.v)
+                elif not uf.union(var.v, ref, off):
+                    return None
 
-        # Ref eq something
-        if self.__idx_map[0][0] == 0:
-            addi: int = other.offset[self.__idx_map[0][1]]
+        zero_rt, zero_off = uf.find(FUnion.ZERO) if absolute else (None, 0)
+        comp: Dict[int, Tuple[List[FVar], List[int]]] = {}
 
-            for idx in self.__idx_map[1:]:
-                if other.offset[idx[1]] - self.__offset[idx[0]] != addi:
-                    return False, None
+        for v in sorted(var_map):
+            rt, off = uf.find(v)
+            var_l, off_l = comp.setdefault(rt, ([], []))
+            var_l.append(var_map[v])
+            off_l.append(off)
 
-            for idx in self.__idx_src:
-                if idx[0] == -1:
-                    new_offset.append(self.__offset[idx[1]] + addi)
-                elif idx[0] == 0:
-                    new_offset.append(other.offset[self.__idx_map[idx[1]][1]])
-                else:
-                    new_offset.append(other.offset[idx[1]])
+        res: List[FConst] = []
 
-            return True, FConst(new_var, new_offset)
-        else:
-            addi: int = other.offset[self.__idx_map[0][1]] - self.__offset[self.__idx_map[0][0]]
-
-            for idx in self.__idx_map[1:]:
-                if other.offset[idx[1]] - self.__offset[idx[0]] != addi:
-                    return False, None
+        for rt, (var_l, off_l) in comp.items():
+            if rt != zero_rt:
+                res.append(FConst(var_l, [None] + [off - off_l[0] for off in off_l[1:]]))
 
-            for idx in self.__idx_src:
-                if idx[0] == -1:
-                    if idx[1] == 0:
-                        new_offset.append(addi)
-                    else:
-                        new_offset.append(self.__offset[idx[1]] + addi)
-                elif idx[0] == 0:
-                    new_offset.append(other.offset[self.__idx_map[idx[1]][1]])
-                else:
-                    new_offset.append(other.offset[idx[1]])
+        if zero_rt in comp:
+            var_l, off_l = comp[zero_rt]
+            res.append(FConst(var_l, [off - zero_off for off in off_l]))
 
-            return True, FConst(new_var, new_offset)
+        return res
 
     @property
     def var(self) -> List[FVar]:
@@ -416,58 +288,87 @@ class FConst:
     def var(self, var: List[FVar]) -> None:
         self.__var = var
 
-    def drop(self) -> FConst:
-        if not self.__eq:
-            return self
-
-        drop_msk: List[bool] = [False for _ in range(len(self.__var))]
-        uniq_idx: List[int] = [0]
-
-        i: int = 1
+    def restrict(self, keep: Set[int]) -> Optional[FConst]:
+        """
+        Restrict constraint to fold variables.
 
-        while i < len(self.__var):
-            if self.__offset[i] == 0:
-                drop_msk[i] = True
-                self.__var[i].v = self.__var[0].v
+        Other variables are quantified out.
+        For equality constraint, offsets are rebased to the first remaining variable.
 
-            i += 1
+        :param keep: Indices of fold variables to be kept.
+        :type keep: Set[int]
 
-        i: int = 1
+        :return: Restricted constraint. None if no variable remains.
+        :rtype: Optional[FConst]
+        """
+        idx: List[int] = [i for i in range(len(self.__var)) if self.__var[i].v in keep]
 
-        while i < len(self.__var):
-            if drop_msk[i]:
-                i += 1
+        if len(idx) == len(self.__var):
+            return self
+        elif not idx:
+            return None
+        elif not self.__eq:
+            return FConst([self.__var[i] for i in idx], [self.__offset[i] for i in idx])
 
-                continue
+        off: List[int] = [self.__offset[i] or 0 for i in idx]
 
-            uniq_idx.append(i)
+        return FConst([self.__var[i] for i in idx], [None] + [it - off[0] for it in off[1:]])
 
-            j: int = i + 1
+    def drop(self) -> FConst:
+        if not self.__eq:
+            return self
 
-            while j < len(self.__var):
-                if self.__var[i] == self.__var[j]:
-                    drop_msk[j] = True
-                    self.__var[j].v = self.__var[i]
+        uniq: Dict[int, int] = {}
 
-                j += 1
+        for i in range(len(self.__var)):
+            if i > 0 and self.__offset[i] == 0:
+                self.__var[i].v = self.__var[0].v
 
-            i += 1
+            uniq.setdefault(self.__var[i].v, i)
 
-        return FConst([self.__var[idx] for idx in uniq_idx], [self.__offset[idx] for idx in uniq_idx])
+        return FConst([self.__var[idx] for idx in uniq.values()], [self.__offset[idx] for idx in uniq.values()])
 
 
 @final
 class TConst:
+    """
+    Type constraint table.
+
+    Rows of ``cand`` list jointly possible types of variables.
+    Along with the rows, it keeps the domain of each variable as bitset over type kinds.
+    Kinds are base types and list of each base type, and two types can be unified iff their kinds coincide.
+    Thus empty intersection of domains refutes unification without scanning rows at all.
+    Likewise, the set of variables is kept as bitset so that tables sharing no variable are skipped at once.
+
+    Variable which is not coupled with others is kept as a mere domain, built by ``TConst.dom_t``, and it has no row.
+    Its domain is intersected with others by bitwise and, and other tables are filtered by it row by row.
+    Rows are built only if the variable is looked up or it becomes coupled with others.
+    Conversely, ``TConst.split`` and ``TConst.drop`` turn variables which are no longer coupled back into domains.
+
+    :cvar __KIND: Kind of each base type. Kind of list type is offset by the # of base types.
+    """
+    __KIND: Final[Dict[type, int]] = {TypeSystem.Real: 0, TypeSystem.Cmplx: 1, TypeSystem.Str: 2, TypeSystem.Bool: 3,
+                                      TypeSystem.Void: 4, TypeSystem.Interval: 5}
     __idx_map: List[Tuple[int, int]] = []
     __idx_src: List[Tuple[int, int]] = []
     __merge_it: List[Tuple[int, int, List[TypeSystem.T], List[FConst]]] = []
-    __merge_idx: List[int] = []
+    __verbose: bool = True
 
     def __init__(self, var: List[TVar], cand: List[List[TypeSystem.T]], f_const: List[List[FConst]]) -> None:
         self.__var: List[TVar] = var
         self.__cand: List[List[TypeSystem.T]] = cand
         self.__f_const: List[List[FConst]] = f_const
         self.__f_var_l: List[List[FVar]] = []
+        self.__dom: List[int] = [0] * len(var)
+        self.__var_msk: int = 0
+        self.__free: bool = self.__is_free()
+
+        for it in var:
+            self.__var_msk |= 1 << it.v
+
+        for it in cand:
+            for pos in range(len(var)):
+                self.__dom[pos] |= 1 << self.__kind(it[pos])
 
         for it in f_const:
             if not it:
@@ -488,7 +389,7 @@ class TConst:
         while pos < len(self.__var):
             if item == self.__var[pos]:
 
-                return {it[pos] for it in self.__cand}
+                return {it[pos] for it in self.cand}
             elif item < self.__var[pos]:
                 return None
 
@@ -496,28 +397,201 @@ class TConst:
 
         return None
 
-    def __mul__(self, other: TConst) -> Tuple[bool, Optional[TConst]]:
-        print('unifying two constraint table')
-        print('LHS')
-        print('  @var  : ' + ', '.join([str(var.v) for var in self.__var]))
-        print('  @const:')
+    @classmethod
+    def __kind(cls, t: TypeSystem.T) -> int:
+        """
+        Find kind of type.
+
+        This method is private and called internally as a helper of ``TConst``.
+
+        :param t: Type whose kind is to be found.
+        :type t: TypeSystem.T
+
+        :return: Kind of type.
+        :rtype: int
+        """
+        return cls.__KIND[type(t)] if t.base else len(cls.__KIND) + cls.__KIND[type(t.chd_t)]
+
+    @classmethod
+    def kind_msk(cls, base: List[type], lst: List[type]) -> int:
+        """
+        Find bitset of kinds.
+
+        :param base: Base types in the bitset.
+        :type base: List[type]
+        :param lst: Base types whose lists are in the bitset.
+        :type lst: List[type]
+
+        :return: Bitset of kinds.
+        :rtype: int
+        """
+        return sum(1 << cls.__KIND[t] for t in base) + sum(1 << (len(cls.__KIND) + cls.__KIND[t]) for t in lst)
+
+    @classmethod
+    def dom_t(cls, var: TVar, msk: int) -> TConst:
+        """
+        Build table which is a mere domain of single variable.
+
+        The domain is kept as bitset only, and rows are built lazily by ``TConst.__build``.
+        Lists in the domain have free folds.
+
+        :param var: Variable of the table.
+        :type var: TVar
+        :param msk: Bitset of kinds in the domain.
+        :type msk: int
+
+        :return: Domain table.
+        :rtype: TConst
+        """
+        res: TConst = TConst([var], [], [])
+        res.__cand = res.__f_const = res.__f_var_l = None
+        res.__dom = [msk]
+
+        return res
+
+    @classmethod
+    def verbose(cls, flag: bool) -> None:
+        cls.__verbose = flag
+
+    def __is_free(self) -> bool:
+        """
+        Check whether the table is a mere domain of single variable.
+
+        That is, it has single variable and none of its rows has fold constraint other than the existence of fold.
+
+        This method is private and called internally as a helper of ``TConst``.
+
+        :return: True if the table is a mere domain.
+        :rtype: bool
+        """
+        return len(self.__var) == 1 and all(
+            not it or (len(it) == 1 and it[0].eq and len(it[0].var) == 1) for it in self.__f_const)
+
+    def __build(self) -> None:
+        """
+        Build rows of domain table.
+
+        Each kind in the domain becomes a row, and list kinds get fresh folds.
+
+        This method is private and called internally as a helper of ``TConst.cand``, ``TConst.f_const`` and
+        ``TConst.f_var_l``.
+        """
+        base_l: List[type] = sorted(self.__KIND, key=self.__KIND.get)
+        self.__cand, self.__f_const, self.__f_var_l = [], [], []
+
+        for kind in range(2 * len(base_l)):
+            if not self.__dom[0] >> kind & 1:
+                continue
+            elif kind < len(base_l):
+                self.__cand.append([base_l[kind].inst()])
+                self.__f_const.append([])
+                self.__f_var_l.append([])
+            else:
+                f_var: FVar = FVar()
+                self.__cand.append([List2(base_l[kind - len(base_l)].inst(), f_var)])
+                self.__f_const.append([FConst([f_var], [None])])
+                self.__f_var_l.append([f_var])
+
+    def __fold(self) -> None:
+        """
+        Turn table back into domain table if it is a mere domain of single variable.
+
+        This method is private and called internally as a helper of ``TConst.__del_col``.
+        """
+        self.__free = self.__is_free()
+
+        if self.__free:
+            self.__cand = self.__f_const = self.__f_var_l = None
+
+    def __dedup(self) -> None:
+        """
+        Remove duplicate rows.
+
+        Rows are duplicates if they coincide up to renaming of folds.
+        Thus, rows are compared by the kinds of their types and the positions where each fold appears.
+
+        This method is private and called internally as a helper of ``TConst.__del_col``.
+        """
+        seen: Set[tuple] = set()
+        keep: List[int] = []
 
         for i in range(len(self.__cand)):
-            print(f'    [{i}] ' + ', '.join([str(t) for t in self.__cand[i]]) + ' ' +
-                  ' '.join([str(it) for it in self.__f_const[i]]) + ' / ' +
-                  ', '.join([str(var.v) for var in self.__f_var_l[i]]))
+            pos: Dict[int, int] = {}
+            key: list = []
+
+            for t in self.__cand[i]:
+                key.append((self.__kind(t), None if t.base else pos.setdefault(t.fold.v, len(pos))))
+
+            for const in self.__f_const[i]:
+                key.append(tuple(zip([pos.setdefault(var.v, len(pos)) for var in const.var], const.offset)))
+
+            if tuple(key) not in seen:
+                seen.add(tuple(key))
+                keep.append(i)
+
+        if len(keep) < len(self.__cand):
+            self.__cand = [self.__cand[i] for i in keep]
+            self.__f_const = [self.__f_const[i] for i in keep]
+            self.__f_var_l = [self.__f_var_l[i] for i in keep]
 
-        print('')
-        print('RHS')
-        print('  @var  : ' + ', '.join([str(var.v) for var in other.var]))
-        print('  @const:')
+    def __restrict(self, pos: int, msk: int) -> Tuple[bool, Optional[TConst]]:
+        """
+        Restrict domain of variable by mask.
 
-        for i in range(len(other.cand)):
-            print(f'    [{i}] ' + ', '.join([str(t) for t in other.cand[i]]) + ' ' +
-                  ' '.join([str(it) for it in other.f_const[i]]) + ' / ' +
-                  ', '.join([str(var.v) for var in other.__f_var_l[i]]))
+        The table is filtered row by row, and no joint row is built.
+        This is the case when the other table is a mere domain of single variable which is not coupled with others.
+        If the table itself is a domain table, the domains are intersected by bitwise and.
 
-        print('')
+        This method is private and called internally as a helper of ``TConst.__mul__``.
+
+        :param pos: Position of variable to be restricted.
+        :type pos: int
+        :param msk: Bitset of admissible kinds.
+        :type msk: int
+
+        :return: Flag for success and restricted table.
+        :rtype: Tuple[bool, Optional[TConst]]
+        """
+        if self.__cand is None:
+            return (True, TConst.dom_t(self.__var[0], self.__dom[0] & msk)) if self.__dom[0] & msk else (False, None)
+
+        if self.__dom[pos] & msk == self.__dom[pos]:
+            return True, TConst(self.__var, self.__cand, self.__f_const)
+
+        keep: List[int] = [i for i in range(len(self.__cand)) if msk >> self.__kind(self.__cand[i][pos]) & 1]
+
+        if not keep:
+            return False, None
+
+        return True, TConst(copy(self.__var), [copy(self.__cand[i]) for i in keep],
+                            [copy(self.__f_const[i]) for i in keep])
+
+    def __mul__(self, other: TConst) -> Tuple[bool, Optional[TConst]]:
+        if not self.__var_msk & other.var_msk:
+            return True, None
+
+        if self.__verbose:
+            print('unifying two constraint table')
+            print('LHS')
+            print('  @var  : ' + ', '.join([str(var.v) for var in self.__var]))
+            print('  @const:')
+
+            for i in range(len(self.cand)):
+                print(f'    [{i}] ' + ', '.join([str(t) for t in self.cand[i]]) + ' ' +
+                      ' '.join([str(it) for it in self.f_const[i]]) + ' / ' +
+                      ', '.join([str(var.v) for var in self.f_var_l[i]]))
+
+            print('')
+            print('RHS')
+            print('  @var  : ' + ', '.join([str(var.v) for var in other.var]))
+            print('  @const:')
+
+            for i in range(len(other.cand)):
+                print(f'    [{i}] ' + ', '.join([str(t) for t in other.cand[i]]) + ' ' +
+                      ' '.join([str(it) for it in other.f_const[i]]) + ' / ' +
+                      ', '.join([str(var.v) for var in other.f_var_l[i]]))
+
+            print('')
 
         i: int = 0
         j: int = 0
@@ -551,7 +625,8 @@ class TConst:
             j += 1
 
         if not self.__idx_map:
-            print('nothing to unify')
+            if self.__verbose:
+                print('nothing to unify')
 
             return True, None
 
@@ -564,29 +639,42 @@ class TConst:
 
         assert len(self.__idx_src) == len(new_var)
 
+        msk: List[int] = [self.__dom[idx[0]] & other.dom[idx[1]] for idx in self.__idx_map]
+
+        if not all(msk):
+            if self.__verbose:
+                print('unification failed')
+
+            return False, None
+
+        if self.__free:
+            return other.__restrict(self.__idx_map[0][1], msk[0])
+        elif other.free:
+            return self.__restrict(self.__idx_map[0][0], msk[0])
+
+        # Rows are joined on the kinds of shared variables, since types resolve iff their kinds coincide.
+        join: Dict[Tuple[int, ...], List[int]] = {}
+
+        for j in range(len(other.cand)):
+            join.setdefault(tuple(self.__kind(other.cand[j][idx[1]]) for idx in self.__idx_map), []).append(j)
+
         for i in range(len(self.__cand)):
-            for j in range(len(other.cand)):
-                merge_flag: bool = True
+            for j in join.get(tuple(self.__kind(self.__cand[i][idx[0]]) for idx in self.__idx_map), ()):
                 resolved: List[TypeSystem.T] = []
                 f_const: List[FConst] = []
 
                 for idx in self.__idx_map:
                     sub_t, const = self.__t_resolve(self.__cand[i][idx[0]], other.cand[j][idx[1]])
-
-                    merge_flag &= bool(sub_t)
                     resolved.append(sub_t)
 
                     if const:
                         f_const.append(const)
 
-                    if not merge_flag:
-                        break
-
-                if merge_flag:
-                    self.__merge_it.append((i, j, resolved, f_const))
+                self.__merge_it.append((i, j, resolved, f_const))
 
         if not self.__merge_it:
-            print('unification failed')
+            if self.__verbose:
+                print('unification failed')
 
             return False, None
 
@@ -618,18 +706,22 @@ class TConst:
             new_f_const.append(new_const_it)
 
         if not new_cand:
-            print('unification failed')
+            if self.__verbose:
+                print('unification failed')
+
             return False, None
 
-        print('unification result')
-        print('  @var  : ' + ', '.join([str(var.v) for var in new_var]))
-        print('  @const:')
+        if self.__verbose:
+            print('unification result')
+            print('  @var  : ' + ', '.join([str(var.v) for var in new_var]))
+            print('  @const:')
+
+            for i in range(len(new_cand)):
+                print(f'    [{i}] ' + ', '.join([str(t) for t in new_cand[i]]) + ' ' +
+                      ' '.join([str(it) for it in new_f_const[i]]))
 
-        for i in range(len(new_cand)):
-            print(f'    [{i}] ' + ', '.join([str(t) for t in new_cand[i]]) + ' ' +
-                  ' '.join([str(it) for it in new_f_const[i]]))
+            print('')
 
-        print('')
         return True, TConst(new_var, new_cand, new_f_const)
 
     def __t_resolve(self, t1: TypeSystem.T, t2: TypeSystem.T) -> Tuple[Optional[TypeSystem.T], Optional[FConst]]:
@@ -647,67 +739,15 @@ class TConst:
             return List2(t1.chd_t, t1.fold), FConst([t2.fold, t1.fold], [None, 0])
 
     def __f_unify(self, f_const_l1: List[FConst], f_const_l2: List[FConst]) -> Optional[List[FConst]]:
-        unified: List[FConst] = []
-        merged: List[FConst] = []
-
-        self.__merge_idx.clear()
-        f_const_l2 = copy(f_const_l2)
-
-        for i in range(len(f_const_l1)):
-            del_idx: List[int] = []
-            res: FConst = f_const_l1[i]
-            j: int = 0
-
-            while j < len(f_const_l2):
-                succ, tmp = res * f_const_l2[j]
-
-                if not succ:
-                    return None
-
-                if tmp:
-                    del_idx.append(j)
-                    res = tmp
-
-                j += 1
-
-            if del_idx:
-                j = len(del_idx) - 1
-
-                while j >= 0:
-                    del f_const_l2[del_idx[j]]
-
-                    j -= 1
-
-                f_const_l2.append(res)
-            else:
-                unified.append(copy(res))
-
-        unified += f_const_l2
-
-        for i in range(len(unified)):
-            if unified[i].eq:
-                merged.append(unified[i])
-            else:
-                self.__merge_idx.append(i)
-
-        if len(self.__merge_idx) == 0:
-            return merged
-
-        res: FConst = unified[self.__merge_idx[0]]
-
-        for i in self.__merge_idx[1:]:
-            res += unified[i]
-
-        return merged + [res]
+        return FConst.solve(f_const_l1 + f_const_l2)
 
     def __alpha_conv(self, cand: List[TypeSystem.T], f_const: List[FConst],
                      f_var: List[FVar]) -> Tuple[List[TypeSystem.T], List[FConst]]:
         new_f_var: List[FVar] = [FVar() for _ in range(len(f_var))]
         var_map: Dict[int, FVar] = {f_var[i].v: new_f_var[i] for i in range(len(f_var))}
 
-        for t in cand:
-            if not t.base:
-                t.fold = var_map[t.fold.v]
+        # Types may be shared by rows of the source tables, so they are rebuilt rather than renamed in place.
+        cand = [t if t.base else List2(t.chd_t, var_map[t.fold.v]) for t in cand]
 
         for const in f_const:
             const.var = [var_map[var.v] for var in const.var]
@@ -746,81 +786,151 @@ class TConst:
 
     @property
     def cand(self) -> List[List[TypeSystem.T]]:
+        if self.__cand is None:
+            self.__build()
+
         return self.__cand
 
     @property
     def f_const(self) -> List[List[FConst]]:
+        if self.__cand is None:
+            self.__build()
+
         return self.__f_const
 
     @property
     def f_var_l(self) -> List[List[FVar]]:
+        if self.__cand is None:
+            self.__build()
+
         return self.__f_var_l
 
+    @property
+    def dom(self) -> List[int]:
+        return self.__dom
+
+    @property
+    def free(self) -> bool:
+        return self.__free
+
+    @property
+    def var_msk(self) -> int:
+        return self.__var_msk
+
     def empty(self) -> bool:
         return not self.__var
 
-    def split(self) -> List[TConst]:
-        if len(self.__var) == 1:
-            return [self]
+    def __del_col(self, pos: int) -> None:
+        """
+        Delete column of variable.
 
-        i: int = len(self.__var) - 1
-        del_idx: List[int] = []
-        frag: List[TConst] = []
+        Rows which coincide after the deletion are merged, and the table is turned back into domain table if it is a
+        mere domain of single variable.
 
-        while i >= 0:
-            split_flag: bool = True
-            j: int = 1
-            ref_t: TypeSystem.T = self.__cand[0][i]
+        This method is private and called internally as a helper of ``TConst.split`` and ``TConst.drop``.
 
-            while j < len(self.__cand) and split_flag:
-                split_flag &= (ref_t == self.__cand[j][i])
-                j += 1
+        :param pos: Position of variable to be deleted.
+        :type pos: int
+        """
+        self.__var_msk &= ~(1 << self.__var[pos].v)
+        del self.__var[pos]
+        del self.__dom[pos]
+
+        if self.__cand is None:
+            return
+
+        for it in self.__cand:
+            del it[pos]
+
+        self.__prune()
+        self.__dedup()
+        self.__fold()
+
+    def __prune(self) -> None:
+        """
+        Remove fold variables which no type in the row refers to.
+
+        They are left by deleted columns, and keeping them would make fold constraints grow with the size of AST.
+
+        This method is private and called internally as a helper of ``TConst.__del_col``.
+        """
+        for i in range(len(self.__cand)):
+            ref: Set[int] = {t.fold.v for t in self.__cand[i] if not t.base}
 
-            if split_flag:
-                del_idx.append(i)
-                frag.append(TConst([self.__var[i]], [[self.__cand[0][i]]]))
+            if len(ref) == len(self.__f_var_l[i]):
+                continue
+
+            self.__f_const[i] = [it for it in [const.restrict(ref) for const in self.__f_const[i]] if it]
+            self.__f_var_l[i] = [var for var in self.__f_var_l[i] if var.v in ref]
+
+    def split(self) -> List[TConst]:
+        """
+        Split out variables which are not coupled with others.
 
-            i -= 1
+        Variable is not coupled if its type is the same base type in every row.
+        Such variable is split out as domain table, so that later unifications do not carry its column.
+        Variables of list types are kept, since their folds may be coupled by fold constraints.
 
-        if not frag:
+        :return: Split tables.
+        :rtype: List[TConst]
+        """
+        if len(self.__var) == 1:
             return [self]
 
-        for idx in del_idx:
-            del self.__var[idx]
+        frag: List[TConst] = []
+
+        for i in reversed(range(len(self.__var))):
+            # Deletion may turn the table into domain table, whose only variable is not coupled as well.
+            if self.__cand is None:
+                break
+
+            ref_t: TypeSystem.T = self.__cand[0][i]
 
-            for it in self.__cand:
-                del it[idx]
+            if ref_t.base and all(it[i] == ref_t for it in self.__cand):
+                frag.append(TConst.dom_t(self.__var[i], self.__dom[i]))
+                self.__del_col(i)
 
         return frag + [self] if self.__var else frag
 
     def drop(self, var: TVar) -> Optional[TVar]:
+        """
+        Drop variable from the table.
+
+        The column of the variable is deleted, that is, the variable is quantified out.
+        Thus it must not be referenced by later unifications.
+
+        :param var: Variable to be dropped.
+        :type var: TVar
+
+        :return: Dropped variable. None if the table does not have it.
+        :rtype: Optional[TVar]
+        """
         i: int = 0
 
         while i < len(self.__var) and self.__var[i] < var:
             i += 1
 
         if i < len(self.__var) and var == self.__var[i]:
-            print(f'drop {var.v} from constraint table')
-            print('TARGET')
-            print('  @var  : ' + ', '.join([str(var.v) for var in self.__var]))
-
-            for it in self.__cand:
-                print('  @const: ' + ', '.join([str(t) for t in it]))
+            if self.__verbose:
+                print(f'drop {var.v} from constraint table')
+                print('TARGET')
+                print('  @var  : ' + ', '.join([str(var.v) for var in self.__var]))
 
-            print('')
+                for it in self.cand:
+                    print('  @const: ' + ', '.join([str(t) for t in it]))
 
-            del self.__var[i]
+                print('')
 
-            for it in self.__cand:
-                del it[i]
+            self.__del_col(i)
 
-            print('drop result')
-            print('  @var  : ' + ', '.join([str(var.v) for var in self.__var]))
+            if self.__verbose:
+                print('drop result')
+                print('  @var  : ' + ', '.join([str(var.v) for var in self.__var]))
 
-            for it in self.__cand:
-                print('  @const: ' + ', '.join([str(t) for t in it]))
+                for it in self.cand if self.__var else []:
+                    print('  @const: ' + ', '.join([str(t) for t in it]))
 
-            print('')
+                print('')
 
             return var
         else:
@@ -830,37 +940,210 @@ class TConst:
 @final
 class TChker:
     __inst: TChker = None
+    __sgn_tb: Dict[str, Tuple[int, List[List[TypeSystem.T]], List[List[FConst]]]] = {}
 
     def __init__(self) -> None:
         self.__expr: AST.AST = None
         self.__t_env: Dict[int, TVar] = {}
         self.__t_const: List[TConst] = []
+        self.__verbose: bool = True
 
     def __new_f_var(self, cnt: int) -> List[FVar]:
         return [FVar() for _ in range(cnt)]
 
     def __new_t_var(self) -> TVar:
         t_var: TVar = TVar()
-        f_var: List[FVar] = self.__new_f_var(5)
-
-        self.__t_const.append(TConst([t_var],
-                                     [[TypeSystem.Real.inst()], [TypeSystem.Cmplx.inst()], [TypeSystem.Str.inst()],
-                                      [TypeSystem.Bool.inst()], [TypeSystem.Void.inst()],
-                                      [List2(TypeSystem.Real.inst(), f_var[0])],
-                                      [List2(TypeSystem.Cmplx.inst(), f_var[1])],
-                                      [List2(TypeSystem.Str.inst(), f_var[2])],
-                                      [List2(TypeSystem.Bool.inst(), f_var[3])],
-                                      [List2(TypeSystem.Void.inst(), f_var[4])]],
-                                     [[], [], [], [], [], [FConst([f_var[0]], [None])], [FConst([f_var[1]], [None])],
-                                      [FConst([f_var[2]], [None])], [FConst([f_var[3]], [None])],
-                                      [FConst([f_var[4]], [None])]]))
+        t_l: List[type] = [TypeSystem.Real, TypeSystem.Cmplx, TypeSystem.Str, TypeSystem.Bool, TypeSystem.Void]
+
+        self.__t_const.append(TConst.dom_t(t_var, TConst.kind_msk(t_l, t_l)))
 
         return t_var
 
+    def __drop(self, var: TVar) -> None:
+        """
+        Drop variable which is no longer referenced.
+
+        Type variables of children are referenced only by the constraint of their parent.
+        Thus they are dropped once it is unified, so that tables do not grow with the size of AST.
+
+        This method is private and called internally as a helper of ``TChker.__chk_t_hlpr``.
+
+        :param var: Variable to be dropped.
+        :type var: TVar
+        """
+        for i in range(len(self.__t_const)):
+            if self.__t_const[i].drop(var):
+                if self.__t_const[i].empty():
+                    del self.__t_const[i]
+
+                return
+
+    def __lift(self, f_var: List[FVar], cand: List[List[TypeSystem.T]], f_const: List[List[FConst]]) -> None:
+        """
+        Extend signature table over list items to the one over list items which are themselves lists.
+
+        Each row of base types is lifted to the row of lists of those types sharing single fold, since the items of
+        list must be of the same depth.
+        Lists of void, i.e. empty lists, are added as well.
+        Rows are appended in place.
+
+        This method is private and called internally as a helper of ``TChker.__mk_sgn``.
+
+        :param f_var: Fold variables of the signature.
+        :type f_var: List[FVar]
+        :param cand: Candidate table of base types.
+        :type cand: List[List[TypeSystem.T]]
+        :param f_const: Fold constraints of the signature.
+        :type f_const: List[List[FConst]]
+        """
+        base: List[List[TypeSystem.T]] = cand + [[TypeSystem.Void.inst()] * len(cand[0])]
+
+        for row in base:
+            var: FVar = FVar()
+            f_var.append(var)
+            cand.append([List2(t, var) for t in row])
+            f_const.append([FConst([var], [None])])
+
+    def __nest(self, f_var: List[FVar], cand: List[List[TypeSystem.T]], f_const: List[List[FConst]]) -> None:
+        """
+        Extend signature table of list and its item to the one where the item is itself a list.
+
+        For each row, the item becomes list of the same base type, and the fold of the list is one more than that of
+        the item.
+        Lists of empty lists are added as well.
+        Rows are appended in place.
+
+        This method is private and called internally as a helper of ``TChker.__mk_sgn``.
+
+        :param f_var: Fold variables of the signature.
+        :type f_var: List[FVar]
+        :param cand: Candidate table of list and its item.
+        :type cand: List[List[TypeSystem.T]]
+        :param f_const: Fold constraints of the signature.
+        :type f_const: List[List[FConst]]
+        """
+        for t in [row[1] for row in cand] + [TypeSystem.Void.inst()]:
+            # Fold of item comes first, since variables of fold constraint must be sorted.
+            item, lst = self.__new_f_var(2)
+            f_var += [item, lst]
+            cand.append([List2(t, lst), List2(t, item)])
+            f_const.append([FConst([item, lst], [None, 1])])
+
+    def __mk_sgn(self, key: str) -> Tuple[int, List[List[TypeSystem.T]], List[List[FConst]]]:
+        """
+        Build signature table template.
+
+        Fold variables in the template are placeholders numbered from 0.
+        They are replaced with fresh ones whenever the template is instantiated by ``TChker.__sgn``.
+
+        This method is private and called internally as a helper of ``TChker.__sgn``.
+
+        :param key: Name of signature table.
+        :type key: str
+
+        :return: # of fold variables, candidate table, and fold constraints of the signature.
+        :rtype: Tuple[int, List[List[TypeSystem.T]], List[List[FConst]]]
+        """
+        real: TypeSystem.T = TypeSystem.Real.inst()
+        cmplx: TypeSystem.T = TypeSystem.Cmplx.inst()
+        str_t: TypeSystem.T = TypeSystem.Str.inst()
+        bool_t: TypeSystem.T = TypeSystem.Bool.inst()
+        void: TypeSystem.T = TypeSystem.Void.inst()
+
+        if key == 'ADD':
+            f_var: List[FVar] = self.__new_f_var(12)
+            cand: List[List[TypeSystem.T]] = [[real, real, real], [cmplx, cmplx, real], [cmplx, real, cmplx],
+                                              [cmplx, cmplx, cmplx],
+                                              [real, List2(real, f_var[0]), List2(real, f_var[0])],
+                                              [real, List2(cmplx, f_var[1]), List2(cmplx, f_var[1])],
+                                              [cmplx, List2(real, f_var[2]), List2(cmplx, f_var[2])],
+                                              [cmplx, List2(cmplx, f_var[3]), List2(cmplx, f_var[3])],
+                                              [List2(real, f_var[4]), real, List2(real, f_var[4])],
+                                              [List2(cmplx, f_var[5]), real, List2(cmplx, f_var[5])],
+                                              [List2(real, f_var[6]), cmplx, List2(cmplx, f_var[6])],
+                                              [List2(cmplx, f_var[7]), cmplx, List2(cmplx, f_var[7])],
+                                              [List2(real, f_var[8]), List2(real, f_var[8]), List2(real, f_var[8])],
+                                              [List2(cmplx, f_var[9]), List2(real, f_var[9]),
+                                               List2(cmplx, f_var[9])],
+                                              [List2(real, f_var[10]), List2(cmplx, f_var[10]),
+                                               List2(cmplx, f_var[10])],
+                                              [List2(cmplx, f_var[11]), List2(cmplx, f_var[11]),
+                                               List2(cmplx, f_var[11])]]
+            f_const: List[List[FConst]] = [[], [], [], []] + [[FConst([var], [None])] for var in f_var]
+        elif key == 'LIST_0':
+            f_var: List[FVar] = self.__new_f_var(1)
+            cand: List[List[TypeSystem.T]] = [[List2(void, f_var[0])]]
+            f_const: List[List[FConst]] = [[FConst([f_var[0]], [1])]]
+        elif key == 'LIST_1':
+            f_var: List[FVar] = self.__new_f_var(4)
+            cand: List[List[TypeSystem.T]] = [[List2(real, f_var[0]), real], [List2(cmplx, f_var[1]), cmplx],
+                                              [List2(str_t, f_var[2]), str_t], [List2(bool_t, f_var[3]), bool_t]]
+            f_const: List[List[FConst]] = [[FConst([var], [1])] for var in f_var]
+            self.__nest(f_var, cand, f_const)
+        elif key == 'LIST_INIT':
+            f_var: List[FVar] = []
+            cand: List[List[TypeSystem.T]] = [[real, real, real], [real, cmplx, cmplx], [cmplx, real, cmplx],
+                                              [cmplx, cmplx, cmplx], [str_t, str_t, str_t],
+                                              [bool_t, bool_t, bool_t]]
+            f_const: List[List[FConst]] = [[] for _ in range(len(cand))]
+            self.__lift(f_var, cand, f_const)
+        elif key == 'LIST_CHAIN':
+            f_var: List[FVar] = []
+            cand: List[List[TypeSystem.T]] = [[real, real, real, real], [real, cmplx, real, cmplx],
+                                              [cmplx, real, real, cmplx], [cmplx, cmplx, real, cmplx],
+                                              [real, real, cmplx, cmplx], [real, cmplx, cmplx, cmplx],
+                                              [cmplx, real, cmplx, cmplx], [cmplx, cmplx, cmplx, cmplx],
+                                              [str_t, str_t, str_t, str_t], [bool_t, bool_t, bool_t, bool_t]]
+            f_const: List[List[FConst]] = [[] for _ in range(len(cand))]
+            self.__lift(f_var, cand, f_const)
+        elif key == 'LIST_FIN':
+            f_var: List[FVar] = self.__new_f_var(4)
+            cand: List[List[TypeSystem.T]] = [[List2(real, f_var[0]), real], [List2(cmplx, f_var[1]), cmplx],
+                                              [List2(str_t, f_var[2]), str_t], [List2(bool_t, f_var[3]), bool_t]]
+            f_const: List[List[FConst]] = [[FConst([var], [1])] for var in f_var]
+            self.__nest(f_var, cand, f_const)
+        else:
+            raise NotImplementedError
+
+        for i in range(len(f_var)):
+            f_var[i].v = i
+
+        return len(f_var), cand, f_const
+
+    def __sgn(self, key: str) -> Tuple[List[List[TypeSystem.T]], List[List[FConst]]]:
+        """
+        Instantiate signature table.
+
+        Signature tables do not change over type checking, so their templates are built only once and cached.
+        Since unification mutates tables in place, each call returns fresh copy whose fold variables are also fresh.
+
+        This method is private and called internally as a helper of ``TChker.__chk_t_hlpr``.
+
+        :param key: Name of signature table.
+        :type key: str
+
+        :return: Candidate table and fold constraints of the signature.
+        :rtype: Tuple[List[List[TypeSystem.T]], List[List[FConst]]]
+        """
+        tmpl: Optional[Tuple[int, List[List[TypeSystem.T]], List[List[FConst]]]] = self.__sgn_tb.get(key)
+
+        if not tmpl:
+            tmpl = self.__sgn_tb[key] = self.__mk_sgn(key)
+
+        f_var: List[FVar] = self.__new_f_var(tmpl[0])
+        cand: List[List[TypeSystem.T]] = [[t if t.base else List2(t.chd_t, f_var[t.fold.v]) for t in row]
+                                          for row in tmpl[1]]
+        f_const: List[List[FConst]] = [[FConst([f_var[var.v] for var in const.var], copy(const.offset))
+                                        for const in row] for row in tmpl[2]]
+
+        return cand, f_const
+
     def __t_unify(self, new_const: TConst) -> None:
         new_const_l: List[TConst] = [new_const]
         unified: List[TConst] = []
-        print('UNIFY')
+
+        if self.__verbose:
+            print('UNIFY')
 
         for i in range(len(self.__t_const)):
             del_idx: List[int] = []
@@ -887,8 +1170,7 @@ class TChker:
 
                     j -= 1
 
-                # new_const_l += res.split()
-                new_const_l += [res]
+                new_const_l += res.split()
             else:
                 unified.append(res)
 
@@ -925,13 +1207,13 @@ class TChker:
 
         if tok_t == Token.Num:
             if type(rt.v) == complex:
-                self.__t_unify(TConst([rt.t_var], [[TypeSystem.Cmplx.inst()]], [[]]))
+                self.__t_unify(TConst.dom_t(rt.t_var, TConst.kind_msk([TypeSystem.Cmplx], [])))
             else:
-                self.__t_unify(TConst([rt.t_var], [[TypeSystem.Real.inst()]], [[]]))
+                self.__t_unify(TConst.dom_t(rt.t_var, TConst.kind_msk([TypeSystem.Real], [])))
         elif tok_t == Token.Str:
-            self.__t_unify(TConst([rt.t_var], [[TypeSystem.Str.inst()]], [[]]))
+            self.__t_unify(TConst.dom_t(rt.t_var, TConst.kind_msk([TypeSystem.Str], [])))
         elif tok_t == Token.Bool:
-            self.__t_unify(TConst([rt.t_var], [[TypeSystem.Bool.inst()]], [[]]))
+            self.__t_unify(TConst.dom_t(rt.t_var, TConst.kind_msk([TypeSystem.Bool], [])))
         elif tok_t == Token.Var:
             pass
             # find: TVar = self.__t_env.get(rt.v)
@@ -945,112 +1227,37 @@ class TChker:
             self.__chk_t_hlpr(rt.chd[0])
             rt.chd[1].t_var = self.__new_t_var()
             self.__chk_t_hlpr(rt.chd[1])
-
-            f_var: List[FVar] = self.__new_f_var(12)
-
-            self.__t_unify(TConst([rt.t_var, rt.chd[0].t_var, rt.chd[1].t_var],
-                                  [[TypeSystem.Real.inst(), TypeSystem.Real.inst(), TypeSystem.Real.inst()],
-                                   [TypeSystem.Cmplx.inst(), TypeSystem.Cmplx.inst(), TypeSystem.Real.inst()],
-                                   [TypeSystem.Cmplx.inst(), TypeSystem.Real.inst(), TypeSystem.Cmplx.inst()],
-                                   [TypeSystem.Cmplx.inst(), TypeSystem.Cmplx.inst(), TypeSystem.Cmplx.inst()],
-                                   [TypeSystem.Real.inst(), List2(TypeSystem.Real.inst(), f_var[0]),
-                                    List2(TypeSystem.Real.inst(), f_var[0])],
-                                   [TypeSystem.Real.inst(), List2(TypeSystem.Cmplx.inst(), f_var[1]),
-                                    List2(TypeSystem.Cmplx.inst(), f_var[1])],
-                                   [TypeSystem.Cmplx.inst(), List2(TypeSystem.Real.inst(), f_var[2]),
-                                    List2(TypeSystem.Cmplx.inst(), f_var[2])],
-                                   [TypeSystem.Cmplx.inst(), List2(TypeSystem.Cmplx.inst(), f_var[3]),
-                                    List2(TypeSystem.Cmplx.inst(), f_var[3])],
-                                   [List2(TypeSystem.Real.inst(), f_var[4]), TypeSystem.Real.inst(),
-                                    List2(TypeSystem.Real.inst(), f_var[4])],
-                                   [List2(TypeSystem.Cmplx.inst(), f_var[5]), TypeSystem.Real.inst(),
-                                    List2(TypeSystem.Cmplx.inst(), f_var[5])],
-                                   [List2(TypeSystem.Real.inst(), f_var[6]), TypeSystem.Cmplx.inst(),
-                                    List2(TypeSystem.Cmplx.inst(), f_var[6])],
-                                   [List2(TypeSystem.Cmplx.inst(), f_var[7]), TypeSystem.Cmplx.inst(),
-                                    List2(TypeSystem.Cmplx.inst(), f_var[7])],
-                                   [List2(TypeSystem.Real.inst(), f_var[8]), List2(TypeSystem.Real.inst(), f_var[8]),
-                                    List2(TypeSystem.Real.inst(), f_var[8])],
-                                   [List2(TypeSystem.Cmplx.inst(), f_var[9]), List2(TypeSystem.Real.inst(), f_var[9]),
-                                    List2(TypeSystem.Cmplx.inst(), f_var[9])],
-                                   [List2(TypeSystem.Real.inst(), f_var[10]), List2(TypeSystem.Cmplx.inst(), f_var[10]),
-                                    List2(TypeSystem.Cmplx.inst(), f_var[10])],
-                                   [List2(TypeSystem.Cmplx.inst(), f_var[11]),
-                                    List2(TypeSystem.Cmplx.inst(), f_var[11]),
-                                    List2(TypeSystem.Cmplx.inst(), f_var[11])]],
-                                  [[], [], [], [], [FConst([f_var[0]], [None])],
-                                   [FConst([f_var[1]], [None])], [FConst([f_var[2]], [None])],
-                                   [FConst([f_var[3]], [None])], [FConst([f_var[4]], [None])],
-                                   [FConst([f_var[5]], [None])], [FConst([f_var[6]], [None])],
-                                   [FConst([f_var[7]], [None])], [FConst([f_var[8]], [None])],
-                                   [FConst([f_var[9]], [None])], [FConst([f_var[10]], [None])],
-                                   [FConst([f_var[11]], [None])]]))
+            self.__t_unify(TConst([rt.t_var, rt.chd[0].t_var, rt.chd[1].t_var], *self.__sgn('ADD')))
+            self.__drop(rt.chd[0].t_var)
+            self.__drop(rt.chd[1].t_var)
         elif tok_t == Token.List:
             for tok in rt.chd:
                 tok.t_var = self.__new_t_var()
                 self.__chk_t_hlpr(tok)
 
             if rt.argc == 0:
-                f_var: FVar = FVar()
-
-                self.__t_unify(TConst([rt.t_var], [[List2(TypeSystem.Void.inst(), f_var)]], [[FConst([f_var], [1])]]))
+                self.__t_unify(TConst([rt.t_var], *self.__sgn('LIST_0')))
             elif rt.argc == 1:
-                f_var: List[FVar] = self.__new_f_var(4)
-
-                self.__t_unify(TConst([rt.t_var, rt.chd[0].t_var],
-                                      [[List2(TypeSystem.Real.inst(), f_var[0]), TypeSystem.Real.inst()],
-                                       [List2(TypeSystem.Cmplx.inst(), f_var[1]), TypeSystem.Cmplx.inst()],
-                                       [List2(TypeSystem.Str.inst(), f_var[2]), TypeSystem.Str.inst()],
-                                       [List2(TypeSystem.Bool.inst(), f_var[3]), TypeSystem.Bool.inst()]],
-                                      [[FConst([f_var[0]], [1])], [FConst([f_var[1]], [1])], [FConst([f_var[2]], [1])],
-                                       [FConst([f_var[3]], [1])]]))
+                self.__t_unify(TConst([rt.t_var, rt.chd[0].t_var], *self.__sgn('LIST_1')))
+                self.__drop(rt.chd[0].t_var)
             else:
                 dummy: TVar = self.__new_t_var()
 
-                self.__t_unify(TConst([rt.chd[0].t_var, rt.chd[1].t_var, dummy],
-                                      [[TypeSystem.Real.inst(), TypeSystem.Real.inst(), TypeSystem.Real.inst()],
-                                       [TypeSystem.Real.inst(), TypeSystem.Cmplx.inst(), TypeSystem.Cmplx.inst()],
-                                       [TypeSystem.Cmplx.inst(), TypeSystem.Real.inst(), TypeSystem.Cmplx.inst()],
-                                       [TypeSystem.Cmplx.inst(), TypeSystem.Cmplx.inst(), TypeSystem.Cmplx.inst()],
-                                       [TypeSystem.Str.inst(), TypeSystem.Str.inst(), TypeSystem.Str.inst()],
-                                       [TypeSystem.Bool.inst(), TypeSystem.Bool.inst(), TypeSystem.Bool.inst()]],
-                                      [[], [], [], [], [], []]))
+                self.__t_unify(TConst([rt.chd[0].t_var, rt.chd[1].t_var, dummy], *self.__sgn('LIST_INIT')))
+                self.__drop(rt.chd[1].t_var)
 
                 for i in range(len(rt.chd) - 2):
                     prev_dummy: TVar = dummy
 
                     dummy = self.__new_t_var()
                     self.__t_unify(TConst([rt.chd[0].t_var, rt.chd[i + 2].t_var, prev_dummy, dummy],
-                                          [[TypeSystem.Real.inst(), TypeSystem.Real.inst(), TypeSystem.Real.inst(),
-                                            TypeSystem.Real.inst()],
-                                           [TypeSystem.Real.inst(), TypeSystem.Cmplx.inst(), TypeSystem.Real.inst(),
-                                            TypeSystem.Cmplx.inst()],
-                                           [TypeSystem.Cmplx.inst(), TypeSystem.Real.inst(), TypeSystem.Real.inst(),
-                                            TypeSystem.Cmplx.inst()],
-                                           [TypeSystem.Cmplx.inst(), TypeSystem.Cmplx.inst(), TypeSystem.Real.inst(),
-                                            TypeSystem.Cmplx.inst()],
-                                           [TypeSystem.Real.inst(), TypeSystem.Real.inst(), TypeSystem.Cmplx.inst(),
-                                            TypeSystem.Cmplx.inst()],
-                                           [TypeSystem.Real.inst(), TypeSystem.Cmplx.inst(), TypeSystem.Cmplx.inst(),
-                                            TypeSystem.Cmplx.inst()],
-                                           [TypeSystem.Cmplx.inst(), TypeSystem.Real.inst(), TypeSystem.Cmplx.inst(),
-                                            TypeSystem.Cmplx.inst()],
-                                           [TypeSystem.Cmplx.inst(), TypeSystem.Cmplx.inst(), TypeSystem.Cmplx.inst(),
-                                            TypeSystem.Cmplx.inst()],
-                                           [TypeSystem.Str.inst(), TypeSystem.Str.inst(), TypeSystem.Str.inst(),
-                                            TypeSystem.Str.inst()],
-                                           [TypeSystem.Bool.inst(), TypeSystem.Bool.inst(), TypeSystem.Bool.inst(),
-                                            TypeSystem.Bool.inst()]], [[], [], [], [], [], [], [], [], [], []]))
-
-                f_var: List[FVar] = self.__new_f_var(4)
-
-                self.__t_unify(TConst([rt.t_var, dummy],
-                                      [[List2(TypeSystem.Real.inst(), f_var[0]), TypeSystem.Real.inst()],
-                                       [List2(TypeSystem.Cmplx.inst(), f_var[1]), TypeSystem.Cmplx.inst()],
-                                       [List2(TypeSystem.Str.inst(), f_var[2]), TypeSystem.Str.inst()],
-                                       [List2(TypeSystem.Bool.inst(), f_var[3]), TypeSystem.Bool.inst()]],
-                                      [[FConst([f_var[0]], [None])], [FConst([f_var[1]], [None])],
-                                       [FConst([f_var[2]], [None])], [FConst([f_var[3]], [None])]]))
+                                          *self.__sgn('LIST_CHAIN')))
+                    self.__drop(rt.chd[i + 2].t_var)
+                    self.__drop(prev_dummy)
+
+                self.__t_unify(TConst([rt.t_var, dummy], *self.__sgn('LIST_FIN')))
+                self.__drop(rt.chd[0].t_var)
+                self.__drop(dummy)
         else:
             raise NotImplementedError
 
@@ -1061,6 +1268,41 @@ class TChker:
             if find:
                 return find
 
+    def __infer(self, expr: AST.AST) -> Set[TypeSystem.T]:
+        """
+        Infer possible types of AST.
+
+        This method is private and called internally as a helper of ``TChker.chk_t`` and ``TChker.chk_many``.
+
+        :param expr: AST to be type checked.
+        :type expr: AST.AST
+
+        :return: Set of possible types of AST.
+        :rtype: Set[TypeSystem.T]
+        """
+        self.__expr = expr
+        self.__init()
+        self.__expr.rt.t_var = self.__new_t_var()
+        self.__chk_t_hlpr(self.__expr.rt)
+
+        return self.__find_t(expr.rt.t_var)
+
+    def __intern(self, t: TypeSystem.T) -> TypeSystem.T:
+        """
+        Replace base types with singleton objects.
+
+        Types sent back from worker processes are copies, so they must be interned before being compared by identity.
+
+        This method is private and called internally as a helper of ``TChker.chk_many``.
+
+        :param t: Type to be interned.
+        :type t: TypeSystem.T
+
+        :return: Interned type.
+        :rtype: TypeSystem.T
+        """
+        return type(t).inst() if t.base else List2(self.__intern(t.chd_t), t.fold)
+
     @classmethod
     def inst(cls) -> TChker:
         if not cls.__inst:
@@ -1069,8 +1311,6 @@ class TChker:
         return cls.__inst
 
     def chk_t(self, expr: AST.AST):
-        self.__expr = expr
-
         buf: Type.BufT = Type.BufT.DEBUG  # Debug buffer.
 
         Printer.Printer.inst().buf(Printer.Printer.inst().f_title('type checking target'), buf)
@@ -1078,17 +1318,87 @@ class TChker:
         Printer.Printer.inst().buf_newline(buf)
         Printer.Printer.inst().buf(Printer.Printer.inst().f_title('type checking chain'), buf)
 
-        Printer.Printer.inst().buf(Printer.Printer.inst().f_prog('Initializing type checker'), buf, False, 2)
-        self.__init()
-        Printer.Printer.inst().buf(Printer.Printer.inst().f_col('done', Type.Col.BLUE), buf)
-        Printer.Printer.inst().buf(f'@__const_l: {len(self.__t_const)} (cleared)', buf, indent=4)
-        Printer.Printer.inst().buf_newline(buf)
-
         Printer.Printer.inst().buf(Printer.Printer.inst().f_prog('Running type checker'), buf, False, 2)
-        self.__expr.rt.t_var = self.__new_t_var()
-        self.__chk_t_hlpr(self.__expr.rt)
+        t: Set[TypeSystem.T] = self.__infer(expr)
         Printer.Printer.inst().buf(Printer.Printer.inst().f_col('done', Type.Col.BLUE), buf)
         Printer.Printer.inst().buf(f'@AST     : {expr}', buf, indent=4)
-        tmp: str = ' or '.join([str(t) for t in self.__find_t(expr.rt.t_var)])
+        tmp: str = ' or '.join([str(it) for it in t])
         Printer.Printer.inst().buf(f'@inferred: {tmp}', buf, indent=4)
         Printer.Printer.inst().buf_newline(buf)
+
+    def chk_many(self, expr_l: List[AST.AST], proc: int = 1) -> List[Union[Set[TypeSystem.T], Exception]]:
+        """
+        Type check many ASTs at once.
+
+        Unlike ``TChker.chk_t``, it skips all debug outputs and reuses the state of the type checker across ASTs.
+        Signature tables are shared, and variable counters are rewound before each AST so that they do not grow
+        over the batch.
+        Error of one AST, whatever its kind is, does not stop the batch. Instead, the error is reported in place of its
+        type.
+
+        If ``proc`` is greater than 1, ASTs are split into contiguous shards which are type checked in separate
+        worker processes.
+        Since only the types are sent back, type variables in the ASTs are not set in this case.
+
+        :param expr_l: ASTs to be type checked.
+        :type expr_l: List[AST.AST]
+        :param proc: # of worker processes. (Default: 1)
+        :type proc: int
+
+        :return: Set of possible types or error for each AST, in the same order with the input.
+        :rtype: List[Union[Set[TypeSystem.T], Exception]]
+        """
+        if proc > 1 and len(expr_l) > 1:
+            sz: int = -(-len(expr_l) // proc)  # Size of each shard.
+
+            with Pool(proc) as pool:
+                res_l: List[List[Union[Set[TypeSystem.T], Exception]]] = \
+                    pool.map(chk_shard, [expr_l[i:i + sz] for i in range(0, len(expr_l), sz)])
+
+            return [it if isinstance(it, Exception) else {self.__intern(t) for t in it} for res in res_l for it in res]
+
+        res: List[Union[Set[TypeSystem.T], Exception]] = []
+        self.__verbose = False
+        TConst.verbose(False)
+
+        try:
+            for expr in expr_l:
+                TVar.rst()
+                FVar.rst()
+
+                try:
+                    res.append(self.__infer(expr))
+                except Exception as err:
+                    res.append(err)
+        finally:
+            self.__verbose = True
+            TConst.verbose(True)
+
+        return res
+
+
+def chk_shard(expr_l: List[AST.AST]) -> List[Union[Set[TypeSystem.T], Exception]]:
+    """
+    Type check shard of ASTs in worker process.
+
+    It is the entry point of worker processes spawned by ``TChker.chk_many``.
+    Errors are sent back to the parent process by pickling.
+    Error which cannot be restored from its pickle would break the whole pool, so it is replaced by a plain
+    ``Exception`` with the same message.
+
+    :param expr_l: ASTs to be type checked.
+    :type expr_l: List[AST.AST]
+
+    :return: Set of possible types or error for each AST.
+    :rtype: List[Union[Set[TypeSystem.T], Exception]]
+    """
+    res: List[Union[Set[TypeSystem.T], Exception]] = TChker.inst().chk_many(expr_l)
+
+    for i, it in enumerate(res):
+        if isinstance(it, Exception):
+            try:
+                pickle.loads(pickle.dumps(it))
+            except Exception:
+                res[i] = Exception(f'{type(it).__name__}: {it}')
+
+    return res
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import final, List, Optional
+from typing import final, List, Optional, Dict, Tuple
 
 
 class T:
@@ -28,7 +28,7 @@ class Real(T):
         super().__init__(True)
 
     def __le__(self, other: T) -> bool:
-        return type(other) in [Real, Cmplx, Sym]
+        return type(other) in [Real, Cmplx, Interval, Sym]
 
     def __str__(self) -> str:
         return 'Real'
@@ -200,13 +200,47 @@ class Void(T):
         return cls.__inst
 
 
+@final
+class Interval(T):
+    __inst: Interval = None
+
+    def __init__(self) -> None:
+        super().__init__(True)
+
+    def __le__(self, other: T) -> bool:
+        return type(other) in [Interval, Sym]
+
+    def __str__(self) -> str:
+        return 'Interval'
+
+    @classmethod
+    def inst(cls) -> Interval:
+        """
+        Getter for singleton object.
+
+        If it is the first time calling this, it initializes the singleton objects.
+        This automatically supports so called lazy initialization.
+
+        :return: Singleton object.
+        :rtype: Interval
+        """
+        if not cls.__inst:
+            cls.__inst = Interval()
+
+        return cls.__inst
+
+
 @final
 class Tens(T):
+    __shape_tb: Dict[Tuple[Optional[int], ...], Tuple[Optional[int], ...]] = {}
+
     def __init__(self, chd_t: T, dim: List[int]) -> None:
         super().__init__(False)
         self.__chd_t: T = chd_t
         self.__dim: List[int] = dim
         self.__fold: int = len(dim)
+        self.__shape: Tuple[Optional[int], ...] = self.__intern(tuple(dim))
+        self.__homo: bool = None not in self.__shape
 
     def __le__(self, other: T) -> bool:
         other_t: type = type(other)
@@ -214,9 +248,9 @@ class Tens(T):
         if other_t == Sym:
             return True
         elif other_t == Tens:
-            return self.__chd_t <= other.chd_t and len(self.__dim) == len(other.dim)
+            return self.__chd_t <= other.chd_t and self.__fold == other.fold
         elif other_t == Arr:
-            return self.__chd_t <= other.chd_t and len(self.__dim) == other.fold
+            return self.__chd_t <= other.chd_t and self.__fold == other.fold
         else:
             return False
 
@@ -229,6 +263,22 @@ class Tens(T):
     def __str__(self) -> str:
         return f'List of {self.__chd_t} ({self.__fold} fold)'
 
+    @classmethod
+    def __intern(cls, shape: Tuple[Optional[int], ...]) -> Tuple[Optional[int], ...]:
+        """
+        Intern shape tuple.
+
+        Every tensor type with the same shape shares one shape tuple, so two shapes can be compared by identity in O(1)
+        instead of comparing dimension lists element by element.
+
+        :param shape: Shape to be interned.
+        :type shape: Tuple[Optional[int], ...]
+
+        :return: Canonical shape tuple.
+        :rtype: Tuple[Optional[int], ...]
+        """
+        return cls.__shape_tb.setdefault(shape, shape)
+
     @property
     def chd_t(self) -> T:
         return self.__chd_t
@@ -241,6 +291,14 @@ class Tens(T):
     def fold(self) -> int:
         return self.__fold
 
+    @property
+    def shape(self) -> Tuple[Optional[int], ...]:
+        return self.__shape
+
+    @property
+    def homo(self) -> bool:
+        return self.__homo
+
 
 @final
 class Arr(T):
@@ -288,16 +346,43 @@ class ArrFact:
         return cls.__inst
 
     def get_arr_t(self, chd_t: List[T]) -> Optional[T]:
+        """
+        Infer type of list from the types of its items.
+
+        Supertype and homogeneity are computed in one pass over the items.
+        Tensor items carry interned shape and homogeneity flag, so checking whether all items share the same shape
+        costs one identity comparison per item, regardless of the depth of nesting.
+
+        :param chd_t: Types of items.
+        :type chd_t: List[T]
+
+        :return: Inferred type. None if the items have no common supertype.
+        :rtype: Optional[T]
+        """
         if not chd_t:
             return Tens(Void.inst(), [0])
 
-        res_t: T = chd_t[0]
+        ref_t: T = chd_t[0]
+        res_t: T = ref_t
+        homo: bool = type(ref_t) == Tens and ref_t.homo
+        shape: Tuple[Optional[int], ...] = ref_t.shape if homo else None
+
+        for t in chd_t:
+            if t is not res_t:
+                sup_t: Optional[T] = T.supt(res_t, t)
 
-        for i in range(len(chd_t) - 1):
-            res_t = T.supt(res_t, chd_t[i + 1])
+                # Tensor and array of the same fold are joined to the array of the supertype of their items.
+                if not sup_t and not (res_t.base or t.base) and res_t.fold == t.fold:
+                    item_t: Optional[T] = T.supt(res_t.chd_t, t.chd_t)
+                    sup_t = Arr(item_t, t.fold) if item_t else None
 
-            if not res_t:
-                return None
+                if not sup_t:
+                    return None
+
+                res_t = sup_t
+
+            if homo and (type(t) != Tens or t.shape is not shape):
+                homo = False
 
         if res_t.base:
             if type(res_t) == Void:
@@ -308,19 +393,11 @@ class ArrFact:
                 return Tens(res_t, [len(chd_t)])
 
         if type(res_t) == Arr:
-            return Arr(res_t.chd_t, res_t.fold, chd_t)
+            return Arr(res_t.chd_t, res_t.fold + 1, chd_t)
+        elif len(chd_t) == 1:
+            return Tens(res_t.chd_t, [1, *res_t.dim])
         else:
-            if len(chd_t) == 1:
-                return Tens(chd_t[0].chd_t, [1, *res_t.dim])
-
-            homo = all([d is not None for d in res_t.dim])
-            i: int = 2
-
-            while homo and i < len(chd_t):
-                homo &= (chd_t[0].dim == chd_t[i].dim)
-                i += 1
-
-            return Tens(res_t.chd_t, [len(chd_t), *res_t.dim]) if homo else Arr(res_t.chd_t, len(res_t.dim) + 1, chd_t)
+            return Tens(res_t.chd_t, [len(chd_t), *shape]) if homo else Arr(res_t.chd_t, res_t.fold + 1, chd_t)
 
     def coerce_arr_t(self, src: T, chd_t: T) -> T:
         if type(chd_t) == Sym:
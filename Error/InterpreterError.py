@@ -25,6 +25,8 @@ class TErr(Error.InterpErr):
                 self.__err_sgn: str = f'{err_tok.chd[0].t}[' + ', '.join([str(tok.t) for tok in err_tok.chd[1:]]) + f']'
             else:
                 self.__err_sgn: str = f'{err_tok.chd[0].t} {err_tok.v.sym()} {err_tok.chd[1].t}'
+        elif type(err_tok) == Token.Fun:
+            self.__err_sgn: str = f'{err_tok.v_str()}[' + ', '.join([str(tok.t) for tok in err_tok.chd]) + ']'
 
     @property
     def err_sgn(self) -> str:
@@ -1,123 +1,1227 @@
 from __future__ import annotations
 
-from typing import final, Dict, Optional
+import math
+from bisect import bisect_right
+from collections import OrderedDict
+from itertools import accumulate, chain, compress, count, islice, repeat
+from operator import add, and_, floordiv, mul, sub
+from typing import final, Final, Dict, Optional, List, Tuple, Union, Callable
 
-from Core import Token, TypeSystem
+from Core import Token, TypeSystem, Type
 from Function import Function
+from Util.Macro import is_int, is_bigint, is_smallint
+from Warning import Warning
 
 
 class CombFun(Function.Fun):
+    """
+    Combinatorial function toolbox.
+
+    Combinatorial numbers are exact integers, and they are read off from memo tables which grow on demand.
+    There are two kinds of tables.
+        1. Prefix tables of factorials, double factorials, subfactorials, Bell numbers, harmonic numbers, Fibonacci
+           numbers and Lucas numbers.
+           Each table keeps all values up to the largest index queried so far, but it never grows beyond ``__TB_SZ``.
+           Beyond the limit, values are computed directly from the last entry.
+        2. Rows of Pascal triangle and Stirling triangles.
+           Rows are kept in LRU cache whose total size in bits is bounded by ``__ROW_BUDGET``.
+           Rows of Stirling triangles are computed from the nearest cached row above, so the cost of a sweep over n is
+           amortized as well.
+    Thus, repeated queries, say ``Binom[n, k]`` over a sweep of k, are amortized O(1) after the first call.
+
+    Huge parameters, say n around 10^6, are handled by algorithms whose cost is dominated by a few multiplications of
+    big integers.
+        1. Factorial is computed by prime swing algorithm, ``n! = (n/2)!^2 * n≀`` where the swing factorial ``n≀`` is
+           factored over primes up to n.
+        2. Binomial coefficient with both k and n - k large is factored over primes up to n by Kummer's theorem.
+        3. Fibonacci and Lucas numbers are computed by fast doubling in O(log n) steps.
+    Primes are sieved once and cached, and products of many factors are taken by balanced binary splitting so that
+    each multiplication is between factors of similar sizes.
+
+    **Reference**
+        * https://en.wikipedia.org/wiki/Bell_triangle
+        * https://en.wikipedia.org/wiki/Stirling_numbers_of_the_first_kind
+        * https://en.wikipedia.org/wiki/Stirling_numbers_of_the_second_kind
+        * https://en.wikipedia.org/wiki/Kahan_summation_algorithm
+        * Luschny, P. Fast factorial functions. http://www.luschny.de/math/factorial/FastFactorialFunctions.htm
+        * https://en.wikipedia.org/wiki/Kummer%27s_theorem
+        * https://www.nayuki.io/page/fast-fibonacci-algorithms
+
+    :cvar __TB_SZ: Maximum size of prefix tables.
+    :cvar __ROW_MAX: Maximum index of rows to be cached.
+    :cvar __ROW_BUDGET: Maximum total size of cached rows in bits.
+    :cvar __SWING_MIN: Minimum parameter where factorial is computed by prime swing algorithm.
+    :cvar __tb: Prefix tables.
+    :cvar __bell_row: Last row of Bell triangle.
+    :cvar __harm_acc: Running sum of harmonic series and its compensation.
+    :cvar __row_tb: LRU cache of rows and their sizes in bits.
+    :cvar __row_sz: Total size of cached rows in bits.
+    :cvar __prime: Primes sieved so far.
+    :cvar __sieve_lim: Upper bound of sieved primes.
+    """
+    __TB_SZ: Final[int] = 1 << 12
+    __ROW_MAX: Final[int] = 1 << 11
+    __ROW_BUDGET: Final[int] = 1 << 28
+    __SWING_MIN: Final[int] = 1 << 14
+
+    __tb: Dict[type, list] = {}
+    __bell_row: List[int] = [1]
+    __harm_acc: List[float] = [0.0, 0.0]
+    __row_tb: OrderedDict[Tuple[type, int], Tuple[List[int], int]] = OrderedDict()
+    __row_sz: int = 0
+    __prime: List[int] = []
+    __sieve_lim: int = 1
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
     @classmethod
-    def chk_t(cls, rt: Token.Tok, t_env: Dict[int, TypeSystem.T]) -> Optional[Dict[int, TypeSystem.T]]:
-        t1: TypeSystem.T = rt.chd[0].t
+    def __tb_get(cls, n: int) -> list:
+        """
+        Get prefix table which contains index n.
+
+        If the table is shorter, it grows up to n.
+        Factorials grow by a single ``accumulate`` call, and harmonic numbers are accumulated with Neumaier's
+        compensation so that each entry is accurate up to rounding.
+        Index n must be less than ``__TB_SZ``.
+
+        This method is private and called internally as a helper of the computation kernels and ``CombFun.eval``.
+
+        :param n: Index to be contained.
+        :type n: int
+
+        :return: Prefix table.
+        :rtype: list
+        """
+        tb: Optional[list] = cls.__tb.get(cls)
+
+        if tb is None:
+            tb = cls.__tb[cls] = [1] if cls in [Factorial, Bell] else [1, 1] if cls == DoubleFactorial else \
+                [1, 0] if cls == Subfactorial else [0.0] if cls == Harmonic else [0, 1] if cls == Fibonacci else [2, 1]
+
+        if len(tb) > n:
+            return tb
+
+        if cls == Factorial:
+            tb.extend(islice(accumulate(range(len(tb), n + 1), mul, initial=tb[-1]), 1, None))
+
+            return tb
+
+        for k in range(len(tb), n + 1):
+            if cls == DoubleFactorial:
+                tb.append(k * tb[-2])
+            elif cls == Subfactorial:
+                tb.append(k * tb[-1] + (1 if k % 2 == 0 else -1))
+            elif cls == Bell:
+                CombFun.__bell_row = list(accumulate(cls.__bell_row, initial=cls.__bell_row[-1]))
+                tb.append(cls.__bell_row[0])
+            elif cls == Harmonic:
+                s, c = cls.__harm_acc
+                t: float = s + 1 / k
+                cls.__harm_acc[:] = [t, c + ((s - t) + 1 / k if s >= 1 / k else (1 / k - t) + s)]
+                tb.append(sum(cls.__harm_acc))
+            else:
+                tb.append(tb[-1] + tb[-2])
+
+        return tb
+
+    @classmethod
+    def __row_put(cls, n: int, row: List[int]) -> None:
+        """
+        Put row into LRU cache.
+
+        Least recently used rows are evicted until the total size fits in ``__ROW_BUDGET``.
+        Rows too big to share the budget are not cached at all.
+
+        This method is private and called internally as a helper of ``CombFun.__row``.
+
+        :param n: Index of row.
+        :type n: int
+        :param row: Row to be cached.
+        :type row: List[int]
+        """
+        sz: int = sum(map(int.bit_length, row))  # Size of row in bits.
+
+        if sz > cls.__ROW_BUDGET // 4:
+            return
+
+        cls.__row_tb[(cls, n)] = (row, sz)
+        CombFun.__row_sz += sz
+
+        while cls.__row_sz > cls.__ROW_BUDGET:
+            CombFun.__row_sz -= cls.__row_tb.popitem(last=False)[1][1]
+
+    @classmethod
+    def __row(cls, n: int) -> List[int]:
+        """
+        Get nth row of triangle.
+
+        For ``Binom``, it is the first half of nth row of Pascal triangle, that is, ``C(n, k)`` for k up to n/2.
+        It is computed by the multiplicative formula.
+        For ``Stirling1`` and ``Stiling2``, it is nth row of the triangle.
+        It is computed by the recurrence from the nearest cached row above, and intermediate rows are cached as well.
+        Each step of the recurrence is a single chain of ``map`` calls.
+
+        This method is private and called internally as a helper of the computation kernels.
+
+        :param n: Index of row.
+        :type n: int
+
+        :return: nth row.
+        :rtype: List[int]
+        """
+        hit: Optional[Tuple[List[int], int]] = cls.__row_tb.get((cls, n))
+
+        if hit:
+            cls.__row_tb.move_to_end((cls, n))
+
+            return hit[0]
 
-        if t1.base:
-            if type(t1) == TypeSystem.Sym:
-                rt.t = t1
-            elif type(t1) == TypeSystem.Real:
-                rt.t = TypeSystem.Real
+        if cls == Binom:
+            row: List[int] = list(accumulate(range(n // 2), lambda c, k: c * (n - k) // (k + 1), initial=1))
+
+            if n <= cls.__ROW_MAX:
+                cls.__row_put(n, row)
+
+            return row
+
+        m: int = max((key[1] for key in cls.__row_tb if key[0] == cls and key[1] < n), default=0)
+        row: List[int] = cls.__row_tb[(cls, m)][0] if (cls, m) in cls.__row_tb else [1]
+
+        for i in range(m, n):
+            if cls == Stirling1:
+                row = list(map(sub, chain([0], row), map(mul, repeat(i), chain(row, [0]))))
             else:
-                return None
+                row = list(map(add, map(mul, count(), chain(row, [0])), chain([0], row)))
+
+            if i < cls.__ROW_MAX:
+                cls.__row_put(i + 1, row)
+
+        return row
+
+    @classmethod
+    def __prime_get(cls, n: int) -> List[int]:
+        """
+        Get primes up to n.
+
+        If primes up to n are not sieved yet, it sieves primes up to n by sieve of Eratosthenes.
+        Each step of the sieve is a single slice assignment, and primes are collected by a single ``compress`` call.
+
+        This method is private and called internally as a helper of ``CombFun.__swing`` and ``CombFun.__binom_pf``.
+
+        :param n: Upper bound of primes.
+        :type n: int
+
+        :return: Primes up to n.
+        :rtype: List[int]
+        """
+        if n > cls.__sieve_lim:
+            sieve: bytearray = bytearray([1]) * (n + 1)
+            sieve[:2] = b'\x00\x00'
+
+            for i in range(2, math.isqrt(n) + 1):
+                if sieve[i]:
+                    sieve[i * i::i] = bytes(len(range(i * i, n + 1, i)))
+
+            CombFun.__prime = list(compress(range(n + 1), sieve))
+            CombFun.__sieve_lim = n
+
+        return cls.__prime[:bisect_right(cls.__prime, n)]
+
+    @classmethod
+    def __prod(cls, x: List[int]) -> int:
+        """
+        Product of integers by balanced binary splitting.
+
+        Adjacent factors are multiplied pairwise by a single ``map`` call until one factor remains.
+        Compared to ``math.prod``, which multiplies from left to right, the sizes of factors in each multiplication are
+        balanced so that the subquadratic multiplication of big integers pays off.
+
+        This method is private and called internally as a helper of ``CombFun.__swing`` and ``CombFun.__binom_pf``.
+
+        :param x: Integers to be multiplied.
+        :type x: List[int]
+
+        :return: Product of integers.
+        :rtype: int
+        """
+        while len(x) > 1:
+            x = list(map(mul, x[::2], x[1::2])) + x[-1:] * (len(x) % 2)
+
+        return x[0] if x else 1
+
+    @classmethod
+    def __swing(cls, n: int) -> int:
+        """
+        Swing factorial.
+
+        Swing factorial ``n≀ = n! / (n/2)!^2`` is factored over primes up to n.
+        The exponent of prime p is the # of odd numbers among ``n / p^i`` for i >= 1.
+        For primes greater than the square root of n, the exponent is either 0 or 1, so they are filtered by a single
+        ``compress`` call.
+
+        This method is private and called internally as a helper of ``CombFun.__fact_swing``.
+
+        :param n: Parameter of swing factorial.
+        :type n: int
+
+        :return: Swing factorial.
+        :rtype: int
+        """
+        prime: List[int] = cls.__prime_get(n)
+        mid: int = bisect_right(prime, math.isqrt(n))
+        fac: List[int] = []
+
+        for p in prime[:mid]:
+            q, e = n, 0
+
+            while q:
+                q //= p
+                e += q & 1
+
+            if e:
+                fac.append(p ** e)
+
+        fac.extend(compress(prime[mid:], map(and_, map(floordiv, repeat(n), prime[mid:]), repeat(1))))
+
+        return cls.__prod(fac)
+
+    @classmethod
+    def __fact_swing(cls, n: int) -> int:
+        """
+        Factorial by prime swing algorithm.
+
+        It is based on the recurrence ``n! = (n/2)!^2 * n≀``.
+        Factorial of parameter less than ``__SWING_MIN`` is computed by ``math.factorial``.
+
+        This method is private and called internally as a helper of ``CombFun.__factorial``.
+
+        :param n: Parameter of factorial.
+        :type n: int
+
+        :return: Factorial.
+        :rtype: int
+        """
+        if n < cls.__SWING_MIN:
+            return math.factorial(n)
+
+        half: int = cls.__fact_swing(n // 2)
+
+        return half * half * cls.__swing(n)
+
+    @classmethod
+    def __binom_pf(cls, n: int, k: int) -> int:
+        """
+        Binomial coefficient by prime factorization.
+
+        By Kummer's theorem, the exponent of prime p in ``C(n, k)`` is the # of carries when k and n - k are added in
+        base p.
+        Equivalently, it is the sum of ``n / p^i - k / p^i - (n - k) / p^i`` for i >= 1.
+        For primes greater than the square root of n, the exponent is either 0 or 1, so they are filtered by a single
+        ``compress`` call.
+        It is faster than ``math.comb`` only if both k and n - k are large.
+
+        This method is private and called internally as a helper of ``CombFun.__binom``.
+
+        :param n: First parameter of binomial coefficient.
+        :type n: int
+        :param k: Second parameter of binomial coefficient.
+        :type k: int
+
+        :return: Binomial coefficient.
+        :rtype: int
+        """
+        prime: List[int] = cls.__prime_get(n)
+        mid: int = bisect_right(prime, math.isqrt(n))
+        fac: List[int] = []
+
+        for p in prime[:mid]:
+            a, b, c, e = n, k, n - k, 0
+
+            while a:
+                a, b, c = a // p, b // p, c // p
+                e += a - b - c
+
+            if e:
+                fac.append(p ** e)
+
+        hi: List[int] = prime[mid:]
+        fac.extend(compress(hi, map(sub, map(sub, map(floordiv, repeat(n), hi), map(floordiv, repeat(k), hi)),
+                                    map(floordiv, repeat(n - k), hi))))
+
+        return cls.__prod(fac)
+
+    @classmethod
+    def __fib_pair(cls, n: int) -> Tuple[int, int]:
+        """
+        Pair of consecutive Fibonacci numbers by fast doubling.
+
+        It is based on the identities ``F(2m) = F(m) * (2F(m + 1) - F(m))`` and ``F(2m + 1) = F(m)^2 + F(m + 1)^2``.
+        Bits of n are scanned from the most significant one, so it takes O(log n) steps.
+
+        This method is private and called internally as a helper of ``CombFun.__fibonacci`` and ``CombFun.__lucas``.
+
+        :param n: Index of Fibonacci number.
+        :type n: int
+
+        :return: ``F(n)`` and ``F(n + 1)``.
+        :rtype: Tuple[int, int]
+        """
+        a, b = 0, 1
+
+        for bit in bin(n)[2:]:
+            c, d = a * (2 * b - a), a * a + b * b
+            a, b = (d, c + d) if bit == '1' else (c, d)
+
+        return a, b
+
+    @classmethod
+    def __factorial(cls, x: Union[int, float]) -> Union[int, float]:
+        """
+        Factorial function.
+
+        Factorial function with parameter x has following computation rules.
+            1. If x is nan, the result is nan.
+            2. If x is +inf, the result is +inf.
+            3. If x is -inf or finite negative integer, the result is nan.
+            4. If x is finite nonnegative integer, the result is exact integer ``x!``.
+            5. If x is finite noninteger, the result is ``math.gamma(x + 1)``.
+               If it overflows, the result is +inf.
+        Here, rule 4 is computed by prime swing algorithm beyond the prefix table.
+
+        This method is private and called internally as a helper of ``CombFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``CombFun.eval``.
+
+        :param x: Point where factorial function is to be computed.
+        :type x: Union[int, float]
+
+        :return: Computed value of factorial function.
+        :rtype: Union[int, float]
+        """
+        if math.isnan(x) or x == -math.inf or (is_int(x) and x < 0):
+            return math.nan
+        elif x == math.inf:
+            return math.inf
+        elif not is_int(x):
+            try:
+                return math.gamma(x + 1)
+            except OverflowError:
+                return math.inf
+        elif x < cls.__TB_SZ:
+            return cls.__tb_get(int(x))[int(x)]
+        else:
+            return cls.__fact_swing(int(x))
+
+    @classmethod
+    def __dfactorial(cls, x: Union[int, float]) -> Union[int, float]:
+        """
+        Double factorial function.
+
+        Double factorial function with parameter x has following computation rules.
+            1. If x is nan, -inf, finite noninteger, or finite integer less than -1, the result is nan.
+            2. If x is +inf, the result is +inf.
+            3. If x is -1 or 0, the result is 1.
+            4. If x is finite positive integer, the result is exact integer ``x!!``.
+        Here, rule 4 is based on the identities ``(2m)!! = 2^m * m!`` and ``(2m-1)!! = (2m)! / (2m)!!`` beyond the
+        prefix table.
+
+        This method is private and called internally as a helper of ``CombFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``CombFun.eval``.
+
+        :param x: Point where double factorial function is to be computed.
+        :type x: Union[int, float]
+
+        :return: Computed value of double factorial function.
+        :rtype: Union[int, float]
+        """
+        if x == math.inf:
+            return math.inf
+        elif not (is_int(x) and x >= -1):
+            return math.nan
+        elif x < cls.__TB_SZ:
+            return 1 if x == -1 else cls.__tb_get(int(x))[int(x)]
+
+        m: int = (int(x) + 1) // 2
+        even: int = Factorial.__factorial(m) << m  # (2m)!!
+
+        return even if x % 2 == 0 else Factorial.__factorial(2 * m) // even
+
+    @classmethod
+    def __binom(cls, n: Union[int, float], k: Union[int, float]) -> Union[int, float]:
+        """
+        Binomial coefficient.
+
+        Binomial coefficient with parameter n and k has following computation rules.
+            1. If n or k is nan, inf, or finite noninteger, the result is nan.
+            2. If k is negative, the result is 0.
+            3. If n is nonnegative and k is greater than n, the result is 0.
+            4. If n is nonnegative, the result is exact integer ``C(n, k)``.
+            5. If n is negative, the result is exact integer ``(-1)^k * C(k - n - 1, k)``.
+        Rows of Pascal triangle are cached up to ``__ROW_MAX``.
+        Beyond it, prime factorization is used if both k and n - k are greater than ``n / (3 * log(n))``, which is
+        about the crossover point where it becomes faster than ``math.comb``.
+
+        This method is private and called internally as a helper of ``CombFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``CombFun.eval``.
+
+        :param n: First parameter of binomial coefficient.
+        :type n: Union[int, float]
+        :param k: Second parameter of binomial coefficient.
+        :type k: Union[int, float]
+
+        :return: Computed value of binomial coefficient.
+        :rtype: Union[int, float]
+        """
+        if not (math.isfinite(n) and math.isfinite(k) and is_int(n) and is_int(k)):
+            return math.nan
+
+        n, k = int(n), int(k)
+
+        if n < 0:
+            return 0 if k < 0 else (-1 if k % 2 else 1) * Binom.__binom(k - n - 1, k)
+        elif k < 0 or k > n:
+            return 0
+        elif n > cls.__ROW_MAX:
+            return cls.__binom_pf(n, k) if 3 * min(k, n - k) * math.log(n) > n else math.comb(n, k)
+        else:
+            return Binom.__row(n)[min(k, n - k)]
+
+    @classmethod
+    def __multinom(cls, *args: Union[int, float]) -> Union[int, float]:
+        """
+        Multinomial coefficient.
+
+        Multinomial coefficient with parameters n1, ..., nk has following computation rules.
+            1. If some parameter is nan, inf, finite noninteger, or finite negative integer, the result is nan.
+            2. Otherwise, the result is exact integer ``(n1 + ... + nk)! / (n1! * ... * nk!)``.
+        Here, rule 2 is computed as the product of binomial coefficients ``C(n1 + ... + ni, ni)``.
+
+        This method is private and called internally as a helper of ``CombFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``CombFun.eval``.
+
+        :param args: Parameters of multinomial coefficient.
+        :type args: Union[int, float]
+
+        :return: Computed value of multinomial coefficient.
+        :rtype: Union[int, float]
+        """
+        if not all(math.isfinite(it) and is_int(it) and it >= 0 for it in args):
+            return math.nan
+
+        return math.prod(map(Binom.__binom, accumulate(args), args))
+
+    @classmethod
+    def __subfactorial(cls, x: Union[int, float]) -> Union[int, float]:
+        """
+        Subfactorial function.
+
+        Subfactorial function with parameter x has following computation rules.
+            1. If x is nan, -inf, finite noninteger, or finite negative integer, the result is nan.
+            2. If x is +inf, the result is +inf.
+            3. If x is finite nonnegative integer, the result is exact integer ``!x``.
+        Here, rule 3 is based on the recurrence ``!n = n * !(n-1) + (-1)^n``.
+
+        This method is private and called internally as a helper of ``CombFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``CombFun.eval``.
+
+        :param x: Point where subfactorial function is to be computed.
+        :type x: Union[int, float]
+
+        :return: Computed value of subfactorial function.
+        :rtype: Union[int, float]
+        """
+        if x == math.inf:
+            return math.inf
+        elif not (is_int(x) and x >= 0):
+            return math.nan
+        elif x < cls.__TB_SZ:
+            return cls.__tb_get(int(x))[int(x)]
+
+        res: int = cls.__tb_get(cls.__TB_SZ - 1)[-1]
+
+        for k in range(cls.__TB_SZ, int(x) + 1):
+            res = k * res + (1 if k % 2 == 0 else -1)
+
+        return res
+
+    @classmethod
+    def __catalan(cls, x: Union[int, float]) -> Union[int, float]:
+        """
+        Catalan number.
+
+        Catalan number with parameter x has following computation rules.
+            1. If x is nan, -inf, finite noninteger, or finite negative integer, the result is nan.
+            2. If x is +inf, the result is +inf.
+            3. If x is finite nonnegative integer, the result is exact integer ``C(2x, x) / (x + 1)``.
+
+        This method is private and called internally as a helper of ``CombFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``CombFun.eval``.
+
+        :param x: Point where Catalan number is to be computed.
+        :type x: Union[int, float]
+
+        :return: Computed value of Catalan number.
+        :rtype: Union[int, float]
+        """
+        if x == math.inf:
+            return math.inf
+        elif not (is_int(x) and x >= 0):
+            return math.nan
+        else:
+            return Binom.__binom(2 * x, x) // (int(x) + 1)
+
+    @classmethod
+    def __bell(cls, x: Union[int, float]) -> Union[int, float]:
+        """
+        Bell number.
+
+        Bell number with parameter x has following computation rules.
+            1. If x is nan, -inf, finite noninteger, or finite negative integer, the result is nan.
+            2. If x is +inf, the result is +inf.
+            3. If x is finite nonnegative integer, the result is exact integer ``B_x``.
+        Here, rule 3 is based on Bell triangle, whose rows are partial sums of the previous row starting with its last
+        entry.
+        Beyond the prefix table, rows are computed from the last row of the table without being cached.
+
+        This method is private and called internally as a helper of ``CombFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``CombFun.eval``.
+
+        :param x: Point where Bell number is to be computed.
+        :type x: Union[int, float]
+
+        :return: Computed value of Bell number.
+        :rtype: Union[int, float]
+        """
+        if x == math.inf:
+            return math.inf
+        elif not (is_int(x) and x >= 0):
+            return math.nan
+        elif x < cls.__TB_SZ:
+            return cls.__tb_get(int(x))[int(x)]
+
+        cls.__tb_get(cls.__TB_SZ - 1)
+        row: List[int] = cls.__bell_row
+
+        for _ in range(cls.__TB_SZ, int(x) + 1):
+            row = list(accumulate(row, initial=row[-1]))
+
+        return row[0]
+
+    @classmethod
+    def __stirling1(cls, n: Union[int, float], k: Union[int, float]) -> Union[int, float]:
+        """
+        Stirling number of the first kind.
+
+        Stirling number of the first kind with parameter n and k has following computation rules.
+            1. If n or k is nan, inf, finite noninteger, or finite negative integer, the result is nan.
+            2. If k is greater than n, the result is 0.
+            3. Otherwise, the result is exact signed integer ``s(n, k)``.
+        Here, rule 3 is based on the recurrence ``s(n + 1, k) = s(n, k - 1) - n * s(n, k)``.
+
+        This method is private and called internally as a helper of ``CombFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``CombFun.eval``.
+
+        :param n: First parameter of Stirling number.
+        :type n: Union[int, float]
+        :param k: Second parameter of Stirling number.
+        :type k: Union[int, float]
+
+        :return: Computed value of Stirling number.
+        :rtype: Union[int, float]
+        """
+        if not (math.isfinite(n) and math.isfinite(k) and is_int(n) and is_int(k) and n >= 0 and k >= 0):
+            return math.nan
+        else:
+            return 0 if k > n else Stirling1.__row(int(n))[int(k)]
+
+    @classmethod
+    def __stirling2(cls, n: Union[int, float], k: Union[int, float]) -> Union[int, float]:
+        """
+        Stirling number of the second kind.
+
+        Stirling number of the second kind with parameter n and k has following computation rules.
+            1. If n or k is nan, inf, finite noninteger, or finite negative integer, the result is nan.
+            2. If k is greater than n, the result is 0.
+            3. Otherwise, the result is exact integer ``S(n, k)``.
+        Here, rule 3 is based on the recurrence ``S(n + 1, k) = k * S(n, k) + S(n, k - 1)``.
+
+        This method is private and called internally as a helper of ``CombFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``CombFun.eval``.
+
+        :param n: First parameter of Stirling number.
+        :type n: Union[int, float]
+        :param k: Second parameter of Stirling number.
+        :type k: Union[int, float]
+
+        :return: Computed value of Stirling number.
+        :rtype: Union[int, float]
+        """
+        if not (math.isfinite(n) and math.isfinite(k) and is_int(n) and is_int(k) and n >= 0 and k >= 0):
+            return math.nan
+        else:
+            return 0 if k > n else Stiling2.__row(int(n))[int(k)]
+
+    @classmethod
+    def __harmonic(cls, x: Union[int, float]) -> float:
+        """
+        Harmonic number.
+
+        Harmonic number with parameter x has following computation rules.
+            1. If x is nan, -inf, finite noninteger, or finite negative integer, the result is nan.
+            2. If x is +inf, the result is +inf.
+            3. If x is finite nonnegative integer less than ``__TB_SZ``, the result is compensated sum
+               ``1 + 1/2 + ... + 1/x``.
+            4. If x is finite integer greater than or equal to ``__TB_SZ``, the result is asymptotic expansion
+               ``log(x) + gamma + 1/(2x) - 1/(12x^2) + 1/(120x^4) - 1/(252x^6)`` where gamma is Euler-Mascheroni
+               constant.
+        Here, the error of truncation in rule 4 is less than ``1/(240x^8)``, which is far below the rounding error.
+
+        This method is private and called internally as a helper of ``CombFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``CombFun.eval``.
+
+        :param x: Point where harmonic number is to be computed.
+        :type x: Union[int, float]
+
+        :return: Computed value of harmonic number.
+        :rtype: float
+        """
+        if x == math.inf:
+            return math.inf
+        elif not (is_int(x) and x >= 0):
+            return math.nan
+        elif x < cls.__TB_SZ:
+            return cls.__tb_get(int(x))[int(x)]
+
+        t: float = 1 / (x * x)
+
+        return math.log(x) + Type.Const.EulerGamma.value + 1 / (2 * x) - t * (1 / 12 - t * (1 / 120 - t / 252))
+
+    @classmethod
+    def __fibonacci(cls, x: Union[int, float]) -> Union[int, float]:
+        """
+        Fibonacci number.
+
+        Fibonacci number with parameter x has following computation rules.
+            1. If x is nan or -inf, the result is nan.
+            2. If x is +inf, the result is +inf.
+            3. If x is finite nonnegative integer, the result is exact integer ``F_x``.
+            4. If x is finite negative integer, the result is exact integer ``(-1)^(x+1) * F_-x``.
+               Beyond the prefix table, it is computed by fast doubling.
+            5. If x is finite noninteger, the result is ``(phi^x - cos(pi * x) * phi^-x) / sqrt(5)`` where phi is
+               golden ratio.
+               If it overflows, the result is +-inf with the sign of the dominant term.
+
+        This method is private and called internally as a helper of ``CombFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``CombFun.eval``.
+
+        :param x: Point where Fibonacci number is to be computed.
+        :type x: Union[int, float]
+
+        :return: Computed value of Fibonacci number.
+        :rtype: Union[int, float]
+        """
+        if math.isnan(x) or x == -math.inf:
+            return math.nan
+        elif x == math.inf:
+            return math.inf
+        elif not is_int(x):
+            phi: float = Type.Const.GoldenRatio.value
+
+            try:
+                return (phi ** x - math.cos(math.pi * x) * phi ** -x) / math.sqrt(5)
+            except OverflowError:
+                return math.inf if x > 0 else math.copysign(math.inf, -math.cos(math.pi * x))
+        elif x < 0:
+            return (-1 if x % 2 == 0 else 1) * cls.__fibonacci(-x)
+        elif x < cls.__TB_SZ:
+            return cls.__tb_get(int(x))[int(x)]
+        else:
+            return cls.__fib_pair(int(x))[0]
+
+    @classmethod
+    def __lucas(cls, x: Union[int, float]) -> Union[int, float]:
+        """
+        Lucas number.
+
+        Lucas number with parameter x has following computation rules.
+            1. If x is nan or -inf, the result is nan.
+            2. If x is +inf, the result is +inf.
+            3. If x is finite nonnegative integer, the result is exact integer ``L_x``.
+            4. If x is finite negative integer, the result is exact integer ``(-1)^x * L_-x``.
+               Beyond the prefix table, it is computed from ``L_x = 2 * F_(x+1) - F_x`` by fast doubling.
+            5. If x is finite noninteger, the result is ``phi^x + cos(pi * x) * phi^-x`` where phi is golden ratio.
+               If it overflows, the result is +-inf with the sign of the dominant term.
+
+        This method is private and called internally as a helper of ``CombFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``CombFun.eval``.
+
+        :param x: Point where Lucas number is to be computed.
+        :type x: Union[int, float]
+
+        :return: Computed value of Lucas number.
+        :rtype: Union[int, float]
+        """
+        if math.isnan(x) or x == -math.inf:
+            return math.nan
+        elif x == math.inf:
+            return math.inf
+        elif not is_int(x):
+            phi: float = Type.Const.GoldenRatio.value
+
+            try:
+                return phi ** x + math.cos(math.pi * x) * phi ** -x
+            except OverflowError:
+                return math.inf if x > 0 else math.copysign(math.inf, math.cos(math.pi * x))
+        elif x < 0:
+            return (-1 if x % 2 else 1) * cls.__lucas(-x)
+        elif x < cls.__TB_SZ:
+            return cls.__tb_get(int(x))[int(x)]
+
+        a, b = cls.__fib_pair(int(x))
+
+        return 2 * b - a
+
+    @classmethod
+    def __pochhammer(cls, x: Union[int, float], n: Union[int, float]) -> Union[int, float]:
+        """
+        Pochhammer symbol, that is, rising factorial.
+
+        Pochhammer symbol with parameter x and n has following computation rules.
+            1. If x or n is nan, inf, or finite noninteger, or n is negative, the result is nan.
+            2. If x is positive, the result is exact integer ``x * (x + 1) * ... * (x + n - 1)``, which is
+               ``(x + n - 1)! / (x - 1)!``.
+            3. If x is nonpositive and ``x + n - 1`` is nonnegative, the factors contain 0 and the result is 0.
+            4. Otherwise, all factors are negative and the result is exact integer ``(-1)^n * (-x)! / (-x - n)!``.
+        Here, the quotients of factorials are computed by ``math.perm``.
+
+        This method is private and called internally as a helper of ``CombFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``CombFun.eval``.
+
+        :param x: First parameter of Pochhammer symbol.
+        :type x: Union[int, float]
+        :param n: # of factors.
+        :type n: Union[int, float]
+
+        :return: Computed value of Pochhammer symbol.
+        :rtype: Union[int, float]
+        """
+        if not (math.isfinite(x) and math.isfinite(n) and is_int(x) and is_int(n) and n >= 0):
+            return math.nan
+
+        x, n = int(x), int(n)
+
+        if x > 0:
+            return math.perm(x + n - 1, n)
+        elif x + n - 1 >= 0:
+            return 0 if n else 1
+        else:
+            return (-1 if n % 2 else 1) * math.perm(-x, n)
+
+    @classmethod
+    def __fpower(cls, x: Union[int, float], n: Union[int, float]) -> Union[int, float]:
+        """
+        Factorial power, that is, falling factorial.
+
+        Factorial power with parameter x and n has following computation rules.
+            1. If x or n is nan, inf, or finite noninteger, or n is negative, the result is nan.
+            2. If x is nonnegative, the result is exact integer ``x * (x - 1) * ... * (x - n + 1)``, which is 0 for n
+               greater than x.
+            3. If x is negative, the result is ``(-1)^n`` times the Pochhammer symbol of -x and n.
+
+        This method is private and called internally as a helper of ``CombFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``CombFun.eval``.
+
+        :param x: First parameter of factorial power.
+        :type x: Union[int, float]
+        :param n: # of factors.
+        :type n: Union[int, float]
+
+        :return: Computed value of factorial power.
+        :rtype: Union[int, float]
+        """
+        if not (math.isfinite(x) and math.isfinite(n) and is_int(x) and is_int(n) and n >= 0):
+            return math.nan
+
+        x, n = int(x), int(n)
+
+        return math.perm(x, n) if x >= 0 else (-1 if n % 2 else 1) * math.perm(n - x - 1, n)
+
+    @classmethod
+    def __afactorial(cls, x: Union[int, float]) -> Union[int, float]:
+        """
+        Alternating factorial function.
+
+        Alternating factorial function with parameter x has following computation rules.
+            1. If x is nan, -inf, finite noninteger, or finite negative integer, the result is nan.
+            2. If x is +inf, the result is +inf.
+            3. If x is finite nonnegative integer, the result is exact integer ``x! - (x - 1)! + ... +- 1!``.
+        Here, rule 3 is computed by the recurrence ``af(n) = n! - af(n - 1)`` with ``af(0) = 0``, and the factorials
+        are read off from the prefix table if they are in it.
+
+        This method is private and called internally as a helper of ``CombFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``CombFun.eval``.
+
+        :param x: Point where alternating factorial function is to be computed.
+        :type x: Union[int, float]
+
+        :return: Computed value of alternating factorial function.
+        :rtype: Union[int, float]
+        """
+        if x == math.inf:
+            return math.inf
+        elif not (is_int(x) and x >= 0):
+            return math.nan
+
+        res: int = 0
+        f: int = 1
+
+        for k in range(1, int(x) + 1):
+            f *= k
+            res = f - res
+
+        return res
+
+    @classmethod
+    def __polygon(cls, *args: Union[int, float]) -> Union[int, float]:
+        """
+        Polygonal number.
+
+        Polygonal number with parameter n, or s and n, has following computation rules.
+            1. If s or n is nan, inf, or finite noninteger, or n is negative, the result is nan.
+            2. Otherwise, the result is exact integer ``((s - 2) * n^2 - (s - 4) * n) / 2``.
+        If s is not given, it is 3, that is, the result is triangular number ``n * (n + 1) / 2``.
+        Since ``n^2 - n`` is even, the result is always an integer.
+
+        This method is private and called internally as a helper of ``CombFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``CombFun.eval``.
+
+        :param args: # of sides s, which is optional, and index n.
+        :type args: Union[int, float]
+
+        :return: Computed value of polygonal number.
+        :rtype: Union[int, float]
+        """
+        s, n = args if len(args) == 2 else (3, args[0])
+
+        if not (math.isfinite(s) and math.isfinite(n) and is_int(s) and is_int(n) and n >= 0):
+            return math.nan
+
+        s, n = int(s), int(n)
+
+        return ((s - 2) * n * n - (s - 4) * n) // 2
+
+    @classmethod
+    def __kern(cls) -> Callable[..., Union[int, float]]:
+        """
+        Find computation kernel implementing the computation rules.
+
+        This method is private and called internally as a helper of ``CombFun.eval``.
+
+        :return: Computation kernel of function.
+        :rtype: Callable[..., Union[int, float]]
+        """
+        if cls == Factorial:
+            return cls.__factorial
+        elif cls == DoubleFactorial:
+            return cls.__dfactorial
+        elif cls == Binom:
+            return cls.__binom
+        elif cls == Multinom:
+            return cls.__multinom
+        elif cls == Subfactorial:
+            return cls.__subfactorial
+        elif cls == CatalanNum:
+            return cls.__catalan
+        elif cls == Bell:
+            return cls.__bell
+        elif cls == Stirling1:
+            return cls.__stirling1
+        elif cls == Stiling2:
+            return cls.__stirling2
+        elif cls == Harmonic:
+            return cls.__harmonic
+        elif cls == Fibonacci:
+            return cls.__fibonacci
+        elif cls == Lucas:
+            return cls.__lucas
+        elif cls == Pochhammer:
+            return cls.__pochhammer
+        elif cls == FacotirlaPower:
+            return cls.__fpower
+        elif cls == AlternatingFactorial:
+            return cls.__afactorial
+        elif cls == PolygonNum:
+            return cls.__polygon
         else:
+            raise NotImplementedError(f'{cls.__name__} has no computation kernel.')
+
+    @classmethod
+    def chk_t(cls, rt: Token.Tok, t_env: Dict[int, TypeSystem.T]) -> Optional[Dict[int, TypeSystem.T]]:
+        """
+        Type checker for combinatorial functions.
+
+        Functions apply elementwise, and parameters are broadcast as binary operators do.
+        For the rules of broadcasting, refer to the comments of ``Fun.bcast_t``.
+        ``Multinom`` takes arbitrary number of parameters.
+
+        :param rt: Token to be type checked.
+        :type rt: Token.Tok
+        :param t_env: Type environment.
+        :type t_env: Dict[int, TypeSystem.T]
+
+        :return: Type environment if type check succeeds. None otherwise.
+        :rtype: Optional[Dict[int, TypeSystem.T]]
+        """
+        if not (rt.argc >= 1 if cls == Multinom else
+                rt.argc == 2 if cls in [Binom, Pochhammer, FacotirlaPower, Stirling1, Stiling2] else
+                rt.argc in [1, 2] if cls == PolygonNum else rt.argc == 1):
+            return None
+
+        rt.t = cls.bcast_t([tok.t for tok in rt.chd], [TypeSystem.Real, TypeSystem.Sym])
+
+        if not rt.t:
             return None
 
         return t_env
 
+    @classmethod
+    def eval(cls, *args: Union[float, list]) -> Tuple[Union[int, float, list], List[Warning.InterpWarn]]:
+        """
+        Evaluate combinatorial function.
+
+        Parameters can be either scalar or tensor, and they are broadcast to the common shape.
+        If parameters are finite integers in domain, they are cast to ``int`` and the results are exact integers.
+        Further, for functions with prefix tables, the table grows once up to the maximum parameter and the whole
+        tensor is read off by a single ``map`` call of the table lookup.
+        Otherwise, the private helper implementing the computation rules is mapped over the whole tensor.
+
+        It generates warnings for followings cases, each at most once per call.
+            1. Some item exceeds floating point max/min size. (BIG_INT/SMALL_INT, resp.)
+            2. Some item is nan. (NAN_DETECT)
+            3. Some item is +-inf. (INF_DETECT)
+            4. Some item of ``Factorial`` is finite negative integer. (POLE_DETECT)
+            5. Some finite item is not in domain. (DOMAIN_OUT)
+               Domains are integers for ``Binom``, integers greater than or equal to -1 for ``DoubleFactorial``, and
+               nonnegative integers for the others except ``Factorial``, ``Fibonacci`` and ``Lucas``.
+            6. Some exact integer result exceeds floating point max size. (BIG_INT)
+        Each check is a single scan over the whole tensor, not a branch per item.
+
+        :param args: Parameters where function is to be computed.
+        :type args: Union[float, list]
+
+        :return: Computed value and list of generated warnings.
+        :rtype: Tuple[Union[int, float, list], List[Warning.InterpWarn]]
+        """
+        arg, shape = cls.bcast(*args)
+
+        # Empty batch has no item to check, and domain checks below do not accept it.
+        if not arg[0]:
+            return cls.unflat([], shape), []
+
+        warn: List[Warning.InterpWarn] = []
+        fast: bool = True
+
+        for i in range(len(arg)):
+            arg[i], arg_warn, arg_fast = cls.chk_arg(arg[i], i + 1)
+            warn += arg_warn
+            fast &= arg_fast
+
+        # Integrality checks run in C if parameters are finite.
+        # Otherwise, they fall back to generator since nan and inf are neither integers nor out of domain.
+        integral: bool = all((not any(map(math.fmod, x, repeat(1)))) if fast else
+                             all(is_int(it) for it in x if math.isfinite(it)) for x in arg)
+
+        # Lower bound of the domain of each parameter.
+        if cls in [Pochhammer, FacotirlaPower] or (cls == PolygonNum and len(arg) == 2):
+            lo: List[float] = [-math.inf, 0]
+        else:
+            lo: List[float] = [-math.inf if cls in [Factorial, Binom, Fibonacci, Lucas] else
+                               -1 if cls == DoubleFactorial else 0] * len(arg)
+
+        if cls == Factorial:
+            # Poles are checked item by item, since negative integers may be mixed with nonintegers.
+            if ((min(arg[0]) < 0) if fast else any(-math.inf < it < 0 for it in arg[0])) and \
+                    any(-math.inf < it < 0 and is_int(it) for it in arg[0]):
+                warn.append(Warning.InterpWarn(Type.InterpWarnT.POLE_DETECT, 65))
+                fast = False
+        elif cls not in [Fibonacci, Lucas]:
+            if not integral or any(((min(x) < x_lo) if fast else any(-math.inf < it < x_lo for it in x))
+                                   for x, x_lo in zip(arg, lo)):
+                warn.append(Warning.InterpWarn(Type.InterpWarnT.DOMAIN_OUT, 66 if cls == DoubleFactorial else
+                                               67 if cls == Binom else 68 if cls == Multinom else
+                                               69 if cls == Subfactorial else 70 if cls == CatalanNum else
+                                               71 if cls == Bell else 72 if cls == Stirling1 else
+                                               73 if cls == Stiling2 else 74 if cls == Harmonic else
+                                               104 if cls == Pochhammer else 105 if cls == FacotirlaPower else
+                                               106 if cls == AlternatingFactorial else 107))
+                fast = False
+
+        if not (fast and integral):
+            return cls.unflat(list(map(cls.__kern(), *arg)), shape), warn
+
+        arg = [list(map(int, x)) for x in arg]
+
+        if cls in [Factorial, DoubleFactorial, Subfactorial, Bell, Harmonic, Fibonacci, Lucas] and \
+                0 <= min(arg[0]) and max(arg[0]) < cls.__TB_SZ:
+            res: list = list(map(cls.__tb_get(max(arg[0])).__getitem__, arg[0]))
+        else:
+            res: list = list(map(cls.__kern(), *arg))
+
+        if cls != Harmonic and any(map(is_bigint, map(abs, res))):
+            warn.append(Warning.InterpWarn(Type.InterpWarnT.BIG_INT, 75))
+
+        return cls.unflat(res, shape), warn
+
 
 @final
 class Factorial(CombFun):
+    __SGN: Final[List[str]] = ['Factorial[Real] -> Real', 'Factorial[Sym] -> Sym',
+                               'Factorial[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class DoubleFactorial(CombFun):
+    __SGN: Final[List[str]] = ['DoubleFactorial[Real] -> Real', 'DoubleFactorial[Sym] -> Sym',
+                               'DoubleFactorial[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class Pochhammer(CombFun):
+    __SGN: Final[List[str]] = ['Pochhammer[Real, Real] -> Real', 'Pochhammer[Sym, Sym] -> Sym',
+                               'Pochhammer[Real, List of Real] -> List of Real',
+                               'Pochhammer[List of Real, Real] -> List of Real',
+                               'Pochhammer[List of Real, List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class Binom(CombFun):
+    __SGN: Final[List[str]] = ['Binom[Real, Real] -> Real', 'Binom[Sym, Sym] -> Sym',
+                               'Binom[Real, List of Real] -> List of Real', 'Binom[List of Real, Real] -> List of Real',
+                               'Binom[List of Real, List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class Multinom(CombFun):
+    __SGN: Final[List[str]] = ['Multinom[Real, ...] -> Real', 'Multinom[Sym, ...] -> Sym',
+                               'Multinom[List of Real, ...] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class Subfactorial(CombFun):
+    __SGN: Final[List[str]] = ['Subfactorial[Real] -> Real', 'Subfactorial[Sym] -> Sym',
+                               'Subfactorial[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class FacotirlaPower(CombFun):
+    __SGN: Final[List[str]] = ['FacotirlaPower[Real, Real] -> Real', 'FacotirlaPower[Sym, Sym] -> Sym',
+                               'FacotirlaPower[Real, List of Real] -> List of Real',
+                               'FacotirlaPower[List of Real, Real] -> List of Real',
+                               'FacotirlaPower[List of Real, List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class AlternatingFactorial(CombFun):
+    __SGN: Final[List[str]] = ['AlternatingFactorial[Real] -> Real', 'AlternatingFactorial[Sym] -> Sym',
+                               'AlternatingFactorial[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class CatalanNum(CombFun):
+    __SGN: Final[List[str]] = ['CatalanNum[Real] -> Real', 'CatalanNum[Sym] -> Sym',
+                               'CatalanNum[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class PolygonNum(CombFun):
+    __SGN: Final[List[str]] = ['PolygonNum[Real] -> Real', 'PolygonNum[Sym] -> Sym',
+                               'PolygonNum[List of Real] -> List of Real', 'PolygonNum[Real, Real] -> Real',
+                               'PolygonNum[Sym, Sym] -> Sym', 'PolygonNum[Real, List of Real] -> List of Real',
+                               'PolygonNum[List of Real, Real] -> List of Real',
+                               'PolygonNum[List of Real, List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class Bell(CombFun):
+    __SGN: Final[List[str]] = ['Bell[Real] -> Real', 'Bell[Sym] -> Sym', 'Bell[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class Fibonacci(CombFun):
+    __SGN: Final[List[str]] = ['Fibonacci[Real] -> Real', 'Fibonacci[Sym] -> Sym',
+                               'Fibonacci[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class Lucas(CombFun):
+    __SGN: Final[List[str]] = ['Lucas[Real] -> Real', 'Lucas[Sym] -> Sym', 'Lucas[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class Harmonic(CombFun):
+    __SGN: Final[List[str]] = ['Harmonic[Real] -> Real', 'Harmonic[Sym] -> Sym',
+                               'Harmonic[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class Stirling1(CombFun):
+    __SGN: Final[List[str]] = ['Stirling1[Real, Real] -> Real', 'Stirling1[Sym, Sym] -> Sym',
+                               'Stirling1[Real, List of Real] -> List of Real',
+                               'Stirling1[List of Real, Real] -> List of Real',
+                               'Stirling1[List of Real, List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class Stiling2(CombFun):
+    __SGN: Final[List[str]] = ['Stiling2[Real, Real] -> Real', 'Stiling2[Sym, Sym] -> Sym',
+                               'Stiling2[Real, List of Real] -> List of Real',
+                               'Stiling2[List of Real, Real] -> List of Real',
+                               'Stiling2[List of Real, List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
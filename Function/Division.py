@@ -1,26 +1,264 @@
-from typing import final
+from __future__ import annotations
 
+import math
+from itertools import repeat
+from operator import floordiv, mod
+from typing import final, Final, Optional, Dict, List, Tuple, Union, Callable
+
+from Core import Token, TypeSystem, Type
 from Function import Function
+from Util.Macro import is_int
+from Warning import Warning
 
 
 class DivFun(Function.Fun):
+    """
+    Division function toolbox.
+
+    ``Mod`` and ``Quotient`` follow Python's ``%`` and ``//``.
+    That is, the quotient is rounded toward -inf and the remainder has the sign of the divisor.
+    If all items of parameters are ``int``, they are computed in exact integer arithmetic without casting to float.
+    ``PowerMod`` is always computed in exact integer arithmetic by ``pow(a, b, m)``, which takes O(log b)
+    multiplications of integers less than m instead of computing ``a^b``.
+    Further, if exponent and modulus are shared by all bases, bases are reduced modulo m first, and the modular power is
+    computed only once for each distinct residue.
+
+    **Reference**
+        * https://en.wikipedia.org/wiki/Modular_exponentiation
+    """
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
+    @classmethod
+    def __mod(cls, m: Union[int, float], n: Union[int, float]) -> Union[int, float]:
+        """
+        Modulo function.
+
+        Modulo function with dividend m and divisor n has following computation rules.
+            1. If n is 0, the result is nan.
+            2. Otherwise, the result is ``m % n``.
+               Thus, it is nan if m or n is nan or m is +-inf.
+
+        This method is private and called internally as a helper of ``DivFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``DivFun.eval``.
+
+        :param m: Dividend.
+        :type m: Union[int, float]
+        :param n: Divisor.
+        :type n: Union[int, float]
+
+        :return: Computed value of modulo function.
+        :rtype: Union[int, float]
+        """
+        return math.nan if n == 0 else m % n
+
+    @classmethod
+    def __quot(cls, m: Union[int, float], n: Union[int, float]) -> Union[int, float]:
+        """
+        Quotient function.
+
+        Quotient function with dividend m and divisor n has following computation rules.
+            1. If n is 0, the result is nan.
+            2. Otherwise, the result is ``m // n``.
+               Thus, it is nan if m or n is nan or m is +-inf.
+
+        This method is private and called internally as a helper of ``DivFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``DivFun.eval``.
+
+        :param m: Dividend.
+        :type m: Union[int, float]
+        :param n: Divisor.
+        :type n: Union[int, float]
+
+        :return: Computed value of quotient function.
+        :rtype: Union[int, float]
+        """
+        return math.nan if n == 0 else m // n
+
+    @classmethod
+    def __is_int(cls, x: Union[int, float]) -> bool:
+        """
+        Check whether parameter is exact or finite integral.
+
+        Unlike ``Util.Macro.is_int``, it does not cast big integers to float.
+
+        This method is private and called internally as a helper of ``DivFun.__powmod`` and ``DivFun.eval``.
+
+        :param x: Parameter to be checked.
+        :type x: Union[int, float]
+
+        :return: True if parameter is integer. False otherwise.
+        :rtype: bool
+        """
+        return type(x) == int or (math.isfinite(x) and is_int(x))
+
+    @classmethod
+    def __powmod(cls, a: Union[int, float], b: Union[int, float], m: Union[int, float]) -> Union[int, float]:
+        """
+        Modular power function.
+
+        Modular power function with base a, exponent b and modulus m has following computation rules.
+            1. If a, b, or m is nan, +-inf, or not integer, the result is nan.
+            2. If m is 0, the result is nan.
+            3. If b is negative and a is not invertible modulo m, the result is nan.
+            4. Otherwise, the result is exact integer ``pow(a, b, m)``.
+
+        This method is private and called internally as a helper of ``DivFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``DivFun.eval``.
+
+        :param a: Base.
+        :type a: Union[int, float]
+        :param b: Exponent.
+        :type b: Union[int, float]
+        :param m: Modulus.
+        :type m: Union[int, float]
+
+        :return: Computed value of modular power function.
+        :rtype: Union[int, float]
+        """
+        if not (cls.__is_int(a) and cls.__is_int(b) and cls.__is_int(m)) or m == 0:
+            return math.nan
+
+        try:
+            return pow(int(a), int(b), int(m))
+        except ValueError:
+            return math.nan
+
+    @classmethod
+    def chk_t(cls, rt: Token.Tok, t_env: Dict[int, TypeSystem.T]) -> Optional[Dict[int, TypeSystem.T]]:
+        """
+        Type checker for division functions.
+
+        Functions apply elementwise, and parameters are broadcast as binary operators do.
+        For the rules of broadcasting, refer to the comments of ``Fun.bcast_t``.
+
+        :param rt: Token to be type checked.
+        :type rt: Token.Tok
+        :param t_env: Type environment.
+        :type t_env: Dict[int, TypeSystem.T]
+
+        :return: Type environment if type check succeeds. None otherwise.
+        :rtype: Optional[Dict[int, TypeSystem.T]]
+        """
+        if rt.argc != (3 if cls == PowerMod else 2):
+            return None
+
+        rt.t = cls.bcast_t([tok.t for tok in rt.chd], [TypeSystem.Real, TypeSystem.Sym])
+
+        if not rt.t:
+            return None
+
+        return t_env
+
+    @classmethod
+    def eval(cls, *args: Union[int, float, list]) -> Tuple[Union[int, float, list], List[Warning.InterpWarn]]:
+        """
+        Evaluate division function.
+
+        Parameters can be either scalar or tensor, and they are broadcast to the common shape.
+        If all items are ``int``, the whole tensor is computed in exact integer arithmetic by a single ``map`` call of
+        ``%`` or ``//``.
+        Otherwise, if there is neither nan, inf, nor zero divisor, it is a single ``map`` call of the same operator on
+        floats, which runs entirely in C.
+        Otherwise, it is computed by the private helper implementing the computation rules.
+        ``PowerMod`` casts finite integral floats to ``int`` and is computed by ``pow`` with three parameters.
+        If exponent and modulus are scalar, the modular power is computed once for each distinct residue of bases and
+        the result is read off by a single ``map`` call of the table lookup.
+
+        It generates warnings for followings cases, each at most once per call.
+            1. Some item exceeds floating point max/min size and there is float item as well.
+               (BIG_INT/SMALL_INT, resp.)
+            2. Some item is nan. (NAN_DETECT)
+            3. Some item is +-inf. (INF_DETECT)
+            4. Some divisor or modulus is 0. (POLE_DETECT)
+            5. Some finite item of ``PowerMod`` is not integer, or some base with negative exponent is not invertible
+               modulo the modulus. (DOMAIN_OUT)
+
+        :param args: Parameters where function is to be computed.
+        :type args: Union[int, float, list]
+
+        :return: Computed value and list of generated warnings.
+        :rtype: Tuple[Union[int, float, list], List[Warning.InterpWarn]]
+        """
+        arg, shape = cls.bcast(*args)
+        warn: List[Warning.InterpWarn] = []
+        fast: bool = True
+        exact: bool = all(set(map(type, x)) <= {int} for x in arg)  # Flag for exact integer parameters.
+
+        # Exact integers are neither nan nor inf, and they need no cast to float.
+        if not exact:
+            for i in range(len(arg)):
+                arg[i], arg_warn, arg_fast = cls.chk_arg(arg[i], i + 1)
+                warn += arg_warn
+                fast &= arg_fast
+
+        if 0 in arg[-1]:
+            warn.append(Warning.InterpWarn(Type.InterpWarnT.POLE_DETECT, 90 if cls == Mod else
+                                           91 if cls == Quotient else 92))
+            fast = False
+
+        if cls != PowerMod:
+            if not fast:
+                return cls.unflat(list(map(cls.__mod if cls == Mod else cls.__quot, *arg)), shape), warn
+
+            return cls.unflat(list(map(mod if cls == Mod else floordiv, *arg)), shape), warn
+
+        # Integrality checks run in C if parameters are finite floats.
+        integral: bool = exact or all((not any(map(math.fmod, x, repeat(1)))) if fast else all(map(cls.__is_int, x))
+                                      for x in arg)
+
+        if not integral and any(not is_int(it) for x in arg for it in x if math.isfinite(it)):
+            warn.append(Warning.InterpWarn(Type.InterpWarnT.DOMAIN_OUT, 93))
+
+        if not (fast and integral):
+            res: list = list(map(cls.__powmod, *arg))
+            inv: bool = any(type(it[0]) == float and cls.__is_int(it[1]) and cls.__is_int(it[2]) and
+                            cls.__is_int(it[3]) and it[3] != 0 for it in zip(res, *arg))
+        else:
+            a, b, m = arg if exact else [list(map(int, x)) for x in arg]
+
+            if type(args[1]) != list and type(args[2]) != list:
+                # Exponent and modulus are shared, so each distinct residue is raised only once.
+                a = list(map(mod, a, repeat(m[0])))
+                res_tb: Dict[int, Union[int, float]] = {it: cls.__powmod(it, b[0], m[0]) for it in set(a)}
+                res: list = list(map(res_tb.__getitem__, a))
+            else:
+                try:
+                    res: list = list(map(pow, a, b, m))
+                except ValueError:
+                    res: list = list(map(cls.__powmod, a, b, m))
+
+            inv: bool = float in set(map(type, res))
+
+        if inv:
+            warn.append(Warning.InterpWarn(Type.InterpWarnT.DOMAIN_OUT, 94))
+
+        return cls.unflat(res, shape), warn
+
 
 @final
 class Mod(DivFun):
+    __SGN: Final[List[str]] = ['Mod[Real, Real] -> Real', 'Mod[Sym, Sym] -> Sym',
+                               'Mod[List of Real, Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class PowerMod(DivFun):
+    __SGN: Final[List[str]] = ['PowerMod[Real, Real, Real] -> Real', 'PowerMod[Sym, Sym, Sym] -> Sym',
+                               'PowerMod[List of Real, Real, Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class Quotient(DivFun):
+    __SGN: Final[List[str]] = ['Quotient[Real, Real] -> Real', 'Quotient[Sym, Sym] -> Sym',
+                               'Quotient[List of Real, Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
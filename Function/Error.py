@@ -1,20 +1,292 @@
-from typing import final
+from __future__ import annotations
+
+import cmath
+import math
+from typing import List, final, Final, Optional, Dict, Tuple, Union, Callable
 
 from Function import Function
+from Core import Token, TypeSystem
+from Warning import Warning
 
 
 class ErrorFun(Function.Fun):
-    def __new__(cls, *args, **kwargs) -> None:
+    """
+    Error function toolbox.
+
+    For real parameters, error functions are computed by ``math.erf`` and ``math.erfc``, which are rational
+    approximations and continued fraction implemented in C.
+    In particular, ``math.erfc`` stays accurate in the far tail until the result underflows at about 26.5.
+    For complex parameters, they are computed by series expansion around the real part for parameters of small modulus.
+    For parameters of large modulus, complementary error function is computed from Faddeeva function
+    ``w(z) = exp(-z^2) * erfc(-iz)``, which is evaluated by its continued fraction.
+    This keeps complementary error function accurate in the far tail since it never subtracts from 1.
+
+    **Reference**
+        * Abramowitz, M., Stegun, I. A. (1972). Handbook of Mathematical Functions. 7.1.29
+        * https://en.wikipedia.org/wiki/Faddeeva_function
+
+    :cvar __CF_RAD: Minimum modulus of parameter where continued fraction is used.
+    :cvar __CF_TERM: # of terms of continued fraction.
+    """
+    __CF_RAD: Final[float] = 6
+    __CF_TERM: Final[int] = 40
+
+    def __new__(cls) -> None:
         raise NotImplementedError
 
+    @classmethod
+    def __series(cls, z: complex, comp: bool) -> complex:
+        """
+        Series expansion of error functions around the real part.
+
+        With z = x + iy, it computes ``erf(x) + exp(-x^2) * S(x, y)`` where S is the series in A&S 7.1.29.
+        The relative error of truncation is about 1e-16 and the terms decay after 2|y| terms.
+        Since it is used only for parameters of small modulus, hyperbolic functions in the terms do not overflow.
+        Complementary error function is computed by replacing ``erf(x)`` by ``erfc(x)`` and negating the series.
+        Since the series is of the same magnitude as the result, it does not suffer from cancellation.
+
+        This method is private and called internally as a helper of ``ErrorFun.__erf`` and ``ErrorFun.__cerfc``.
+
+        :param z: Point where error function is to be computed.
+        :type z: complex
+        :param comp: Flag for complementary error function.
+        :type comp: bool
+
+        :return: Computed value of error function.
+        :rtype: complex
+        """
+        x, y = z.real, z.imag
+        e: float = math.exp(-x * x)
+        sin: float = math.sin(2 * x * y)
+        cos: float = math.cos(2 * x * y)
+
+        # Leading term ``(1 - cos(2xy) + i * sin(2xy)) / (2 * pi * x)``, continuously extended to x = 0.
+        res: complex = complex(math.sin(x * y) ** 2 / (math.pi * x), sin / (2 * math.pi * x)) if x else \
+            complex(0, y / math.pi)
+
+        for n in range(1, math.ceil(2 * abs(y)) + 14):
+            g: float = math.exp(-n * n / 4)
+            ch: float = g * math.cosh(n * y)
+            sh: float = g * math.sinh(n * y)
+            res += 2 / math.pi * complex(2 * x * (g - ch * cos) + n * sh * sin, 2 * x * ch * sin + n * sh * cos) / \
+                (n * n + 4 * x * x)
+
+        return math.erfc(x) - e * res if comp else math.erf(x) + e * res
+
+    @classmethod
+    def __faddeeva(cls, z: complex) -> complex:
+        """
+        Faddeeva function.
+
+        It computes ``w(z)`` by the continued fraction ``i / sqrt(pi) / (z - 1/2 / (z - 1 / (z - 3/2 / ...)))``
+        truncated at ``__CF_TERM`` terms.
+        The imaginary part of z must be nonnegative and its modulus must be at least ``__CF_RAD``.
+
+        This method is private and called internally as a helper of ``ErrorFun.__cerfc``.
+
+        :param z: Point where Faddeeva function is to be computed.
+        :type z: complex
+
+        :return: Computed value of Faddeeva function.
+        :rtype: complex
+        """
+        res: complex = z
+
+        for k in range(cls.__CF_TERM, 0, -1):
+            res = z - k / 2 / res
+
+        return 1j / math.sqrt(math.pi) / res
+
+    @classmethod
+    def __cerfc(cls, z: complex) -> complex:
+        """
+        Complementary error function of finite complex parameter.
+
+        For parameter of small modulus, it uses the series expansion.
+        Otherwise, it uses ``erfc(z) = exp(-z^2) * w(iz)`` for nonnegative real part and ``erfc(z) = 2 - erfc(-z)``
+        for negative real part.
+        The real part of ``-z^2`` is computed as ``(y - x) * (x + y)`` so that it does not lose precision near the
+        diagonals.
+
+        This method is private and called internally as a helper of the computation kernels.
+
+        :param z: Point where complementary error function is to be computed.
+        :type z: complex
+
+        :return: Computed value of complementary error function.
+        :rtype: complex
+        """
+        if abs(z) < cls.__CF_RAD:
+            return cls.__series(z, True)
+        elif z.real < 0:
+            return 2 - cls.__cerfc(-z)
+
+        x, y = z.real, z.imag
+        w: complex = cls.__faddeeva(1j * z)
+        e: complex = complex((y - x) * (x + y), -2 * x * y)  # Exponent, that is, ``-z^2``.
+
+        try:
+            return cmath.exp(e) * w
+        except OverflowError:
+            # Exponential itself overflows, but the result may not.
+            if e.real + math.log(abs(w)) < 709:
+                return cmath.exp(e + cmath.log(w))
+            else:
+                return cmath.rect(math.inf, e.imag + cmath.phase(w))
+
+    @classmethod
+    def __erf(cls, x: Union[float, complex]) -> Union[float, complex]:
+        """
+        Error function.
+
+        Error function with parameter x has following computation rules.
+            1. If x is nan, the result is nan.
+            2. If x is +-inf, the result is +-1, resp.
+            3. If x is finite, the result is ``math.erf(x)``.
+            4. If x is complex with nan or inf part, the result is nan.
+            5. If x is complex with zero imaginary part, the result is the result for its real part as complex.
+            6. If x is complex of small modulus, the result is the series expansion around its real part.
+            7. If x is complex of large modulus, the result is ``1 - erfc(x)`` for nonnegative real part and
+               ``erfc(-x) - 1`` for negative real part.
+
+        This method is private and called internally as a helper of ``ErrorFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``ErrorFun.eval``.
+
+        :param x: Point where error function is to be computed.
+        :type x: Union[float, complex]
+
+        :return: Computed value of error function.
+        :rtype: Union[float, complex]
+        """
+        if type(x) != complex:
+            return math.erf(x)
+        elif not cmath.isfinite(x):
+            return math.nan
+        elif x.imag == 0:
+            return complex(math.erf(x.real))
+        elif abs(x) < cls.__CF_RAD:
+            return cls.__series(x, False)
+        else:
+            return 1 - cls.__cerfc(x) if x.real >= 0 else cls.__cerfc(-x) - 1
+
+    @classmethod
+    def __erfc(cls, x: Union[float, complex]) -> Union[float, complex]:
+        """
+        Complementary error function.
+
+        Complementary error function with parameter x has following computation rules.
+            1. If x is nan, the result is nan.
+            2. If x is +-inf, the result is 0, 2, resp.
+            3. If x is finite, the result is ``math.erfc(x)``.
+            4. If x is complex with nan or inf part, the result is nan.
+            5. If x is complex with zero imaginary part, the result is the result for its real part as complex.
+            6. If x is complex of small modulus, the result is the series expansion around its real part.
+            7. If x is complex of large modulus, the result is ``exp(-x^2) * w(ix)`` for nonnegative real part and
+               ``2 - erfc(-x)`` for negative real part.
+
+        This method is private and called internally as a helper of ``ErrorFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``ErrorFun.eval``.
+
+        :param x: Point where complementary error function is to be computed.
+        :type x: Union[float, complex]
+
+        :return: Computed value of complementary error function.
+        :rtype: Union[float, complex]
+        """
+        if type(x) != complex:
+            return math.erfc(x)
+        elif not cmath.isfinite(x):
+            return math.nan
+        elif x.imag == 0:
+            return complex(math.erfc(x.real))
+        else:
+            return cls.__cerfc(x)
+
+    @classmethod
+    def __kern(cls) -> Callable[[Union[float, complex]], Union[float, complex]]:
+        """
+        Find computation kernel implementing the computation rules.
+
+        This method is private and called internally as a helper of ``ErrorFun.eval``.
+
+        :return: Computation kernel of function.
+        :rtype: Callable[[Union[float, complex]], Union[float, complex]]
+        """
+        if cls == Erf:
+            return cls.__erf
+        else:
+            return cls.__erfc
+
+    @classmethod
+    def chk_t(cls, rt: Token.Tok, t_env: Dict[int, TypeSystem.T]) -> Optional[Dict[int, TypeSystem.T]]:
+        """
+        Type checker for error functions.
+
+        Error functions apply elementwise, so tensor is mapped to tensor of the same shape.
+
+        :param rt: Token to be type checked.
+        :type rt: Token.Tok
+        :param t_env: Type environment.
+        :type t_env: Dict[int, TypeSystem.T]
+
+        :return: Type environment if type check succeeds. None otherwise.
+        :rtype: Optional[Dict[int, TypeSystem.T]]
+        """
+        if rt.argc != 1:
+            return None
+
+        rt.t = cls.bcast_t([rt.chd[0].t], [TypeSystem.Real, TypeSystem.Cmplx, TypeSystem.Sym])
+
+        if not rt.t:
+            return None
+
+        return t_env
+
+    @classmethod
+    def eval(cls, x: Union[float, complex, list]) -> Tuple[Union[float, complex, list], List[Warning.InterpWarn]]:
+        """
+        Evaluate error function.
+
+        Parameter can be either scalar or tensor, and the result has the same shape with the parameter.
+        If the parameter is real, the whole tensor is evaluated by a single ``map`` call of ``math`` function, which
+        runs entirely in C.
+        Since ``math.erf`` and ``math.erfc`` already follow the computation rules for nan and inf, this is the case even
+        if the parameter has nan or inf.
+        Complex parameter is evaluated by the private helper implementing the computation rules.
+
+        It generates warnings for followings cases, each at most once per call.
+            1. Some item exceeds floating point max/min size. (BIG_INT/SMALL_INT, resp.)
+            2. Some item is nan. (NAN_DETECT)
+            3. Some item is +-inf. (INF_DETECT)
+
+        :param x: Point where function is to be computed.
+        :type x: Union[float, complex, list]
+
+        :return: Computed value and list of generated warnings.
+        :rtype: Tuple[Union[float, complex, list], List[Warning.InterpWarn]]
+        """
+        x, shape = cls.flat(x)
+        x, warn, _ = cls.chk_arg(x)
+
+        if cls.is_cmplx(x):
+            return cls.unflat(list(map(cls.__kern(), x)), shape), warn
+
+        return cls.unflat(list(map(math.erf if cls == Erf else math.erfc, x)), shape), warn
+
 
 @final
 class Erf(ErrorFun):
+    __SGN: Final[List[str]] = ['Erf[Real] -> Real', 'Erf[Cmplx] -> Cmplx', 'Erf[Sym] -> Sym',
+                               'Erf[List of Real] -> List of Real', 'Erf[List of Cmplx] -> List of Cmplx']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class Erfc(ErrorFun):
+    __SGN: Final[List[str]] = ['Erfc[Real] -> Real', 'Erfc[Cmplx] -> Cmplx', 'Erfc[Sym] -> Sym',
+                               'Erfc[List of Real] -> List of Real', 'Erfc[List of Cmplx] -> List of Cmplx']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
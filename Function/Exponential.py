@@ -1,211 +1,766 @@
-from typing import final
+from __future__ import annotations
 
-from Function import Function
+import cmath
+import math
+from itertools import repeat
+from operator import mul, neg, sub, truediv
+from typing import List, final, Final, Optional, Dict, Tuple, Union, Callable
+
+from Function import Function, Precision
+from Core import Dual, Interval, Symbolic, Token, TypeSystem, Type
+from Util.Macro import is_int
+from Warning import Warning
 
 
 class ExpFun(Function.Fun):
     """
     Exponential and logarithm function toolbox.
 
-    :cvar __sign: Signatures of exponential and logarithm functions.
+    Functions with two parameters, that is, ``Log[x, b]``, ``Power[x, y]`` and ``Surd[x, n]``, broadcast scalar
+    parameter against tensor parameter.
+    Since real is subtype of complex, logarithms, square root and power of negative reals are computed as complex
+    principal values instead of nan.
+    On the other hand, ``CubeRoot`` and ``Surd`` are real roots, so they stay real.
     """
 
     def __new__(cls) -> None:
         raise NotImplementedError
 
-    # @classmethod
-    # def __exp(cls, x: float) -> float:
-    #     """
-    #     Exponential function.
-    #
-    #     Exponential function with parameter x has following computation rules.
-    #         1. If x is nan, the result is nan.
-    #         2. If x if -inf, the result is 0.
-    #         3. If x is +inf, the result is +inf.
-    #         4. If x is finite, the result is ``math.exp(x)``.
-    #
-    #     This method is private and called internally as a helper of ``Exp.simplify``.
-    #     For detailed description for simplification, refer to the comments of ``Exp.simplify``.
-    #
-    #     :param x: Point where exponential function is to be computed.
-    #     :type x: float
-    #
-    #     :return: Computed value of exponential function.
-    #     :rtype: float
-    #     """
-    #     try:
-    #         return math.exp(x)
-    #     except OverflowError:
-    #         return math.inf
-    #
-    # @classmethod
-    # def __log(cls, x: float, y: float = None) -> float:
-    #     """
-    #     Log function.
-    #
-    #     Log function with exponent x has following computation rules.
-    #         1. If x is nan or -inf, the result is nan.
-    #         2. If x is +inf, the result is +inf.
-    #         3. If x is finite negative, the result if nan.
-    #         4. If x is 0, the result is -inf.
-    #         5. If x is finite positive, the result is ``math.log2(x)``.
-    #
-    #     Log function with exponent x and base y has following computation rules.
-    #         1. If x or y is nan or -inf, the result is nan.
-    #         2. If x or y is finite negative, the result is nan.
-    #         3. If y is 1, the result is nan.
-    #         4. If x and y is inf, the result is nan.
-    #         5. If x is inf and y is 0, the result is nan.
-    #         6. If x is inf and y is finite which is in (0, 1), the result is -inf.
-    #         7. If x is inf and y is finite which is greater than 1, the result is inf.
-    #         8. If x is 0 and y is inf, the result is nan.
-    #         9. If x is finite positive and y is inf, the result is 0.
-    #         10. If x and y is 0, the result is nan.
-    #         11. If x is 0 and y is finite which is in (0, 1), the result is inf.
-    #         12. If x is 0 and y is finite which is greater than 1, the result is -inf.
-    #         13. If x is finite positive and y is 0, the result is 0.
-    #         14. If x is finite positive and y is finite positive which is not 1, the result is ``math.log(x, y)``.
-    #
-    #     This method is private and called internally as a helper of ``Exp.simplify``.
-    #     For detailed description for simplification, refer to the comments of ``Exp.simplify``.
-    #
-    #     :param x: Exponent where log function is to be computed.
-    #     :type x: float
-    #     :param y: Base where log function is to be computed.
-    #     :type y: float
-    #
-    #     :return: Computed value of log function.
-    #     :rtype: float
-    #     """
-    #     if y is None:
-    #         return math.nan if x < 0 else -math.inf if x == 0 else math.log(x)
-    #     else:
-    #         if math.isnan(x + y) or x < 0 or y < 0 or y == 1:
-    #             return math.nan
-    #         elif y == 0 or math.isinf(y):
-    #             return math.nan if x == 0 or math.isinf(x) else 0
-    #         else:
-    #             return math.inf if x == 0 and y < 1 else -math.inf if x == 0 and y > 1 else math.log(x, y)
-    #
-    # @classmethod
-    # def __pow(cls, x: float, y: float) -> float:
-    #     """
-    #     Power function.
-    #
-    #     Power function with base x and exponent y has following computation rules.
-    #         1. If x or y is nan, the result is nan.
-    #         2. If x is +-inf and y is -inf, the result is 0.
-    #         3. If x and y is inf, the result is inf.
-    #         4. If x is -inf and y is inf, the result is nan.
-    #         5. If x is inf and y is 0, the result is nan.
-    #         6. If x is inf and y is finite positive, the result is inf.
-    #         7. If x is inf and y is finite negative, the result is 0.
-    #         8. If x is -inf and y is 0 or finite noninteger, the result is nan.
-    #         9. If x is -inf and y is finite negative integer, the result is 0.
-    #         10. If x is -inf and y is finite even positive integer, the result is inf.
-    #         11. If x is -inf and y is finite odd positive integer, the result is -inf.
-    #         12. If x is 1 or y is 0, the result is 1.
-    #         13. If x is finite which is in [-1, 0] and y is -inf, the result is nan.
-    #         14. If x is finite which is in (0, 1) and y is -inf, the result is inf.
-    #         15. If x is finite which is not in [-1, 1] and y is -inf, the result is 0.
-    #         16. If x is finite which is less than or equal to -1 and y is inf, the result is nan.
-    #         17. If x is finite which is in (-1, 1) and y is inf, the result is 0.
-    #         18. If x is finite which is in greater than 1 and y is inf, the result is inf.
-    #         19. If x is finite negative and y is finite noninteger, the result is nan.
-    #         20. If x is finite positive and y is finite, the result is ``math.pow(x, y)``.
-    #         21. If x is finite negative and y is finite integer, the result is ``math.pow(x, y)``.
-    #
-    #     This method is private and called internally as a helper of ``Exp.simplify``.
-    #     For detailed description for simplification, refer to the comments of ``Exp.simplify``.
-    #
-    #     :param x: Base where power function is to be computed.
-    #     :type x: float
-    #     :param y: Exponent where power function is to be computed.
-    #     :type y: float
-    #
-    #     :return: Computed value of power function.
-    #     :rtype: float
-    #     """
-    #     if math.isnan(x + y) or (x < 0 and not is_int(y)):
-    #         return math.nan
-    #     elif (x <= -1 and y == math.inf) or (-1 <= x <= 0 and y == -math.inf) or (x == 0 and y < 0):
-    #         return math.nan
-    #     elif y == 0:
-    #         return math.nan if math.isinf(x) else 1
-    #     else:
-    #         try:
-    #             return math.pow(x, y)
-    #         except OverflowError:
-    #             return -math.inf if x < 0 and y % 2 == 1 else math.inf
-    #
-    # @classmethod
-    # def __sqrt(cls, x: float) -> float:
-    #     """
-    #     Square root function.
-    #
-    #     Square root function with parameter x has following computation rules.
-    #         1. If x is nan or -inf, the result is nan.
-    #         2. If x is +inf, the result is +inf.
-    #         3. If x is finite negative, the result if nan.
-    #         4. If x is finite nonnegative, the result is ``math.sqrt(x)``.
-    #
-    #     This method is private and called internally as a helper of ``Exp.simplify``.
-    #     For detailed description for simplification, refer to the comments of ``Exp.simplify``.
-    #
-    #     :param x: Point where square root function is to be computed.
-    #     :type x: float
-    #
-    #     :return: Computed value of square root function.
-    #     :rtype: float
-    #     """
-    #     return math.nan if x < 0 else math.sqrt(x)
-    #
-    # @classmethod
-    # def __log2(cls, x: float) -> float:
-    #     """
-    #     Log function with base 2.
-    #
-    #     Log function with base 2 with parameter x has following computation rules.
-    #         1. If x is nan or -inf, the result is nan.
-    #         2. If x is +inf, the result is +inf.
-    #         3. If x is finite negative, the result if nan.
-    #         4. If x is 0, the result is -inf.
-    #         5. If x is finite positive, the result is ``math.log2(x)``.
-    #
-    #     This method is private and called internally as a helper of ``Exp.simplify``.
-    #     For detailed description for simplification, refer to the comments of ``Exp.simplify``.
-    #
-    #     :param x: Point where log function with base 2 is to be computed.
-    #     :type x: float
-    #
-    #     :return: Computed value of log function with base 2.
-    #     :rtype: float
-    #     """
-    #     return math.nan if x < 0 else -math.inf if x == 0 else math.log2(x)
-    #
-    # @classmethod
-    # def __log10(cls, x: float) -> float:
-    #     """
-    #     Log function with base 10.
-    #
-    #     Log function with base 10 with parameter x has following computation rules.
-    #         1. If x is nan or -inf, the result is nan.
-    #         2. If x is +inf, the result is +inf.
-    #         3. If x is finite negative, the result if nan.
-    #         4. If x is 0, the result is -inf.
-    #         5. If x is finite positive, the result is ``math.log10(x)``.
-    #
-    #     This method is private and called internally as a helper of ``Exp.simplify``.
-    #     For detailed description for simplification, refer to the comments of ``Exp.simplify``.
-    #
-    #     :param x: Point where log function with base 10 is to be computed.
-    #     :type x: float
-    #
-    #     :return: Computed value of log function with base 10.
-    #     :rtype: float
-    #     """
-    #     return math.nan if x < 0 else -math.inf if x == 0 else math.log10(x)
-    #
+    @classmethod
+    def __exp(cls, x: Union[float, complex]) -> Union[float, complex]:
+        """
+        Exponential function.
+
+        Exponential function with parameter x has following computation rules.
+            1. If x is nan, the result is nan.
+            2. If x if -inf, the result is 0.
+            3. If x is +inf, the result is +inf.
+            4. If x is finite, the result is ``math.exp(x)``.
+            5. If x is complex, the result is ``cmath.exp(x)``.
+               If it overflows, the result is complex inf whose phase is the imaginary part of x.
+
+        This method is private and called internally as a helper of ``ExpFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``ExpFun.eval``.
+
+        :param x: Point where exponential function is to be computed.
+        :type x: Union[float, complex]
+
+        :return: Computed value of exponential function.
+        :rtype: Union[float, complex]
+        """
+        try:
+            return cmath.exp(x) if type(x) == complex else math.exp(x)
+        except OverflowError:
+            return cmath.rect(math.inf, x.imag) if type(x) == complex else math.inf
+
+    @classmethod
+    def __log(cls, x: Union[float, complex], y: Union[float, complex] = None) -> Union[float, complex]:
+        """
+        Log function.
+
+        Log function with exponent x has following computation rules.
+            1. If x is nan, the result is nan.
+            2. If x is +inf, the result is +inf.
+            3. If x is 0, the result is -inf.
+            4. If x is finite positive, the result is ``math.log(x)``.
+            5. If x is negative including -inf, the result is ``log(-x) + i * pi``.
+            6. If x is complex, the result is ``cmath.log(x)``.
+
+        Log function with exponent x and base y has following computation rules.
+            1. If x or y is nan, the result is nan.
+            2. If y is 1, the result is nan.
+            3. If x or y is negative or complex, and the other one is 0, the result is nan.
+            4. If x or y is negative or complex, and none of them is 0, the result is ``log(x) / log(y)`` where the
+               logarithms follow the rules above.
+            5. If x and y is inf, the result is nan.
+            6. If x is inf and y is 0, the result is nan.
+            7. If x is inf and y is finite which is in (0, 1), the result is -inf.
+            8. If x is inf and y is finite which is greater than 1, the result is inf.
+            9. If x is 0 and y is inf, the result is nan.
+            10. If x is finite positive and y is inf, the result is 0.
+            11. If x and y is 0, the result is nan.
+            12. If x is 0 and y is finite which is in (0, 1), the result is inf.
+            13. If x is 0 and y is finite which is greater than 1, the result is -inf.
+            14. If x is finite positive and y is 0, the result is 0.
+            15. If x is finite positive and y is 2 or 10, the result is ``math.log2(x)`` or ``math.log10(x)``, resp.
+            16. If x is finite positive and y is finite positive which is not 1, the result is ``math.log(x, y)``.
+        Here, the rule 15 is for exactness, e.g., ``math.log(1000, 10)`` is not exactly 3 but ``math.log10(1000)`` is.
+
+        This method is private and called internally as a helper of ``ExpFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``ExpFun.eval``.
+
+        :param x: Exponent where log function is to be computed.
+        :type x: Union[float, complex]
+        :param y: Base where log function is to be computed.
+        :type y: Union[float, complex]
+
+        :return: Computed value of log function.
+        :rtype: Union[float, complex]
+        """
+        if y is None:
+            if x == 0:
+                return -math.inf
+            elif type(x) == complex:
+                return cmath.log(x)
+            else:
+                return complex(math.log(-x), math.pi) if x < 0 else math.log(x)
+        elif x != x or y != y or y == 1:
+            return math.nan
+        elif type(x) == complex or type(y) == complex or x < 0 or y < 0:
+            return math.nan if x == 0 or y == 0 else cls.__log(x) / cls.__log(y)
+        elif y == 0 or math.isinf(y):
+            return math.nan if x == 0 or math.isinf(x) else 0
+        else:
+            if x == 0:
+                return math.inf if y < 1 else -math.inf
+            else:
+                return math.log2(x) if y == 2 else math.log10(x) if y == 10 else math.log(x, y)
+
+    @classmethod
+    def __pow(cls, x: Union[float, complex], y: Union[float, complex]) -> Union[float, complex]:
+        """
+        Power function.
+
+        Power function with base x and exponent y has following computation rules.
+            1. If x or y is nan, the result is nan.
+            2. If x is +-inf and y is -inf, the result is 0.
+            3. If x and y is inf, the result is inf.
+            4. If x is -inf and y is inf, the result is nan.
+            5. If x is inf and y is 0, the result is nan.
+            6. If x is inf and y is finite positive, the result is inf.
+            7. If x is inf and y is finite negative, the result is 0.
+            8. If x is -inf and y is 0 or finite noninteger, the result is nan.
+            9. If x is -inf and y is finite negative integer, the result is 0.
+            10. If x is -inf and y is finite even positive integer, the result is inf.
+            11. If x is -inf and y is finite odd positive integer, the result is -inf.
+            12. If x is 1 or y is 0, the result is 1.
+            13. If x is finite which is in [-1, 0] and y is -inf, the result is nan.
+            14. If x is finite which is in (0, 1) and y is -inf, the result is inf.
+            15. If x is finite which is not in [-1, 1] and y is -inf, the result is 0.
+            16. If x is finite which is less than or equal to -1 and y is inf, the result is nan.
+            17. If x is finite which is in (-1, 1) and y is inf, the result is 0.
+            18. If x is finite which is in greater than 1 and y is inf, the result is inf.
+            19. If x is 0 and y is finite negative, the result is nan.
+            20. If x is finite negative and y is finite noninteger, the result is complex principal value ``x ** y``.
+            21. If x is finite positive and y is finite, the result is ``math.pow(x, y)``.
+            22. If x is finite negative and y is finite integer, the result is ``math.pow(x, y)``.
+            23. If x or y is complex, the result is complex principal value ``x ** y``.
+                If x is 0 and the real part of y is negative, the result is nan.
+
+        This method is private and called internally as a helper of ``ExpFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``ExpFun.eval``.
+
+        :param x: Base where power function is to be computed.
+        :type x: Union[float, complex]
+        :param y: Exponent where power function is to be computed.
+        :type y: Union[float, complex]
+
+        :return: Computed value of power function.
+        :rtype: Union[float, complex]
+        """
+        if type(x) == complex or type(y) == complex:
+            try:
+                return x ** y
+            except ZeroDivisionError:
+                return math.nan
+            except OverflowError:
+                return cls.__exp(y * cls.__log(x))
+        elif math.isnan(x) or math.isnan(y):
+            return math.nan
+        elif (x <= -1 and y == math.inf) or (-1 <= x <= 0 and y == -math.inf) or (x == 0 and y < 0):
+            return math.nan
+        elif y == 0:
+            return math.nan if math.isinf(x) else 1
+        elif x == -math.inf and math.isfinite(y) and not is_int(y):
+            return math.nan
+        elif x < 0 and math.isfinite(y) and not is_int(y):
+            try:
+                return x ** y
+            except OverflowError:
+                return cls.__exp(y * cls.__log(x))
+        else:
+            try:
+                return math.pow(x, y)
+            except OverflowError:
+                return -math.inf if x < 0 and y % 2 == 1 else math.inf
+
+    @classmethod
+    def __sqrt(cls, x: Union[float, complex]) -> Union[float, complex]:
+        """
+        Square root function.
+
+        Square root function with parameter x has following computation rules.
+            1. If x is nan, the result is nan.
+            2. If x is +inf, the result is +inf.
+            3. If x is negative including -inf, the result is ``i * math.sqrt(-x)``.
+            4. If x is finite nonnegative, the result is ``math.sqrt(x)``.
+            5. If x is complex, the result is ``cmath.sqrt(x)``.
+
+        This method is private and called internally as a helper of ``ExpFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``ExpFun.eval``.
+
+        :param x: Point where square root function is to be computed.
+        :type x: Union[float, complex]
+
+        :return: Computed value of square root function.
+        :rtype: Union[float, complex]
+        """
+        if type(x) == complex:
+            return cmath.sqrt(x)
+        else:
+            return complex(0, math.sqrt(-x)) if x < 0 else math.sqrt(x)
+
+    @classmethod
+    def __log2(cls, x: Union[float, complex]) -> Union[float, complex]:
+        """
+        Log function with base 2.
+
+        Log function with base 2 with parameter x has following computation rules.
+            1. If x is nan, the result is nan.
+            2. If x is +inf, the result is +inf.
+            3. If x is 0, the result is -inf.
+            4. If x is finite positive, the result is ``math.log2(x)``.
+            5. If x is negative including -inf, the result is ``log2(-x) + i * pi / log(2)``.
+            6. If x is complex, the result is ``cmath.log(x) / log(2)``.
+
+        This method is private and called internally as a helper of ``ExpFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``ExpFun.eval``.
+
+        :param x: Point where log function with base 2 is to be computed.
+        :type x: Union[float, complex]
+
+        :return: Computed value of log function with base 2.
+        :rtype: Union[float, complex]
+        """
+        if x == 0:
+            return -math.inf
+        elif type(x) == complex:
+            return cmath.log(x) / math.log(2)
+        else:
+            return complex(math.log2(-x), math.pi / math.log(2)) if x < 0 else math.log2(x)
+
+    @classmethod
+    def __log10(cls, x: Union[float, complex]) -> Union[float, complex]:
+        """
+        Log function with base 10.
+
+        Log function with base 10 with parameter x has following computation rules.
+            1. If x is nan, the result is nan.
+            2. If x is +inf, the result is +inf.
+            3. If x is 0, the result is -inf.
+            4. If x is finite positive, the result is ``math.log10(x)``.
+            5. If x is negative including -inf, the result is ``log10(-x) + i * pi / log(10)``.
+            6. If x is complex, the result is ``cmath.log10(x)``.
+
+        This method is private and called internally as a helper of ``ExpFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``ExpFun.eval``.
+
+        :param x: Point where log function with base 10 is to be computed.
+        :type x: Union[float, complex]
+
+        :return: Computed value of log function with base 10.
+        :rtype: Union[float, complex]
+        """
+        if x == 0:
+            return -math.inf
+        elif type(x) == complex:
+            return cmath.log10(x)
+        else:
+            return complex(math.log10(-x), math.pi / math.log(10)) if x < 0 else math.log10(x)
+
+    @classmethod
+    def __cbrt(cls, x: float) -> float:
+        """
+        Cube root function.
+
+        Cube root function with parameter x has following computation rules.
+            1. If x is nan, 0, or +-inf, the result is x itself.
+            2. If x is finite nonzero, the result is real cube root of x.
+        Here, the rule 2 takes ``abs(x) ** (1 / 3)`` with the sign of x and refines it by one step of Newton's method.
+        Since 1 / 3 is not exact in floating point, the refinement is needed for exact cube roots of perfect cubes.
+
+        This method is private and called internally as a helper of ``ExpFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``ExpFun.eval``.
+
+        **Reference**
+            * https://en.wikipedia.org/wiki/Newton%27s_method
+
+        :param x: Point where cube root function is to be computed.
+        :type x: float
+
+        :return: Computed value of cube root function.
+        :rtype: float
+        """
+        if x == 0 or not math.isfinite(x):
+            return x
+
+        r: float = math.copysign(abs(x) ** (1 / 3), x)  # Initial approximation.
+
+        return r - (r - x / (r * r)) / 3
+
+    @classmethod
+    def __surd(cls, x: float, n: float) -> float:
+        """
+        Real nth root function.
+
+        Real nth root function with parameter x and order n has following computation rules.
+            1. If x or n is nan, the result is nan.
+            2. If n is not integer or n is 0, the result is nan.
+            3. If x is negative and n is even, the result is nan.
+            4. If x is 0 and n is negative, the result is inf.
+            5. If x is 0 and n is positive, the result is x itself.
+            6. If x is +-inf, the result is +-inf if n is positive and +-0 if n is negative, resp.
+            7. If x is finite nonzero, the result is real nth root of x.
+        Here, the rule 7 takes ``abs(x) ** (1 / n)`` with the sign of x and refines it by one step of Newton's method as
+        ``ExpFun.__cbrt`` does.
+
+        This method is private and called internally as a helper of ``ExpFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``ExpFun.eval``.
+
+        :param x: Point where real nth root function is to be computed.
+        :type x: float
+        :param n: Order of root.
+        :type n: float
+
+        :return: Computed value of real nth root function.
+        :rtype: float
+        """
+        if math.isnan(x) or math.isnan(n) or not is_int(n) or n == 0 or (x < 0 and n % 2 == 0):
+            return math.nan
+        elif x == 0:
+            return math.inf if n < 0 else x
+        elif math.isinf(x):
+            return math.copysign(0.0 if n < 0 else math.inf, x)
+
+        r: float = math.copysign(abs(x) ** (1 / n), x)  # Initial approximation.
+
+        return r - (r - x / r ** (n - 1)) / n
+
+    @classmethod
+    def __kern(cls) -> Callable[..., Union[float, complex]]:
+        """
+        Find computation kernel implementing the computation rules.
+
+        This method is private and called internally as a helper of ``ExpFun.eval``.
+
+        :return: Computation kernel of function.
+        :rtype: Callable[..., Union[float, complex]]
+        """
+        if cls == Log:
+            return cls.__log
+        elif cls == Log2:
+            return cls.__log2
+        elif cls == Log10:
+            return cls.__log10
+        elif cls == Power:
+            return cls.__pow
+        elif cls == Exp:
+            return cls.__exp
+        elif cls == Sqrt:
+            return cls.__sqrt
+        elif cls == CubeRoot:
+            return cls.__cbrt
+        else:
+            return cls.__surd
+
+    @classmethod
+    def chk_t(cls, rt: Token.Tok, t_env: Dict[int, TypeSystem.T]) -> Optional[Dict[int, TypeSystem.T]]:
+        """
+        Type checker for exponential and logarithm functions.
+
+        Functions apply elementwise, and parameters are broadcast as binary operators do.
+        For the rules of broadcasting, refer to the comments of ``Fun.bcast_t``.
+        ``CubeRoot`` and ``Surd`` accept only reals.
+
+        :param rt: Token to be type checked.
+        :type rt: Token.Tok
+        :param t_env: Type environment.
+        :type t_env: Dict[int, TypeSystem.T]
+
+        :return: Type environment if type check succeeds. None otherwise.
+        :rtype: Optional[Dict[int, TypeSystem.T]]
+        """
+        if rt.argc not in ([1, 2] if cls == Log else [2] if cls in [Power, Surd] else [1]):
+            return None
+
+        rt.t = cls.bcast_t([tok.t for tok in rt.chd],
+                           [TypeSystem.Real, TypeSystem.Interval, TypeSystem.Sym] if cls in [CubeRoot, Surd] else
+                           [TypeSystem.Real, TypeSystem.Cmplx, TypeSystem.Interval, TypeSystem.Sym])
+
+        if not rt.t:
+            return None
+
+        return t_env
+
+    @classmethod
+    def eval(cls, *args: Union[float, complex, list]) -> Tuple[Union[float, complex, list], List[Warning.InterpWarn]]:
+        """
+        Evaluate exponential and logarithm function.
+
+        Parameters can be either scalar or tensor, and they are broadcast to the common shape.
+        Note that ``Log`` with two parameters takes base last, that is, ``Log[x, b]`` is log of x with base b.
+        The whole tensor is evaluated by chain of ``map`` calls.
+        If parameters have no nan, inf, pole, or point out of domain, the chain is built only from ``math`` functions,
+        ``cmath`` functions for complex parameters, and arithmetic operators, so the loop runs entirely in C.
+        If the fast chain overflows or hits a pole, the whole tensor is evaluated again by the private helper
+        implementing the computation rules.
+
+        If arbitrary precision mode is on, it is evaluated by ``Precision.PrecFun.eval`` instead.
+
+        It generates warnings for followings cases, each at most once per call.
+            1. Some item exceeds floating point max/min size. (BIG_INT/SMALL_INT, resp.)
+            2. Some item is nan. (NAN_DETECT)
+            3. Some item is +-inf. (INF_DETECT)
+            4. Some item is mathematical pole. (POLE_DETECT)
+               Poles are exponent 0 for ``Log``, ``Log2`` and ``Log10``, base 0 or 1 for ``Log``, base 0 with
+               nonpositive exponent for ``Power``, and 0 with negative order for ``Surd``.
+            5. Some finite real item is not in domain. (DOMAIN_OUT)
+               Domains are positive reals for ``Log``, ``Log2`` and ``Log10``, nonnegative reals for ``Sqrt``,
+               nonnegative base or integer exponent for ``Power``, and integer order and, for even order, nonnegative
+               reals for ``Surd``.
+               Real items out of domain are nan since the results are typed real, while complex parameters give
+               complex principal values.
+            6. ``Exp`` or ``Power`` of finite parameters overflows to inf. (BIG_INT)
+        Each check is a single scan over the whole tensor, not a branch per item.
+
+        :param args: Parameters where function is to be computed.
+        :type args: Union[float, complex, list]
+
+        :return: Computed value and list of generated warnings.
+        :rtype: Tuple[Union[float, complex, list], List[Warning.InterpWarn]]
+        """
+        if Precision.PrecFun.prec():
+            return Precision.PrecFun.eval(cls, *args)
+
+        arg, shape = cls.bcast(*args)
+
+        # Empty batch has no item to check, and domain checks below do not accept it.
+        if not arg[0]:
+            return cls.unflat([], shape), []
+
+        warn: List[Warning.InterpWarn] = []
+        fast: bool = True
+
+        for i in range(len(arg)):
+            arg[i], arg_warn, arg_fast = cls.chk_arg(arg[i], i + 1)
+            warn += arg_warn
+            fast &= arg_fast
+
+        cplx: bool = any(map(cls.is_cmplx, arg))
+
+        # Pole and domain checks run in C if the parameter is finite real.
+        # Otherwise, they fall back to generator since comparison with nan or complex is not reliable.
+        if cls == Log and len(arg) == 2:
+            x, b = arg
+
+            if not cplx and ((min(b) < 0 or min(x) < 0) if fast else
+                             any(-math.inf < it < 0 for it in b) or any(-math.inf < it < 0 for it in x)):
+                warn.append(Warning.InterpWarn(Type.InterpWarnT.DOMAIN_OUT, 50))
+                fast = False
+
+            if 0.0 in x:
+                warn.append(Warning.InterpWarn(Type.InterpWarnT.POLE_DETECT, 48))
+                fast = False
+
+            if 0.0 in b or 1.0 in b:
+                warn.append(Warning.InterpWarn(Type.InterpWarnT.POLE_DETECT, 51))
+                fast = False
+
+            # Tensor base with 2 or 10 needs dedicated logarithms of the computation rules item by item.
+            fast &= type(args[1]) != list or not (2.0 in b or 10.0 in b)
+        elif cls in [Log, Log2, Log10]:
+            x = arg[0]
+
+            if 0.0 in x:
+                warn.append(Warning.InterpWarn(Type.InterpWarnT.POLE_DETECT, 48 if cls == Log else
+                                               54 if cls == Log2 else 56))
+                fast = False
+
+            if not cplx and ((min(x) < 0) if fast else any(-math.inf < it < 0 for it in x)):
+                warn.append(Warning.InterpWarn(Type.InterpWarnT.DOMAIN_OUT, 49 if cls == Log else
+                                               55 if cls == Log2 else 57))
+                fast = False
+        elif cls == Sqrt:
+            x = arg[0]
+
+            if not cplx and ((min(x) < 0) if fast else any(-math.inf < it < 0 for it in x)):
+                warn.append(Warning.InterpWarn(Type.InterpWarnT.DOMAIN_OUT, 25))
+                fast = False
+        elif cls == Power:
+            x, y = arg
+
+            if not cplx and ((min(x) < 0) if fast else any(-math.inf < it < 0 for it in x)) and \
+                    any(-math.inf < it1 < 0 and math.isfinite(it2) and not is_int(it2) for it1, it2 in zip(x, y)):
+                warn.append(Warning.InterpWarn(Type.InterpWarnT.DOMAIN_OUT, 52))
+                fast = False
+
+            if not cplx and 0.0 in x and any(it1 == 0 and it2 <= 0 for it1, it2 in zip(x, y)):
+                warn.append(Warning.InterpWarn(Type.InterpWarnT.POLE_DETECT, 53))
+        elif cls == Surd:
+            x, n = arg
+
+            if (any(map(math.fmod, n, repeat(1))) if fast else
+                    any(math.isfinite(it) and not is_int(it) for it in n)) or 0.0 in n:
+                warn.append(Warning.InterpWarn(Type.InterpWarnT.DOMAIN_OUT, 62))
+                fast = False
+
+            if ((min(x) < 0) if fast else any(it < 0 for it in x)) and \
+                    any(it1 < 0 and it2 % 2 == 0 for it1, it2 in zip(x, n)):
+                warn.append(Warning.InterpWarn(Type.InterpWarnT.DOMAIN_OUT, 63))
+                fast = False
+
+            if 0.0 in x:
+                if any(it1 == 0 and it2 < 0 for it1, it2 in zip(x, n)):
+                    warn.append(Warning.InterpWarn(Type.InterpWarnT.POLE_DETECT, 64))
+
+                fast = False
+        elif cls == CubeRoot:
+            # Not a pole, but 0 is handled separately by the computation rules.
+            fast &= 0.0 not in arg[0]
+
+        if not fast:
+            res: list = list(map(cls.__kern(), *arg))
+        else:
+            try:
+                if cls == Log:
+                    if len(arg) == 2 and not cplx and type(args[1]) != list and args[1] in [2, 10]:
+                        res: list = list(map(math.log2 if args[1] == 2 else math.log10, arg[0]))
+                    else:
+                        res: list = list(map(cmath.log if cplx else math.log, *arg))
+                elif cls == Log2:
+                    res: list = list(map(truediv, map(cmath.log, arg[0]), repeat(math.log(2)))) if cplx else \
+                        list(map(math.log2, arg[0]))
+                elif cls == Log10:
+                    res: list = list(map(cmath.log10 if cplx else math.log10, arg[0]))
+                elif cls == Power:
+                    res: list = list(map(pow if cplx else math.pow, *arg))
+                elif cls == Exp:
+                    res: list = list(map(cmath.exp if cplx else math.exp, arg[0]))
+                elif cls == Sqrt:
+                    res: list = list(map(cmath.sqrt if cplx else math.sqrt, arg[0]))
+                elif cls == CubeRoot:
+                    x = arg[0]
+                    r: list = list(map(math.copysign, map(pow, map(abs, x), repeat(1 / 3)), x))
+                    res: list = list(map(sub, r, map(truediv, map(sub, r, map(truediv, x, map(mul, r, r))), repeat(3))))
+                else:
+                    x, n = arg
+                    r: list = list(map(math.copysign, map(pow, map(abs, x), map(truediv, repeat(1), n)), x))
+                    rn: map = map(pow, r, map(sub, n, repeat(1)))  # (n - 1)th power of the approximation.
+                    res: list = list(map(sub, r, map(truediv, map(sub, r, map(truediv, x, rn)), n)))
+            except (OverflowError, ZeroDivisionError, ValueError):
+                # Overflow of exponential or power, or power with base 0 or negative base.
+                # Recomputation by the rules gives inf, nan, or complex principal values.
+                res: list = list(map(cls.__kern(), *arg))
+
+        # Complex principal values of real items out of domain, including -inf, do not match real type.
+        # They come only from the computation rules, so they are replaced with nan if the rules are used.
+        if not (cplx or fast):
+            res = [math.nan if type(it) == complex else it for it in res]
+
+        # Exponential and power of finite parameters are inf only if the result is too big to be represented in float.
+        if cls in [Exp, Power] and any(map(cmath.isinf, res)) and \
+                any(cmath.isinf(y) and all(map(cmath.isfinite, x)) for y, *x in zip(res, *arg)):
+            warn.append(Warning.InterpWarn(Type.InterpWarnT.BIG_INT, 102 if cls == Exp else 103))
+
+        return cls.unflat(res, shape), warn
+
+    @classmethod
+    def ival(cls, *args: Interval.Ival) -> Tuple[Interval.Ival, List[Warning.InterpWarn]]:
+        """
+        Evaluate exponential and logarithm function over intervals.
+
+        Parameters are batches of intervals, and batch of size 1 is broadcast.
+        The result encloses all the values of the function over each interval.
+            1. ``Exp``, ``Log``, ``Log2``, ``Log10``, ``Sqrt`` and ``CubeRoot`` are increasing.
+            2. ``Log[x, b]`` is the quotient of ``Log[x]`` and ``Log[b]``.
+            3. ``Power`` follows the rules of ``Interval.IvalArith.pow``.
+            4. ``Surd`` is increasing for positive order and reciprocal of that of the negated order for negative order.
+               Order must be a single nonzero integer point, or the result is empty.
+        Values at the end points are computed by ``ExpFun.eval`` and moved outward by 2 ulps, or 4 ulps for
+        ``CubeRoot`` and ``Surd`` whose kernels are refined by Newton's method.
+        Intervals are restricted to the real domain of the function first, that is, complex values are not enclosed.
+
+        It generates warnings for followings cases.
+            1. Some interval contains pole. (POLE_DETECT)
+               Poles are the same as those of ``ExpFun.eval``.
+            2. Some interval is not contained in real domain, or order of ``Surd`` is not a nonzero integer point.
+               (DOMAIN_OUT)
+
+        :param args: Intervals where function is to be computed.
+        :type args: Interval.Ival
+
+        :return: Enclosure of the result and list of generated warnings.
+        :rtype: Tuple[Interval.Ival, List[Warning.InterpWarn]]
+        """
+        pole: bool = False
+        out: bool = False
+
+        if cls == Exp:
+            res: Interval.Ival = Interval.IvalArith.mono(lambda t: cls.eval(t)[0], args[0], rng=(0.0, math.inf))
+        elif cls in [Log, Log2, Log10]:
+            x_l: List[Interval.Ival] = []
+
+            # Logarithms of base and exponent are enclosed separately, and then divided if base is given.
+            for x in args:
+                x, x_out = Interval.IvalArith.clip(x, 0.0, math.inf)
+                x_l.append(Interval.IvalArith.mono(lambda t: cls.eval(t)[0], x))
+                pole |= 0.0 in x.lo
+                out |= x_out
+
+            if len(x_l) == 1:
+                res: Interval.Ival = x_l[0]
+            else:
+                res, x_pole = Interval.IvalArith.div(x_l[0], x_l[1])
+                pole |= x_pole
+        elif cls == Power:
+            res, out, pole = Interval.IvalArith.pow(*args)
+        elif cls == Sqrt:
+            x, out = Interval.IvalArith.clip(args[0], 0.0, math.inf)
+            res: Interval.Ival = Interval.IvalArith.mono(lambda t: cls.eval(t)[0], x, rng=(0.0, math.inf))
+        elif cls == CubeRoot:
+            res: Interval.Ival = Interval.IvalArith.mono(lambda t: cls.eval(t)[0], args[0], ulp=4)
+        else:
+            x, n = args
+
+            if len(n) == 1 and n.lo[0] == n.hi[0] and n.lo[0] and is_int(n.lo[0]):
+                k: float = abs(n.lo[0])
+
+                if k % 2 == 0:
+                    x, out = Interval.IvalArith.clip(x, 0.0, math.inf)
+
+                res: Interval.Ival = Interval.IvalArith.mono(lambda t: cls.eval(t, k)[0], x, ulp=4)
+
+                if n.lo[0] < 0:
+                    res, pole = Interval.IvalArith.recip(res)
+            else:
+                res: Interval.Ival = Interval.Ival([math.nan] * len(x), [math.nan] * len(x))
+                out = True
+
+        warn: List[Warning.InterpWarn] = []
+
+        if out:
+            warn.append(Warning.InterpWarn(Type.InterpWarnT.DOMAIN_OUT, 98, handle=cls.__name__))
+
+        if pole:
+            warn.append(Warning.InterpWarn(Type.InterpWarnT.POLE_DETECT, 99, handle=cls.__name__))
+
+        return res, warn
+
+    @classmethod
+    def __deriv(cls) -> Callable[[list, list], list]:
+        """
+        Find chain computing derivative of function of single parameter.
+
+        Derivatives are computed from the points and the values of function as follows.
+            1. ``Exp`` is ``exp(x)``.
+            2. ``Log``, ``Log2`` and ``Log10`` are ``1 / (x * log(b))`` where b is e, 2, and 10, resp.
+            3. ``Sqrt`` is ``1 / (2 * sqrt(x))``, and ``CubeRoot`` is ``1 / (3 * cbrt(x)^2)``.
+
+        This method is private and called internally as a helper of ``ExpFun.dual``.
+
+        :return: Chain computing derivative from points and values of function.
+        :rtype: Callable[[list, list], list]
+        """
+        if cls == Exp:
+            return lambda x, f: f
+        elif cls == Log:
+            return lambda x, f: list(map(truediv, repeat(1.0), x))
+        elif cls in [Log2, Log10]:
+            return lambda x, f: list(map(truediv, repeat(1 / math.log(2 if cls == Log2 else 10)), x))
+        elif cls == Sqrt:
+            return lambda x, f: list(map(truediv, repeat(0.5), f))
+        else:
+            return lambda x, f: list(map(truediv, repeat(1 / 3), map(mul, f, f)))
+
+    @classmethod
+    def dual(cls, *args: Dual.Dual) -> Tuple[Dual.Dual, List[Warning.InterpWarn]]:
+        """
+        Evaluate exponential and logarithm function over dual numbers.
+
+        Parameters are batches of dual numbers, and batch of size 1 is broadcast.
+        Values are computed by ``ExpFun.eval``, and tangents by the chain rule as follows.
+            1. Functions of single parameter follow the rules of ``ExpFun.__deriv``.
+            2. Partial derivatives of ``Log[x, b]`` are ``1 / (x * log(b))`` and ``-Log[x, b] / (b * log(b))``.
+            3. ``Power`` follows the rules of ``Dual.DualArith.pow``.
+            4. ``Surd[x, n]`` is ``Surd[x, n] / (n * x)``.
+               Order is integer, so its tangent is ignored.
+        Derivative at the point out of domain or pole is nan, and so is the one where the value is nan.
+
+        :param args: Points where function is to be computed.
+        :type args: Dual.Dual
+
+        :return: Computed value with tangents and list of generated warnings.
+        :rtype: Tuple[Dual.Dual, List[Warning.InterpWarn]]
+        """
+        if len(args) == 1:
+            res, warn = cls.eval(args[0].v)
+
+            return Dual.DualArith.mask(Dual.DualArith.lift(args[0], res, cls.__deriv())), warn
+
+        (a, b), _ = Dual.DualArith.bcast(*args)
+        res, warn = cls.eval(a, b)
+
+        if cls == Log:
+            dx: list = Dual.DualArith.deriv(lambda s, t: list(map(truediv, repeat(1.0), map(mul, s, map(math.log, t)))),
+                                            a, b)
+            db: list = Dual.DualArith.deriv(lambda t, f: list(map(truediv, map(neg, f), map(mul, t, map(math.log, t)))),
+                                            b, res)
+
+            return Dual.DualArith.mask(Dual.DualArith.chain(res, (dx, args[0]), (db, args[1]))), warn
+        elif cls == Power:
+            return Dual.DualArith.pow(*args, res), warn
+        else:
+            dx: list = Dual.DualArith.deriv(lambda s, t, f: list(map(truediv, f, map(mul, t, s))), a, b, res)
+
+            return Dual.DualArith.chain(res, (dx, args[0])), warn
+
+    @classmethod
+    def diff(cls, rt: Token.Fun, b: Symbolic.Builder) -> List[Optional[Token.Tok]]:
+        """
+        Build partial derivatives of exponential and logarithm function wrt. its parameters.
+
+        Partial derivatives follow the rules of ``ExpFun.dual``, where f is the token itself so that it is shared.
+            1. ``Exp`` is f, and ``Log``, ``Log2`` and ``Log10`` are ``1 / x``, ``(1 / log(2)) / x`` and
+               ``(1 / log(10)) / x``, resp.
+            2. ``Sqrt`` is ``0.5 / f``, and ``CubeRoot`` is ``(1 / 3) / (f * f)``.
+            3. Partial derivatives of ``Log[x, b]`` are ``1 / (x * Log[b])`` and ``-f / (b * Log[b])``.
+            4. ``Power`` follows the rules of ``Binary.Pow``.
+            5. ``Surd[x, n]`` is ``f / (n * x)``, and its partial derivative wrt. order is None.
+
+        :param rt: Token whose partial derivatives are to be built.
+        :type rt: Token.Fun
+        :param b: Builder of tokens.
+        :type b: Symbolic.Builder
+
+        :return: Partial derivatives. None if identically 0.
+        :rtype: List[Optional[Token.Tok]]
+        """
+        x: Token.Tok = rt.chd[0]
+
+        if cls == Exp:
+            return [rt]
+        elif cls == Log and rt.argc == 1:
+            return [b.div(b.num(1), x)]
+        elif cls in [Log2, Log10]:
+            return [b.div(b.num(1 / math.log(2 if cls == Log2 else 10)), x)]
+        elif cls == Sqrt:
+            return [b.div(b.num(0.5), rt)]
+        elif cls == CubeRoot:
+            return [b.div(b.num(1 / 3), b.mul(rt, rt))]
+
+        y: Token.Tok = rt.chd[1]
+
+        if cls == Log:
+            lb: Token.Tok = b.fun(Log, y)
+
+            return [b.div(b.num(1), b.mul(x, lb)), b.neg(b.div(rt, b.mul(y, lb)))]
+        elif cls == Power:
+            dx: Token.Tok = b.mul(y, b.pow(x, b.sub(y, b.num(1))))
+
+            return [dx, None if b.is_num(y) else b.mul(rt, b.fun(Log, x))]
+        else:
+            return [b.div(rt, b.mul(y, x)), None]
+
     # @classmethod
     # def chk_t(cls, rt: Token.Fun) -> Optional[List[Type.Sign]]:
     #     """
@@ -592,47 +1147,89 @@ class ExpFun(Function.Fun):
 
 @final
 class Log(ExpFun):
+    __SGN: Final[List[str]] = ['Log[Real] -> Real', 'Log[Cmplx] -> Cmplx', 'Log[Sym] -> Sym',
+                               'Log[Interval] -> Interval', 'Log[List of Real] -> List of Real',
+                               'Log[List of Cmplx] -> List of Cmplx', 'Log[Real, Real] -> Real',
+                               'Log[Cmplx, Cmplx] -> Cmplx', 'Log[Sym, Sym] -> Sym',
+                               'Log[Interval, Interval] -> Interval', 'Log[Real, List of Real] -> List of Real',
+                               'Log[List of Real, Real] -> List of Real',
+                               'Log[List of Real, List of Real] -> List of Real',
+                               'Log[Cmplx, List of Cmplx] -> List of Cmplx',
+                               'Log[List of Cmplx, Cmplx] -> List of Cmplx',
+                               'Log[List of Cmplx, List of Cmplx] -> List of Cmplx']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class Log2(ExpFun):
+    __SGN: Final[List[str]] = ['Log2[Real] -> Real', 'Log2[Cmplx] -> Cmplx', 'Log2[Sym] -> Sym',
+                               'Log2[Interval] -> Interval', 'Log2[List of Real] -> List of Real',
+                               'Log2[List of Cmplx] -> List of Cmplx']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class Log10(ExpFun):
+    __SGN: Final[List[str]] = ['Log10[Real] -> Real', 'Log10[Cmplx] -> Cmplx', 'Log10[Sym] -> Sym',
+                               'Log10[Interval] -> Interval', 'Log10[List of Real] -> List of Real',
+                               'Log10[List of Cmplx] -> List of Cmplx']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class Power(ExpFun):
+    __SGN: Final[List[str]] = ['Power[Real, Real] -> Real', 'Power[Cmplx, Cmplx] -> Cmplx', 'Power[Sym, Sym] -> Sym',
+                               'Power[Interval, Interval] -> Interval', 'Power[Real, List of Real] -> List of Real',
+                               'Power[List of Real, Real] -> List of Real',
+                               'Power[List of Real, List of Real] -> List of Real',
+                               'Power[Cmplx, List of Cmplx] -> List of Cmplx',
+                               'Power[List of Cmplx, Cmplx] -> List of Cmplx',
+                               'Power[List of Cmplx, List of Cmplx] -> List of Cmplx']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class Exp(ExpFun):
+    __SGN: Final[List[str]] = ['Exp[Real] -> Real', 'Exp[Cmplx] -> Cmplx', 'Exp[Sym] -> Sym',
+                               'Exp[Interval] -> Interval', 'Exp[List of Real] -> List of Real',
+                               'Exp[List of Cmplx] -> List of Cmplx']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class Sqrt(ExpFun):
+    __SGN: Final[List[str]] = ['Sqrt[Real] -> Real', 'Sqrt[Cmplx] -> Cmplx', 'Sqrt[Sym] -> Sym',
+                               'Sqrt[Interval] -> Interval', 'Sqrt[List of Real] -> List of Real',
+                               'Sqrt[List of Cmplx] -> List of Cmplx']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class CubeRoot(ExpFun):
+    __SGN: Final[List[str]] = ['CubeRoot[Real] -> Real', 'CubeRoot[Sym] -> Sym', 'CubeRoot[Interval] -> Interval',
+                               'CubeRoot[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class Surd(ExpFun):
+    __SGN: Final[List[str]] = ['Surd[Real, Real] -> Real', 'Surd[Sym, Sym] -> Sym', 'Surd[Interval, Real] -> Interval',
+                               'Surd[Real, List of Real] -> List of Real', 'Surd[List of Real, Real] -> List of Real',
+                               'Surd[List of Real, List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
@@ -1,8 +1,28 @@
+from __future__ import annotations
+
+import cmath
+import math
+from itertools import chain
 from sys import maxsize
-from typing import Final, Tuple, List
+from typing import Final, Tuple, List, Dict, Optional, Any
+
+from Core import Type, TypeSystem
+from Util.Macro import is_bigint, is_smallint
+from Warning import Warning
 
 
 class Fun:
+    """
+    Function toolbox.
+
+    Functions evaluate whole arrays at once.
+    Tensor arguments are flattened into a single list, computed by one ``map`` call of the kernel, and reshaped back.
+    When the arguments are known to be free of nan and inf, the kernel is the raw ``math`` function so that the whole
+    loop runs in C.
+    Otherwise, the kernel implements the documented computation rules elementwise.
+    Warnings are aggregated per call, not per element.
+    That is, each kind of warning is reported at most once for each parameter.
+    """
     __PRECD: Final[Tuple[int, int]] = (0, maxsize)
     __SGN: List[str] = None
 
@@ -19,4 +39,219 @@ class Fun:
 
     @classmethod
     def sgn(cls) -> List[str]:
-        return cls.__SGN
+        # Signatures are declared as name mangled class attribute of each concrete function.
+        return getattr(cls, f'_{cls.__name__}__SGN', cls.__SGN)
+
+    @classmethod
+    def chk_t(cls, rt: Token.Tok, t_env: Dict[int, TypeSystem.T]) -> Optional[Dict[int, TypeSystem.T]]:
+        """
+        Type checker for functions.
+
+        Functions without their own type checker are typed as symbol.
+
+        :param rt: Token to be type checked.
+        :type rt: Token.Tok
+        :param t_env: Type environment.
+        :type t_env: Dict[int, TypeSystem.T]
+
+        :return: Type environment if type check succeeds. None otherwise.
+        :rtype: Optional[Dict[int, TypeSystem.T]]
+        """
+        rt.t = TypeSystem.Sym.inst()
+
+        return t_env
+
+    @classmethod
+    def bcast_t(cls, t_l: List[TypeSystem.T], dom: List[type]) -> Optional[TypeSystem.T]:
+        """
+        Infer result type of elementwise function whose parameters are broadcast.
+
+        Parameters are broadcast as binary operators do.
+        That is, the result type is the supertype of item types and it is tensor if some parameter is tensor.
+        Tensor parameters must be of the same shape.
+        Interval is a batch of intervals by itself, so it is not broadcast against tensor.
+
+        :param t_l: Types of parameters.
+        :type t_l: List[TypeSystem.T]
+        :param dom: Allowed types of items.
+        :type dom: List[type]
+
+        :return: Result type if parameters can be broadcast. None otherwise.
+        :rtype: Optional[TypeSystem.T]
+        """
+        tens: List[TypeSystem.T] = [t for t in t_l if not t.base]  # Tensor parameters.
+
+        if any(type(t) != TypeSystem.Tens or t.shape is not tens[0].shape for t in tens):
+            return None
+
+        res_t: Optional[TypeSystem.T] = t_l[0] if t_l[0].base else t_l[0].chd_t
+
+        for t in t_l[1:]:
+            if res_t is None:
+                return None
+
+            res_t = TypeSystem.T.supt(res_t, t if t.base else t.chd_t)
+
+        if type(res_t) not in dom or (tens and type(res_t) == TypeSystem.Interval):
+            return None
+
+        return TypeSystem.ArrFact.inst().coerce_arr_t(tens[0], res_t) if tens else res_t
+
+    @classmethod
+    def flat(cls, x: Any) -> Tuple[list, Tuple[int, ...]]:
+        """
+        Flatten tensor.
+
+        Scalar is regarded as tensor of shape ().
+
+        :param x: Tensor to be flattened.
+        :type x: Any
+
+        :return: Flattened tensor and its shape.
+        :rtype: Tuple[list, Tuple[int, ...]]
+        """
+        if type(x) != list:
+            return [x], ()
+
+        shape: List[int] = []
+        it: Any = x
+
+        while type(it) == list:
+            shape.append(len(it))
+            it = it[0] if it else None
+
+        for _ in range(len(shape) - 1):
+            x = list(chain.from_iterable(x))
+
+        return x, tuple(shape)
+
+    @classmethod
+    def unflat(cls, x: list, shape: Tuple[int, ...]) -> Any:
+        """
+        Reshape flattened tensor back.
+
+        :param x: Flattened tensor.
+        :type x: list
+        :param shape: Shape of tensor.
+        :type shape: Tuple[int, ...]
+
+        :return: Reshaped tensor.
+        :rtype: Any
+        """
+        if not shape:
+            return x[0]
+
+        # Dimension 0 has no item to split, so the # of empty lists is that of the outer dimensions.
+        for k in range(len(shape) - 1, 0, -1):
+            n: int = shape[k]
+            x = [x[i:i + n] for i in range(0, len(x), n)] if n else [[] for _ in range(math.prod(shape[:k]))]
+
+        return x
+
+    @classmethod
+    def bcast(cls, *args: Any) -> Tuple[List[list], Tuple[int, ...]]:
+        """
+        Flatten tensors after broadcasting them to common shape.
+
+        Only scalar and tensors of the same shape can be broadcast to each other.
+        Scalar is repeated to fill the common shape.
+
+        :param args: Tensors to be broadcast.
+        :type args: Any
+
+        :return: Flattened tensors of common shape and the common shape.
+        :rtype: Tuple[List[list], Tuple[int, ...]]
+
+        :raise ValueError: If tensors are of different shapes.
+        """
+        flat_l: List[Tuple[list, Tuple[int, ...]]] = [cls.flat(arg) for arg in args]
+        shape: Tuple[int, ...] = max((it[1] for it in flat_l), key=len)
+        sz: int = math.prod(shape)
+        res: List[list] = []
+
+        for x, x_shape in flat_l:
+            if x_shape == shape:
+                res.append(x)
+            elif not x_shape:
+                res.append(x * sz)
+            else:
+                raise ValueError
+
+        return res, shape
+
+    @classmethod
+    def chk_arg(cls, x: list, arg_pos: int = 1) -> Tuple[list, List[Warning.InterpWarn], bool]:
+        """
+        Check flattened parameter for common warnings.
+
+        It generates warnings for followings cases, each at most once.
+            1. Some item exceeds floating point max/min size. (BIG_INT/SMALL_INT, resp.)
+               Such items are replaced with inf and -inf, resp.
+            2. Some item is nan. (NAN_DETECT)
+            3. Some item is +-inf. (INF_DETECT)
+        Each check is one pass of C level loop.
+        Items can be complex, in which case an item is nan or inf if its real or imaginary part is.
+        Further, finite sum certifies that there is neither nan nor inf, so the common case of finite floats costs only
+        a single scan.
+        This shortcut is not taken if there is integer item, since big integers may cancel out in the sum.
+
+        :param x: Flattened parameter to be checked.
+        :type x: list
+        :param arg_pos: Position of parameter. (Default: 1)
+        :type arg_pos: int
+
+        :return: Checked parameter, list of generated warnings, and flag for all items being finite.
+        :rtype: Tuple[list, List[Warning.InterpWarn], bool]
+        """
+        has_int: bool = int in set(map(type, x))
+
+        if not has_int:
+            try:
+                if cmath.isfinite(sum(x)):
+                    return x, [], True
+            except OverflowError:
+                pass
+
+        warn: List[Warning.InterpWarn] = []
+        src: list = x  # Parameter before casting big integers.
+
+        if has_int:
+            if any(map(is_bigint, x)):
+                warn.append(Warning.InterpWarn(Type.InterpWarnT.BIG_INT, 15, arg_pos=arg_pos, handle=cls.__name__))
+
+            if any(map(is_smallint, x)):
+                warn.append(Warning.InterpWarn(Type.InterpWarnT.SMALL_INT, 16, arg_pos=arg_pos, handle=cls.__name__))
+
+            if warn:
+                x = [math.inf if is_bigint(it) else -math.inf if is_smallint(it) else it for it in x]
+                src = [it for it in src if type(it) != int]
+
+        nan: bool = any(map(cmath.isnan, x))
+        inf: bool = any(map(cmath.isinf, src))
+
+        if nan:
+            warn.append(Warning.InterpWarn(Type.InterpWarnT.NAN_DETECT, 1, arg_pos=arg_pos, handle=cls.__name__))
+
+        if inf:
+            warn.append(Warning.InterpWarn(Type.InterpWarnT.INF_DETECT, 2, arg_pos=arg_pos, handle=cls.__name__))
+
+        return x, warn, not (nan or inf or warn)
+
+    @classmethod
+    def is_cmplx(cls, x: list) -> bool:
+        """
+        Check whether flattened parameter has complex item.
+
+        Sum of items is complex if and only if some item is complex, so the check is a single C level loop.
+        If the sum overflows due to big integers, it falls back to the scan of item types.
+
+        :param x: Flattened parameter to be checked.
+        :type x: list
+
+        :return: True if some item is complex. False otherwise.
+        :rtype: bool
+        """
+        try:
+            return type(sum(x)) == complex
+        except OverflowError:
+            return complex in set(map(type, x))
@@ -1,26 +1,686 @@
-from typing import final
+from __future__ import annotations
 
-from Function import Function
+import cmath
+import math
+from itertools import repeat
+from operator import add, mul, sub, truediv
+from typing import List, final, Final, Optional, Dict, Tuple, Union, Callable
+
+from Function import Function, Precision
+from Core import Dual, Symbolic, Token, TypeSystem, Type
+from Util.Macro import is_int
+from Warning import Warning
 
 
 class GammaFun(Function.Fun):
+    """
+    Gamma function toolbox.
+
+    For real parameters, gamma and log gamma functions are computed by ``math.gamma`` and ``math.lgamma``, which are
+    Lanczos approximations implemented in C.
+    For complex parameters, log gamma function is computed by Stirling series after shifting the parameter by the
+    recurrence ``gamma(z + 1) = z * gamma(z)``, and by reflection formula for parameters in the left half plane.
+    Gamma function of complex parameter is its exponential.
+    Beta function is computed directly from gamma functions only if none of them overflows.
+    Otherwise, it is computed from log gamma functions.
+    Digamma function, the logarithmic derivative of gamma function, is computed by its asymptotic series after the same
+    shift, and by its own reflection formula for parameters in the left half plane.
+
+    **Reference**
+        * https://en.wikipedia.org/wiki/Stirling%27s_approximation
+        * https://en.wikipedia.org/wiki/Reflection_formula
+        * https://en.wikipedia.org/wiki/Digamma_function#Asymptotic_expansion
+
+    :cvar __STIRLING: Coefficients of Stirling series, that is, ``B_2k / (2k * (2k - 1))`` for k = 1, ..., 8 where
+                      ``B_2k`` is Bernoulli number.
+    :cvar __PSI: Coefficients of asymptotic series of digamma function, that is, ``B_2k / 2k`` for k = 1, ..., 8.
+    :cvar __TRIGAMMA: Coefficients of asymptotic series of trigamma function, that is, ``B_2k`` for k = 1, ..., 7.
+    :cvar __SHIFT: Minimum modulus of parameter where Stirling series is used without shift.
+    """
+    __STIRLING: Final[List[float]] = [1 / 12, -1 / 360, 1 / 1260, -1 / 1680, 1 / 1188, -691 / 360360, 1 / 156,
+                                      -3617 / 122400]
+    __PSI: Final[List[float]] = [1 / 12, -1 / 120, 1 / 252, -1 / 240, 1 / 132, -691 / 32760, 1 / 12, -3617 / 8160]
+    __TRIGAMMA: Final[List[float]] = [1 / 6, -1 / 30, 1 / 42, -1 / 30, 5 / 66, -691 / 2730, 7 / 6]
+    __SHIFT: Final[int] = 10
+
+    def __new__(cls) -> None:
+        raise NotImplementedError
+
+    @classmethod
+    def __sgn(cls, x: float) -> int:
+        """
+        Sign of gamma function.
+
+        Gamma function of finite real x is positive iff x is positive or in (2n, 2n+1) for some negative integer n.
+
+        This method is private and called internally as a helper of ``GammaFun.__gamma`` and ``GammaFun.__beta``.
+
+        :param x: Point where sign of gamma function is to be computed.
+        :type x: float
+
+        :return: Sign of gamma function.
+        :rtype: int
+        """
+        return 1 if x > 0 or math.ceil(x) % 2 == 1 else -1
+
+    @classmethod
+    def __clgamma(cls, z: complex) -> complex:
+        """
+        Log gamma function of complex parameter.
+
+        It computes the principal branch, which is analytic except on the negative real axis and agrees with
+        ``math.lgamma`` in real part.
+        If the real part of z is less than 1/2, it uses the reflection formula
+        ``lgamma(z) = log(pi) - log(sin(pi * z)) - lgamma(1 - z)``.
+        Otherwise, z is shifted so that its modulus is at least ``__SHIFT`` and the Stirling series is evaluated by
+        Horner's method.
+        Since the result at the conjugate is the conjugate, only the upper half plane is computed.
+
+        This method is private and called internally as a helper of the computation kernels.
+        Parameter must be finite and must not be a pole.
+
+        :param z: Point where log gamma function is to be computed.
+        :type z: complex
+
+        :return: Computed value of log gamma function.
+        :rtype: complex
+        """
+        if z.imag < 0:
+            return cls.__clgamma(z.conjugate()).conjugate()
+
+        if z.real < 0.5:
+            # Log sine on the branch consistent with the principal branch of log gamma.
+            # Since the imaginary part of z is nonnegative, ``exp(2i * pi * z)`` is in the unit disk.
+            lsin: complex = -1j * math.pi * z + cmath.log(1 - cmath.exp(2j * math.pi * z)) + cmath.log(0.5j)
+
+            return math.log(math.pi) - lsin - cls.__clgamma(1 - z)
+
+        n: int = 0 if abs(z) >= cls.__SHIFT else math.ceil(cls.__SHIFT - z.real)  # Amount of shift.
+        w: complex = z + n
+        t: complex = 1 / (w * w)
+        s: complex = 0
+
+        for c in reversed(cls.__STIRLING):
+            s = s * t + c
+
+        return (w - 0.5) * cmath.log(w) - w + 0.5 * math.log(2 * math.pi) + s / w - \
+            sum(map(cmath.log, map(add, repeat(z), range(n))))
+
+    @classmethod
+    def __cexp(cls, z: complex) -> complex:
+        """
+        Exponential of complex parameter.
+
+        If it overflows, the result is complex inf whose phase is the imaginary part of z.
+
+        This method is private and called internally as a helper of the computation kernels.
+
+        :param z: Point where exponential is to be computed.
+        :type z: complex
+
+        :return: Computed value of exponential.
+        :rtype: complex
+        """
+        try:
+            return cmath.exp(z)
+        except OverflowError:
+            return cmath.rect(math.inf, z.imag)
+
+    @classmethod
+    def __gamma(cls, x: Union[float, complex]) -> Union[float, complex]:
+        """
+        Gamma function.
+
+        Gamma function with parameter x has following computation rules.
+            1. If x is nan or -inf, the result is nan.
+            2. If x is +inf, the result is +inf.
+            3. If x is finite nonpositive integer, the result is nan.
+            4. If x is finite, the result is ``math.gamma(x)``.
+               If it overflows, the result is +-inf with the sign of gamma function.
+            5. If x is complex with nan or inf part, or x is complex pole, the result is nan.
+            6. If x is complex with zero imaginary part, the result is the result for its real part as complex.
+            7. If x is finite complex, the result is exponential of log gamma function.
+
+        This method is private and called internally as a helper of ``GammaFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``GammaFun.eval``.
+
+        :param x: Point where gamma function is to be computed.
+        :type x: Union[float, complex]
+
+        :return: Computed value of gamma function.
+        :rtype: Union[float, complex]
+        """
+        if type(x) == complex:
+            if not cmath.isfinite(x) or (x.imag == 0 and x.real <= 0 and is_int(x.real)):
+                return math.nan
+            elif x.imag == 0:
+                return complex(cls.__gamma(x.real))
+            else:
+                return cls.__cexp(cls.__clgamma(x))
+        elif x == -math.inf or (is_int(x) and x <= 0):
+            return math.nan
+        else:
+            try:
+                return math.gamma(x)
+            except OverflowError:
+                return cls.__sgn(x) * math.inf
+
+    @classmethod
+    def __lgamma(cls, x: Union[float, complex]) -> Union[float, complex]:
+        """
+        Log gamma function.
+
+        Log gamma function with parameter x has following computation rules.
+            1. If x is nan or -inf, the result is nan.
+            2. If x is +inf, the result is +inf.
+            3. If x is finite nonpositive integer, the result is nan.
+            4. If x is finite, the result is ``math.lgamma(x)``, that is, log of the absolute value of gamma function.
+               If it overflows, the result is +inf.
+            5. If x is complex with nan or inf part, or x is complex pole, the result is nan.
+            6. If x is complex with zero imaginary part and positive real part, the result is the result for its real
+               part as complex.
+            7. If x is finite complex, the result is the principal branch of log gamma function.
+
+        This method is private and called internally as a helper of ``GammaFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``GammaFun.eval``.
+
+        :param x: Point where log gamma function is to be computed.
+        :type x: Union[float, complex]
+
+        :return: Computed value of log gamma function.
+        :rtype: Union[float, complex]
+        """
+        if type(x) == complex:
+            if not cmath.isfinite(x) or (x.imag == 0 and x.real <= 0 and is_int(x.real)):
+                return math.nan
+            elif x.imag == 0 and x.real > 0:
+                return complex(cls.__lgamma(x.real))
+            else:
+                return cls.__clgamma(x)
+        elif x == -math.inf or (is_int(x) and x <= 0):
+            return math.nan
+        else:
+            try:
+                return math.lgamma(x)
+            except OverflowError:
+                return math.inf
+
+    @classmethod
+    def __beta(cls, x: Union[float, complex], y: Union[float, complex]) -> Union[float, complex]:
+        """
+        Beta function.
+
+        Beta function with parameter x and y has following computation rules.
+            1. If x or y is nan, -inf, or finite nonpositive integer, the result is nan.
+            2. If x and y are both inf, the result is 0.
+            3. If x is inf and y is either finite positive or in (2n, 2n+1) for some finite negative integer n, the
+               result is inf.
+            4. If x is inf and y is in (2n-1, 2n) for some finite nonpositive integer n, the result is -inf.
+            5. If y is inf and x is either finite positive or in (2n, 2n+1) for some finite negative integer n, the
+               result is inf.
+            6. If y is inf and x is in (2n-1, 2n) for some finite nonpositive integer n, the result is -inf.
+            7. If x + y is finite nonpositive integer, the result is 0.
+            8. If x, y and x + y are less than 170 in absolute value, the result is
+               ``math.gamma(x) / math.gamma(x + y) * math.gamma(y)`` provided that it is normal.
+            9. Otherwise, the result is ``math.exp(math.lgamma(x) + math.lgamma(y) - math.lgamma(x + y))``
+               multiplied by proper sign.
+            10. If x or y is complex with nan or inf part, or x or y is complex pole, the result is nan.
+            11. If x + y is complex pole, the result is 0.
+            12. If x and y are complex with zero imaginary part, the result is the result for their real parts as
+                complex.
+            13. If x and y are finite complex, the result is exponential of log gamma functions combined as in rule 9.
+        Here, rule 8 and 9 are based on the identity ``B(x, y) = gamma(x) * gamma(y) / gamma(x + y)``.
+        Since gamma functions overflow for parameters greater than about 171, we take logarithm and take exponential
+        again for large parameters.
+        Before taking logarithm, we must take absolute value first and the lost sign information is recovered from the
+        sign of gamma functions.
+        Since the error of log gamma function is amplified by exponential, rule 8 is preferred if possible.
+
+        This method is private and called internally as a helper of ``GammaFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``GammaFun.eval``.
+
+        :param x: First coordinate of point where beta function is to be computed.
+        :type x: Union[float, complex]
+        :param y: Second coordinate of point where beta function is to be computed.
+        :type y: Union[float, complex]
+
+        :return: Computed value of beta function.
+        :rtype: Union[float, complex]
+        """
+        if type(x) == complex or type(y) == complex:
+            x, y = complex(x), complex(y)
+
+            if not (cmath.isfinite(x) and cmath.isfinite(y)) or \
+                    (x.imag == 0 and x.real <= 0 and is_int(x.real)) or \
+                    (y.imag == 0 and y.real <= 0 and is_int(y.real)):
+                return math.nan
+            elif (x + y).imag == 0 and (x + y).real <= 0 and is_int((x + y).real):
+                return 0j
+            elif x.imag == 0 and y.imag == 0:
+                return complex(cls.__beta(x.real, y.real))
+            else:
+                return cls.__cexp(cls.__clgamma(x) + cls.__clgamma(y) - cls.__clgamma(x + y))
+        elif math.isnan(x) or math.isnan(y) or ((is_int(x) or math.isinf(x)) and x <= 0) or \
+                ((is_int(y) or math.isinf(y)) and y <= 0):
+            return math.nan
+        elif math.isinf(x):
+            return 0 if math.isinf(y) else cls.__sgn(y) * math.inf
+        elif math.isinf(y):
+            return cls.__sgn(x) * math.inf
+        elif is_int(x + y) and x + y <= 0:
+            return 0
+        elif max(abs(x), abs(y), abs(x + y)) < 170:
+            res: float = math.gamma(x) / math.gamma(x + y) * math.gamma(y)
+
+            if 1e-290 < abs(res) < math.inf:
+                return res
+
+        sgn: int = cls.__sgn(x) * cls.__sgn(y) * cls.__sgn(x + y)
+
+        try:
+            return sgn * math.exp(math.lgamma(x) + math.lgamma(y) - math.lgamma(x + y))
+        except OverflowError:
+            return sgn * math.inf
+
+    @classmethod
+    def __digamma(cls, x: Union[float, complex]) -> Union[float, complex]:
+        """
+        Digamma function.
+
+        Digamma function with parameter x has following computation rules.
+            1. If x is nan or -inf, the result is nan.
+            2. If x is +inf, the result is +inf.
+            3. If x is finite nonpositive integer, the result is nan.
+            4. If x is finite and less than 1/2, the result is given by the reflection formula
+               ``digamma(x) = digamma(1 - x) - pi / tan(pi * x)``.
+            5. If x is finite, x is shifted so that it is at least ``__SHIFT`` and the result is
+               ``log(w) - 1 / 2w - sum(c_k / w^2k)`` minus the terms ``1 / (x + k)`` of the shift, where w is the
+               shifted parameter and ``c_k`` are the coefficients in ``__PSI``.
+            6. If x is complex with nan or inf part, or x is complex pole, the result is nan.
+            7. If x is complex with zero imaginary part, the result is the result for its real part as complex.
+            8. If x is finite complex, rule 4 and 5 are applied with the real part in place of x for comparison.
+        The asymptotic series is evaluated by Horner's method in ``1 / w^2``.
+
+        This method is private and called internally as a helper of ``GammaFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``GammaFun.eval``.
+
+        :param x: Point where digamma function is to be computed.
+        :type x: Union[float, complex]
+
+        :return: Computed value of digamma function.
+        :rtype: Union[float, complex]
+        """
+        if type(x) == complex:
+            if not cmath.isfinite(x) or (x.imag == 0 and x.real <= 0 and is_int(x.real)):
+                return math.nan
+            elif x.imag == 0:
+                return complex(cls.__digamma(x.real))
+            elif x.real < 0.5:
+                return cls.__digamma(1 - x) - math.pi / cmath.tan(math.pi * x)
+        elif math.isnan(x) or x == -math.inf or (is_int(x) and x <= 0):
+            return math.nan
+        elif x == math.inf:
+            return math.inf
+        elif x < 0.5:
+            return cls.__digamma(1 - x) - math.pi / math.tan(math.pi * x)
+
+        n: int = 0 if abs(x) >= cls.__SHIFT else math.ceil(cls.__SHIFT - x.real)  # Amount of shift.
+        w: Union[float, complex] = x + n
+        t: Union[float, complex] = 1 / (w * w)
+        s: Union[float, complex] = 0
+
+        for c in reversed(cls.__PSI):
+            s = s * t + c
+
+        return (cmath.log(w) if type(w) == complex else math.log(w)) - 0.5 / w - s * t - \
+            sum(map(truediv, repeat(1), map(add, repeat(x), range(n))))
+
+    @classmethod
+    def __trigamma(cls, x: float) -> float:
+        """
+        Trigamma function, the derivative of digamma function.
+
+        Trigamma function with parameter x has following computation rules.
+            1. If x is nan or -inf, the result is nan.
+            2. If x is +inf, the result is 0.
+            3. If x is finite nonpositive integer, the result is nan.
+            4. If x is finite and less than 1/2, the result is given by the reflection formula
+               ``trigamma(x) = (pi / sin(pi * x))^2 - trigamma(1 - x)``.
+            5. If x is finite, x is shifted so that it is at least ``__SHIFT`` and the result is
+               ``1 / w + 1 / 2w^2 + sum(B_2k / w^(2k + 1))`` plus the terms ``1 / (x + k)^2`` of the shift, where w is
+               the shifted parameter.
+
+        This method is private and called internally as a helper of ``GammaFun.dual``.
+
+        :param x: Point where trigamma function is to be computed.
+        :type x: float
+
+        :return: Computed value of trigamma function.
+        :rtype: float
+        """
+        if math.isnan(x) or x == -math.inf or (is_int(x) and x <= 0):
+            return math.nan
+        elif x == math.inf:
+            return 0.0
+        elif x < 0.5:
+            return (math.pi / math.sin(math.pi * x)) ** 2 - cls.__trigamma(1 - x)
+
+        n: int = 0 if x >= cls.__SHIFT else math.ceil(cls.__SHIFT - x)  # Amount of shift.
+        w: float = x + n
+        t: float = 1 / (w * w)
+        s: float = 0
+
+        for c in reversed(cls.__TRIGAMMA):
+            s = s * t + c
+
+        return 1 / w + 0.5 * t + s * t / w + sum(1 / ((x + k) * (x + k)) for k in range(n))
+
+    @classmethod
+    def __vdigamma(cls, x: List[float]) -> List[float]:
+        """
+        Digamma function over flattened real parameter.
+
+        If all items are at least 1/2, every item is shifted by ``__SHIFT`` and the asymptotic series is evaluated by
+        chain of ``map`` calls, with the terms of the shift subtracted by another chain per shift step.
+        Thus the loop runs entirely in C.
+        Otherwise, it falls back to ``GammaFun.__digamma`` for each item.
+
+        This method is private and called internally as a helper of ``GammaFun.eval``.
+        Parameter must be finite and must not have a pole.
+
+        :param x: Flattened parameter where digamma function is to be computed.
+        :type x: List[float]
+
+        :return: Computed values of digamma function.
+        :rtype: List[float]
+        """
+        if min(x) < 0.5:
+            return list(map(cls.__digamma, x))
+
+        w: List[float] = list(map(add, x, repeat(cls.__SHIFT)))
+        t: List[float] = list(map(truediv, repeat(1.0), map(mul, w, w)))
+        s: List[float] = [cls.__PSI[-1]] * len(x)
+
+        for c in reversed(cls.__PSI[:-1]):
+            s = list(map(add, map(mul, s, t), repeat(c)))
+
+        res: List[float] = list(map(sub, map(sub, map(math.log, w), map(truediv, repeat(0.5), w)), map(mul, s, t)))
+
+        for k in range(cls.__SHIFT):
+            res = list(map(sub, res, map(truediv, repeat(1.0), map(add, x, repeat(k)))))
+
+        return res
+
+    @classmethod
+    def __kern(cls) -> Callable[..., Union[float, complex]]:
+        """
+        Find computation kernel implementing the computation rules.
+
+        This method is private and called internally as a helper of ``GammaFun.eval``.
+
+        :return: Computation kernel of function.
+        :rtype: Callable[..., Union[float, complex]]
+        """
+        if cls == Gamma:
+            return cls.__gamma
+        elif cls == LogGamma:
+            return cls.__lgamma
+        elif cls == Digamma:
+            return cls.__digamma
+        else:
+            return cls.__beta
+
+    @classmethod
+    def __pole(cls, x: list, fast: bool) -> bool:
+        """
+        Check whether flattened parameter has pole, that is, nonpositive integer.
+
+        If the parameter is finite real, positive parameter is certified by a single C level scan.
+        Complex item is a pole if its imaginary part is 0 and its real part is nonpositive integer.
+
+        This method is private and called internally as a helper of ``GammaFun.eval``.
+
+        :param x: Flattened parameter to be checked.
+        :type x: list
+        :param fast: Flag for all items being finite.
+        :type fast: bool
+
+        :return: True if some item is pole. False otherwise.
+        :rtype: bool
+        """
+        if fast and not cls.is_cmplx(x) and min(x) > 0:
+            return False
+
+        return any(it.imag == 0 and it.real <= 0 and is_int(it.real) for it in x)
+
+    @classmethod
+    def chk_t(cls, rt: Token.Tok, t_env: Dict[int, TypeSystem.T]) -> Optional[Dict[int, TypeSystem.T]]:
+        """
+        Type checker for gamma functions.
+
+        Functions apply elementwise, and parameters of ``Beta`` are broadcast as binary operators do.
+        For the rules of broadcasting, refer to the comments of ``Fun.bcast_t``.
+
+        :param rt: Token to be type checked.
+        :type rt: Token.Tok
+        :param t_env: Type environment.
+        :type t_env: Dict[int, TypeSystem.T]
+
+        :return: Type environment if type check succeeds. None otherwise.
+        :rtype: Optional[Dict[int, TypeSystem.T]]
+        """
+        if rt.argc != (2 if cls == Beta else 1):
+            return None
+
+        rt.t = cls.bcast_t([tok.t for tok in rt.chd], [TypeSystem.Real, TypeSystem.Cmplx, TypeSystem.Sym])
+
+        if not rt.t:
+            return None
+
+        return t_env
+
+    @classmethod
+    def eval(cls, *args: Union[float, complex, list]) -> Tuple[Union[float, complex, list], List[Warning.InterpWarn]]:
+        """
+        Evaluate gamma function.
+
+        Parameters can be either scalar or tensor, and they are broadcast to the common shape.
+        The whole tensor is evaluated by chain of ``map`` calls.
+        If parameters are real and have no nan, inf, or pole, the chain is built only from ``math`` functions and
+        arithmetic operators, so the loop runs entirely in C.
+        If the fast chain overflows or hits a pole of intermediate gamma function, the whole tensor is evaluated again
+        by the private helper implementing the computation rules.
+        Complex parameters are always evaluated by the private helper.
+
+        If arbitrary precision mode is on, it is evaluated by ``Precision.PrecFun.eval`` instead.
+
+        It generates warnings for followings cases, each at most once per call.
+            1. Some item exceeds floating point max/min size. (BIG_INT/SMALL_INT, resp.)
+            2. Some item is nan. (NAN_DETECT)
+            3. Some item is +-inf. (INF_DETECT)
+            4. Some item is mathematical pole, that is, finite nonpositive integer. (POLE_DETECT)
+        Each check is a single scan over the whole tensor, not a branch per item.
+
+        :param args: Parameters where function is to be computed.
+        :type args: Union[float, complex, list]
+
+        :return: Computed value and list of generated warnings.
+        :rtype: Tuple[Union[float, complex, list], List[Warning.InterpWarn]]
+        """
+        if Precision.PrecFun.prec():
+            return Precision.PrecFun.eval(cls, *args)
+
+        arg, shape = cls.bcast(*args)
+
+        # Empty batch has no item to check, and domain checks below do not accept it.
+        if not arg[0]:
+            return cls.unflat([], shape), []
+
+        warn: List[Warning.InterpWarn] = []
+        fast: bool = True
+
+        for i in range(len(arg)):
+            arg[i], arg_warn, arg_fast = cls.chk_arg(arg[i], i + 1)
+            warn += arg_warn
+            fast &= arg_fast
+
+        if any(map(cls.is_cmplx, arg)):
+            fast = False
+
+        if any(cls.__pole(x, fast) for x in arg):
+            warn.append(Warning.InterpWarn(Type.InterpWarnT.POLE_DETECT, 23 if cls == Gamma else
+                                           24 if cls == LogGamma else 101 if cls == Digamma else 31))
+            fast = False
+
+        if not fast:
+            return cls.unflat(list(map(cls.__kern(), *arg)), shape), warn
+
+        try:
+            if cls == Gamma:
+                res: list = list(map(math.gamma, arg[0]))
+            elif cls == LogGamma:
+                res: list = list(map(math.lgamma, arg[0]))
+            elif cls == Digamma:
+                res: list = cls.__vdigamma(arg[0])
+            else:
+                x, y = arg
+                s: list = list(map(add, x, y))
+
+                if max(map(abs, x)) < 170 and max(map(abs, y)) < 170 and max(map(abs, s)) < 170:
+                    res: list = list(map(mul, map(truediv, map(math.gamma, x), map(math.gamma, s)),
+                                         map(math.gamma, y)))
+
+                    # Underflow of the quotient loses precision, and its recomputation goes through log gamma.
+                    if min(map(abs, res)) < 1e-290 or max(map(abs, res)) == math.inf:
+                        res = list(map(cls.__beta, x, y))
+                elif min(x) > 0 and min(y) > 0:
+                    res: list = list(map(math.exp, map(sub, map(add, map(math.lgamma, x), map(math.lgamma, y)),
+                                                       map(math.lgamma, s))))
+                else:
+                    # Sign of large negative parameters is recovered by the rules.
+                    res: list = list(map(cls.__beta, x, y))
+        except (OverflowError, ValueError):
+            # Overflow of gamma function, or pole of gamma function of x + y.
+            # Recomputation by the rules gives +-inf or 0.
+            return cls.unflat(list(map(cls.__kern(), *arg)), shape), warn
+
+        return cls.unflat(res, shape), warn
+
+    @classmethod
+    def dual(cls, *args: Dual.Dual) -> Tuple[Dual.Dual, List[Warning.InterpWarn]]:
+        """
+        Evaluate gamma function over dual numbers.
+
+        Parameters are batches of dual numbers, and batch of size 1 is broadcast.
+        Values are computed by ``GammaFun.eval``, and tangents by the chain rule as follows.
+            1. ``Gamma`` is ``gamma(x) * digamma(x)``, and ``LogGamma`` is ``digamma(x)``.
+            2. ``Digamma`` is ``trigamma(x)``, which follows the rules of ``GammaFun.__trigamma``.
+            3. Partial derivatives of ``Beta[x, y]`` are ``B(x, y) * (digamma(x) - digamma(x + y))`` and
+               ``B(x, y) * (digamma(y) - digamma(x + y))``.
+        Derivative at pole is nan.
+
+        :param args: Points where function is to be computed.
+        :type args: Dual.Dual
+
+        :return: Computed value with tangents and list of generated warnings.
+        :rtype: Tuple[Dual.Dual, List[Warning.InterpWarn]]
+        """
+        if cls == Gamma:
+            res, warn = cls.eval(args[0].v)
+
+            return Dual.DualArith.lift(args[0], res, lambda x, f: list(map(mul, f, Digamma.eval(x)[0]))), warn
+        elif cls == LogGamma:
+            res, warn = cls.eval(args[0].v)
+
+            return Dual.DualArith.lift(args[0], res, lambda x, f: Digamma.eval(x)[0]), warn
+        elif cls == Digamma:
+            res, warn = cls.eval(args[0].v)
+
+            return Dual.DualArith.lift(args[0], res, lambda x, f: list(map(cls.__trigamma, x))), warn
+
+        (a, b), _ = Dual.DualArith.bcast(*args)
+        res, warn = cls.eval(a, b)
+        s: list = Digamma.eval(list(map(add, a, b)))[0]
+        da: list = list(map(mul, res, map(sub, Digamma.eval(a)[0], s)))
+        db: list = list(map(mul, res, map(sub, Digamma.eval(b)[0], s)))
+
+        return Dual.DualArith.chain(res, (da, args[0]), (db, args[1])), warn
+
+
+class DiffGammaFun(GammaFun):
+    """
+    Gamma function toolbox with derivative rules.
+
+    Derivatives of gamma, log gamma and beta functions are built from digamma function.
+    ``Digamma`` is not a member, since its derivative, trigamma function, is not a function of the language.
+    Thus, ``Digamma`` has no ``diff`` method, and it is rejected as other functions without derivative rules.
+    """
+    def __new__(cls) -> None:
+        raise NotImplementedError
+
+    @classmethod
+    def diff(cls, rt: Token.Fun, b: Symbolic.Builder) -> List[Optional[Token.Tok]]:
+        """
+        Build partial derivatives of gamma function wrt. its parameters.
+
+        Partial derivatives follow the rules of ``GammaFun.dual``, where f is the token itself so that it is shared.
+
+        :param rt: Token whose partial derivatives are to be built.
+        :type rt: Token.Fun
+        :param b: Builder of tokens.
+        :type b: Symbolic.Builder
+
+        :return: Partial derivatives. None if identically 0.
+        :rtype: List[Optional[Token.Tok]]
+        """
+        x: Token.Tok = rt.chd[0]
+
+        if cls == Gamma:
+            return [b.mul(rt, b.fun(Digamma, x))]
+        elif cls == LogGamma:
+            return [b.fun(Digamma, x)]
+
+        y: Token.Tok = rt.chd[1]
+        s: Token.Tok = b.fun(Digamma, b.add(x, y))
+
+        return [b.mul(rt, b.sub(b.fun(Digamma, x), s)), b.mul(rt, b.sub(b.fun(Digamma, y), s))]
+
+
+@final
+class Gamma(DiffGammaFun):
+    __SGN: Final[List[str]] = ['Gamma[Real] -> Real', 'Gamma[Cmplx] -> Cmplx', 'Gamma[Sym] -> Sym',
+                               'Gamma[List of Real] -> List of Real', 'Gamma[List of Cmplx] -> List of Cmplx']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
-class Gamma(GammaFun):
+class LogGamma(DiffGammaFun):
+    __SGN: Final[List[str]] = ['LogGamma[Real] -> Real', 'LogGamma[Cmplx] -> Cmplx', 'LogGamma[Sym] -> Sym',
+                               'LogGamma[List of Real] -> List of Real', 'LogGamma[List of Cmplx] -> List of Cmplx']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
-class LogGamma(GammaFun):
+class Beta(DiffGammaFun):
+    __SGN: Final[List[str]] = ['Beta[Real, Real] -> Real', 'Beta[Cmplx, Cmplx] -> Cmplx', 'Beta[Sym, Sym] -> Sym',
+                               'Beta[Real, List of Real] -> List of Real', 'Beta[List of Real, Real] -> List of Real',
+                               'Beta[List of Real, List of Real] -> List of Real',
+                               'Beta[Cmplx, List of Cmplx] -> List of Cmplx',
+                               'Beta[List of Cmplx, Cmplx] -> List of Cmplx',
+                               'Beta[List of Cmplx, List of Cmplx] -> List of Cmplx']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
-class Beta(GammaFun):
+class Digamma(GammaFun):
+    __SGN: Final[List[str]] = ['Digamma[Real] -> Real', 'Digamma[Cmplx] -> Cmplx', 'Digamma[Sym] -> Sym',
+                               'Digamma[List of Real] -> List of Real', 'Digamma[List of Cmplx] -> List of Cmplx']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
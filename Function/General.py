@@ -1,38 +1,276 @@
-from typing import final
+from __future__ import annotations
 
+import math
+from itertools import repeat
+from operator import add, eq, ge, gt, le, lt, not_, sub
+from typing import final, Final, Optional, Dict, List, Tuple, Union, Callable
+
+from Core import Token, TypeSystem, Type
 from Function import Function
+from Warning import Warning
 
 
 class GenFun(Function.Fun):
+    """
+    Generalized function toolbox.
+
+    Generalized functions are piecewise, so they are evaluated over sample grids as masks.
+    That is, comparison operators are mapped over the whole grid, and the resulting booleans are used as indices of
+    small lookup tables.
+    Thus, there is no branch per item and the loop runs entirely in C.
+    Step functions take 1/2 at their jumps, and delta functions are +inf at their supports with warning.
+    Symbolic parameters are typed as symbol, so they stay symbolic instead of being sampled.
+
+    :cvar __STEP: Lookup table of step functions indexed by the # of strict and nonstrict comparisons which hold.
+    :cvar __SPIKE: Lookup table of delta functions indexed by whether the point is in the support.
+    """
+    __STEP: Final[Tuple[float, float, float]] = (0.0, 0.5, 1.0)
+    __SPIKE: Final[Tuple[float, float]] = (0.0, math.inf)
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
+    @classmethod
+    def __delta(cls, x: float) -> float:
+        """
+        Dirac delta function.
+
+        Dirac delta function with parameter x has following computation rules.
+            1. If x is nan, the result is nan.
+            2. If x is 0, the result is +inf.
+            3. Otherwise, the result is 0.
+
+        This method is private and called internally as a helper of ``GenFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``GenFun.eval``.
+
+        :param x: Point where Dirac delta function is to be computed.
+        :type x: float
+
+        :return: Computed value of Dirac delta function.
+        :rtype: float
+        """
+        return x if math.isnan(x) else cls.__SPIKE[x == 0]
+
+    @classmethod
+    def __theta(cls, x: float) -> float:
+        """
+        Heaviside theta function.
+
+        Heaviside theta function with parameter x has following computation rules.
+            1. If x is nan, the result is nan.
+            2. If x is 0, the result is 1/2.
+            3. Otherwise, the result is 1 for positive x and 0 for negative x.
+
+        This method is private and called internally as a helper of ``GenFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``GenFun.eval``.
+
+        :param x: Point where Heaviside theta function is to be computed.
+        :type x: float
+
+        :return: Computed value of Heaviside theta function.
+        :rtype: float
+        """
+        return x if math.isnan(x) else cls.__STEP[(x > 0) + (x >= 0)]
+
+    @classmethod
+    def __comb(cls, x: float) -> float:
+        """
+        Dirac comb function.
+
+        Dirac comb function with parameter x has following computation rules.
+            1. If x is nan or +-inf, the result is nan.
+            2. If x is integer, the result is +inf.
+            3. Otherwise, the result is 0.
+
+        This method is private and called internally as a helper of ``GenFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``GenFun.eval``.
+
+        :param x: Point where Dirac comb function is to be computed.
+        :type x: float
+
+        :return: Computed value of Dirac comb function.
+        :rtype: float
+        """
+        return cls.__SPIKE[not math.fmod(x, 1)] if math.isfinite(x) else math.nan
+
+    @classmethod
+    def __pi(cls, x: float) -> float:
+        """
+        Heaviside pi function.
+
+        Heaviside pi function with parameter x has following computation rules.
+            1. If x is nan, the result is nan.
+            2. If x is +-1/2, the result is 1/2.
+            3. Otherwise, the result is 1 for x in (-1/2, 1/2) and 0 otherwise.
+
+        This method is private and called internally as a helper of ``GenFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``GenFun.eval``.
+
+        :param x: Point where Heaviside pi function is to be computed.
+        :type x: float
+
+        :return: Computed value of Heaviside pi function.
+        :rtype: float
+        """
+        return x if math.isnan(x) else cls.__STEP[(abs(x) < 0.5) + (abs(x) <= 0.5)]
+
+    @classmethod
+    def __lambda(cls, x: float) -> float:
+        """
+        Heaviside lambda function.
+
+        Heaviside lambda function with parameter x has following computation rules.
+            1. If x is nan, the result is nan.
+            2. Otherwise, the result is ``1 - |x|`` for x in (-1, 1) and 0 otherwise.
+
+        This method is private and called internally as a helper of ``GenFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``GenFun.eval``.
+
+        :param x: Point where Heaviside lambda function is to be computed.
+        :type x: float
+
+        :return: Computed value of Heaviside lambda function.
+        :rtype: float
+        """
+        return x if math.isnan(x) else max(0.0, 1 - abs(x))
+
+    @classmethod
+    def __kern(cls) -> Callable[[float], float]:
+        """
+        Find computation kernel implementing the computation rules.
+
+        This method is private and called internally as a helper of ``GenFun.eval``.
+
+        :return: Computation kernel of function.
+        :rtype: Callable[[float], float]
+        """
+        if cls == DiracDelta:
+            return cls.__delta
+        elif cls == HeavisideTheta:
+            return cls.__theta
+        elif cls == DiracComb:
+            return cls.__comb
+        elif cls == HeavisidePi:
+            return cls.__pi
+        else:
+            return cls.__lambda
+
+    @classmethod
+    def chk_t(cls, rt: Token.Tok, t_env: Dict[int, TypeSystem.T]) -> Optional[Dict[int, TypeSystem.T]]:
+        """
+        Type checker for generalized functions.
+
+        Generalized functions apply elementwise, so tensor is mapped to tensor of the same shape.
+        Symbolic parameter is typed as symbol so that it is not sampled.
+
+        :param rt: Token to be type checked.
+        :type rt: Token.Tok
+        :param t_env: Type environment.
+        :type t_env: Dict[int, TypeSystem.T]
+
+        :return: Type environment if type check succeeds. None otherwise.
+        :rtype: Optional[Dict[int, TypeSystem.T]]
+        """
+        if rt.argc != 1:
+            return None
+
+        rt.t = cls.bcast_t([rt.chd[0].t], [TypeSystem.Real, TypeSystem.Sym])
+
+        if not rt.t:
+            return None
+
+        return t_env
+
+    @classmethod
+    def eval(cls, x: Union[float, list]) -> Tuple[Union[float, list], List[Warning.InterpWarn]]:
+        """
+        Evaluate generalized function.
+
+        Parameter can be either scalar or tensor, and the result has the same shape with the parameter.
+        If there is neither nan nor inf, the whole tensor is evaluated as mask.
+            1. ``DiracDelta`` looks up ``x == 0`` in the spike table.
+            2. ``HeavisideTheta`` looks up ``(x > 0) + (x >= 0)`` in the step table.
+            3. ``DiracComb`` looks up ``not fmod(x, 1)`` in the spike table.
+            4. ``HeavisidePi`` looks up ``(|x| < 1/2) + (|x| <= 1/2)`` in the step table.
+            5. ``HeavisideLambda`` is ``max(0, 1 - |x|)``.
+        Each of them is a single chain of ``map`` calls.
+        Otherwise, it is computed by the private helper implementing the computation rules.
+
+        It generates warnings for followings cases, each at most once per call.
+            1. Some item exceeds floating point max/min size. (BIG_INT/SMALL_INT, resp.)
+            2. Some item is nan. (NAN_DETECT)
+            3. Some item is +-inf. (INF_DETECT)
+            4. Some item is in the support of ``DiracDelta`` or ``DiracComb``. (POLE_DETECT)
+
+        :param x: Point where function is to be computed.
+        :type x: Union[float, list]
+
+        :return: Computed value and list of generated warnings.
+        :rtype: Tuple[Union[float, list], List[Warning.InterpWarn]]
+        """
+        x, shape = cls.flat(x)
+        x, warn, fast = cls.chk_arg(x)
+
+        if not fast:
+            res: list = list(map(cls.__kern(), x))
+        elif cls == DiracDelta:
+            res: list = list(map(cls.__SPIKE.__getitem__, map(eq, x, repeat(0))))
+        elif cls == HeavisideTheta:
+            res: list = list(map(cls.__STEP.__getitem__, map(add, map(gt, x, repeat(0)), map(ge, x, repeat(0)))))
+        elif cls == DiracComb:
+            res: list = list(map(cls.__SPIKE.__getitem__, map(not_, map(math.fmod, x, repeat(1)))))
+        elif cls == HeavisidePi:
+            a: List[float] = list(map(abs, x))
+            res: list = list(map(cls.__STEP.__getitem__, map(add, map(lt, a, repeat(0.5)), map(le, a, repeat(0.5)))))
+        else:
+            res: list = list(map(max, repeat(0.0), map(sub, repeat(1.0), map(abs, x))))
+
+        if cls in [DiracDelta, DiracComb] and math.inf in res:
+            warn.append(Warning.InterpWarn(Type.InterpWarnT.POLE_DETECT, 95 if cls == DiracDelta else 96))
+
+        return cls.unflat(res, shape), warn
+
 
 @final
 class DiracDelta(GenFun):
+    __SGN: Final[List[str]] = ['DiracDelta[Real] -> Real', 'DiracDelta[Sym] -> Sym',
+                               'DiracDelta[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class HeavisideTheta(GenFun):
+    __SGN: Final[List[str]] = ['HeavisideTheta[Real] -> Real', 'HeavisideTheta[Sym] -> Sym',
+                               'HeavisideTheta[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class DiracComb(GenFun):
+    __SGN: Final[List[str]] = ['DiracComb[Real] -> Real', 'DiracComb[Sym] -> Sym',
+                               'DiracComb[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class HeavisidePi(GenFun):
+    __SGN: Final[List[str]] = ['HeavisidePi[Real] -> Real', 'HeavisidePi[Sym] -> Sym',
+                               'HeavisidePi[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class HeavisideLambda(GenFun):
+    __SGN: Final[List[str]] = ['HeavisideLambda[Real] -> Real', 'HeavisideLambda[Sym] -> Sym',
+                               'HeavisideLambda[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
@@ -1,301 +1,756 @@
-from typing import final
+from __future__ import annotations
 
-from Function import Function
+import math
+from itertools import repeat
+from operator import add, mul, neg, sub, truediv
+from typing import List, final, Final, Optional, Dict, Tuple, Union, Callable
+
+from Function import Exponential, Function, Integer, Precision, Trigonometric
+from Core import Dual, Interval, Symbolic, Token, TypeSystem, Type
+from Warning import Warning
 
 
 class HypbolicFun(Function.Fun):
     """
     Hyperbolic trigonometric function toolbox.
 
-    :cvar __sign: Signatures of hyperbolic trigonometric functions.
+    Reciprocal and inverse functions are computed from the formulae which neither overflow nor underflow prematurely.
+    For example, ``1 / math.sinh(x)`` overflows for x greater than about 710, but cosecant hyperbolic itself stays
+    representable as subnormal number until x is about 745.
     """
+
     def __new__(cls) -> None:
         raise NotImplementedError
-    #
-    # @classmethod
-    # def __sinh(cls, x: float) -> float:
-    #     """
-    #     Sine hyperbolic function.
-    #
-    #     Sine hyperbolic function with parameter x has following computation rules.
-    #         1. If x is nan, the result is nan.
-    #         2. If x is +-inf, the result is +-inf, resp.
-    #         3. If x is finite, the result is ``math.sinh(x)``.
-    #
-    #     This method is private and called internally as a helper of ``HyperTri.simplify``.
-    #     For detailed description for simplification, refer to the comments of ``HyperTri.simplify``.
-    #
-    #     :param x: Point where sine hyperbolic function is to be computed.
-    #     :type x: float
-    #
-    #     :return: Computed value of sine hyperbolic function.
-    #     :rtype: float
-    #     """
-    #     try:
-    #         return math.sinh(x)
-    #     except OverflowError:
-    #         return math.inf if x > 0 else -math.inf
-    #
-    # @classmethod
-    # def __cosh(cls, x: float) -> float:
-    #     """
-    #     Cosine hyperbolic function.
-    #
-    #     Cosine hyperbolic function with parameter x has following computation rules.
-    #         1. If x is nan, the result is nan.
-    #         2. If x is +-inf, the result is inf.
-    #         3. If x is finite, the result is ``math.cosh(x)``.
-    #
-    #     This method is private and called internally as a helper of ``HyperTri.simplify``.
-    #     For detailed description for simplification, refer to the comments of ``HyperTri.simplify``.
-    #
-    #     :param x: Point where cosine hyperbolic function is to be computed.
-    #     :type x: float
-    #
-    #     :return: Computed value of cosine hyperbolic function.
-    #     :rtype: float
-    #     """
-    #     try:
-    #         return math.cosh(x)
-    #     except OverflowError:
-    #         return math.inf
-    #
-    # @classmethod
-    # def __tanh(cls, x: float) -> float:
-    #     """
-    #     Tangent hyperbolic function.
-    #
-    #     Tangent hyperbolic function with parameter x has following computation rules.
-    #         1. If x is nan, the result is nan.
-    #         2. If x is +-inf, the result is inf.
-    #         3. If x is finite, the result is ``math.cosh(x)``.
-    #
-    #     This method is private and called internally as a helper of ``HyperTri.simplify``.
-    #     For detailed description for simplification, refer to the comments of ``HyperTri.simplify``.
-    #
-    #     :param x: Point where tangent hyperbolic function is to be computed.
-    #     :type x: float
-    #
-    #     :return: Computed value of tangent hyperbolic function.
-    #     :rtype: float
-    #     """
-    #     return math.tanh(x)
-    #
-    # @classmethod
-    # def __csch(cls, x: float) -> float:
-    #     """
-    #     Cosecant hyperbolic function.
-    #
-    #     Cosecant hyperbolic function with parameter x has following computation rules.
-    #         1. If x is nan or 0, the result is nan.
-    #         2. If x is +-inf, the result is 0.
-    #         3. If x is finite, the result is ``1 / math.sinh(x)``.
-    #
-    #     This method is private and called internally as a helper of ``HyperTri.simplify``.
-    #     For detailed description for simplification, refer to the comments of ``HyperTri.simplify``.
-    #
-    #     :param x: Point where cosecant hyperbolic function is to be computed.
-    #     :type x: float
-    #
-    #     :return: Computed value of cosecant hyperbolic function.
-    #     :rtype: float
-    #     """
-    #     try:
-    #         return math.nan if x == 0 else 1 / math.sinh(x)
-    #     except OverflowError:
-    #         return 0
-    #
-    # @classmethod
-    # def __sech(cls, x: float) -> float:
-    #     """
-    #     Secant hyperbolic function.
-    #
-    #     Secant hyperbolic function with parameter x has following computation rules.
-    #         1. If x is nan, the result is nan.
-    #         2. If x is +-inf, the result is 0.
-    #         3. If x is finite, the result is ``1 / math.cosh(x)``.
-    #
-    #     This method is private and called internally as a helper of ``HyperTri.simplify``.
-    #     For detailed description for simplification, refer to the comments of ``HyperTri.simplify``.
-    #
-    #     :param x: Point where secant hyperbolic function is to be computed.
-    #     :type x: float
-    #
-    #     :return: Computed value of secant hyperbolic function.
-    #     :rtype: float
-    #     """
-    #     try:
-    #         return 1 / math.cosh(x)
-    #     except OverflowError:
-    #         return 0
-    #
-    # @classmethod
-    # def __coth(cls, x: float) -> float:
-    #     """
-    #     Cotangent hyperbolic function.
-    #
-    #     Cotangent hyperbolic function with parameter x has following computation rules.
-    #         1. If x is nan or 0, the result is nan.
-    #         2. If x is +-inf, the result is +-1, resp.
-    #         3. If x is finite, the result is ``1 / math.tanh(x)``.
-    #
-    #     This method is private and called internally as a helper of ``HyperTri.simplify``.
-    #     For detailed description for simplification, refer to the comments of ``HyperTri.simplify``.
-    #
-    #     :param x: Point where cotangent hyperbolic function is to be computed.
-    #     :type x: float
-    #
-    #     :return: Computed value of cotangent hyperbolic function.
-    #     :rtype: float
-    #     """
-    #     return math.nan if x == 0 else 1 / math.tanh(x)
-    #
-    # @classmethod
-    # def __asinh(cls, x: float) -> float:
-    #     """
-    #     Arcsine hyperbolic function.
-    #
-    #     Arcsine hyperbolic function with parameter x has following computation rules.
-    #         1. If x is nan, the result is nan.
-    #         2. If x is +-inf, the result is +-inf, resp.
-    #         3. If x is finite, the result is ``math.asinh(x)``.
-    #
-    #     This method is private and called internally as a helper of ``HyperTri.simplify``.
-    #     For detailed description for simplification, refer to the comments of ``HyperTri.simplify``.
-    #
-    #     :param x: Point where arcsine hyperbolic function is to be computed.
-    #     :type x: float
-    #
-    #     :return: Computed value of arcsine hyperbolic function.
-    #     :rtype: float
-    #     """
-    #     return math.asinh(x)
-    #
-    # @classmethod
-    # def __acosh(cls, x: float) -> float:
-    #     """
-    #     Arccosine hyperbolic function.
-    #
-    #     Arccosine hyperbolic function with parameter x has following computation rules.
-    #         1. If x is +inf, the result is inf.
-    #         2. If x is -inf or nan, the result is nan
-    #         3. If x is finite which is not in [1, inf), the result is nan.
-    #         4. If x is finite which is in [1, inf), the result is ``math.acosh(x)``.
-    #
-    #     This method is private and called internally as a helper of ``HyperTri.simplify``.
-    #     For detailed description for simplification, refer to the comments of ``HyperTri.simplify``.
-    #
-    #     :param x: Point where arccosine hyperbolic function is to be computed.
-    #     :type x: float
-    #
-    #     :return: Computed value of arccosine hyperbolic function.
-    #     :rtype: float
-    #     """
-    #     return math.nan if x < 1 else math.acosh(x)
-    #
-    # @classmethod
-    # def __atanh(cls, x: float) -> float:
-    #     """
-    #     Arctangent hyperbolic function.
-    #
-    #     Arctangent hyperbolic function with parameter x has following computation rules.
-    #         1. If x is +-inf or nan, the result is nan.
-    #         2. If x is finite which is not in (-1, 1), the result is nan.
-    #         3. If x is +-1, then the result is +-inf.
-    #         4. If x is finite which is in (-1, 1), the result is ``math.atanh(x)``.
-    #
-    #     This method is private and called internally as a helper of ``HyperTri.simplify``.
-    #     For detailed description for simplification, refer to the comments of ``HyperTri.simplify``.
-    #
-    #     :param x: Point where arctangent hyperbolic function is to be computed.
-    #     :type x: float
-    #
-    #     :return: Computed value of arctangent hyperbolic function.
-    #     :rtype: float
-    #     """
-    #     return math.nan if x < -1 or x > 1 else math.inf if x == 1 else -math.inf if x == -1 else math.atanh(x)
-    #
-    # @classmethod
-    # def __acsch(cls, x: float) -> float:
-    #     """
-    #     Arccosecant hyperbolic function.
-    #
-    #     Arccosecant hyperbolic function with parameter x has following computation rules.
-    #         1. If x is nan or 0, the result is nan.
-    #         2. If x is +-inf, the result is 0.
-    #         3. If x is finite, the result is ``math.asinh(1 / x)``.
-    #     Here, the rule 3 is based on identity ``acsch(x) = asinh(1 / x)``.
-    #     For detail and more identities, consult the reference below.
-    #
-    #     This method is private and called internally as a helper of ``HyperTri.simplify``.
-    #     For detailed description for simplification, refer to the comments of ``HyperTri.simplify``.
-    #
-    #     **Reference**
-    #         * https://en.wikipedia.org/wiki/Inverse_hyperbolic_functions
-    #
-    #     :param x: Point where arccosecant hyperbolic function is to be computed.
-    #     :type x: float
-    #
-    #     :return: Computed value of arccosecant hyperbolic function.
-    #     :rtype: float
-    #     """
-    #     return math.nan if x == 0 else math.asinh(1 / x)
-    #
-    # @classmethod
-    # def __asech(cls, x: float) -> float:
-    #     """
-    #     Arcsecant hyperbolic function.
-    #
-    #     Arcsecant hyperbolic function with parameter x has following computation rules.
-    #         1. If x is nan or +-inf, the result is nan.
-    #         2. If x is 0, the result is inf.
-    #         3. If x is finite not in (0, 1], the result is nan.
-    #         4. If x is in (0, 1], the result is ``math.acosh(1 / x)``.
-    #     Here, the rule 4 is based on identity ``asech(x) = acosh(1 / x)``.
-    #     For detail and more identities, consult the reference below.
-    #
-    #     This method is private and called internally as a helper of ``HyperTri.simplify``.
-    #     For detailed description for simplification, refer to the comments of ``HyperTri.simplify``.
-    #
-    #     **Reference**
-    #         * https://en.wikipedia.org/wiki/Inverse_hyperbolic_functions
-    #
-    #     :param x: Point where arcsecant hyperbolic function is to be computed.
-    #     :type x: float
-    #
-    #     :return: Computed value of arcsecant hyperbolic function.
-    #     :rtype: float
-    #     """
-    #     return math.nan if x < 0 or x > 1 else math.inf if x == 0 else math.acosh(1 / x)
-    #
-    # @classmethod
-    # def __acoth(cls, x: float) -> float:
-    #     """
-    #     Arccotangent hyperbolic function.
-    #
-    #     Arccotangent hyperbolic function with parameter x has following computation rules.
-    #         1. If x is nan, the result is nan.
-    #         2. If x is +-inf, the result is 0.
-    #         3. If x is +-1, the result is +-inf.
-    #         4. If x is in (-1, 1), the result is nan.
-    #         5. If x is finite not in [-1, 1], the result is ``math.atanh(1 / x)``.
-    #     Here, the rule 5 is based on identity ``acoth(x) = atanh(1 / x)``.
-    #     For detail and more identities, consult the reference below.
-    #
-    #     This method is private and called internally as a helper of ``HyperTri.simplify``.
-    #     For detailed description for simplification, refer to the comments of ``HyperTri.simplify``.
-    #
-    #     **Reference**
-    #         * https://en.wikipedia.org/wiki/Inverse_hyperbolic_functions
-    #
-    #     :param x: Point where arccotangent hyperbolic function is to be computed.
-    #     :type x: float
-    #
-    #     :return: Computed value of arccotangent hyperbolic function.
-    #     :rtype: float
-    #     """
-    #     return math.nan if -1 < x < 1 else math.inf if x == 1 else -math.inf if x == -1 else math.atanh(1 / x)
-    #
+
+    @classmethod
+    def __sinh(cls, x: float) -> float:
+        """
+        Sine hyperbolic function.
+
+        Sine hyperbolic function with parameter x has following computation rules.
+            1. If x is nan, the result is nan.
+            2. If x is +-inf, the result is +-inf, resp.
+            3. If x is finite, the result is ``math.sinh(x)``.
+
+        This method is private and called internally as a helper of ``HypbolicFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``HypbolicFun.eval``.
+
+        :param x: Point where sine hyperbolic function is to be computed.
+        :type x: float
+
+        :return: Computed value of sine hyperbolic function.
+        :rtype: float
+        """
+        try:
+            return math.sinh(x)
+        except OverflowError:
+            return math.inf if x > 0 else -math.inf
+
+    @classmethod
+    def __cosh(cls, x: float) -> float:
+        """
+        Cosine hyperbolic function.
+
+        Cosine hyperbolic function with parameter x has following computation rules.
+            1. If x is nan, the result is nan.
+            2. If x is +-inf, the result is inf.
+            3. If x is finite, the result is ``math.cosh(x)``.
+
+        This method is private and called internally as a helper of ``HypbolicFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``HypbolicFun.eval``.
+
+        :param x: Point where cosine hyperbolic function is to be computed.
+        :type x: float
+
+        :return: Computed value of cosine hyperbolic function.
+        :rtype: float
+        """
+        try:
+            return math.cosh(x)
+        except OverflowError:
+            return math.inf
+
+    @classmethod
+    def __tanh(cls, x: float) -> float:
+        """
+        Tangent hyperbolic function.
+
+        Tangent hyperbolic function with parameter x has following computation rules.
+            1. If x is nan, the result is nan.
+            2. If x is +-inf, the result is +-1, resp.
+            3. If x is finite, the result is ``math.tanh(x)``.
+
+        This method is private and called internally as a helper of ``HypbolicFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``HypbolicFun.eval``.
+
+        :param x: Point where tangent hyperbolic function is to be computed.
+        :type x: float
+
+        :return: Computed value of tangent hyperbolic function.
+        :rtype: float
+        """
+        return math.tanh(x)
+
+    @classmethod
+    def __csch(cls, x: float) -> float:
+        """
+        Cosecant hyperbolic function.
+
+        Cosecant hyperbolic function with parameter x has following computation rules.
+            1. If x is nan or 0, the result is nan.
+            2. If x is +-inf, the result is 0.
+            3. If x is finite which is in (-1, 1), the result is ``1 / math.sinh(x)``.
+            4. If x is finite which is not in (-1, 1), the result is ``2 * exp(-|x|) / (1 - exp(-2|x|))`` with the sign
+               of x.
+        Here, the rule 4 does not overflow for large x, and ``math.expm1`` keeps the denominator accurate.
+
+        This method is private and called internally as a helper of ``HypbolicFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``HypbolicFun.eval``.
+
+        :param x: Point where cosecant hyperbolic function is to be computed.
+        :type x: float
+
+        :return: Computed value of cosecant hyperbolic function.
+        :rtype: float
+        """
+        if x == 0:
+            return math.nan
+        elif -1 < x < 1:
+            return 1 / math.sinh(x)
+        else:
+            return math.copysign(2 * math.exp(-abs(x)) / -math.expm1(-2 * abs(x)), x)
+
+    @classmethod
+    def __sech(cls, x: float) -> float:
+        """
+        Secant hyperbolic function.
+
+        Secant hyperbolic function with parameter x has following computation rules.
+            1. If x is nan, the result is nan.
+            2. If x is +-inf, the result is 0.
+            3. If x is finite, the result is ``2 * exp(-|x|) / (1 + exp(-2|x|))``.
+        Here, the rule 3 does not overflow for large x.
+
+        This method is private and called internally as a helper of ``HypbolicFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``HypbolicFun.eval``.
+
+        :param x: Point where secant hyperbolic function is to be computed.
+        :type x: float
+
+        :return: Computed value of secant hyperbolic function.
+        :rtype: float
+        """
+        return 2 * math.exp(-abs(x)) / (1 + math.exp(-2 * abs(x)))
+
+    @classmethod
+    def __coth(cls, x: float) -> float:
+        """
+        Cotangent hyperbolic function.
+
+        Cotangent hyperbolic function with parameter x has following computation rules.
+            1. If x is nan or 0, the result is nan.
+            2. If x is +-inf, the result is +-1, resp.
+            3. If x is finite, the result is ``1 / math.tanh(x)``.
+
+        This method is private and called internally as a helper of ``HypbolicFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``HypbolicFun.eval``.
+
+        :param x: Point where cotangent hyperbolic function is to be computed.
+        :type x: float
+
+        :return: Computed value of cotangent hyperbolic function.
+        :rtype: float
+        """
+        return math.nan if x == 0 else 1 / math.tanh(x)
+
+    @classmethod
+    def __asinh(cls, x: float) -> float:
+        """
+        Arcsine hyperbolic function.
+
+        Arcsine hyperbolic function with parameter x has following computation rules.
+            1. If x is nan, the result is nan.
+            2. If x is +-inf, the result is +-inf, resp.
+            3. If x is finite, the result is ``math.asinh(x)``.
+
+        This method is private and called internally as a helper of ``HypbolicFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``HypbolicFun.eval``.
+
+        :param x: Point where arcsine hyperbolic function is to be computed.
+        :type x: float
+
+        :return: Computed value of arcsine hyperbolic function.
+        :rtype: float
+        """
+        return math.asinh(x)
+
+    @classmethod
+    def __acosh(cls, x: float) -> float:
+        """
+        Arccosine hyperbolic function.
+
+        Arccosine hyperbolic function with parameter x has following computation rules.
+            1. If x is +inf, the result is inf.
+            2. If x is -inf or nan, the result is nan
+            3. If x is finite which is not in [1, inf), the result is nan.
+            4. If x is finite which is in [1, inf), the result is ``math.acosh(x)``.
+
+        This method is private and called internally as a helper of ``HypbolicFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``HypbolicFun.eval``.
+
+        :param x: Point where arccosine hyperbolic function is to be computed.
+        :type x: float
+
+        :return: Computed value of arccosine hyperbolic function.
+        :rtype: float
+        """
+        return math.nan if x < 1 else math.acosh(x)
+
+    @classmethod
+    def __atanh(cls, x: float) -> float:
+        """
+        Arctangent hyperbolic function.
+
+        Arctangent hyperbolic function with parameter x has following computation rules.
+            1. If x is +-inf or nan, the result is nan.
+            2. If x is finite which is not in (-1, 1), the result is nan.
+            3. If x is +-1, then the result is +-inf.
+            4. If x is finite which is in (-1, 1), the result is ``math.atanh(x)``.
+
+        This method is private and called internally as a helper of ``HypbolicFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``HypbolicFun.eval``.
+
+        :param x: Point where arctangent hyperbolic function is to be computed.
+        :type x: float
+
+        :return: Computed value of arctangent hyperbolic function.
+        :rtype: float
+        """
+        return math.nan if x < -1 or x > 1 else math.inf if x == 1 else -math.inf if x == -1 else math.atanh(x)
+
+    @classmethod
+    def __acsch(cls, x: float) -> float:
+        """
+        Arccosecant hyperbolic function.
+
+        Arccosecant hyperbolic function with parameter x has following computation rules.
+            1. If x is nan or 0, the result is nan.
+            2. If x is +-inf, the result is 0.
+            3. If x is finite which is in (-1, 1), the result is ``log1p(sqrt(1 + x^2)) - log(|x|)`` with the sign of x.
+            4. If x is finite which is not in (-1, 1), the result is ``math.asinh(1 / x)``.
+        Here, the rules 3 and 4 are based on identity ``acsch(x) = asinh(1 / x)``.
+        The rule 3 is its rearrangement which does not overflow for subnormal x.
+        For detail and more identities, consult the reference below.
+
+        This method is private and called internally as a helper of ``HypbolicFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``HypbolicFun.eval``.
+
+        **Reference**
+            * https://en.wikipedia.org/wiki/Inverse_hyperbolic_functions
+
+        :param x: Point where arccosecant hyperbolic function is to be computed.
+        :type x: float
+
+        :return: Computed value of arccosecant hyperbolic function.
+        :rtype: float
+        """
+        if x == 0:
+            return math.nan
+        elif -1 < x < 1:
+            return math.copysign(math.log1p(math.hypot(1, x)) - math.log(abs(x)), x)
+        else:
+            return math.asinh(1 / x)
+
+    @classmethod
+    def __asech(cls, x: float) -> float:
+        """
+        Arcsecant hyperbolic function.
+
+        Arcsecant hyperbolic function with parameter x has following computation rules.
+            1. If x is nan or +-inf, the result is nan.
+            2. If x is 0, the result is inf.
+            3. If x is finite not in (0, 1], the result is nan.
+            4. If x is in (0, 1 / 2), the result is ``log1p(sqrt(1 - x^2)) - log(x)``.
+            5. If x is in [1 / 2, 1], the result is ``math.acosh(1 / x)``.
+        Here, the rules 4 and 5 are based on identity ``asech(x) = acosh(1 / x)``.
+        The rule 4 is its rearrangement which does not overflow for subnormal x.
+        For detail and more identities, consult the reference below.
+
+        This method is private and called internally as a helper of ``HypbolicFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``HypbolicFun.eval``.
+
+        **Reference**
+            * https://en.wikipedia.org/wiki/Inverse_hyperbolic_functions
+
+        :param x: Point where arcsecant hyperbolic function is to be computed.
+        :type x: float
+
+        :return: Computed value of arcsecant hyperbolic function.
+        :rtype: float
+        """
+        if not 0 <= x <= 1:
+            return math.nan
+        elif x == 0:
+            return math.inf
+        elif x < 0.5:
+            return math.log1p(math.sqrt(1 - x * x)) - math.log(x)
+        else:
+            return math.acosh(1 / x)
+
+    @classmethod
+    def __acoth(cls, x: float) -> float:
+        """
+        Arccotangent hyperbolic function.
+
+        Arccotangent hyperbolic function with parameter x has following computation rules.
+            1. If x is nan, the result is nan.
+            2. If x is +-inf, the result is 0.
+            3. If x is +-1, the result is +-inf.
+            4. If x is in (-1, 1), the result is nan.
+            5. If x is finite not in [-1, 1], the result is ``math.atanh(1 / x)``.
+        Here, the rule 5 is based on identity ``acoth(x) = atanh(1 / x)``.
+        For detail and more identities, consult the reference below.
+
+        This method is private and called internally as a helper of ``HypbolicFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``HypbolicFun.eval``.
+
+        **Reference**
+            * https://en.wikipedia.org/wiki/Inverse_hyperbolic_functions
+
+        :param x: Point where arccotangent hyperbolic function is to be computed.
+        :type x: float
+
+        :return: Computed value of arccotangent hyperbolic function.
+        :rtype: float
+        """
+        return math.nan if -1 < x < 1 else math.inf if x == 1 else -math.inf if x == -1 else math.atanh(1 / x)
+
+    @classmethod
+    def __gd(cls, x: float) -> float:
+        """
+        Gudermannian function.
+
+        Gudermannian function with parameter x has following computation rules.
+            1. If x is nan, the result is nan.
+            2. If x is +-inf, the result is +-pi/2, resp.
+            3. If x is finite, the result is ``2 * math.atan(math.tanh(x / 2))``.
+        Here, the rule 3 is based on identity ``gd(x) = 2 * atan(tanh(x / 2))``.
+        Unlike the defining form ``atan(sinh(x))``, it does not overflow for large x.
+
+        This method is private and called internally as a helper of ``HypbolicFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``HypbolicFun.eval``.
+
+        **Reference**
+            * https://en.wikipedia.org/wiki/Gudermannian_function
+
+        :param x: Point where Gudermannian function is to be computed.
+        :type x: float
+
+        :return: Computed value of Gudermannian function.
+        :rtype: float
+        """
+        return 2 * math.atan(math.tanh(x / 2))
+
+    @classmethod
+    def __agd(cls, x: float) -> float:
+        """
+        Inverse Gudermannian function.
+
+        Inverse Gudermannian function with parameter x has following computation rules.
+            1. If x is +-inf or nan, the result is nan.
+            2. If x is finite which is not in [-pi/2, pi/2], the result is nan.
+            3. If x is finite which is in [-pi/2, pi/2], the result is ``math.asinh(math.tan(x))``.
+        Here, the rule 3 is based on identity ``gd^-1(x) = asinh(tan(x))``.
+        Note that the floating point pi/2 is slightly less than the true pi/2, so the result is always finite.
+
+        This method is private and called internally as a helper of ``HypbolicFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``HypbolicFun.eval``.
+
+        **Reference**
+            * https://en.wikipedia.org/wiki/Gudermannian_function
+
+        :param x: Point where inverse Gudermannian function is to be computed.
+        :type x: float
+
+        :return: Computed value of inverse Gudermannian function.
+        :rtype: float
+        """
+        return math.asinh(math.tan(x)) if -math.pi / 2 <= x <= math.pi / 2 else math.nan
+
+    @classmethod
+    def __kern(cls) -> Callable[[float], float]:
+        """
+        Find computation kernel implementing the computation rules.
+
+        This method is private and called internally as a helper of ``HypbolicFun.eval``.
+
+        :return: Computation kernel of function.
+        :rtype: Callable[[float], float]
+        """
+        if cls == Sinh:
+            return cls.__sinh
+        elif cls == Cosh:
+            return cls.__cosh
+        elif cls == Tanh:
+            return cls.__tanh
+        elif cls == Csch:
+            return cls.__csch
+        elif cls == Sech:
+            return cls.__sech
+        elif cls == Coth:
+            return cls.__coth
+        elif cls == ArcSinh:
+            return cls.__asinh
+        elif cls == ArcCosh:
+            return cls.__acosh
+        elif cls == ArcTanh:
+            return cls.__atanh
+        elif cls == ArcCsch:
+            return cls.__acsch
+        elif cls == ArcSech:
+            return cls.__asech
+        elif cls == ArcCoth:
+            return cls.__acoth
+        elif cls == Gudermannian:
+            return cls.__gd
+        else:
+            return cls.__agd
+
+    @classmethod
+    def chk_t(cls, rt: Token.Tok, t_env: Dict[int, TypeSystem.T]) -> Optional[Dict[int, TypeSystem.T]]:
+        """
+        Type checker for hyperbolic trigonometric functions.
+
+        Hyperbolic trigonometric functions apply elementwise, so tensor of reals is mapped to tensor of the same shape.
+
+        :param rt: Token to be type checked.
+        :type rt: Token.Tok
+        :param t_env: Type environment.
+        :type t_env: Dict[int, TypeSystem.T]
+
+        :return: Type environment if type check succeeds. None otherwise.
+        :rtype: Optional[Dict[int, TypeSystem.T]]
+        """
+        if rt.argc != 1:
+            return None
+
+        t: TypeSystem.T = rt.chd[0].t
+
+        if type(t) in [TypeSystem.Real, TypeSystem.Interval, TypeSystem.Sym] or \
+                (type(t) == TypeSystem.Tens and type(t.chd_t) == TypeSystem.Real):
+            rt.t = t
+
+            return t_env
+        else:
+            return None
+
+    @classmethod
+    def eval(cls, x: Union[float, list]) -> Tuple[Union[float, list], List[Warning.InterpWarn]]:
+        """
+        Evaluate hyperbolic trigonometric function.
+
+        Parameter can be either real or tensor of reals, and the result has the same shape with the parameter.
+        The whole tensor is evaluated by chain of ``map`` calls.
+        If the parameter has no nan, inf, pole, or point out of domain, the chain is built only from ``math`` functions
+        and arithmetic operators, so the loop runs entirely in C.
+        If the fast chain overflows, which happens only for large parameters, the whole tensor is evaluated again by the
+        private helper implementing the computation rules.
+        Otherwise, it falls back to the private helper from the beginning.
+
+        If arbitrary precision mode is on, it is evaluated by ``Precision.PrecFun.eval`` instead.
+
+        It generates warnings for followings cases, each at most once per call.
+            1. Some item exceeds floating point max/min size. (BIG_INT/SMALL_INT, resp.)
+            2. Some item is nan. (NAN_DETECT)
+            3. Some item is +-inf. (INF_DETECT)
+            4. Some item is mathematical pole. (POLE_DETECT)
+               Poles are 0 for Csch, Coth, ArcCsch and ArcSech, and -1 and 1 for ArcTanh and ArcCoth.
+            5. Some finite item is not in domain. (DOMAIN_OUT)
+               Domains are [1, inf) for ArcCosh, [-1, 1] for ArcTanh, [0, 1] for ArcSech, (-inf, -1] and [1, inf) for
+               ArcCoth, and [-pi/2, pi/2] for InverseGudermannian.
+        Each check is a single scan over the whole tensor, not a branch per item.
+
+        :param x: Point where function is to be computed.
+        :type x: Union[float, list]
+
+        :return: Computed value and list of generated warnings.
+        :rtype: Tuple[Union[float, list], List[Warning.InterpWarn]]
+        """
+        if Precision.PrecFun.prec():
+            return Precision.PrecFun.eval(cls, x)
+
+        x, shape = cls.flat(x)
+
+        # Empty batch has no item to check, and domain checks below do not accept it.
+        if not x:
+            return cls.unflat(x, shape), []
+
+        x, warn, fast = cls.chk_arg(x)
+
+        # Pole and domain checks run in C if the parameter is finite.
+        # Otherwise, they fall back to generator since comparison with nan is not reliable.
+        if cls in [Csch, Coth, ArcCsch]:
+            if 0.0 in x:
+                warn.append(Warning.InterpWarn(Type.InterpWarnT.POLE_DETECT, 33 if cls == Csch else
+                                               34 if cls == Coth else 35))
+                fast = False
+        elif cls == ArcCosh:
+            if (min(x) < 1) if fast else any(-math.inf < it < 1 for it in x):
+                warn.append(Warning.InterpWarn(Type.InterpWarnT.DOMAIN_OUT, 21))
+                fast = False
+        elif cls == ArcTanh:
+            if 1.0 in x or -1.0 in x:
+                warn.append(Warning.InterpWarn(Type.InterpWarnT.POLE_DETECT, 32))
+                fast = False
+
+            if (min(x) < -1 or max(x) > 1) if fast else any(1 < abs(it) < math.inf for it in x):
+                warn.append(Warning.InterpWarn(Type.InterpWarnT.DOMAIN_OUT, 22))
+                fast = False
+        elif cls == ArcCoth:
+            if 1.0 in x or -1.0 in x:
+                warn.append(Warning.InterpWarn(Type.InterpWarnT.POLE_DETECT, 39))
+                fast = False
+
+            if (min(map(abs, x)) < 1) if fast else any(-1 < it < 1 for it in x):
+                warn.append(Warning.InterpWarn(Type.InterpWarnT.DOMAIN_OUT, 38))
+                fast = False
+        elif cls == ArcSech:
+            if 0.0 in x:
+                warn.append(Warning.InterpWarn(Type.InterpWarnT.POLE_DETECT, 37))
+                fast = False
+
+            if (min(x) < 0 or max(x) > 1) if fast else any(-math.inf < it < 0 or 1 < it < math.inf for it in x):
+                warn.append(Warning.InterpWarn(Type.InterpWarnT.DOMAIN_OUT, 36))
+                fast = False
+        elif cls == InverseGudermannian:
+            if (min(x) < -math.pi / 2 or max(x) > math.pi / 2) if fast else \
+                    any(-math.inf < it < -math.pi / 2 or math.pi / 2 < it < math.inf for it in x):
+                warn.append(Warning.InterpWarn(Type.InterpWarnT.DOMAIN_OUT, 61))
+                fast = False
+
+        if not fast:
+            return cls.unflat(list(map(cls.__kern(), x)), shape), warn
+
+        try:
+            if cls == Sinh:
+                res: list = list(map(math.sinh, x))
+            elif cls == Cosh:
+                res: list = list(map(math.cosh, x))
+            elif cls == Tanh:
+                res: list = list(map(math.tanh, x))
+            elif cls == Csch:
+                res: list = list(map(truediv, repeat(1.0), map(math.sinh, x)))
+            elif cls == Sech:
+                res: list = list(map(truediv, repeat(1.0), map(math.cosh, x)))
+            elif cls == Coth:
+                res: list = list(map(truediv, repeat(1.0), map(math.tanh, x)))
+            elif cls == ArcSinh:
+                res: list = list(map(math.asinh, x))
+            elif cls == ArcCosh:
+                res: list = list(map(math.acosh, x))
+            elif cls == ArcTanh:
+                res: list = list(map(math.atanh, x))
+            elif cls == ArcCsch:
+                res: list = list(map(math.asinh, map(truediv, repeat(1.0), x)))
+            elif cls == ArcSech:
+                res: list = list(map(math.acosh, map(truediv, repeat(1.0), x)))
+            elif cls == ArcCoth:
+                res: list = list(map(math.atanh, map(truediv, repeat(1.0), x)))
+            elif cls == Gudermannian:
+                res: list = list(map(mul, repeat(2.0), map(math.atan, map(math.tanh, map(mul, x, repeat(0.5))))))
+            else:
+                res: list = list(map(math.asinh, map(math.tan, x)))
+        except OverflowError:
+            # Sinh and cosh of large parameter. Recomputation by the rules gives +-inf or stable reciprocals.
+            return cls.unflat(list(map(cls.__kern(), x)), shape), warn
+
+        # Reciprocal of subnormal parameter overflows silently to inf.
+        # Recomputation by the rules gives finite results from the rearranged formulae.
+        if cls in [ArcCsch, ArcSech] and max(map(abs, res)) == math.inf:
+            res = list(map(cls.__kern(), x))
+
+        return cls.unflat(res, shape), warn
+
+    @classmethod
+    def ival(cls, x: Interval.Ival) -> Tuple[Interval.Ival, List[Warning.InterpWarn]]:
+        """
+        Evaluate hyperbolic trigonometric function over intervals.
+
+        The result encloses all the values of the function over each interval.
+            1. ``Sinh``, ``Tanh``, ``ArcSinh``, ``ArcCosh``, ``ArcTanh``, ``Gudermannian`` and ``InverseGudermannian``
+               are increasing.
+            2. ``Cosh`` is even and increasing on ``[0, inf]``.
+            3. ``Csch``, ``Sech`` and ``Coth`` are reciprocals of ``Sinh``, ``Cosh`` and ``Tanh``, resp.
+            4. ``ArcCsch``, ``ArcSech`` and ``ArcCoth`` are ``ArcSinh``, ``ArcCosh`` and ``ArcTanh`` of reciprocal,
+               resp.
+        Values at the end points are computed by ``HypbolicFun.eval`` and moved outward by 2 ulps, or 4 ulps for
+        ``Gudermannian`` and ``InverseGudermannian`` whose kernels are compositions.
+        Intervals are restricted to the domain of the function first.
+
+        It generates warnings for followings cases.
+            1. Some interval contains pole. (POLE_DETECT)
+            2. Some interval is not contained in domain. (DOMAIN_OUT)
+
+        :param x: Intervals where function is to be computed.
+        :type x: Interval.Ival
+
+        :return: Enclosure of the result and list of generated warnings.
+        :rtype: Tuple[Interval.Ival, List[Warning.InterpWarn]]
+        """
+        kern: Callable[[List[float]], List[float]] = lambda t: cls.eval(t)[0]
+        pole: bool = False
+        out: bool = False
+
+        if cls in [Sinh, ArcSinh]:
+            res: Interval.Ival = Interval.IvalArith.mono(kern, x)
+        elif cls == Cosh:
+            res: Interval.Ival = Interval.IvalArith.even(kern, x, rng=(1.0, math.inf))
+        elif cls == Tanh:
+            res: Interval.Ival = Interval.IvalArith.mono(kern, x, rng=(-1.0, 1.0))
+        elif cls in [Csch, Sech, Coth]:
+            res, pole = Interval.IvalArith.recip((Sinh if cls == Csch else Cosh if cls == Sech else Tanh).ival(x)[0])
+        elif cls == ArcCosh:
+            x, out = Interval.IvalArith.clip(x, 1.0, math.inf)
+            res: Interval.Ival = Interval.IvalArith.mono(kern, x, rng=(0.0, math.inf))
+        elif cls == ArcTanh:
+            x, out = Interval.IvalArith.clip(x, -1.0, 1.0)
+            res: Interval.Ival = Interval.IvalArith.mono(kern, x)
+        elif cls == ArcCsch:
+            x, pole = Interval.IvalArith.recip(x)
+            res: Interval.Ival = ArcSinh.ival(x)[0]
+        elif cls == ArcSech:
+            x, out = Interval.IvalArith.clip(x, 0.0, 1.0)
+            x, pole = Interval.IvalArith.recip(x)
+            res: Interval.Ival = ArcCosh.ival(x)[0]
+        elif cls == ArcCoth:
+            # Reciprocal of interval in the domain may exceed [-1, 1] by rounding, so domain is checked beforehand.
+            out = Interval.IvalArith.gap(x, 1.0)
+            res: Interval.Ival = ArcTanh.ival(Interval.IvalArith.recip(x)[0])[0]
+        elif cls == Gudermannian:
+            res: Interval.Ival = Interval.IvalArith.mono(kern, x, ulp=4)
+        else:
+            x, out = Interval.IvalArith.clip(x, -math.pi / 2, math.pi / 2)
+            res: Interval.Ival = Interval.IvalArith.mono(kern, x, ulp=4)
+
+        warn: List[Warning.InterpWarn] = []
+
+        if out:
+            warn.append(Warning.InterpWarn(Type.InterpWarnT.DOMAIN_OUT, 98, handle=cls.__name__))
+
+        if pole:
+            warn.append(Warning.InterpWarn(Type.InterpWarnT.POLE_DETECT, 99, handle=cls.__name__))
+
+        return res, warn
+
+    @classmethod
+    def __deriv(cls) -> Callable[[list, list], list]:
+        """
+        Find chain computing derivative of function.
+
+        Derivatives are computed from the points and the values of function as follows.
+            1. ``Sinh`` is ``cosh(x)``, and ``Cosh`` is ``sinh(x)``.
+            2. ``Tanh`` and ``Coth`` are ``1 - f(x)^2``.
+            3. ``Csch`` is ``-csch(x) / tanh(x)``, and ``Sech`` is ``-sech(x) * tanh(x)``.
+            4. ``ArcSinh`` and ``ArcCosh`` are ``1 / sqrt(x^2 +- 1)``, resp.
+            5. ``ArcTanh`` and ``ArcCoth`` are ``1 / (1 - x^2)``.
+            6. ``ArcCsch`` is ``-1 / (|x| * sqrt(1 + x^2))``, and ``ArcSech`` is ``-1 / (x * sqrt(1 - x^2))``.
+            7. ``Gudermannian`` is ``cos(gd(x))``, and ``InverseGudermannian`` is ``cosh(gd^-1(x))``.
+               They equal to ``sech(x)`` and ``sec(x)``, resp., but never overflow in the domain.
+
+        This method is private and called internally as a helper of ``HypbolicFun.dual``.
+
+        :return: Chain computing derivative from points and values of function.
+        :rtype: Callable[[list, list], list]
+        """
+        if cls == Sinh:
+            return lambda x, f: list(map(math.cosh, x))
+        elif cls == Cosh:
+            return lambda x, f: list(map(math.sinh, x))
+        elif cls in [Tanh, Coth]:
+            return lambda x, f: list(map(sub, repeat(1.0), map(mul, f, f)))
+        elif cls == Csch:
+            return lambda x, f: list(map(neg, map(truediv, f, map(math.tanh, x))))
+        elif cls == Sech:
+            return lambda x, f: list(map(neg, map(mul, f, map(math.tanh, x))))
+        elif cls in [ArcSinh, ArcCosh]:
+            return lambda x, f: list(map(truediv, repeat(1.0),
+                                         map(math.sqrt, map(add if cls == ArcSinh else sub, map(mul, x, x),
+                                                            repeat(1.0)))))
+        elif cls in [ArcTanh, ArcCoth]:
+            return lambda x, f: list(map(truediv, repeat(1.0), map(sub, repeat(1.0), map(mul, x, x))))
+        elif cls == ArcCsch:
+            return lambda x, f: list(map(truediv, repeat(-1.0),
+                                         map(mul, map(abs, x), map(math.sqrt, map(add, repeat(1.0), map(mul, x, x))))))
+        elif cls == ArcSech:
+            return lambda x, f: list(map(truediv, repeat(-1.0),
+                                         map(mul, x, map(math.sqrt, map(sub, repeat(1.0), map(mul, x, x))))))
+        elif cls == Gudermannian:
+            return lambda x, f: list(map(math.cos, f))
+        else:
+            return lambda x, f: list(map(math.cosh, f))
+
+    @classmethod
+    def dual(cls, x: Dual.Dual) -> Tuple[Dual.Dual, List[Warning.InterpWarn]]:
+        """
+        Evaluate hyperbolic function over dual numbers.
+
+        Values are computed by ``HypbolicFun.eval``, and tangents by the chain rule with the derivative found by
+        ``HypbolicFun.__deriv``.
+        Derivative at the point out of domain or pole, or derivative which overflows is nan.
+
+        :param x: Point where function is to be computed.
+        :type x: Dual.Dual
+
+        :return: Computed value with tangents and list of generated warnings.
+        :rtype: Tuple[Dual.Dual, List[Warning.InterpWarn]]
+        """
+        res, warn = cls.eval(x.v)
+
+        return Dual.DualArith.lift(x, res, cls.__deriv()), warn
+
+    @classmethod
+    def diff(cls, rt: Token.Fun, b: Symbolic.Builder) -> List[Optional[Token.Tok]]:
+        """
+        Build derivative of hyperbolic function.
+
+        Derivatives follow the rules of ``HypbolicFun.__deriv``, where f is the token itself so that it is shared.
+
+        :param rt: Token whose derivative is to be built.
+        :type rt: Token.Fun
+        :param b: Builder of tokens.
+        :type b: Symbolic.Builder
+
+        :return: Derivative. None if identically 0.
+        :rtype: List[Optional[Token.Tok]]
+        """
+        x: Token.Tok = rt.chd[0]
+
+        if cls == Sinh:
+            return [b.fun(Cosh, x)]
+        elif cls == Cosh:
+            return [b.fun(Sinh, x)]
+        elif cls in [Tanh, Coth]:
+            return [b.sub(b.num(1), b.mul(rt, rt))]
+        elif cls == Csch:
+            return [b.neg(b.div(rt, b.fun(Tanh, x)))]
+        elif cls == Sech:
+            return [b.neg(b.mul(rt, b.fun(Tanh, x)))]
+        elif cls == ArcSinh:
+            return [b.div(b.num(1), b.fun(Exponential.Sqrt, b.add(b.mul(x, x), b.num(1))))]
+        elif cls == ArcCosh:
+            return [b.div(b.num(1), b.fun(Exponential.Sqrt, b.sub(b.mul(x, x), b.num(1))))]
+        elif cls in [ArcTanh, ArcCoth]:
+            return [b.div(b.num(1), b.sub(b.num(1), b.mul(x, x)))]
+        elif cls == ArcCsch:
+            return [b.div(b.num(-1),
+                          b.mul(b.fun(Integer.Abs, x), b.fun(Exponential.Sqrt, b.add(b.num(1), b.mul(x, x)))))]
+        elif cls == ArcSech:
+            return [b.div(b.num(-1), b.mul(x, b.fun(Exponential.Sqrt, b.sub(b.num(1), b.mul(x, x)))))]
+        elif cls == Gudermannian:
+            return [b.fun(Trigonometric.Cos, rt)]
+        else:
+            return [b.fun(Cosh, rt)]
+
     # @classmethod
     # def chk_t(cls, rt: Token.Fun) -> Optional[List[Type.Sign]]:
     #     """
@@ -850,83 +1305,126 @@ class HypbolicFun(Function.Fun):
 
 @final
 class Sinh(HypbolicFun):
+    __SGN: Final[List[str]] = ['Sinh[Real] -> Real', 'Sinh[Sym] -> Sym', 'Sinh[Interval] -> Interval',
+                               'Sinh[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class Cosh(HypbolicFun):
+    __SGN: Final[List[str]] = ['Cosh[Real] -> Real', 'Cosh[Sym] -> Sym', 'Cosh[Interval] -> Interval',
+                               'Cosh[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class Tanh(HypbolicFun):
+    __SGN: Final[List[str]] = ['Tanh[Real] -> Real', 'Tanh[Sym] -> Sym', 'Tanh[Interval] -> Interval',
+                               'Tanh[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class Csch(HypbolicFun):
+    __SGN: Final[List[str]] = ['Csch[Real] -> Real', 'Csch[Sym] -> Sym', 'Csch[Interval] -> Interval',
+                               'Csch[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class Sech(HypbolicFun):
+    __SGN: Final[List[str]] = ['Sech[Real] -> Real', 'Sech[Sym] -> Sym', 'Sech[Interval] -> Interval',
+                               'Sech[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class Coth(HypbolicFun):
+    __SGN: Final[List[str]] = ['Coth[Real] -> Real', 'Coth[Sym] -> Sym', 'Coth[Interval] -> Interval',
+                               'Coth[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class ArcSinh(HypbolicFun):
+    __SGN: Final[List[str]] = ['ArcSinh[Real] -> Real', 'ArcSinh[Sym] -> Sym', 'ArcSinh[Interval] -> Interval',
+                               'ArcSinh[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class ArcCosh(HypbolicFun):
+    __SGN: Final[List[str]] = ['ArcCosh[Real] -> Real', 'ArcCosh[Sym] -> Sym', 'ArcCosh[Interval] -> Interval',
+                               'ArcCosh[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class ArcTanh(HypbolicFun):
+    __SGN: Final[List[str]] = ['ArcTanh[Real] -> Real', 'ArcTanh[Sym] -> Sym', 'ArcTanh[Interval] -> Interval',
+                               'ArcTanh[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class ArcCsch(HypbolicFun):
+    __SGN: Final[List[str]] = ['ArcCsch[Real] -> Real', 'ArcCsch[Sym] -> Sym', 'ArcCsch[Interval] -> Interval',
+                               'ArcCsch[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class ArcSech(HypbolicFun):
+    __SGN: Final[List[str]] = ['ArcSech[Real] -> Real', 'ArcSech[Sym] -> Sym', 'ArcSech[Interval] -> Interval',
+                               'ArcSech[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class ArcCoth(HypbolicFun):
+    __SGN: Final[List[str]] = ['ArcCoth[Real] -> Real', 'ArcCoth[Sym] -> Sym', 'ArcCoth[Interval] -> Interval',
+                               'ArcCoth[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class Gudermannian(HypbolicFun):
+    __SGN: Final[List[str]] = ['Gudermannian[Real] -> Real', 'Gudermannian[Sym] -> Sym',
+                               'Gudermannian[Interval] -> Interval', 'Gudermannian[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class InverseGudermannian(HypbolicFun):
+    __SGN: Final[List[str]] = ['InverseGudermannian[Real] -> Real', 'InverseGudermannian[Sym] -> Sym',
+                               'InverseGudermannian[Interval] -> Interval',
+                               'InverseGudermannian[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
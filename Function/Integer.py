@@ -1,56 +1,439 @@
-from typing import final
+from __future__ import annotations
 
+import cmath
+import math
+from itertools import repeat
+from operator import eq, gt, lt, or_, sub
+from typing import final, Final, Optional, Dict, List, Tuple, Union, Callable
+
+from Core import Dual, Interval, Symbolic, Token, TypeSystem
 from Function import Function
+from Warning import Warning
 
 
 class IntFun(Function.Fun):
+    """
+    Integer function toolbox.
+
+    Integer parameters are parsed as Python ``int``, which has arbitrary precision.
+    If all items of parameter are ``int``, integer functions are computed in exact integer arithmetic without casting to
+    float.
+    In particular, big integers beyond the floating point range are neither warned nor replaced by inf.
+    For float parameters, rounding functions return exact integers as ``math.floor`` does, so that
+    ``Floor[1e300]`` is the exact integer whose value is the float.
+    """
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
+    @classmethod
+    def __round(cls, x: Union[int, float], fun: Callable[[float], int]) -> Union[int, float]:
+        """
+        Rounding function.
+
+        Rounding function with parameter x has following computation rules.
+            1. If x is nan or +-inf, the result is x itself.
+            2. Otherwise, the result is ``fun(x)``.
+
+        This method is private and called internally as a helper of the computation kernels.
+
+        :param x: Point where rounding function is to be computed.
+        :type x: Union[int, float]
+        :param fun: Rounding function.
+        :type fun: Callable[[float], int]
+
+        :return: Computed value of rounding function.
+        :rtype: Union[int, float]
+        """
+        return fun(x) if math.isfinite(x) else x
+
+    @classmethod
+    def __ceil(cls, x: Union[int, float]) -> Union[int, float]:
+        """
+        Ceiling function.
+
+        Ceiling function with parameter x follows the computation rules of ``IntFun.__round`` with ``math.ceil``.
+
+        This method is private and called internally as a helper of ``IntFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``IntFun.eval``.
+
+        :param x: Point where ceiling function is to be computed.
+        :type x: Union[int, float]
+
+        :return: Computed value of ceiling function.
+        :rtype: Union[int, float]
+        """
+        return cls.__round(x, math.ceil)
+
+    @classmethod
+    def __floor(cls, x: Union[int, float]) -> Union[int, float]:
+        """
+        Floor function.
+
+        Floor function with parameter x follows the computation rules of ``IntFun.__round`` with ``math.floor``.
+
+        This method is private and called internally as a helper of ``IntFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``IntFun.eval``.
+
+        :param x: Point where floor function is to be computed.
+        :type x: Union[int, float]
+
+        :return: Computed value of floor function.
+        :rtype: Union[int, float]
+        """
+        return cls.__round(x, math.floor)
+
+    @classmethod
+    def __nint(cls, x: Union[int, float]) -> Union[int, float]:
+        """
+        Round function.
+
+        Round function with parameter x follows the computation rules of ``IntFun.__round`` with ``round``.
+        Thus, halves are rounded to the nearest even integer.
+
+        This method is private and called internally as a helper of ``IntFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``IntFun.eval``.
+
+        :param x: Point where round function is to be computed.
+        :type x: Union[int, float]
+
+        :return: Computed value of round function.
+        :rtype: Union[int, float]
+        """
+        return cls.__round(x, round)
+
+    @classmethod
+    def __ipart(cls, x: Union[int, float]) -> Union[int, float]:
+        """
+        Integer part function.
+
+        Integer part function with parameter x follows the computation rules of ``IntFun.__round`` with
+        ``math.trunc``.
+
+        This method is private and called internally as a helper of ``IntFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``IntFun.eval``.
+
+        :param x: Point where integer part function is to be computed.
+        :type x: Union[int, float]
+
+        :return: Computed value of integer part function.
+        :rtype: Union[int, float]
+        """
+        return cls.__round(x, math.trunc)
+
+    @classmethod
+    def __fpart(cls, x: Union[int, float]) -> Union[int, float]:
+        """
+        Fractional part function.
+
+        Fractional part function with parameter x has following computation rules.
+            1. If x is nan or +-inf, the result is nan.
+            2. If x is integer, the result is 0.
+            3. Otherwise, the result is ``math.fmod(x, 1)``, which has the sign of x.
+
+        This method is private and called internally as a helper of ``IntFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``IntFun.eval``.
+
+        :param x: Point where fractional part function is to be computed.
+        :type x: Union[int, float]
+
+        :return: Computed value of fractional part function.
+        :rtype: Union[int, float]
+        """
+        if type(x) == int:
+            return 0
+
+        return math.fmod(x, 1) if math.isfinite(x) else math.nan
+
+    @classmethod
+    def __sgn(cls, x: Union[int, float, complex]) -> Union[int, float, complex]:
+        """
+        Sign function.
+
+        Sign function with parameter x has following computation rules.
+            1. If x is nan, the result is nan.
+            2. If x is real, the result is 1, 0, or -1 if x is positive, 0, or negative, resp.
+            3. If x is complex 0, the result is 0.
+            4. If x is complex with nan part, the result is nan.
+            5. If x is complex with inf part, the result is the unit complex whose direction is the limit direction.
+            6. Otherwise, the result is ``x / |x|``.
+
+        This method is private and called internally as a helper of ``IntFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``IntFun.eval``.
+
+        :param x: Point where sign function is to be computed.
+        :type x: Union[int, float, complex]
+
+        :return: Computed value of sign function.
+        :rtype: Union[int, float, complex]
+        """
+        if type(x) != complex:
+            return x if math.isnan(x) else (x > 0) - (x < 0)
+        elif x == 0:
+            return 0j
+        elif cmath.isnan(x):
+            return complex(math.nan, math.nan)
+        elif cmath.isinf(x):
+            # Infinite parts dominate and finite parts vanish in the limit.
+            x = complex(math.copysign(1, x.real) if math.isinf(x.real) else 0,
+                        math.copysign(1, x.imag) if math.isinf(x.imag) else 0)
+
+        return x / abs(x)
+
+    @classmethod
+    def __kern(cls) -> Callable[[Union[int, float, complex]], Union[int, float, complex]]:
+        """
+        Find computation kernel implementing the computation rules.
+
+        This method is private and called internally as a helper of ``IntFun.eval``.
+
+        :return: Computation kernel of function.
+        :rtype: Callable[[Union[int, float, complex]], Union[int, float, complex]]
+        """
+        if cls == Ceil:
+            return cls.__ceil
+        elif cls == Floor:
+            return cls.__floor
+        elif cls == Round:
+            return cls.__nint
+        elif cls == IntPart:
+            return cls.__ipart
+        elif cls == FracPart:
+            return cls.__fpart
+        elif cls == Abs:
+            return abs
+        else:
+            return cls.__sgn
+
+    @classmethod
+    def chk_t(cls, rt: Token.Tok, t_env: Dict[int, TypeSystem.T]) -> Optional[Dict[int, TypeSystem.T]]:
+        """
+        Type checker for integer functions.
+
+        Integer functions apply elementwise, so tensor is mapped to tensor of the same shape.
+        ``Abs`` and ``Sgn`` accept complex as well, and ``Abs`` of complex is real.
+
+        :param rt: Token to be type checked.
+        :type rt: Token.Tok
+        :param t_env: Type environment.
+        :type t_env: Dict[int, TypeSystem.T]
+
+        :return: Type environment if type check succeeds. None otherwise.
+        :rtype: Optional[Dict[int, TypeSystem.T]]
+        """
+        if rt.argc != 1:
+            return None
+
+        rt.t = cls.bcast_t([rt.chd[0].t], [TypeSystem.Real, TypeSystem.Cmplx, TypeSystem.Interval, TypeSystem.Sym]
+                           if cls in [Abs, Sgn] else [TypeSystem.Real, TypeSystem.Interval, TypeSystem.Sym])
+
+        if not rt.t:
+            return None
+
+        if cls == Abs and type(rt.t.chd_t if type(rt.t) == TypeSystem.Tens else rt.t) == TypeSystem.Cmplx:
+            rt.t = TypeSystem.Real.inst() if rt.t.base else \
+                TypeSystem.ArrFact.inst().coerce_arr_t(rt.t, TypeSystem.Real.inst())
+
+        return t_env
+
+    @classmethod
+    def eval(cls, x: Union[int, float, complex, list]) -> Tuple[Union[int, float, complex, list],
+                                                                List[Warning.InterpWarn]]:
+        """
+        Evaluate integer function.
+
+        Parameter can be either scalar or tensor, and the result has the same shape with the parameter.
+        If all items are ``int``, the whole tensor is computed in exact integer arithmetic by a single ``map`` call.
+        Rounding functions are identity, ``FracPart`` is 0, and ``Abs`` and ``Sgn`` are exact as well.
+        Otherwise, if there is neither nan nor inf, the whole tensor is computed by a single ``map`` call of ``math``
+        function or a short chain of operators, so the loop runs entirely in C.
+        Otherwise, it is computed by the private helper implementing the computation rules.
+
+        It generates warnings for followings cases, each at most once per call.
+            1. Some item exceeds floating point max/min size and there is float item as well.
+               (BIG_INT/SMALL_INT, resp.)
+            2. Some item is nan. (NAN_DETECT)
+            3. Some item is +-inf. (INF_DETECT)
+
+        :param x: Point where function is to be computed.
+        :type x: Union[int, float, complex, list]
+
+        :return: Computed value and list of generated warnings.
+        :rtype: Tuple[Union[int, float, complex, list], List[Warning.InterpWarn]]
+        """
+        x, shape = cls.flat(x)
+
+        if set(map(type, x)) <= {int}:
+            if cls in [Ceil, Floor, Round, IntPart]:
+                return cls.unflat(x, shape), []
+            elif cls == FracPart:
+                return cls.unflat([0] * len(x), shape), []
+            elif cls == Abs:
+                return cls.unflat(list(map(abs, x)), shape), []
+            else:
+                return cls.unflat(list(map(sub, map(gt, x, repeat(0)), map(lt, x, repeat(0)))), shape), []
+
+        x, warn, fast = cls.chk_arg(x)
+
+        if not fast or (cls == Sgn and cls.is_cmplx(x)):
+            return cls.unflat(list(map(cls.__kern(), x)), shape), warn
+
+        if cls == FracPart:
+            return cls.unflat(list(map(math.fmod, x, repeat(1.0))), shape), warn
+        elif cls == Sgn:
+            return cls.unflat(list(map(sub, map(gt, x, repeat(0)), map(lt, x, repeat(0)))), shape), warn
+
+        return cls.unflat(list(map(math.ceil if cls == Ceil else math.floor if cls == Floor else round if cls == Round
+                                   else math.trunc if cls == IntPart else abs, x)), shape), warn
+
+    @classmethod
+    def ival(cls, x: Interval.Ival) -> Tuple[Interval.Ival, List[Warning.InterpWarn]]:
+        """
+        Evaluate integer function over intervals.
+
+        The result encloses all the values of the function over each interval.
+            1. ``Ceil``, ``Floor``, ``Round``, ``IntPart`` and ``Sgn`` are nondecreasing.
+            2. ``Abs`` is even and increasing on ``[0, inf]``.
+            3. ``FracPart`` is increasing if the end points have the same integer part.
+               Otherwise, the result is ``[0, 1]``, ``[-1, 0]``, or ``[-1, 1]`` by the signs of the end points.
+        Values at the end points are computed by ``IntFun.eval``, which is exact, so no rounding is needed.
+        Since functions are defined on the whole real line, it generates no warning.
+
+        :param x: Intervals where function is to be computed.
+        :type x: Interval.Ival
+
+        :return: Enclosure of the result and list of generated warnings.
+        :rtype: Tuple[Interval.Ival, List[Warning.InterpWarn]]
+        """
+        kern: Callable[[List[float]], List[float]] = lambda t: list(map(float, cls.eval(t)[0]))
+
+        if cls == Abs:
+            return Interval.IvalArith.even(kern, x, 0), []
+
+        res: Interval.Ival = Interval.IvalArith.mono(kern, x, ulp=0)
+
+        if cls != FracPart:
+            return res, []
+
+        # Empty intervals are marked as the same so that they stay empty.
+        same: List[bool] = list(map(or_, map(eq, IntPart.eval(x.lo)[0], IntPart.eval(x.hi)[0]), map(math.isnan, x.lo)))
+
+        if all(same):
+            return res, []
+
+        return Interval.Ival([it if s else -1.0 if lo < 0 else 0.0 for it, s, lo in zip(res.lo, same, x.lo)],
+                             [it if s else 1.0 if hi > 0 else 0.0 for it, s, hi in zip(res.hi, same, x.hi)]), []
+
+    @classmethod
+    def dual(cls, x: Dual.Dual) -> Tuple[Dual.Dual, List[Warning.InterpWarn]]:
+        """
+        Evaluate integer function over dual numbers.
+
+        Values are computed by ``IntFun.eval``, and tangents by the chain rule as follows.
+            1. ``Ceil``, ``Floor``, ``Round``, ``IntPart`` and ``Sgn`` are piecewise constant, so their derivatives are
+               taken 0 everywhere, ignoring jumps.
+            2. ``FracPart`` is ``1``, ignoring jumps.
+            3. ``Abs`` is ``Sgn``, which is 0 at 0.
+
+        :param x: Point where function is to be computed.
+        :type x: Dual.Dual
+
+        :return: Computed value with tangents and list of generated warnings.
+        :rtype: Tuple[Dual.Dual, List[Warning.InterpWarn]]
+        """
+        res, warn = cls.eval(x.v)
+
+        if cls == Abs:
+            return Dual.DualArith.lift(x, res, lambda s, f: Sgn.eval(s)[0]), warn
+        elif cls == FracPart:
+            return Dual.DualArith.chain(res, (None, x)), warn
+        else:
+            return Dual.Dual(res, [None] * x.dim), warn
+
+    @classmethod
+    def diff(cls, rt: Token.Fun, b: Symbolic.Builder) -> List[Optional[Token.Tok]]:
+        """
+        Build derivative of integer function.
+
+        Derivatives follow the rules of ``IntFun.dual``.
+        That is, piecewise constant functions are None, ``FracPart`` is 1, and ``Abs`` is ``Sgn[x]``.
+
+        :param rt: Token whose derivative is to be built.
+        :type rt: Token.Fun
+        :param b: Builder of tokens.
+        :type b: Symbolic.Builder
+
+        :return: Derivative. None if identically 0.
+        :rtype: List[Optional[Token.Tok]]
+        """
+        if cls == Abs:
+            return [b.fun(Sgn, rt.chd[0])]
+        elif cls == FracPart:
+            return [b.num(1)]
+        else:
+            return [None]
+
 
 @final
 class Ceil(IntFun):
+    __SGN: Final[List[str]] = ['Ceil[Real] -> Real', 'Ceil[Sym] -> Sym', 'Ceil[Interval] -> Interval',
+                               'Ceil[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class Floor(IntFun):
+    __SGN: Final[List[str]] = ['Floor[Real] -> Real', 'Floor[Sym] -> Sym', 'Floor[Interval] -> Interval',
+                               'Floor[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class Round(IntFun):
-    def __new__(cls, *args, **kwargs) -> None:
-        raise NotImplementedError
-
+    __SGN: Final[List[str]] = ['Round[Real] -> Real', 'Round[Sym] -> Sym', 'Round[Interval] -> Interval',
+                               'Round[List of Real] -> List of Real']
 
-@final
-class IntPart(IntFun):
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class IntPart(IntFun):
+    __SGN: Final[List[str]] = ['IntPart[Real] -> Real', 'IntPart[Sym] -> Sym', 'IntPart[Interval] -> Interval',
+                               'IntPart[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class FracPart(IntFun):
+    __SGN: Final[List[str]] = ['FracPart[Real] -> Real', 'FracPart[Sym] -> Sym', 'FracPart[Interval] -> Interval',
+                               'FracPart[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class Abs(IntFun):
+    __SGN: Final[List[str]] = ['Abs[Real] -> Real', 'Abs[Cmplx] -> Real', 'Abs[Sym] -> Sym',
+                               'Abs[Interval] -> Interval', 'Abs[List of Real] -> List of Real',
+                               'Abs[List of Cmplx] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class Sgn(IntFun):
+    __SGN: Final[List[str]] = ['Sgn[Real] -> Real', 'Sgn[Cmplx] -> Cmplx', 'Sgn[Sym] -> Sym',
+                               'Sgn[Interval] -> Interval', 'Sgn[List of Real] -> List of Real',
+                               'Sgn[List of Cmplx] -> List of Cmplx']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
@@ -1,74 +1,960 @@
-from typing import final
+from __future__ import annotations
 
+import math
+from itertools import repeat
+from operator import add, mul, neg, sub, truediv
+from statistics import NormalDist
+from typing import final, Final, Optional, Dict, List, Tuple, Union, Callable
+
+from Core import Token, TypeSystem, Type
 from Function import Function
+from Warning import Warning
 
 
 class LinkFun(Function.Fun):
+    """
+    Link function toolbox.
+
+    Link functions map means of generalized linear models to linear predictors, and their inverses map linear
+    predictors back to means.
+    Both directions are evaluated over large prediction vectors by chains of ``map`` calls.
+    Tails are computed in the forms which do not lose precision.
+    For example, ``Logit`` is ``log(p) - log1p(-p)`` instead of ``log(p / (1 - p))``, so the relative accuracy is kept
+    for p close to 1 as well as p close to 0.
+    Likewise, inverse of ``LogLogComplement`` is ``-expm1(-exp(x))`` instead of ``1 - exp(-exp(x))``.
+    Probabilities are not clipped silently.
+    Instead, probabilities on the boundary map to +-inf and the ones out of [0, 1] map to nan with warning, and
+    inverses of probability links always lie in [0, 1].
+
+    **Reference**
+        * McCullagh, P., Nelder, J. A. (1989). Generalized Linear Models. 2nd ed.
+        * https://en.wikipedia.org/wiki/Generalized_linear_model#Link_function
+
+    :cvar __NORM: Standard normal distribution.
+    """
+    __NORM: Final[NormalDist] = NormalDist()
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
+    @classmethod
+    def __logit(cls, p: float) -> float:
+        """
+        Logit link.
+
+        Logit link with parameter p has following computation rules.
+            1. If p is nan or not in [0, 1], the result is nan.
+            2. If p is 0 or 1, the result is -inf or +inf, resp.
+            3. Otherwise, the result is ``log(p) - log1p(-p)``.
+
+        This method is private and called internally as a helper of ``LinkFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``LinkFun.eval``.
+
+        :param p: Point where logit link is to be computed.
+        :type p: float
+
+        :return: Computed value of logit link.
+        :rtype: float
+        """
+        if not 0 <= p <= 1:
+            return math.nan
+        elif p == 0 or p == 1:
+            return math.inf if p else -math.inf
+
+        return math.log(p) - math.log1p(-p)
+
+    @classmethod
+    def __logit_inv(cls, x: float) -> float:
+        """
+        Inverse of logit link.
+
+        Inverse of logit link with parameter x has following computation rules.
+            1. If x is nan, the result is nan.
+            2. If x is -inf or +inf, the result is 0 or 1, resp.
+            3. If x is finite nonnegative, the result is ``1 / (1 + exp(-x))``.
+            4. If x is finite negative, the result is ``exp(x) / (1 + exp(x))``.
+
+        This method is private and called internally as a helper of ``LinkFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``LinkFun.eval``.
+
+        :param x: Point where inverse of logit link is to be computed.
+        :type x: float
+
+        :return: Computed value of inverse of logit link.
+        :rtype: float
+        """
+        if math.isnan(x):
+            return x
+        elif x >= 0:
+            return 1 / (1 + math.exp(-x))
+
+        e: float = math.exp(x)
+
+        return e / (1 + e)
+
+    @classmethod
+    def __probit(cls, p: float) -> float:
+        """
+        Probit link.
+
+        Probit link with parameter p has following computation rules.
+            1. If p is nan or not in [0, 1], the result is nan.
+            2. If p is 0 or 1, the result is -inf or +inf, resp.
+            3. Otherwise, the result is the quantile of standard normal distribution.
+        Here, the rule 3 uses ``NormalDist.inv_cdf``, which is accurate up to rounding in the far tails as well.
+
+        This method is private and called internally as a helper of ``LinkFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``LinkFun.eval``.
+
+        :param p: Point where probit link is to be computed.
+        :type p: float
+
+        :return: Computed value of probit link.
+        :rtype: float
+        """
+        if not 0 <= p <= 1:
+            return math.nan
+        elif p == 0 or p == 1:
+            return math.inf if p else -math.inf
+
+        return cls.__NORM.inv_cdf(p)
+
+    @classmethod
+    def __probit_inv(cls, x: float) -> float:
+        """
+        Inverse of probit link.
+
+        Inverse of probit link with parameter x is ``erfc(-x / sqrt(2)) / 2``, which is accurate in the lower tail
+        until it underflows.
+        It follows the computation rules of ``math.erfc`` for nan and inf.
+
+        This method is private and called internally as a helper of ``LinkFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``LinkFun.eval``.
+
+        :param x: Point where inverse of probit link is to be computed.
+        :type x: float
+
+        :return: Computed value of inverse of probit link.
+        :rtype: float
+        """
+        return math.erfc(x / -math.sqrt(2)) / 2
+
+    @classmethod
+    def __cauchit(cls, p: float) -> float:
+        """
+        Cauchit link.
+
+        Cauchit link with parameter p has following computation rules.
+            1. If p is nan or not in [0, 1], the result is nan.
+            2. If p is 0 or 1, the result is -inf or +inf, resp.
+            3. If p is in [1/4, 3/4], the result is ``tan(pi * (p - 1/2))``.
+            4. Otherwise, the result is ``-1 / tan(pi * p)`` for p less than 1/4 and ``1 / tan(pi * (1 - p))`` for p
+               greater than 3/4.
+        Here, the subtractions in rules 3 and 4 are exact, so the relative accuracy is kept in both tails.
+
+        This method is private and called internally as a helper of ``LinkFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``LinkFun.eval``.
+
+        :param p: Point where cauchit link is to be computed.
+        :type p: float
+
+        :return: Computed value of cauchit link.
+        :rtype: float
+        """
+        if not 0 <= p <= 1:
+            return math.nan
+        elif p == 0 or p == 1:
+            return math.inf if p else -math.inf
+        elif p < 0.25:
+            return -1 / math.tan(math.pi * p)
+        elif p > 0.75:
+            return 1 / math.tan(math.pi * (1 - p))
+        else:
+            return math.tan(math.pi * (p - 0.5))
+
+    @classmethod
+    def __cauchit_inv(cls, x: float) -> float:
+        """
+        Inverse of cauchit link.
+
+        Inverse of cauchit link with parameter x is ``atan2(1, -x) / pi``, which equals ``1/2 + atan(x) / pi`` but
+        does not cancel in the lower tail.
+        It follows the computation rules of ``math.atan2`` for nan and inf.
+
+        This method is private and called internally as a helper of ``LinkFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``LinkFun.eval``.
+
+        :param x: Point where inverse of cauchit link is to be computed.
+        :type x: float
+
+        :return: Computed value of inverse of cauchit link.
+        :rtype: float
+        """
+        return math.atan2(1, -x) / math.pi
+
+    @classmethod
+    def __loglog(cls, p: float) -> float:
+        """
+        Log-log link.
+
+        Log-log link with parameter p has following computation rules.
+            1. If p is nan or not in [0, 1], the result is nan.
+            2. If p is 0 or 1, the result is -inf or +inf, resp.
+            3. Otherwise, the result is ``-log(-log(p))``.
+
+        This method is private and called internally as a helper of ``LinkFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``LinkFun.eval``.
+
+        :param p: Point where log-log link is to be computed.
+        :type p: float
+
+        :return: Computed value of log-log link.
+        :rtype: float
+        """
+        if not 0 <= p <= 1:
+            return math.nan
+        elif p == 0 or p == 1:
+            return math.inf if p else -math.inf
+
+        return -math.log(-math.log(p))
+
+    @classmethod
+    def __loglog_inv(cls, x: float) -> float:
+        """
+        Inverse of log-log link.
+
+        Inverse of log-log link with parameter x has following computation rules.
+            1. If x is nan, the result is nan.
+            2. Otherwise, the result is ``exp(-exp(-x))``.
+               If the inner exponential overflows, the result is 0.
+
+        This method is private and called internally as a helper of ``LinkFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``LinkFun.eval``.
+
+        :param x: Point where inverse of log-log link is to be computed.
+        :type x: float
+
+        :return: Computed value of inverse of log-log link.
+        :rtype: float
+        """
+        try:
+            return math.exp(-math.exp(-x))
+        except OverflowError:
+            return 0.0
+
+    @classmethod
+    def __logcomp(cls, p: float) -> float:
+        """
+        Log-complement link.
+
+        Log-complement link with parameter p has following computation rules.
+            1. If p is nan or not in [0, 1], the result is nan.
+            2. If p is 1, the result is -inf.
+            3. Otherwise, the result is ``log1p(-p)``.
+
+        This method is private and called internally as a helper of ``LinkFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``LinkFun.eval``.
+
+        :param p: Point where log-complement link is to be computed.
+        :type p: float
+
+        :return: Computed value of log-complement link.
+        :rtype: float
+        """
+        if not 0 <= p <= 1:
+            return math.nan
+
+        return -math.inf if p == 1 else math.log1p(-p)
+
+    @classmethod
+    def __logcomp_inv(cls, x: float) -> float:
+        """
+        Inverse of log-complement link.
+
+        Inverse of log-complement link with parameter x has following computation rules.
+            1. If x is nan or positive, the result is nan.
+            2. Otherwise, the result is ``-expm1(x)``.
+
+        This method is private and called internally as a helper of ``LinkFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``LinkFun.eval``.
+
+        :param x: Point where inverse of log-complement link is to be computed.
+        :type x: float
+
+        :return: Computed value of inverse of log-complement link.
+        :rtype: float
+        """
+        return -math.expm1(x) if x <= 0 else math.nan
+
+    @classmethod
+    def __loglogcomp(cls, p: float) -> float:
+        """
+        Complementary log-log link.
+
+        Complementary log-log link with parameter p has following computation rules.
+            1. If p is nan or not in [0, 1], the result is nan.
+            2. If p is 0 or 1, the result is -inf or +inf, resp.
+            3. Otherwise, the result is ``log(-log1p(-p))``.
+
+        This method is private and called internally as a helper of ``LinkFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``LinkFun.eval``.
+
+        :param p: Point where complementary log-log link is to be computed.
+        :type p: float
+
+        :return: Computed value of complementary log-log link.
+        :rtype: float
+        """
+        if not 0 <= p <= 1:
+            return math.nan
+        elif p == 0 or p == 1:
+            return math.inf if p else -math.inf
+
+        return math.log(-math.log1p(-p))
+
+    @classmethod
+    def __loglogcomp_inv(cls, x: float) -> float:
+        """
+        Inverse of complementary log-log link.
+
+        Inverse of complementary log-log link with parameter x has following computation rules.
+            1. If x is nan, the result is nan.
+            2. Otherwise, the result is ``-expm1(-exp(x))``.
+               If the inner exponential overflows, the result is 1.
+
+        This method is private and called internally as a helper of ``LinkFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``LinkFun.eval``.
+
+        :param x: Point where inverse of complementary log-log link is to be computed.
+        :type x: float
+
+        :return: Computed value of inverse of complementary log-log link.
+        :rtype: float
+        """
+        try:
+            return -math.expm1(-math.exp(x))
+        except OverflowError:
+            return 1.0
+
+    @classmethod
+    def __oddspow(cls, p: float, a: float) -> float:
+        """
+        Odds power link.
+
+        Odds power link with parameter p and power a has following computation rules.
+            1. If p or a is nan, the result is nan.
+            2. If a is 0, the result is logit link of p.
+            3. Otherwise, the result is ``expm1(a * logit(p)) / a``, which equals ``((p / (1 - p))^a - 1) / a``.
+               If it overflows, the result is +-inf with the sign of a.
+        Here, the rule 3 does not cancel as a goes to 0.
+
+        This method is private and called internally as a helper of ``LinkFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``LinkFun.eval``.
+
+        :param p: Point where odds power link is to be computed.
+        :type p: float
+        :param a: Power.
+        :type a: float
+
+        :return: Computed value of odds power link.
+        :rtype: float
+        """
+        lo: float = cls.__logit(p)
+
+        if math.isnan(lo) or math.isnan(a):
+            return math.nan
+        elif a == 0:
+            return lo
+
+        try:
+            return math.expm1(a * lo) / a
+        except OverflowError:
+            return math.copysign(math.inf, a)
+
+    @classmethod
+    def __oddspow_inv(cls, x: float, a: float) -> float:
+        """
+        Inverse of odds power link.
+
+        Inverse of odds power link with parameter x and power a has following computation rules.
+            1. If x or a is nan, the result is nan.
+            2. If a is 0, the result is inverse of logit link of x.
+            3. If ``a * x`` is less than -1, the result is nan.
+            4. Otherwise, the result is inverse of logit link of ``log1p(a * x) / a``.
+
+        This method is private and called internally as a helper of ``LinkFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``LinkFun.eval``.
+
+        :param x: Point where inverse of odds power link is to be computed.
+        :type x: float
+        :param a: Power.
+        :type a: float
+
+        :return: Computed value of inverse of odds power link.
+        :rtype: float
+        """
+        if math.isnan(x) or math.isnan(a):
+            return math.nan
+        elif a == 0:
+            return cls.__logit_inv(x)
+
+        ax: float = a * x
+
+        if ax < -1:
+            return math.nan
+
+        return cls.__logit_inv((-math.inf if ax == -1 else math.log1p(ax)) / a)
+
+    @classmethod
+    def __nbinom(cls, m: float, k: float) -> float:
+        """
+        Negative binomial link.
+
+        Negative binomial link with mean m and shape k has following computation rules.
+            1. If m or k is nan, the result is nan.
+            2. If m is negative or k is nonpositive, the result is nan.
+            3. If m is 0, the result is -inf.
+            4. Otherwise, the result is ``log(m / (m + k))``, computed as ``-log1p(k / m)``.
+
+        This method is private and called internally as a helper of ``LinkFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``LinkFun.eval``.
+
+        :param m: Point where negative binomial link is to be computed.
+        :type m: float
+        :param k: Shape.
+        :type k: float
+
+        :return: Computed value of negative binomial link.
+        :rtype: float
+        """
+        if not (m >= 0 and k > 0):
+            return math.nan
+
+        return -math.inf if m == 0 else -math.log1p(k / m)
+
+    @classmethod
+    def __nbinom_inv(cls, x: float, k: float) -> float:
+        """
+        Inverse of negative binomial link.
+
+        Inverse of negative binomial link with parameter x and shape k has following computation rules.
+            1. If x or k is nan, the result is nan.
+            2. If x is positive or k is nonpositive, the result is nan.
+            3. If x is 0, the result is +inf.
+            4. Otherwise, the result is ``k / expm1(-x)``.
+               If it overflows, the result is 0.
+
+        This method is private and called internally as a helper of ``LinkFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``LinkFun.eval``.
+
+        :param x: Point where inverse of negative binomial link is to be computed.
+        :type x: float
+        :param k: Shape.
+        :type k: float
+
+        :return: Computed value of inverse of negative binomial link.
+        :rtype: float
+        """
+        if not (x <= 0 and k > 0):
+            return math.nan
+        elif x == 0:
+            return math.inf
+
+        try:
+            return k / math.expm1(-x)
+        except OverflowError:
+            return 0.0
+
+    @classmethod
+    def __powlink(cls, m: float, lam: float) -> float:
+        """
+        Power link.
+
+        Power link with mean m and power lam has following computation rules.
+            1. If m or lam is nan, the result is nan.
+            2. If m is negative, the result is nan.
+            3. If lam is 0, the result is ``log(m)``.
+            4. If m is 0, the result is 0 for positive lam and +inf for negative lam.
+            5. Otherwise, the result is ``m^lam``.
+               If it overflows, the result is +inf.
+
+        This method is private and called internally as a helper of ``LinkFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``LinkFun.eval``.
+
+        :param m: Point where power link is to be computed.
+        :type m: float
+        :param lam: Power.
+        :type lam: float
+
+        :return: Computed value of power link.
+        :rtype: float
+        """
+        if not m >= 0 or math.isnan(lam):
+            return math.nan
+        elif lam == 0:
+            return math.log(m) if m else -math.inf
+        elif m == 0:
+            return 0.0 if lam > 0 else math.inf
+
+        try:
+            return m ** lam
+        except OverflowError:
+            return math.inf
+
+    @classmethod
+    def __powlink_inv(cls, x: float, lam: float) -> float:
+        """
+        Inverse of power link.
+
+        Inverse of power link with parameter x and power lam has following computation rules.
+            1. If x or lam is nan, the result is nan.
+            2. If lam is 0, the result is ``exp(x)``.
+               If it overflows, the result is +inf.
+            3. If x is negative, the result is nan.
+            4. Otherwise, the result is the result of power link of x with power ``1 / lam``.
+
+        This method is private and called internally as a helper of ``LinkFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``LinkFun.eval``.
+
+        :param x: Point where inverse of power link is to be computed.
+        :type x: float
+        :param lam: Power.
+        :type lam: float
+
+        :return: Computed value of inverse of power link.
+        :rtype: float
+        """
+        if lam == 0:
+            try:
+                return math.exp(x)
+            except OverflowError:
+                return math.inf
+
+        return cls.__powlink(x, 1 / lam) if not math.isnan(lam) else math.nan
+
+    @classmethod
+    def __recip(cls, m: float) -> float:
+        """
+        Reciprocal link.
+
+        Reciprocal link with parameter m has following computation rules.
+            1. If m is nan, the result is nan.
+            2. If m is +-0, the result is +-inf, resp.
+            3. Otherwise, the result is ``1 / m``.
+        The inverse of reciprocal link is itself.
+
+        This method is private and called internally as a helper of ``LinkFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``LinkFun.eval``.
+
+        :param m: Point where reciprocal link is to be computed.
+        :type m: float
+
+        :return: Computed value of reciprocal link.
+        :rtype: float
+        """
+        return math.copysign(math.inf, m) if m == 0 else 1 / m
+
+    @classmethod
+    def __invsq(cls, m: float) -> float:
+        """
+        Inverse square link.
+
+        Inverse square link with parameter m has following computation rules.
+            1. If m is nan, the result is nan.
+            2. If m is 0, the result is +inf.
+            3. Otherwise, the result is ``(1 / m)^2``.
+               If it overflows, the result is +inf.
+
+        This method is private and called internally as a helper of ``LinkFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``LinkFun.eval``.
+
+        :param m: Point where inverse square link is to be computed.
+        :type m: float
+
+        :return: Computed value of inverse square link.
+        :rtype: float
+        """
+        if m == 0:
+            return math.inf
+
+        r: float = 1 / m
+
+        return r * r
+
+    @classmethod
+    def __invsq_inv(cls, x: float) -> float:
+        """
+        Inverse of inverse square link.
+
+        Inverse of inverse square link with parameter x has following computation rules.
+            1. If x is nan or negative, the result is nan.
+            2. If x is 0, the result is +inf.
+            3. Otherwise, the result is ``1 / sqrt(x)``.
+
+        This method is private and called internally as a helper of ``LinkFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``LinkFun.eval``.
+
+        :param x: Point where inverse of inverse square link is to be computed.
+        :type x: float
+
+        :return: Computed value of inverse of inverse square link.
+        :rtype: float
+        """
+        if not x >= 0:
+            return math.nan
+
+        return math.inf if x == 0 else 1 / math.sqrt(x)
+
+    @classmethod
+    def __kern(cls, inv: bool) -> Callable[..., float]:
+        """
+        Find computation kernel implementing the computation rules.
+
+        This method is private and called internally as a helper of ``LinkFun.eval``.
+
+        :param inv: Flag for inverse link.
+        :type inv: bool
+
+        :return: Computation kernel of function.
+        :rtype: Callable[..., float]
+        """
+        if cls == Logit:
+            return cls.__logit_inv if inv else cls.__logit
+        elif cls == Probit:
+            return cls.__probit_inv if inv else cls.__probit
+        elif cls == Cauchit:
+            return cls.__cauchit_inv if inv else cls.__cauchit
+        elif cls == LogLog:
+            return cls.__loglog_inv if inv else cls.__loglog
+        elif cls == LogComplement:
+            return cls.__logcomp_inv if inv else cls.__logcomp
+        elif cls == LogLogComplement:
+            return cls.__loglogcomp_inv if inv else cls.__loglogcomp
+        elif cls == OddsPower:
+            return cls.__oddspow_inv if inv else cls.__oddspow
+        elif cls == NegBinomLink:
+            return cls.__nbinom_inv if inv else cls.__nbinom
+        elif cls == PowerLink:
+            return cls.__powlink_inv if inv else cls.__powlink
+        elif cls == Reciprocal:
+            return cls.__recip
+        else:
+            return cls.__invsq_inv if inv else cls.__invsq
+
+    @classmethod
+    def __fast(cls, arg: List[list], inv: bool) -> Optional[list]:
+        """
+        Evaluate link function by chain of ``map`` calls.
+
+        Parameters must be finite and in the domain of the chain.
+        If the chain overflows or hits a point where it is not defined, it gives up and returns None.
+
+        This method is private and called internally as a helper of ``LinkFun.eval``.
+
+        :param arg: Flattened parameters.
+        :type arg: List[list]
+        :param inv: Flag for inverse link.
+        :type inv: bool
+
+        :return: Computed value if the chain succeeds. None otherwise.
+        :rtype: Optional[list]
+        """
+        x: list = arg[0]
+
+        try:
+            if cls == Logit and not inv:
+                return list(map(sub, map(math.log, x), map(math.log1p, map(neg, x))))
+            elif cls == Logit or (cls == OddsPower and inv):
+                if cls == OddsPower:
+                    x = list(map(truediv, map(math.log1p, map(mul, arg[1], x)), arg[1]))
+
+                return list(map(truediv, repeat(1.0), map(add, repeat(1.0), map(math.exp, map(neg, x)))))
+            elif cls == Probit:
+                return list(map(truediv, map(math.erfc, map(truediv, x, repeat(-math.sqrt(2)))), repeat(2.0))) if \
+                    inv else list(map(cls.__NORM.inv_cdf, x))
+            elif cls == Cauchit:
+                return list(map(truediv, map(math.atan2, repeat(1.0), map(neg, x)), repeat(math.pi))) if inv else \
+                    list(map(cls.__cauchit, x))
+            elif cls == LogLog:
+                return list(map(math.exp, map(neg, map(math.exp, map(neg, x))))) if inv else \
+                    list(map(neg, map(math.log, map(neg, map(math.log, x)))))
+            elif cls == LogComplement:
+                return list(map(neg, map(math.expm1, x))) if inv else list(map(math.log1p, map(neg, x)))
+            elif cls == LogLogComplement:
+                return list(map(neg, map(math.expm1, map(neg, map(math.exp, x))))) if inv else \
+                    list(map(math.log, map(neg, map(math.log1p, map(neg, x)))))
+            elif cls == OddsPower:
+                lo: map = map(sub, map(math.log, x), map(math.log1p, map(neg, x)))  # Logit.
+
+                return list(map(truediv, map(math.expm1, map(mul, arg[1], lo)), arg[1]))
+            elif cls == NegBinomLink:
+                return list(map(truediv, arg[1], map(math.expm1, map(neg, x)))) if inv else \
+                    list(map(neg, map(math.log1p, map(truediv, arg[1], x))))
+            elif cls == PowerLink:
+                return list(map(pow, x, map(truediv, repeat(1.0), arg[1]) if inv else arg[1]))
+            elif cls == Reciprocal:
+                return list(map(truediv, repeat(1.0), x))
+            elif inv:
+                return list(map(truediv, repeat(1.0), map(math.sqrt, x)))
+            else:
+                r: list = list(map(truediv, repeat(1.0), x))
+
+                return list(map(mul, r, r))
+        except (OverflowError, ValueError, ZeroDivisionError):
+            return None
+
+    @classmethod
+    def __dom_inv(cls, arg: List[list]) -> Tuple[Callable[[float], bool], List[list]]:
+        """
+        Find domain of inverse link.
+
+        Inverses of probability links are defined on whole real line except the followings.
+            1. Inverse of ``LogComplement`` is defined on nonpositive reals, since it is not a probability otherwise.
+            2. Inverse of ``OddsPower`` is defined where the product of parameter and power is greater than -1.
+        Inverses of the other links are defined as follows.
+            1. Inverse of ``NegBinomLink`` is defined on negative reals with positive shape.
+            2. Inverse of ``PowerLink`` is defined on positive reals unless the power is 0.
+            3. Inverse of ``Reciprocal`` is itself, and inverse of ``InverseSquare`` is defined on positive reals.
+        Domains are given as a predicate and the quantities where it must hold, so that they are checked in the same
+        way with links.
+
+        This method is private and called internally as a helper of ``LinkFun.eval``.
+
+        :param arg: Flattened parameters.
+        :type arg: List[list]
+
+        :return: Predicate of domain and quantities to be checked.
+        :rtype: Tuple[Callable[[float], bool], List[list]]
+        """
+        x: list = arg[0]
+
+        if cls == LogComplement:
+            return lambda t: t <= 0, [x]
+        elif cls == OddsPower:
+            return lambda t: t > -1, [list(map(mul, arg[1], x))]
+        elif cls == NegBinomLink:
+            return lambda t: t > 0, [list(map(neg, x)), arg[1]]
+        elif cls == PowerLink:
+            return lambda t: t > 0, [[t for t, lam in zip(x, arg[1]) if lam != 0] if 0.0 in arg[1] else x]
+        elif cls == Reciprocal:
+            return lambda t: t != 0, [x]
+        elif cls == InverseSquare:
+            return lambda t: t > 0, [x]
+        else:
+            return lambda t: True, []
+
+    @classmethod
+    def chk_t(cls, rt: Token.Tok, t_env: Dict[int, TypeSystem.T]) -> Optional[Dict[int, TypeSystem.T]]:
+        """
+        Type checker for link functions.
+
+        Functions apply elementwise, and parameters are broadcast as binary operators do.
+        For the rules of broadcasting, refer to the comments of ``Fun.bcast_t``.
+
+        :param rt: Token to be type checked.
+        :type rt: Token.Tok
+        :param t_env: Type environment.
+        :type t_env: Dict[int, TypeSystem.T]
+
+        :return: Type environment if type check succeeds. None otherwise.
+        :rtype: Optional[Dict[int, TypeSystem.T]]
+        """
+        if rt.argc != (2 if cls in [OddsPower, NegBinomLink, PowerLink] else 1):
+            return None
+
+        rt.t = cls.bcast_t([tok.t for tok in rt.chd], [TypeSystem.Real, TypeSystem.Sym])
+
+        if not rt.t:
+            return None
+
+        return t_env
+
+    @classmethod
+    def eval(cls, *args: Union[float, list], inv: bool = False) -> Tuple[Union[float, list], List[Warning.InterpWarn]]:
+        """
+        Evaluate link function or its inverse.
+
+        Parameters can be either scalar or tensor of any rank, and they are broadcast to the common shape.
+        ``OddsPower``, ``NegBinomLink`` and ``PowerLink`` take their power or shape as the second parameter, which is
+        shared by the inverse.
+        If parameters are finite and strictly inside the domain, the whole tensor is evaluated by a single chain of
+        ``map`` calls built only from ``math`` functions and arithmetic operators, so the loop runs in C.
+        Since the domains are intervals except for ``Reciprocal`` and ``InverseSquare``, the domain check only looks at
+        the minimum and maximum.
+        If the fast chain fails, the whole tensor is evaluated again by the private helper implementing the computation
+        rules.
+
+        It generates warnings for followings cases, each at most once per call.
+            1. Some item exceeds floating point max/min size. (BIG_INT/SMALL_INT, resp.)
+            2. Some item is nan. (NAN_DETECT)
+            3. Some item is +-inf. (INF_DETECT)
+            4. Some finite item of link is not strictly inside the domain. (DOMAIN_OUT)
+               Domains are (0, 1) for probability links except ``LogComplement`` whose domain is [0, 1), positive
+               reals for mean and shape of ``NegBinomLink`` and mean of ``PowerLink``, and nonzero reals for
+               ``Reciprocal`` and ``InverseSquare``.
+               For the domains of inverses, refer to the comments of ``LinkFun.__dom_inv``.
+
+        :param args: Parameters where function is to be computed.
+        :type args: Union[float, list]
+        :param inv: Flag for inverse link. (Default: False)
+        :type inv: bool
+
+        :return: Computed value and list of generated warnings.
+        :rtype: Tuple[Union[float, list], List[Warning.InterpWarn]]
+        """
+        arg, shape = cls.bcast(*args)
+
+        # Empty batch has no item to check, and domain checks below do not accept it.
+        if not arg[0]:
+            return cls.unflat([], shape), []
+
+        warn: List[Warning.InterpWarn] = []
+        fast: bool = True
+
+        for i in range(len(arg)):
+            arg[i], arg_warn, arg_fast = cls.chk_arg(arg[i], i + 1)
+            warn += arg_warn
+            fast &= arg_fast
+
+        # Domain checks look at the extremes if parameters are finite.
+        # Otherwise, they fall back to generator since comparison with nan is not reliable.
+        if inv:
+            dom, chk = cls.__dom_inv(arg)
+        else:
+            if cls in [Reciprocal, InverseSquare]:
+                dom: Callable[[float], bool] = lambda t: t != 0
+            elif cls in [NegBinomLink, PowerLink]:
+                dom: Callable[[float], bool] = lambda t: t > 0
+            elif cls == LogComplement:
+                dom: Callable[[float], bool] = lambda t: 0 <= t < 1
+            else:
+                dom: Callable[[float], bool] = lambda t: 0 < t < 1
+
+            chk: List[list] = arg[:1] + (arg[1:] if cls == NegBinomLink else [])
+
+        nz: bool = cls == Reciprocal or (cls == InverseSquare and not inv)  # Domain is nonzero reals.
+        out: bool = any((0.0 in x if nz else not (dom(min(x)) and dom(max(x)))) if
+                        fast else any(not dom(it) for it in x if math.isfinite(it)) for x in chk if x)
+
+        if out and inv and cls != Reciprocal:
+            warn.append(Warning.InterpWarn(Type.InterpWarnT.DOMAIN_OUT,
+                                           108 if cls == LogComplement else 109 if cls == OddsPower else
+                                           110 if cls == NegBinomLink else 111 if cls == PowerLink else 112))
+        elif out:
+            warn.append(Warning.InterpWarn(Type.InterpWarnT.DOMAIN_OUT,
+                                           79 if cls == Logit else 80 if cls == Probit else 81 if cls == Cauchit else
+                                           82 if cls == LogLog else 83 if cls == LogComplement else
+                                           84 if cls == LogLogComplement else 85 if cls == OddsPower else
+                                           86 if cls == NegBinomLink else 87 if cls == PowerLink else
+                                           88 if cls == Reciprocal else 89))
+
+        # Singular powers and inverses outside the domain of the chains are left to the kernel.
+        if cls in [OddsPower, PowerLink] and 0.0 in arg[1]:
+            fast = False
+        elif inv and arg[0]:
+            if cls == NegBinomLink:
+                fast &= max(arg[0]) < 0
+            elif cls in [PowerLink, InverseSquare]:
+                fast &= min(arg[0]) > 0
+
+        res: Optional[list] = cls.__fast(arg, inv) if fast and not out else None
+
+        if res is None:
+            res = list(map(cls.__kern(inv), *arg))
+
+        return cls.unflat(res, shape), warn
+
 
 @final
 class Logit(LinkFun):
+    __SGN: Final[List[str]] = ['Logit[Real] -> Real', 'Logit[Sym] -> Sym', 'Logit[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class Reciprocal(LinkFun):
+    __SGN: Final[List[str]] = ['Reciprocal[Real] -> Real', 'Reciprocal[Sym] -> Sym',
+                               'Reciprocal[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class InverseSquare(LinkFun):
+    __SGN: Final[List[str]] = ['InverseSquare[Real] -> Real', 'InverseSquare[Sym] -> Sym',
+                               'InverseSquare[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class Probit(LinkFun):
+    __SGN: Final[List[str]] = ['Probit[Real] -> Real', 'Probit[Sym] -> Sym', 'Probit[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class Cauchit(LinkFun):
+    __SGN: Final[List[str]] = ['Cauchit[Real] -> Real', 'Cauchit[Sym] -> Sym', 'Cauchit[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class LogLog(LinkFun):
+    __SGN: Final[List[str]] = ['LogLog[Real] -> Real', 'LogLog[Sym] -> Sym', 'LogLog[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class LogComplement(LinkFun):
+    __SGN: Final[List[str]] = ['LogComplement[Real] -> Real', 'LogComplement[Sym] -> Sym',
+                               'LogComplement[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class LogLogComplement(LinkFun):
+    __SGN: Final[List[str]] = ['LogLogComplement[Real] -> Real', 'LogLogComplement[Sym] -> Sym',
+                               'LogLogComplement[List of Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class OddsPower(LinkFun):
+    __SGN: Final[List[str]] = ['OddsPower[Real, Real] -> Real', 'OddsPower[Sym, Sym] -> Sym',
+                               'OddsPower[List of Real, Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class NegBinomLink(LinkFun):
+    __SGN: Final[List[str]] = ['NegBinomLink[Real, Real] -> Real', 'NegBinomLink[Sym, Sym] -> Sym',
+                               'NegBinomLink[List of Real, Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class PowerLink(LinkFun):
+    __SGN: Final[List[str]] = ['PowerLink[Real, Real] -> Real', 'PowerLink[Sym, Sym] -> Sym',
+                               'PowerLink[List of Real, Real] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
@@ -0,0 +1,1089 @@
+from __future__ import annotations
+
+import math
+from decimal import Decimal, Context, localcontext, getcontext, MAX_EMAX, MIN_EMIN, ROUND_HALF_EVEN, ROUND_CEILING
+from functools import partial
+from typing import Final, Optional, Dict, List, Tuple, Callable, Any
+
+from Core import Type
+from Function import Function
+from Warning import Warning
+
+
+class PrecFun:
+    """
+    Arbitrary precision evaluation toolbox.
+
+    If precision is set, numeric literals and constants are parsed as ``Decimal`` with that many significant digits,
+    and trigonometric, hyperbolic, exponential, and gamma functions are evaluated by the kernels of this toolbox instead
+    of floating point ``math`` functions.
+    Each kernel runs in a local context with guard digits and the result is rounded to the target precision, so the
+    last digit is rarely off by more than one unit.
+    Traps are disabled in the local context, thus overflow and invalid operation do not raise but give +-inf and nan
+    as floating point arithmetic does.
+
+    Kernels are computed as follows.
+        1. Pi is computed by Machin's formula in integer fixed point arithmetic.
+        2. Euler-Mascheroni constant is computed by Brent-McMillan algorithm and Catalan's constant by Ramanujan's
+           series.
+        3. Sine and cosine reduce the argument modulo pi/2 with extra digits as many as the magnitude of the argument,
+           and the reduced argument in [-pi/4, pi/4] is summed by Taylor series.
+        4. Arctangent halves the argument by ``x / (1 + sqrt(1 + x^2))`` until it is less than 1/100, and the reduced
+           argument is summed by Taylor series.
+        5. Exponential, logarithm, and square root are ``Decimal`` methods, which are correctly rounded.
+           Hyperbolic functions and their inverses are built on them with extra digits against cancellation.
+        6. Log gamma function shifts the argument to the right so that Stirling series converges to the target
+           precision, and the shift is undone by product of the skipped factors.
+           Bernoulli numbers are computed from tangent numbers by the recurrence of Brent and Harvey.
+           Negative arguments are reflected.
+
+    Items which are not finite, poles, and finite items out of real domain are delegated to the floating point
+    kernels so that the computation rules and warnings are the same with the ordinary evaluation.
+    Complex results are not representable by ``Decimal``, so they become nan with warning.
+    Also, if some parameter is complex or the function has no arbitrary precision kernel, the whole tensor is
+    evaluated in floating point arithmetic.
+
+    **Reference**
+        * https://docs.python.org/3/library/decimal.html
+        * https://en.wikipedia.org/wiki/Machin-like_formula
+        * https://en.wikipedia.org/wiki/Stirling%27s_approximation
+        * R. P. Brent and E. M. McMillan, Some new algorithms for high-precision computation of Euler's constant,
+          Mathematics of Computation, 34(149), 1980.
+        * R. P. Brent and D. Harvey, Fast computation of Bernoulli, tangent and secant numbers, Computational and
+          Analytical Mathematics, 2013.
+
+    :cvar __GUARD: # of guard digits of local context.
+    :cvar __SHIFT: Lower bound of argument of Stirling series relative to the precision.
+    :cvar __ATAN_RED: Upper bound of reduced argument of arctangent.
+    :cvar __DIGIT: Constants which are taken from the table rather than computed.
+    :cvar __prec: Target precision. None if arbitrary precision mode is off.
+    :cvar __const_tb: Cache of constants keyed by name and precision.
+    :cvar __bern: Cache of Bernoulli numbers B_2, B_4, ... as pairs of numerator and denominator.
+    :cvar __coef_tb: Cache of coefficients of Stirling series keyed by precision.
+    """
+    __GUARD: Final[int] = 10
+    __SHIFT: Final[float] = 1.0
+    __ATAN_RED: Final[Decimal] = Decimal('0.01')
+    __DIGIT: Final[Dict[str, str]] = {
+        'Glaisher': '1.2824271291006226368753425688697917277676889273250011920637400217404063088588265',
+        'Khinchin': '2.6854520010653064453097148354817956938203822939944629530511523455572188595371520'}
+    __prec: Optional[int] = None
+    __const_tb: Dict[Tuple[str, int], Decimal] = {}
+    __bern: List[Tuple[int, int]] = []
+    __coef_tb: Dict[int, List[Decimal]] = {}
+
+    def __new__(cls, *args, **kwargs) -> None:
+        raise NotImplementedError
+
+    @classmethod
+    def __ctx(cls, prec: int) -> Context:
+        """
+        Generate local context.
+
+        Traps are disabled and the exponent range is the widest one, so that the kernels never raise.
+
+        This method is private and called internally as a helper of ``PrecFun``.
+
+        :param prec: Precision of the context.
+        :type prec: int
+
+        :return: Generated context.
+        :rtype: Context
+        """
+        return Context(prec=prec, rounding=ROUND_HALF_EVEN, Emax=MAX_EMAX, Emin=MIN_EMIN, traps=[])
+
+    @classmethod
+    def __atan_inv(cls, n: int, one: int) -> int:
+        """
+        Arctangent of 1/n in integer fixed point arithmetic.
+
+        This method is private and called internally as a helper of ``PrecFun.__pi``.
+
+        :param n: Reciprocal of the point where arctangent is to be computed.
+        :type n: int
+        :param one: Fixed point representation of 1.
+        :type one: int
+
+        :return: Fixed point representation of arctangent of 1/n.
+        :rtype: int
+        """
+        n2: int = n * n
+        x: int = one // n  # Fixed point representation of 1/n^(2k + 1).
+        res: int = x
+        k: int = 1
+
+        while x:
+            x //= n2
+            k += 2
+            res += -(x // k) if k % 4 == 3 else x // k
+
+        return res
+
+    @classmethod
+    def __pi(cls) -> Decimal:
+        """
+        Pi.
+
+        It is computed by Machin's formula ``pi = 16 * atan(1 / 5) - 4 * atan(1 / 239)`` in integer fixed point
+        arithmetic with 10 extra digits.
+
+        This method is private and called internally as a helper of ``PrecFun.__const``.
+
+        :return: Pi in the precision of current context.
+        :rtype: Decimal
+        """
+        digit: int = getcontext().prec + 10
+        one: int = 10 ** digit
+
+        return +Decimal(16 * cls.__atan_inv(5, one) - 4 * cls.__atan_inv(239, one)).scaleb(-digit)
+
+    @classmethod
+    def __euler_gamma(cls) -> Decimal:
+        """
+        Euler-Mascheroni constant.
+
+        It is computed by Brent-McMillan algorithm whose error is O(exp(-4n)).
+
+        This method is private and called internally as a helper of ``PrecFun.__const``.
+
+        :return: Euler-Mascheroni constant in the precision of current context.
+        :rtype: Decimal
+        """
+        with localcontext() as ctx:
+            ctx.prec += 10
+            n: int = math.ceil(ctx.prec * math.log(10) / 4) + 1
+            a: Decimal = -Decimal(n).ln()
+            b: Decimal = Decimal(1)
+            u: Decimal = a
+            v: Decimal = b
+            k: int = 1
+
+            while True:
+                b = b * n * n / (k * k)
+                a = (a * n * n / k + b) / k
+
+                if k > n and u + a == u and v + b == v:
+                    break
+
+                u += a
+                v += b
+                k += 1
+
+            res: Decimal = u / v
+
+        return +res
+
+    @classmethod
+    def __catalan(cls) -> Decimal:
+        """
+        Catalan's constant.
+
+        It is computed by Ramanujan's series
+        ``G = pi / 8 * log(2 + sqrt(3)) + 3 / 8 * sum((n!)^2 / ((2n)! * (2n + 1)^2))``, whose terms decay as 4^(-n).
+
+        This method is private and called internally as a helper of ``PrecFun.__const``.
+
+        :return: Catalan's constant in the precision of current context.
+        :rtype: Decimal
+        """
+        with localcontext() as ctx:
+            ctx.prec += 10
+            t: Decimal = Decimal(1)  # (n!)^2 / (2n)!.
+            s: Decimal = Decimal(1)
+            n: int = 0
+
+            while True:
+                t = t * (n + 1) / (2 * (2 * n + 1))
+                n += 1
+                term: Decimal = t / ((2 * n + 1) * (2 * n + 1))
+
+                if s + term == s:
+                    break
+
+                s += term
+
+            res: Decimal = cls.__const('Pi') / 8 * (2 + Decimal(3).sqrt()).ln() + 3 * s / 8
+
+        return +res
+
+    @classmethod
+    def __const(cls, name: str) -> Decimal:
+        """
+        Find constant in the precision of current context.
+
+        Computed constants are cached by name and precision.
+
+        This method is private and called internally as a helper of ``PrecFun``.
+
+        :param name: Name of the constant.
+        :type name: str
+
+        :return: Constant in the precision of current context.
+        :rtype: Decimal
+        """
+        key: Tuple[str, int] = (name, getcontext().prec)
+        res: Optional[Decimal] = cls.__const_tb.get(key)
+
+        if res is not None:
+            return res
+
+        if name == 'Pi':
+            res = cls.__pi()
+        elif name == 'E':
+            res = Decimal(1).exp()
+        elif name == 'Degree':
+            res = cls.__const('Pi') / 180
+        elif name == 'EulerGamma':
+            res = cls.__euler_gamma()
+        elif name == 'GoldenRatio':
+            res = (1 + Decimal(5).sqrt()) / 2
+        elif name == 'GoldenAngle':
+            res = cls.__const('Pi') * (3 - Decimal(5).sqrt())
+        elif name == 'LogSqrt2Pi':
+            res = (2 * cls.__const('Pi')).ln() / 2
+        elif name == 'Catalan':
+            res = cls.__catalan()
+        elif name in cls.__DIGIT:
+            res = +Decimal(cls.__DIGIT[name])
+        elif name == 'Eps':
+            res = Decimal(1).scaleb(1 + cls.__GUARD - getcontext().prec)
+        else:
+            res = Decimal(Type.Const[name].value)
+
+        cls.__const_tb[key] = res
+
+        return res
+
+    @classmethod
+    def __taylor(cls, x: Decimal, odd: bool, alt: bool) -> Decimal:
+        """
+        Taylor series of sine, cosine, and hyperbolic sine.
+
+        It sums ``x^n / n!`` for odd or even n, with alternating sign if specified, until the terms are negligible.
+
+        This method is private and called internally as a helper of ``PrecFun``.
+
+        :param x: Point where series is to be computed.
+        :type x: Decimal
+        :param odd: Flag for odd terms.
+        :type odd: bool
+        :param alt: Flag for alternating sign.
+        :type alt: bool
+
+        :return: Computed value of series.
+        :rtype: Decimal
+        """
+        x2: Decimal = -x * x if alt else x * x
+        term: Decimal = x if odd else Decimal(1)
+        res: Decimal = term
+        n: int = 1 if odd else 0
+
+        while True:
+            term = term * x2 / ((n + 1) * (n + 2))
+            n += 2
+
+            if res + term == res:
+                return res
+
+            res += term
+
+    @classmethod
+    def __reduce(cls, x: Decimal) -> Tuple[int, Decimal]:
+        """
+        Reduce argument modulo pi/2.
+
+        The quotient is rounded to the nearest integer, so the reduced argument is in [-pi/4, pi/4].
+        Since the reduction cancels as many digits as the magnitude of x, pi/2 is taken with that many extra digits.
+        If the reduced argument is still smaller than 1, it is computed again with extra digits as many as its
+        magnitude.
+
+        This method is private and called internally as a helper of ``PrecFun.__sincos``.
+
+        :param x: Argument to be reduced.
+        :type x: Decimal
+
+        :return: Quotient modulo 4 and reduced argument.
+        :rtype: Tuple[int, Decimal]
+        """
+        extra: int = max(x.adjusted(), 0) + 3
+
+        for _ in range(2):
+            with localcontext() as ctx:
+                ctx.prec += extra
+                half: Decimal = cls.__const('Pi') / 2
+                q: Decimal = (x / half).to_integral_value()
+                r: Decimal = x - q * half
+
+            if not r or r.adjusted() >= 0:
+                break
+
+            extra -= r.adjusted()
+
+        return int(q) % 4, +r
+
+    @classmethod
+    def __sincos(cls, x: Decimal) -> Tuple[Decimal, Decimal]:
+        """
+        Sine and cosine.
+
+        The reduced argument is in [-pi/4, pi/4], so cosine of it is at least 1/sqrt(2).
+        Thus, it is computed from sine by ``sqrt(1 - sin^2)`` without cancellation.
+
+        This method is private and called internally as a helper of ``PrecFun``.
+
+        :param x: Finite point where sine and cosine are to be computed.
+        :type x: Decimal
+
+        :return: Sine and cosine.
+        :rtype: Tuple[Decimal, Decimal]
+        """
+        q, r = cls.__reduce(x)
+        s: Decimal = cls.__taylor(r, True, True)
+        c: Decimal = (1 - s * s).sqrt()
+
+        return ((s, c), (c, -s), (-s, -c), (-c, s))[q]
+
+    @classmethod
+    def __tan(cls, x: Decimal) -> Decimal:
+        s, c = cls.__sincos(x)
+
+        return s / c
+
+    @classmethod
+    def __sinpi(cls, x: Decimal) -> Decimal:
+        """
+        Sine of pi times x.
+
+        The integer part of x is split off exactly, so that the result does not lose digits near integers.
+
+        This method is private and called internally as a helper of ``PrecFun.__gamma`` and ``PrecFun.__lgamma``.
+
+        :param x: Finite point where sine of pi times x is to be computed.
+        :type x: Decimal
+
+        :return: Computed value.
+        :rtype: Decimal
+        """
+        n: Decimal = x.to_integral_value()
+        res: Decimal = cls.__sincos(cls.__const('Pi') * (x - n))[0]
+
+        return -res if n % 2 else res
+
+    @classmethod
+    def __atan(cls, x: Decimal) -> Decimal:
+        """
+        Arctangent.
+
+        Arguments greater than 1 in absolute value are replaced by their reciprocals.
+        Then the argument is halved by ``atan(x) = 2 * atan(x / (1 + sqrt(1 + x^2)))`` until it is less than 1/100,
+        and summed by Taylor series.
+
+        This method is private and called internally as a helper of ``PrecFun``.
+
+        :param x: Point where arctangent is to be computed. It can be +-inf.
+        :type x: Decimal
+
+        :return: Computed value of arctangent.
+        :rtype: Decimal
+        """
+        if x.is_infinite():
+            return (cls.__const('Pi') / 2).copy_sign(x)
+
+        y: Decimal = abs(x)
+        inv: bool = y > 1
+
+        if inv:
+            y = 1 / y
+
+        k: int = 0
+
+        while y > cls.__ATAN_RED:
+            y = y / (1 + (1 + y * y).sqrt())
+            k += 1
+
+        y2: Decimal = -y * y
+        term: Decimal = y
+        res: Decimal = y
+        n: int = 1
+
+        while True:
+            term *= y2
+            n += 2
+
+            if res + term / n == res:
+                break
+
+            res += term / n
+
+        res *= 2 ** k
+
+        if inv:
+            res = cls.__const('Pi') / 2 - res
+
+        return res.copy_sign(x)
+
+    @classmethod
+    def __log1p(cls, x: Decimal) -> Decimal:
+        """
+        Log of 1 + x.
+
+        1 + x is taken with extra digits as many as the magnitude of x so that small x does not lose its digits.
+
+        This method is private and called internally as a helper of ``PrecFun``.
+
+        :param x: Point where function is to be computed. It is greater than -1.
+        :type x: Decimal
+
+        :return: Computed value.
+        :rtype: Decimal
+        """
+        with localcontext() as ctx:
+            ctx.prec += max(-x.adjusted(), 0) + 2
+            res: Decimal = (1 + x).ln()
+
+        return +res
+
+    @classmethod
+    def __sinh(cls, x: Decimal) -> Decimal:
+        """
+        Hyperbolic sine.
+
+        If x is in (-1, 1), it is summed by Taylor series to avoid cancellation.
+        Otherwise, it is ``(exp(x) - exp(-x)) / 2``.
+
+        This method is private and called internally as a helper of ``PrecFun``.
+
+        :param x: Finite point where hyperbolic sine is to be computed.
+        :type x: Decimal
+
+        :return: Computed value of hyperbolic sine.
+        :rtype: Decimal
+        """
+        if abs(x) < 1:
+            return cls.__taylor(x, True, False)
+
+        e: Decimal = x.exp()
+
+        return (e - 1 / e) / 2
+
+    @classmethod
+    def __cosh(cls, x: Decimal) -> Decimal:
+        e: Decimal = x.exp()
+
+        return (e + 1 / e) / 2
+
+    @classmethod
+    def __tanh(cls, x: Decimal) -> Decimal:
+        """
+        Hyperbolic tangent.
+
+        If x is in (-1, 1), it is ``sinh(x) / sqrt(1 + sinh(x)^2)``.
+        Otherwise, it is ``(1 - exp(-2|x|)) / (1 + exp(-2|x|))`` with the sign of x, which does not overflow.
+
+        This method is private and called internally as a helper of ``PrecFun``.
+
+        :param x: Finite point where hyperbolic tangent is to be computed.
+        :type x: Decimal
+
+        :return: Computed value of hyperbolic tangent.
+        :rtype: Decimal
+        """
+        if abs(x) < 1:
+            s: Decimal = cls.__taylor(x, True, False)
+
+            return s / (1 + s * s).sqrt()
+
+        e: Decimal = (-2 * abs(x)).exp()
+
+        return ((1 - e) / (1 + e)).copy_sign(x)
+
+    @classmethod
+    def __asinh(cls, x: Decimal) -> Decimal:
+        """
+        Inverse hyperbolic sine.
+
+        It is ``log1p(|x| + x^2 / (1 + sqrt(1 + x^2)))`` with the sign of x, which does not cancel for small x.
+
+        This method is private and called internally as a helper of ``PrecFun``.
+
+        :param x: Finite point where inverse hyperbolic sine is to be computed.
+        :type x: Decimal
+
+        :return: Computed value of inverse hyperbolic sine.
+        :rtype: Decimal
+        """
+        if not x:
+            return x
+
+        y: Decimal = abs(x)
+
+        return cls.__log1p(y + y * y / (1 + (1 + y * y).sqrt())).copy_sign(x)
+
+    @classmethod
+    def __acosh(cls, x: Decimal) -> Optional[Decimal]:
+        """
+        Inverse hyperbolic cosine.
+
+        With t = x - 1, it is ``log1p(t + sqrt(t * (t + 2)))``, which does not cancel near 1.
+        The result is None if x is less than 1.
+
+        This method is private and called internally as a helper of ``PrecFun``.
+
+        :param x: Finite point where inverse hyperbolic cosine is to be computed.
+        :type x: Decimal
+
+        :return: Computed value of inverse hyperbolic cosine.
+        :rtype: Optional[Decimal]
+        """
+        if x < 1:
+            return None
+
+        t: Decimal = x - 1
+
+        return cls.__log1p(t + (t * (t + 2)).sqrt()) if t else t
+
+    @classmethod
+    def __atanh(cls, x: Decimal) -> Optional[Decimal]:
+        """
+        Inverse hyperbolic tangent.
+
+        It is ``log1p(2x / (1 - x)) / 2``, which does not cancel near 0.
+        The result is None if x is not in (-1, 1).
+
+        This method is private and called internally as a helper of ``PrecFun``.
+
+        :param x: Finite point where inverse hyperbolic tangent is to be computed.
+        :type x: Decimal
+
+        :return: Computed value of inverse hyperbolic tangent.
+        :rtype: Optional[Decimal]
+        """
+        if abs(x) >= 1:
+            return None
+
+        return cls.__log1p(2 * x / (1 - x)) / 2 if x else x
+
+    @classmethod
+    def __asin(cls, x: Decimal) -> Optional[Decimal]:
+        if abs(x) > 1:
+            return None
+
+        return cls.__atan(x / ((1 - x) * (1 + x)).sqrt())
+
+    @classmethod
+    def __acos(cls, x: Decimal) -> Optional[Decimal]:
+        if abs(x) > 1:
+            return None
+
+        return 2 * cls.__atan(((1 - x) / (1 + x)).sqrt())
+
+    @classmethod
+    def __acot(cls, x: Decimal) -> Decimal:
+        return cls.__atan(1 / x) if x else cls.__const('Pi') / 2
+
+    @classmethod
+    def __root(cls, x: Decimal, n: int) -> Decimal:
+        """
+        Real nth root.
+
+        The initial guess ``exp(log(|x|) / n)`` with the sign of x is refined by one step of Newton's method.
+
+        This method is private and called internally as a helper of ``PrecFun``.
+
+        :param x: Finite nonzero point where root is to be computed.
+        :type x: Decimal
+        :param n: Nonzero integer order of root.
+        :type n: int
+
+        :return: Computed value of root.
+        :rtype: Decimal
+        """
+        r: Decimal = (abs(x).ln() / n).exp().copy_sign(x)
+
+        return r - (r ** n - x) / (n * r ** (n - 1))
+
+    @classmethod
+    def __surd(cls, x: Decimal, n: Decimal) -> Optional[Decimal]:
+        if not x or n != n.to_integral_value() or not n or (x < 0 and n % 2 == 0):
+            return None
+
+        return cls.__root(x, int(n))
+
+    @classmethod
+    def __pow(cls, x: Decimal, y: Decimal) -> Optional[Decimal]:
+        if (x < 0 and y != y.to_integral_value()) or (not x and y <= 0):
+            return None
+
+        return x ** y
+
+    @classmethod
+    def __log(cls, x: Decimal, b: Decimal = None) -> Optional[Decimal]:
+        if b is None:
+            return x.ln() if x > 0 else None
+
+        if x <= 0 or b <= 0 or b == 1:
+            return None
+
+        return x.ln() / b.ln()
+
+    @classmethod
+    def __bern_get(cls, n: int) -> None:
+        """
+        Compute Bernoulli numbers.
+
+        Bernoulli numbers B_2, ..., B_2n are computed from tangent numbers T_1, ..., T_n by
+        ``B_2k = (-1)^(k - 1) * 2k * T_k / (4^k * (4^k - 1))``, and the tangent numbers are computed by the
+        recurrence of Brent and Harvey in O(n^2) integer operations.
+
+        This method is private and called internally as a helper of ``PrecFun.__stirling``.
+
+        :param n: # of Bernoulli numbers to be computed.
+        :type n: int
+        """
+        t: List[int] = [0] * (n + 1)
+        t[1] = 1
+
+        for k in range(2, n + 1):
+            t[k] = (k - 1) * t[k - 1]
+
+        for k in range(2, n + 1):
+            for j in range(k, n + 1):
+                t[j] = (j - k) * t[j - 1] + (j - k + 2) * t[j]
+
+        cls.__bern = [((-1) ** (k - 1) * 2 * k * t[k], 4 ** k * (4 ** k - 1)) for k in range(1, n + 1)]
+
+    @classmethod
+    def __coef(cls, k: int) -> Decimal:
+        """
+        Find kth coefficient of Stirling series, that is, ``B_2k / (2k * (2k - 1))``.
+
+        Coefficients are cached for each precision since the conversion of Bernoulli numbers to ``Decimal`` costs as
+        much as the series itself.
+
+        This method is private and called internally as a helper of ``PrecFun.__stirling``.
+
+        :param k: Index of coefficient starting from 1.
+        :type k: int
+
+        :return: Coefficient in the precision of current context.
+        :rtype: Decimal
+        """
+        tb: List[Decimal] = cls.__coef_tb.setdefault(getcontext().prec, [])
+
+        while len(tb) < k:
+            if len(tb) >= len(cls.__bern):
+                cls.__bern_get(2 * len(tb) + 16)
+
+            num, den = cls.__bern[len(tb)]
+            tb.append(Decimal(num) / (den * 2 * (len(tb) + 1) * (2 * len(tb) + 1)))
+
+        return tb[k - 1]
+
+    @classmethod
+    def __stirling(cls, z: Decimal) -> Decimal:
+        """
+        Stirling series of log gamma function.
+
+        It is ``(z - 1/2) * log(z) - z + log(2pi) / 2 + sum(B_2k / (2k * (2k - 1) * z^(2k - 1)))``, which is summed
+        until the terms are negligible.
+
+        This method is private and called internally as a helper of ``PrecFun.__lgamma_pos``.
+
+        :param z: Point where series is to be computed. It is large enough for the precision of current context.
+        :type z: Decimal
+
+        :return: Computed value of series.
+        :rtype: Decimal
+        """
+        res: Decimal = (z - Decimal('0.5')) * z.ln() - z + cls.__const('LogSqrt2Pi')
+        z2: Decimal = 1 / (z * z)
+        p: Decimal = 1 / z  # z^-(2k - 1).
+        k: int = 1
+
+        while True:
+            term: Decimal = p * cls.__coef(k)
+
+            if res + term == res:
+                return res
+
+            res += term
+            p *= z2
+            k += 1
+
+    @classmethod
+    def __lgamma_pos(cls, x: Decimal) -> Tuple[Decimal, Decimal]:
+        """
+        Log gamma function of x which is at least 1/2.
+
+        x is shifted to z = x + m which is at least the precision, where Stirling series converges to the precision
+        with fewer terms than the precision.
+        The shift is undone by the product of x, ..., x + m - 1.
+        The product is returned separately so that gamma function can divide by it instead of subtracting its log.
+
+        This method is private and called internally as a helper of ``PrecFun.__gamma`` and ``PrecFun.__lgamma``.
+
+        :param x: Point where log gamma function is to be computed.
+        :type x: Decimal
+
+        :return: Log gamma function of z and the product of skipped factors.
+        :rtype: Tuple[Decimal, Decimal]
+        """
+        m: int = max(math.ceil(cls.__SHIFT * getcontext().prec) - int(x), 0)
+        prod: Decimal = Decimal(1)
+
+        for i in range(m):
+            prod *= x + i
+
+        return cls.__stirling(x + m), prod
+
+    @classmethod
+    def __gamma(cls, x: Decimal) -> Optional[Decimal]:
+        """
+        Gamma function.
+
+        Since exponential amplifies the absolute error of its argument, log gamma function is computed with extra
+        digits as many as the magnitude of its value.
+        If x is less than 1/2, it is reflected by ``gamma(x) = pi / (sin(pi * x) * gamma(1 - x))``.
+        The result is None if x is nonpositive integer.
+
+        This method is private and called internally as a helper of ``PrecFun``.
+
+        :param x: Finite point where gamma function is to be computed.
+        :type x: Decimal
+
+        :return: Computed value of gamma function.
+        :rtype: Optional[Decimal]
+        """
+        if x <= 0 and x == x.to_integral_value():
+            return None
+
+        if x < Decimal('0.5'):
+            return cls.__const('Pi') / (cls.__sinpi(x) * cls.__gamma(1 - x))
+
+        with localcontext() as ctx:
+            ctx.prec += 2 * max(x.adjusted() + 1, len(str(ctx.prec))) + 2
+            lg, prod = cls.__lgamma_pos(x)
+            res: Decimal = lg.exp() / prod
+
+        return +res
+
+    @classmethod
+    def __lgamma(cls, x: Decimal) -> Optional[Decimal]:
+        """
+        Log gamma function.
+
+        It is log of the absolute value of gamma function, as ``math.lgamma``.
+        If x is less than 1/2, it is reflected by ``lgamma(x) = log(pi / |sin(pi * x)|) - lgamma(1 - x)``.
+        The result is exactly 0 at 1 and 2, and None if x is nonpositive integer.
+
+        This method is private and called internally as a helper of ``PrecFun``.
+
+        :param x: Finite point where log gamma function is to be computed.
+        :type x: Decimal
+
+        :return: Computed value of log gamma function.
+        :rtype: Optional[Decimal]
+        """
+        if x <= 0 and x == x.to_integral_value():
+            return None
+
+        if x == 1 or x == 2:
+            return Decimal(0)
+
+        if x < Decimal('0.5'):
+            return (cls.__const('Pi') / abs(cls.__sinpi(x))).ln() - cls.__lgamma(1 - x)
+
+        with localcontext() as ctx:
+            ctx.prec += len(str(ctx.prec)) + 2
+            lg, prod = cls.__lgamma_pos(x)
+            res: Decimal = lg - prod.ln()
+
+        return +res
+
+    @classmethod
+    def __sgn(cls, x: Decimal) -> int:
+        """
+        Sign of gamma function.
+
+        Gamma function of finite x which is not pole is positive iff x is positive or in (2n, 2n+1) for some negative
+        integer n.
+
+        This method is private and called internally as a helper of ``PrecFun.__beta``.
+
+        :param x: Point where sign of gamma function is to be computed.
+        :type x: Decimal
+
+        :return: Sign of gamma function.
+        :rtype: int
+        """
+        return 1 if x > 0 or int(x.to_integral_value(ROUND_CEILING)) % 2 == 1 else -1
+
+    @classmethod
+    def __beta(cls, x: Decimal, y: Decimal) -> Optional[Decimal]:
+        """
+        Beta function.
+
+        Since gamma functions of huge parameters overflow even in ``Decimal``, it is computed as
+        ``exp(lgamma(x) + lgamma(y) - lgamma(x + y))`` with the sign recovered from the signs of gamma functions.
+        The log gamma functions are computed with extra digits as many as twice the magnitude of parameters, against
+        the cancellation of the sum and the amplification by exponential.
+        The result is None if x, y, or x + y is nonpositive integer.
+
+        This method is private and called internally as a helper of ``PrecFun``.
+
+        :param x: First coordinate of point where beta function is to be computed.
+        :type x: Decimal
+        :param y: Second coordinate of point where beta function is to be computed.
+        :type y: Decimal
+
+        :return: Computed value of beta function.
+        :rtype: Optional[Decimal]
+        """
+        s: Decimal = x + y
+
+        if any(it <= 0 and it == it.to_integral_value() for it in (x, y, s)):
+            return None
+
+        with localcontext() as ctx:
+            ctx.prec += 2 * max(x.adjusted(), y.adjusted(), s.adjusted(), 0) + 5
+            res: Decimal = (cls.__lgamma(x) + cls.__lgamma(y) - cls.__lgamma(x + y)).exp()
+
+        return +res * cls.__sgn(x) * cls.__sgn(y) * cls.__sgn(s)
+
+    @classmethod
+    def __kern(cls, name: str) -> Optional[Callable[..., Optional[Decimal]]]:
+        """
+        Find arbitrary precision kernel of function.
+
+        Kernels take finite ``Decimal`` parameters and return None if the parameters are pole or out of real domain.
+
+        This method is private and called internally as a helper of ``PrecFun.eval``.
+
+        :param name: Name of function.
+        :type name: str
+
+        :return: Kernel of function. None if there is no kernel for the function.
+        :rtype: Optional[Callable[..., Optional[Decimal]]]
+        """
+        if name == 'Sin':
+            return lambda x: cls.__sincos(x)[0]
+        elif name == 'Cos':
+            return lambda x: cls.__sincos(x)[1]
+        elif name == 'Tan':
+            return cls.__tan
+        elif name == 'Csc':
+            return lambda x: 1 / cls.__sincos(x)[0] if x else None
+        elif name == 'Sec':
+            return lambda x: 1 / cls.__sincos(x)[1]
+        elif name == 'Cot':
+            return lambda x: 1 / cls.__tan(x) if x else None
+        elif name == 'ArcSin':
+            return cls.__asin
+        elif name == 'ArcCos':
+            return cls.__acos
+        elif name == 'ArcTan':
+            return cls.__atan
+        elif name == 'ArcCsc':
+            return lambda x: cls.__asin(1 / x) if abs(x) >= 1 else None
+        elif name == 'ArcSec':
+            return lambda x: cls.__acos(1 / x) if abs(x) >= 1 else None
+        elif name == 'ArcCot':
+            return cls.__acot
+        elif name == 'Haversine':
+            return lambda x: cls.__sincos(x / 2)[0] ** 2
+        elif name == 'InverseHaversine':
+            return lambda x: 2 * cls.__asin(x.sqrt()) if 0 <= x <= 1 else None
+        elif name == 'Sinc':
+            return lambda x: cls.__sincos(x)[0] / x if x else Decimal(1)
+        elif name == 'Sinh':
+            return cls.__sinh
+        elif name == 'Cosh':
+            return cls.__cosh
+        elif name == 'Tanh':
+            return cls.__tanh
+        elif name == 'Csch':
+            return lambda x: 1 / cls.__sinh(x) if x else None
+        elif name == 'Sech':
+            return lambda x: 1 / cls.__cosh(x)
+        elif name == 'Coth':
+            return lambda x: 1 / cls.__tanh(x) if x else None
+        elif name == 'ArcSinh':
+            return cls.__asinh
+        elif name == 'ArcCosh':
+            return cls.__acosh
+        elif name == 'ArcTanh':
+            return cls.__atanh
+        elif name == 'ArcCsch':
+            return lambda x: cls.__asinh(1 / x) if x else None
+        elif name == 'ArcSech':
+            return lambda x: cls.__acosh(1 / x) if 0 < x <= 1 else None
+        elif name == 'ArcCoth':
+            return lambda x: cls.__atanh(1 / x) if abs(x) > 1 else None
+        elif name == 'Gudermannian':
+            return lambda x: 2 * cls.__atan(cls.__tanh(x / 2))
+        elif name == 'InverseGudermannian':
+            return lambda x: cls.__asinh(cls.__tan(x)) if abs(x) < cls.__const('Pi') / 2 else None
+        elif name == 'Exp':
+            return Decimal.exp
+        elif name == 'Log':
+            return cls.__log
+        elif name == 'Log2':
+            return lambda x: x.ln() / Decimal(2).ln() if x > 0 else None
+        elif name == 'Log10':
+            return lambda x: x.log10() if x > 0 else None
+        elif name == 'Power':
+            return cls.__pow
+        elif name == 'Sqrt':
+            return lambda x: x.sqrt() if x >= 0 else None
+        elif name == 'CubeRoot':
+            return lambda x: cls.__root(x, 3) if x else x
+        elif name == 'Surd':
+            return cls.__surd
+        elif name == 'Gamma':
+            return cls.__gamma
+        elif name == 'LogGamma':
+            return cls.__lgamma
+        elif name == 'Beta':
+            return cls.__beta
+        else:
+            return None
+
+    @classmethod
+    def __apply(cls, fun: type, kern: Callable[..., Optional[Decimal]], warn: List[Warning.InterpWarn],
+                *x: Decimal) -> Decimal:
+        """
+        Apply kernel to parameters.
+
+        If parameters are not finite or the kernel gives None, the result follows the computation rules of the
+        floating point kernel, and the warnings it generates are appended to ``warn``.
+        Complex results are not representable, so they are nan with DOMAIN_OUT warning.
+
+        This method is private and called internally as a helper of ``PrecFun.eval``.
+
+        :param fun: Function to be applied.
+        :type fun: type
+        :param kern: Arbitrary precision kernel of function.
+        :type kern: Callable[..., Optional[Decimal]]
+        :param warn: List of generated warnings.
+        :type warn: List[Warning.InterpWarn]
+        :param x: Parameters.
+        :type x: Decimal
+
+        :return: Computed value.
+        :rtype: Decimal
+        """
+        res: Optional[Decimal] = kern(*x) if all(map(Decimal.is_finite, x)) else None
+
+        if res is not None:
+            return res
+
+        res, res_warn = fun.eval(*map(float, x))
+        warn += res_warn
+
+        if type(res) == complex:
+            warn.append(Warning.InterpWarn(Type.InterpWarnT.DOMAIN_OUT, 97))
+
+            return Decimal('NaN')
+        else:
+            return Decimal(res)
+
+    @classmethod
+    def __to_float(cls, x: Any) -> Any:
+        """
+        Cast ``Decimal`` items of parameter to float.
+
+        This method is private and called internally as a helper of ``PrecFun.eval``.
+
+        :param x: Parameter to be cast. It can be either scalar or tensor.
+        :type x: Any
+
+        :return: Parameter whose ``Decimal`` items are cast to float.
+        :rtype: Any
+        """
+        x, shape = Function.Fun.flat(x)
+
+        return Function.Fun.unflat([float(it) if type(it) == Decimal else it for it in x], shape)
+
+    @classmethod
+    def prec(cls) -> Optional[int]:
+        """
+        Getter for target precision.
+
+        :return: # of significant digits. None if arbitrary precision mode is off.
+        :rtype: Optional[int]
+        """
+        return cls.__prec
+
+    @classmethod
+    def set_prec(cls, prec: Optional[int]) -> None:
+        """
+        Setter for target precision.
+
+        :param prec: # of significant digits. None turns arbitrary precision mode off.
+        :type prec: Optional[int]
+        """
+        cls.__prec = prec
+
+    @classmethod
+    def const(cls, name: str) -> Decimal:
+        """
+        Find constant in the target precision.
+
+        :param name: Name of the constant. It is one of the names of ``Type.Const``.
+        :type name: str
+
+        :return: Constant in the target precision.
+        :rtype: Decimal
+        """
+        with localcontext(cls.__ctx(cls.__prec + cls.__GUARD)):
+            res: Decimal = cls.__const(name)
+
+        return cls.__ctx(cls.__prec).plus(res)
+
+    @classmethod
+    def eval(cls, fun: type, *args: Any) -> Tuple[Any, List[Warning.InterpWarn]]:
+        """
+        Evaluate function in arbitrary precision.
+
+        Parameters can be either scalar or tensor, and they are broadcast to the common shape.
+        Items are cast to ``Decimal`` exactly, evaluated by the kernel in the local context with guard digits, and
+        rounded to the target precision.
+        While the kernels run, arbitrary precision mode is turned off so that the floating point kernels used for
+        non-finite items do not come back here.
+        If some parameter is complex or the function has no arbitrary precision kernel, ``Decimal`` items are cast to
+        float and the whole tensor is evaluated by ``fun.eval``.
+
+        It generates warnings for followings cases, each at most once per call.
+            1. Some item of the result is complex, which is not representable. (DOMAIN_OUT)
+            2. Some item is delegated to the floating point kernel. Warnings of ``fun.eval`` for the item, including
+               those for nan, inf, poles, and items out of domain, are passed through.
+            3. The whole tensor is evaluated in floating point arithmetic. Warnings of ``fun.eval`` are passed through.
+
+        :param fun: Function to be evaluated.
+        :type fun: type
+        :param args: Parameters where function is to be computed.
+        :type args: Any
+
+        :return: Computed value and list of generated warnings.
+        :rtype: Tuple[Any, List[Warning.InterpWarn]]
+        """
+        arg, shape = Function.Fun.bcast(*args)
+        kern: Optional[Callable[..., Optional[Decimal]]] = cls.__kern(fun.__name__)
+        warn: List[Warning.InterpWarn] = []
+        prec: int = cls.__prec
+        cls.__prec = None
+
+        try:
+            if kern is None or any(type(it) == complex for x in arg for it in x):
+                return fun.eval(*map(cls.__to_float, args))
+
+            with localcontext(cls.__ctx(prec + cls.__GUARD)):
+                res: List[Decimal] = list(map(partial(cls.__apply, fun, kern, warn),
+                                              *[list(map(Decimal, x)) for x in arg]))
+        finally:
+            cls.__prec = prec
+
+        res = list(map(cls.__ctx(prec).plus, res))
+        warn = list({(it.warn_t, it.warn_no): it for it in warn}.values())
+
+        return Function.Fun.unflat(res, shape), warn
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import cmath
+import math
+from itertools import chain
+from typing import final, Final, Optional, Dict, List, Tuple
+
+from Core import Polynomial, Token, TypeSystem
+from Function import Function
+from Warning import Warning
+
+
+class RootFun(Function.Fun):
+    """
+    Root finding function toolbox.
+
+    Polynomial is given by the list of its coefficients in ascending order of degree, as ``Polynomial.UniPoly`` keeps
+    them.
+    That is, ``Roots[{-1, 0, 1}]`` finds the roots of ``x ** 2 - 1``.
+    List of lists is a batch of polynomials, which need not be of the same degree.
+    Polynomials of the same degree in the batch are solved in a single stacked computation, so that the roots of
+    thousands of characteristic polynomials cost a few hundred ``map`` calls rather than thousands of solves.
+    For the algorithms, refer to the comments of ``Polynomial.PolyArith.roots_batch``.
+    """
+
+    def __new__(cls, *args, **kwargs) -> None:
+        raise NotImplementedError
+
+    @classmethod
+    def chk_t(cls, rt: Token.Tok, t_env: Dict[int, TypeSystem.T]) -> Optional[Dict[int, TypeSystem.T]]:
+        """
+        Type checker for root finding functions.
+
+        Parameter must be a list or a list of lists of real or complex coefficients.
+        Roots are complex, and their # is not known until leading zero coefficients are stripped.
+        Thus the result is a list of the same fold with the parameter, whose length is not fixed.
+        Symbolic parameter is typed as symbol.
+
+        :param rt: Token to be type checked.
+        :type rt: Token.Tok
+        :param t_env: Type environment.
+        :type t_env: Dict[int, TypeSystem.T]
+
+        :return: Type environment if type check succeeds. None otherwise.
+        :rtype: Optional[Dict[int, TypeSystem.T]]
+        """
+        if rt.argc != 1:
+            return None
+
+        t: TypeSystem.T = rt.chd[0].t
+
+        if type(t) == TypeSystem.Sym:
+            rt.t = t
+        elif type(t) in [TypeSystem.Tens, TypeSystem.Arr] and t.fold in [1, 2] and \
+                type(t.chd_t) in [TypeSystem.Real, TypeSystem.Cmplx]:
+            rt.t = TypeSystem.Arr(TypeSystem.Cmplx.inst(), t.fold)
+        else:
+            return None
+
+        return t_env
+
+    @classmethod
+    def eval(cls, x: list) -> Tuple[list, List[Warning.InterpWarn]]:
+        """
+        Evaluate root finding function.
+
+        Parameter is a list of coefficients or a list of such lists.
+        Roots of each polynomial are with multiplicity and sorted by real part and then by imaginary part.
+        Polynomial having nan or inf coefficient has nan roots, as many as its length minus 1.
+
+        It generates warnings for followings cases, each at most once per call.
+            1. Some coefficient exceeds floating point max/min size. (BIG_INT/SMALL_INT, resp.)
+            2. Some coefficient is nan. (NAN_DETECT)
+            3. Some coefficient is +-inf. (INF_DETECT)
+
+        :param x: Coefficients of polynomials in ascending order of degree.
+        :type x: list
+
+        :return: Computed roots and list of generated warnings.
+        :rtype: Tuple[list, List[Warning.InterpWarn]]
+        """
+        batch: bool = bool(x) and type(x[0]) == list
+        coef: List[list] = x if batch else [x]
+        flat, warn, fast = cls.chk_arg(list(chain.from_iterable(coef)))
+
+        if fast:
+            res: List[List[complex]] = Polynomial.PolyArith.roots_batch(coef)
+        else:
+            ofs: List[int] = [0, *map(len, coef)]
+
+            for i in range(1, len(ofs)):
+                ofs[i] += ofs[i - 1]
+
+            coef = [flat[ofs[i]:ofs[i + 1]] for i in range(len(coef))]
+            ok: List[bool] = [all(map(cmath.isfinite, c)) for c in coef]
+            res: List[List[complex]] = Polynomial.PolyArith.roots_batch([c for c, f in zip(coef, ok) if f])
+            res.reverse()
+            res = [res.pop() if f else [complex(math.nan, math.nan)] * max(len(c) - 1, 0) for c, f in zip(coef, ok)]
+
+        return (res if batch else res[0]), warn
+
+
+@final
+class Roots(RootFun):
+    __SGN: Final[List[str]] = ['Roots[List of Real] -> List of Cmplx', 'Roots[List of Cmplx] -> List of Cmplx',
+                               'Roots[List of List of Real] -> List of List of Cmplx',
+                               'Roots[List of List of Cmplx] -> List of List of Cmplx', 'Roots[Sym] -> Sym']
+
+    def __new__(cls, *args, **kwargs) -> None:
+        raise NotImplementedError
@@ -1,16 +1,339 @@
-from typing import final, Final, List
+from __future__ import annotations
 
+import math
+from itertools import repeat
+from operator import abs as absolute, add, ge, lt, mod, mul, neg, sub, truediv
+from typing import final, Final, Optional, Dict, List, Tuple, Union, Callable
+
+from Core import Token, TypeSystem, Type
 from Function import Function
+from Warning import Warning
 
 
 class SigFun(Function.Fun):
+    """
+    Signal function toolbox.
+
+    Signal functions are used to synthesize waveforms over large time grids, so a whole grid is computed by a single
+    chain of ``map`` calls.
+    Periodic waveforms take optional period, and ``SquareWave`` takes optional duty cycle as well.
+    They are broadcast against the time grid so that, say, a bank of waveforms of different periods can be computed
+    at once.
+    The phase of a periodic waveform is ``(x % p) / p``, which always lies in [0, 1) regardless of the signs of x and
+    p since ``%`` takes the sign of the divisor.
+    Also, ``x % p`` is exact in floating point arithmetic, so the phase does not drift for huge x.
+
+    :cvar __DUTY: Default duty cycle of ``SquareWave``.
+    """
+    __DUTY: Final[float] = 0.5
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
+    @classmethod
+    def __phase(cls, x: float, p: float) -> float:
+        """
+        Phase of periodic waveform.
+
+        If x is not finite, or p is not finite or 0, the result is nan.
+
+        This method is private and called internally as a helper of the computation kernels.
+
+        :param x: Point where phase is to be computed.
+        :type x: float
+        :param p: Period.
+        :type p: float
+
+        :return: Phase in [0, 1).
+        :rtype: float
+        """
+        if not (math.isfinite(x) and math.isfinite(p)) or p == 0:
+            return math.nan
+
+        return x % p / p
+
+    @classmethod
+    def __ramp(cls, x: float) -> float:
+        """
+        Ramp function.
+
+        Ramp function with parameter x has following computation rules.
+            1. If x is nan, the result is nan.
+            2. If x is negative including -inf, the result is 0.
+            3. Otherwise, the result is x itself.
+
+        This method is private and called internally as a helper of ``SigFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``SigFun.eval``.
+
+        :param x: Point where ramp function is to be computed.
+        :type x: float
+
+        :return: Computed value of ramp function.
+        :rtype: float
+        """
+        return max(x, 0.0)
+
+    @classmethod
+    def __unitize(cls, x: float, dx: float = None) -> float:
+        """
+        Unitize function.
+
+        Unitize function with parameter x and tolerance dx has following computation rules.
+            1. If x or dx is nan, the result is nan.
+            2. If dx is not given, the result is 0 if x is 0 and 1 otherwise.
+            3. If dx is given, the result is 0 if ``|x| < dx`` and 1 otherwise.
+
+        This method is private and called internally as a helper of ``SigFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``SigFun.eval``.
+
+        :param x: Point where unitize function is to be computed.
+        :type x: float
+        :param dx: Tolerance. (Default: None)
+        :type dx: float
+
+        :return: Computed value of unitize function.
+        :rtype: float
+        """
+        if math.isnan(x) or (dx is not None and math.isnan(dx)):
+            return math.nan
+        elif dx is None:
+            return 0.0 if x == 0 else 1.0
+        else:
+            return 0.0 if abs(x) < dx else 1.0
+
+    @classmethod
+    def __logistic(cls, x: float) -> float:
+        """
+        Logistic function.
+
+        Logistic function with parameter x has following computation rules.
+            1. If x is nan, the result is nan.
+            2. If x is -inf, the result is 0.
+            3. If x is +inf, the result is 1.
+            4. If x is finite nonnegative, the result is ``1 / (1 + exp(-x))``.
+            5. If x is finite negative, the result is ``exp(x) / (1 + exp(x))``.
+        Here, the rule 5 avoids overflow of ``exp(-x)`` and keeps the relative accuracy of tiny results.
+
+        This method is private and called internally as a helper of ``SigFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``SigFun.eval``.
+
+        :param x: Point where logistic function is to be computed.
+        :type x: float
+
+        :return: Computed value of logistic function.
+        :rtype: float
+        """
+        if math.isnan(x):
+            return x
+        elif x >= 0:
+            return 1 / (1 + math.exp(-x))
+
+        e: float = math.exp(x)
+
+        return e / (1 + e)
+
+    @classmethod
+    def __square(cls, x: float, p: float = 1.0, d: float = __DUTY) -> float:
+        """
+        Square wave.
+
+        Square wave with parameter x, period p and duty cycle d has following computation rules.
+            1. If x, p, or d is nan, the result is nan.
+            2. If x is +-inf, or p is +-inf or 0, the result is nan.
+            3. Otherwise, the result is 1 if the phase is less than d and -1 otherwise.
+
+        This method is private and called internally as a helper of ``SigFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``SigFun.eval``.
+
+        :param x: Point where square wave is to be computed.
+        :type x: float
+        :param p: Period. (Default: 1)
+        :type p: float
+        :param d: Duty cycle. (Default: 0.5)
+        :type d: float
+
+        :return: Computed value of square wave.
+        :rtype: float
+        """
+        t: float = cls.__phase(x, p)
+
+        if math.isnan(t) or math.isnan(d):
+            return math.nan
+
+        return 1.0 if t < d else -1.0
+
+    @classmethod
+    def __triangle(cls, x: float, p: float = 1.0) -> float:
+        """
+        Triangle wave.
+
+        Triangle wave with parameter x and period p has following computation rules.
+            1. If x or p is nan, the result is nan.
+            2. If x is +-inf, or p is +-inf or 0, the result is nan.
+            3. Otherwise, the result is ``1 - 4 * |t - 1/2|`` where t is the phase shifted by a quarter period.
+        Thus, it is 0 at x = 0 and rises to 1 at a quarter period.
+
+        This method is private and called internally as a helper of ``SigFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``SigFun.eval``.
+
+        :param x: Point where triangle wave is to be computed.
+        :type x: float
+        :param p: Period. (Default: 1)
+        :type p: float
+
+        :return: Computed value of triangle wave.
+        :rtype: float
+        """
+        return 1 - 4 * abs((cls.__phase(x, p) + 0.25) % 1 - 0.5)
+
+    @classmethod
+    def __sawtooth(cls, x: float, p: float = 1.0) -> float:
+        """
+        Sawtooth wave.
+
+        Sawtooth wave with parameter x and period p has following computation rules.
+            1. If x or p is nan, the result is nan.
+            2. If x is +-inf, or p is +-inf or 0, the result is nan.
+            3. Otherwise, the result is the phase.
+
+        This method is private and called internally as a helper of ``SigFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``SigFun.eval``.
+
+        :param x: Point where sawtooth wave is to be computed.
+        :type x: float
+        :param p: Period. (Default: 1)
+        :type p: float
+
+        :return: Computed value of sawtooth wave.
+        :rtype: float
+        """
+        return cls.__phase(x, p)
+
+    @classmethod
+    def __kern(cls) -> Callable[..., float]:
+        """
+        Find computation kernel implementing the computation rules.
+
+        This method is private and called internally as a helper of ``SigFun.eval``.
+
+        :return: Computation kernel of function.
+        :rtype: Callable[..., float]
+        """
+        if cls == Ramp:
+            return cls.__ramp
+        elif cls == Unitize:
+            return cls.__unitize
+        elif cls == Logistic:
+            return cls.__logistic
+        elif cls == SquareWave:
+            return cls.__square
+        elif cls == TriangleWave:
+            return cls.__triangle
+        else:
+            return cls.__sawtooth
+
+    @classmethod
+    def chk_t(cls, rt: Token.Tok, t_env: Dict[int, TypeSystem.T]) -> Optional[Dict[int, TypeSystem.T]]:
+        """
+        Type checker for signal functions.
+
+        Functions apply elementwise, and parameters are broadcast as binary operators do.
+        For the rules of broadcasting, refer to the comments of ``Fun.bcast_t``.
+
+        :param rt: Token to be type checked.
+        :type rt: Token.Tok
+        :param t_env: Type environment.
+        :type t_env: Dict[int, TypeSystem.T]
+
+        :return: Type environment if type check succeeds. None otherwise.
+        :rtype: Optional[Dict[int, TypeSystem.T]]
+        """
+        if rt.argc not in ([1, 2, 3] if cls == SquareWave else [1, 2] if cls in [Unitize, TriangleWave, SawtoothWave]
+                           else [1]):
+            return None
+
+        rt.t = cls.bcast_t([tok.t for tok in rt.chd], [TypeSystem.Real, TypeSystem.Sym])
+
+        if not rt.t:
+            return None
+
+        return t_env
+
+    @classmethod
+    def eval(cls, *args: Union[float, list]) -> Tuple[Union[float, list], List[Warning.InterpWarn]]:
+        """
+        Evaluate signal function.
+
+        Parameters can be either scalar or tensor, and they are broadcast to the common shape.
+        Omitted period and duty cycle are 1 and 1/2, resp.
+        If parameters have neither nan, inf, nor period 0, the whole tensor is evaluated by a single chain of ``map``
+        calls built only from ``math`` functions and arithmetic operators, so the loop runs entirely in C.
+        ``Ramp`` is a single ``map`` call of ``max`` regardless of nan and inf since it already follows the
+        computation rules.
+        If the fast chain of ``Logistic`` overflows, the whole tensor is evaluated again by the private helper
+        implementing the computation rules.
+
+        It generates warnings for followings cases, each at most once per call.
+            1. Some item exceeds floating point max/min size. (BIG_INT/SMALL_INT, resp.)
+            2. Some item is nan. (NAN_DETECT)
+            3. Some item is +-inf. (INF_DETECT)
+            4. Some period of periodic waveform is 0. (DOMAIN_OUT)
+        Each check is a single scan over the whole tensor, not a branch per item.
+
+        :param args: Parameters where function is to be computed.
+        :type args: Union[float, list]
+
+        :return: Computed value and list of generated warnings.
+        :rtype: Tuple[Union[float, list], List[Warning.InterpWarn]]
+        """
+        arg, shape = cls.bcast(*args)
+        warn: List[Warning.InterpWarn] = []
+        fast: bool = True
+
+        for i in range(len(arg)):
+            arg[i], arg_warn, arg_fast = cls.chk_arg(arg[i], i + 1)
+            warn += arg_warn
+            fast &= arg_fast
+
+        if cls in [SquareWave, TriangleWave, SawtoothWave] and len(arg) > 1 and 0.0 in arg[1]:
+            warn.append(Warning.InterpWarn(Type.InterpWarnT.DOMAIN_OUT, 76 if cls == SquareWave else
+                                           77 if cls == TriangleWave else 78))
+            fast = False
+
+        if cls == Ramp:
+            return cls.unflat(list(map(max, arg[0], repeat(0.0))), shape), warn
+        elif not fast:
+            return cls.unflat(list(map(cls.__kern(), *arg)), shape), warn
+
+        x: list = arg[0]
+
+        if cls == Unitize:
+            res: list = list(map(float, map(bool, x))) if len(arg) == 1 else \
+                list(map(float, map(ge, map(absolute, x), arg[1])))
+        elif cls == Logistic:
+            try:
+                res: list = list(map(truediv, repeat(1.0), map(add, repeat(1.0), map(math.exp, map(neg, x)))))
+            except OverflowError:
+                res: list = list(map(cls.__logistic, x))
+        else:
+            p: list = arg[1] if len(arg) > 1 else [1.0] * len(x)
+            t: list = list(map(truediv, map(mod, x, p), p))  # Phase.
+
+            if cls == SquareWave:
+                d: list = arg[2] if len(arg) > 2 else repeat(cls.__DUTY)
+                res: list = list(map(sub, map(mul, repeat(2.0), map(lt, t, d)), repeat(1.0)))
+            elif cls == TriangleWave:
+                t = map(absolute, map(sub, map(mod, map(add, t, repeat(0.25)), repeat(1.0)), repeat(0.5)))
+                res: list = list(map(sub, repeat(1.0), map(mul, repeat(4.0), t)))
+            else:
+                res: list = t
+
+        return cls.unflat(res, shape), warn
+
 
 @final
 class Ramp(SigFun):
-    __SGN: Final[List[str]] = ['Ramp[Real] -> Real', 'Ramp[Sym] -> Sym']
+    __SGN: Final[List[str]] = ['Ramp[Real] -> Real', 'Ramp[Sym] -> Sym', 'Ramp[List of Real] -> List of Real']
 
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
@@ -21,7 +344,9 @@ class Unitize(SigFun):
     __SGN: Final[List[str]] = ['Unitize[Real] -> Real',
                                'Unitize[Sym] -> Sym',
                                'Unitize[Real, Real] -> Real',
-                               'Unitize[Sym, Sym] -> Sym']
+                               'Unitize[Sym, Sym] -> Sym',
+                               'Unitize[List of Real] -> List of Real',
+                               'Unitize[List of Real, Real] -> List of Real']
 
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
@@ -29,7 +354,8 @@ class Unitize(SigFun):
 
 @final
 class Logistic(SigFun):
-    __SGN: Final[List[str]] = ['Logistic[Real] -> Real', 'Logistic[Sym] -> Sym']
+    __SGN: Final[List[str]] = ['Logistic[Real] -> Real', 'Logistic[Sym] -> Sym',
+                               'Logistic[List of Real] -> List of Real']
 
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
@@ -38,7 +364,8 @@ class Logistic(SigFun):
 @final
 class SquareWave(SigFun):
     __SGN: Final[List[str]] = ['SquareWave[Real, Real (Optional), Real (Optional)] -> Real',
-                               'SquareWave[Sym, Sym (Optional), Sym (Optional)] -> Sym']
+                               'SquareWave[Sym, Sym (Optional), Sym (Optional)] -> Sym',
+                               'SquareWave[List of Real, Real (Optional), Real (Optional)] -> List of Real']
 
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
@@ -46,11 +373,19 @@ class SquareWave(SigFun):
 
 @final
 class TriangleWave(SigFun):
+    __SGN: Final[List[str]] = ['TriangleWave[Real, Real (Optional)] -> Real',
+                               'TriangleWave[Sym, Sym (Optional)] -> Sym',
+                               'TriangleWave[List of Real, Real (Optional)] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
 
 @final
 class SawtoothWave(SigFun):
+    __SGN: Final[List[str]] = ['SawtoothWave[Real, Real (Optional)] -> Real',
+                               'SawtoothWave[Sym, Sym (Optional)] -> Sym',
+                               'SawtoothWave[List of Real, Real (Optional)] -> List of Real']
+
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
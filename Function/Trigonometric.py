@@ -1,301 +1,761 @@
 from __future__ import annotations
 
-from typing import List, final, Final, Optional, Dict
+import math
+from itertools import repeat
+from operator import add, and_, ge, le, lt, mul, neg, sub, truediv
+from typing import List, final, Final, Optional, Dict, Tuple, Union, Callable
 
-from Function import Function
-from Core import Token, TypeSystem
+from Function import Exponential, Function, Integer, Precision
+from Core import Dual, Interval, Symbolic, Token, TypeSystem, Type
+from Warning import Warning
 
 
 class TriFun(Function.Fun):
     """
     Trigonometric function toolbox.
 
-    :cvar __sign: Signatures of trigonometric functions.
+    :cvar __SINC_MIN: Lower bound of the minimum of sinc function.
+    :cvar __HALF_PI: Upper bound of pi/2.
     """
+    __SINC_MIN: Final[float] = -0.2172336282112217
+    __HALF_PI: Final[float] = math.nextafter(math.pi / 2, math.inf)
 
     def __new__(cls) -> None:
         raise NotImplementedError
 
+    @classmethod
+    def __sin(cls, x: float) -> float:
+        """
+        Sine function.
+
+        Sine function with parameter x has following computation rules.
+            1. If x is +-inf or nan, the result is nan.
+            2. If x is finite, the result is ``math.sin(x)``.
+
+        This method is private and called internally as a helper of ``TriFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``TriFun.eval``.
+
+        :param x: Point where sine function is to be computed.
+        :type x: float
+
+        :return: Computed value of sine function.
+        :rtype: float
+        """
+        return math.nan if math.isinf(x) else math.sin(x)
+
+    @classmethod
+    def __cos(cls, x: float) -> float:
+        """
+        Cosine function.
+
+        Cosine function with parameter x has following computation rules.
+            1. If x is +-inf or nan, the result is nan.
+            2. If x is finite, the result is ``math.cos(x)``.
+
+        This method is private and called internally as a helper of ``TriFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``TriFun.eval``.
+
+        :param x: Point where cosine function is to be computed.
+        :type x: float
+
+        :return: Computed value of cosine function.
+        :rtype: float
+        """
+        return math.nan if math.isinf(x) else math.cos(x)
+
+    @classmethod
+    def __tan(cls, x: float) -> float:
+        """
+        Tangent function.
+
+        Tangent function with parameter x has following computation rules.
+            1. If x is +-inf or nan, the result is nan.
+            2. If x is finite which is (integer multiple of pi)+pi/2, the result is nan.
+            3. If x is finite which is not (integer multiple of pi)+pi/2, the result is ``math.tan(x)``.
+
+        This method is private and called internally as a helper of ``TriFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``TriFun.eval``.
+
+        :param x: Point where tangent function is to be computed.
+        :type x: float
+
+        :return: Computed value of tangent function.
+        :rtype: float
+        """
+        return math.nan if math.isinf(x) or (x - math.pi / 2) % math.pi == 0 else math.tan(x)
+
+    @classmethod
+    def __csc(cls, x: float) -> float:
+        """
+        Cosecant function.
+
+        Cosecant function with parameter x has following computation rules.
+            1. If x is +-inf or nan, the result is nan.
+            2. If x is finite which is integer multiple of pi, the result is nan.
+            3. If x is finite which is not integer multiple of pi, the result is ``1 / math.sin(x)``.
+
+        This method is private and called internally as a helper of ``TriFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``TriFun.eval``.
+
+        :param x: Point where cosecant function is to be computed.
+        :type x: float
+
+        :return: Computed value of cosecant function.
+        :rtype: float
+        """
+        return math.nan if math.isinf(x) or x % math.pi == 0 else 1 / math.sin(x)
+
+    @classmethod
+    def __sec(cls, x: float) -> float:
+        """
+        Secant function.
+
+        Secant function with parameter x has following computation rules.
+            1. If x is +-inf or nan, the result is nan.
+            2. If x is finite which is (integer multiple of pi)+pi/2, the result is nan.
+            3. If x is finite which is not (integer multiple of pi)+pi/2, the result is ``1 / math.cos(x)``.
+
+        This method is private and called internally as a helper of ``TriFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``TriFun.eval``.
+
+        :param x: Point where secant function is to be computed.
+        :type x: float
+
+        :return: Computed value of secant function.
+        :rtype: float
+        """
+        return math.nan if math.isinf(x) or (x - math.pi / 2) % math.pi == 0 else 1 / math.cos(x)
+
+    @classmethod
+    def __cot(cls, x: float) -> float:
+        """
+        Cotangent function.
+
+        Secant function with parameter x has following computation rules.
+            1. If x is +-inf or nan, the result is nan.
+            2. If x is finite which is integer multiple of pi, the result is nan.
+            3. If x is finite which is not integer multiple of pi, the result is ``1 / math.tan(x)``.
+
+        This method is private and called internally as a helper of ``TriFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``TriFun.eval``.
+
+        :param x: Point where cotangent function is to be computed.
+        :type x: float
+
+        :return: Computed value of cotangent function.
+        :rtype: float
+        """
+        return math.nan if math.isinf(x) or x % math.pi == 0 else 1 / math.tan(x)
+
+    @classmethod
+    def __asin(cls, x: float) -> float:
+        """
+        Arcsine function.
+
+        Arcsine function with parameter x has following computation rules.
+            1. If x is +-inf or nan, the result is nan.
+            2. If x is finite which is not in [-1, 1], the result is nan.
+            3. If x is finite which is in [-1. 1], the result is ``math.asin(x)``.
+
+        This method is private and called internally as a helper of ``TriFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``TriFun.eval``.
+
+        :param x: Point where arcsine function is to be computed.
+        :type x: float
+
+        :return: Computed value of arcsine function.
+        :rtype: float
+        """
+        return math.nan if math.isinf(x) or not (-1 <= x <= 1) else math.asin(x)
+
+    @classmethod
+    def __acos(cls, x: float) -> float:
+        """
+        Arccosine function.
+
+        Arccosine function with parameter x has following computation rules.
+            1. If x is +-inf or nan, the result is nan.
+            2. If x is finite which is not in [-1, 1], the result is nan.
+            3. If x is finite which is in [-1. 1], the result is ``math.acos(x)``.
+
+        This method is private and called internally as a helper of ``TriFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``TriFun.eval``.
+
+        :param x: Point where arccosine function is to be computed.
+        :type x: float
+
+        :return: Computed value of arccosine function.
+        :rtype: float
+        """
+        return math.nan if math.isinf(x) or not (-1 <= x <= 1) else math.acos(x)
+
+    @classmethod
+    def __atan(cls, x: float) -> float:
+        """
+        Arctangent function.
+
+        Arctangent function with parameter x has following computation rules.
+            1. If x is nan, the result is nan.
+            2. If x is +-inf, the result is +-pi/2, resp.
+            3. If x is finite, the result is ``math.atan(x)``.
+
+        This method is private and called internally as a helper of ``TriFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``TriFun.eval``.
+
+        :param x: Point where arctangent function is to be computed.
+        :type x: float
+
+        :return: Computed value of arctangent function.
+        :rtype: float
+        """
+        return math.atan(x)
+
+    @classmethod
+    def __acsc(cls, x: float) -> float:
+        """
+        Arccosecant function.
+
+        Arccosecant function with parameter x has following computation rules.
+            1. If x is nan, the result is nan.
+            2. If x is +-inf, the result is 0.
+            3. If x is in (-1, 1), the result is nan.
+            4. If x is finite which is not in (-1, 1), the result is ``math.asin(1 / x)``.
+        Here, the rule 4 is based on identity ``asec(x) = acos(1 / x)``.
+        For detail and more identities, consult the reference below.
+
+        This method is private and called internally as a helper of ``TriFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``TriFun.eval``.
+
+        **Reference**
+            * https://en.wikipedia.org/wiki/Inverse_trigonometric_functions
+
+        :param x: Point where arccosecant function is to be computed.
+        :type x: float
+
+        :return: Computed value of arccosecant function.
+        :rtype: float
+        """
+        return math.nan if -1 < x < 1 else math.asin(1 / x)
+
+    @classmethod
+    def __asec(cls, x: float) -> float:
+        """
+        Arcsecant function.
+
+        Arcsecant function with parameter x has following computation rules.
+            1. If x is nan, the result is nan.
+            2. If x is +-inf, the result is pi/2.
+            3. If x is in (-1, 1), the result is nan.
+            4. If x is finite which is not in (-1, 1), the result is ``math.acos(1 / x)``.
+        Here, the rule 4 is based on identity ``asec(x) = acos(1 / x)``.
+        For detail and more identities, consult the reference below.
+
+        This method is private and called internally as a helper of ``TriFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``TriFun.eval``.
+
+        **Reference**
+            * https://en.wikipedia.org/wiki/Inverse_trigonometric_functions
+
+        :param x: Point where arcsecant function is to be computed.
+        :type x: float
+
+        :return: Computed value of arcsecant function.
+        :rtype: float
+        """
+        return math.nan if -1 < x < 1 else math.acos(1 / x)
+
+    @classmethod
+    def __acot(cls, x: float) -> float:
+        """
+        Arccotangent function.
+
+        Arccotangent function with parameter x has following computation rules.
+            1. If x is nan, the result is nan.
+            2. If x is +-inf, the result is 0.
+            3. If x is finite negative, the result is ``-(math.pi / 2 + math.atan(x))``.
+            4. If x is nonnegative, the result is ``math.pi / 2 - math.atan(x)``.
+        Here, the rule 3 and 4 are based on identity ``acot(x) = -pi / 2 - atan(x)`` for negative x and
+        ``acot(x) = pi / 2 - atan(x)`` for nonnegative x.
+        For detail and more identities, consult the reference below.
+
+        This method is private and called internally as a helper of ``TriFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``TriFun.eval``.
+
+        **Reference**
+            * https://en.wikipedia.org/wiki/Inverse_trigonometric_functions
+
+        :param x: Point where arccotangent function is to be computed.
+        :type x: float
+
+        :return: Computed value of arccotangent function.
+        :rtype: float
+        """
+        return -(math.pi / 2 + math.atan(x)) if x < 0 else math.pi / 2 - math.atan(x)
+
+    @classmethod
+    def __hav(cls, x: float) -> float:
+        """
+        Haversine function.
+
+        Haversine function with parameter x has following computation rules.
+            1. If x is +-inf or nan, the result is nan.
+            2. If x is finite, the result is ``math.sin(x / 2) ** 2``.
+        Here, the rule 2 is based on identity ``hav(x) = (1 - cos(x)) / 2 = sin(x / 2)^2``.
+        The latter form does not suffer from cancellation near the integer multiple of 2pi.
+
+        This method is private and called internally as a helper of ``TriFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``TriFun.eval``.
+
+        **Reference**
+            * https://en.wikipedia.org/wiki/Versine
+
+        :param x: Point where haversine function is to be computed.
+        :type x: float
+
+        :return: Computed value of haversine function.
+        :rtype: float
+        """
+        return math.nan if math.isinf(x) else math.sin(x / 2) ** 2
+
+    @classmethod
+    def __ahav(cls, x: float) -> float:
+        """
+        Inverse haversine function.
+
+        Inverse haversine function with parameter x has following computation rules.
+            1. If x is +-inf or nan, the result is nan.
+            2. If x is finite which is not in [0, 1], the result is nan.
+            3. If x is finite which is in [0, 1], the result is ``2 * math.asin(math.sqrt(x))``.
+
+        This method is private and called internally as a helper of ``TriFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``TriFun.eval``.
+
+        **Reference**
+            * https://en.wikipedia.org/wiki/Versine
+
+        :param x: Point where inverse haversine function is to be computed.
+        :type x: float
+
+        :return: Computed value of inverse haversine function.
+        :rtype: float
+        """
+        return 2 * math.asin(math.sqrt(x)) if 0 <= x <= 1 else math.nan
+
+    @classmethod
+    def __sinc(cls, x: float) -> float:
+        """
+        Sinc function.
+
+        Sinc function with parameter x has following computation rules.
+            1. If x is nan, the result is nan.
+            2. If x is +-inf, the result is 0.
+            3. If x is 0, the result is 1.
+            4. If x is finite nonzero, the result is ``math.sin(x) / x``.
+
+        This method is private and called internally as a helper of ``TriFun.eval``.
+        For detailed description for evaluation, refer to the comments of ``TriFun.eval``.
+
+        :param x: Point where sinc function is to be computed.
+        :type x: float
+
+        :return: Computed value of sinc function.
+        :rtype: float
+        """
+        return 0.0 if math.isinf(x) else 1.0 if x == 0 else math.sin(x) / x
+
+    @classmethod
+    def __kern(cls) -> Callable[[float], float]:
+        """
+        Find computation kernel implementing the computation rules.
+
+        This method is private and called internally as a helper of ``TriFun.eval``.
+
+        :return: Computation kernel of function.
+        :rtype: Callable[[float], float]
+        """
+        if cls == Sin:
+            return cls.__sin
+        elif cls == Cos:
+            return cls.__cos
+        elif cls == Tan:
+            return cls.__tan
+        elif cls == Csc:
+            return cls.__csc
+        elif cls == Sec:
+            return cls.__sec
+        elif cls == Cot:
+            return cls.__cot
+        elif cls == ArcSin:
+            return cls.__asin
+        elif cls == ArcCos:
+            return cls.__acos
+        elif cls == ArcTan:
+            return cls.__atan
+        elif cls == ArcCsc:
+            return cls.__acsc
+        elif cls == ArcSec:
+            return cls.__asec
+        elif cls == ArcCot:
+            return cls.__acot
+        elif cls == Haversine:
+            return cls.__hav
+        elif cls == InverseHaversine:
+            return cls.__ahav
+        else:
+            return cls.__sinc
+
     @classmethod
     def chk_t(cls, rt: Token.Tok, t_env: Dict[int, TypeSystem.T]) -> Optional[Dict[int, TypeSystem.T]]:
-        t = rt.chd[0].t
+        """
+        Type checker for trigonometric functions.
+
+        Trigonometric functions apply elementwise, so tensor of reals is mapped to tensor of the same shape.
+
+        :param rt: Token to be type checked.
+        :type rt: Token.Tok
+        :param t_env: Type environment.
+        :type t_env: Dict[int, TypeSystem.T]
+
+        :return: Type environment if type check succeeds. None otherwise.
+        :rtype: Optional[Dict[int, TypeSystem.T]]
+        """
+        if rt.argc != 1:
+            return None
+
+        t: TypeSystem.T = rt.chd[0].t
 
-        if type(t) in [TypeSystem.Real, TypeSystem.Sym]:
+        if type(t) in [TypeSystem.Real, TypeSystem.Interval, TypeSystem.Sym] or \
+                (type(t) == TypeSystem.Tens and type(t.chd_t) == TypeSystem.Real):
             rt.t = t
 
             return t_env
         else:
             return None
 
-    # @classmethod
-    # def __sin(cls, x: float) -> float:
-    #     """
-    #     Sine function.
-    #
-    #     Sine function with parameter x has following computation rules.
-    #         1. If x is +-inf or nan, the result is nan.
-    #         2. If x is finite, the result is ``math.sin(x)``.
-    #
-    #     This method is private and called internally as a helper of ``Tri.simplify``.
-    #     For detailed description for simplification, refer to the comments of ``Tri.simplify``.
-    #
-    #     :param x: Point where sine function is to be computed.
-    #     :type x: float
-    #
-    #     :return: Computed value of sine function.
-    #     :rtype: float
-    #     """
-    #     return math.nan if math.isinf(x) else math.sin(x)
-    #
-    # @classmethod
-    # def __cos(cls, x: float) -> float:
-    #     """
-    #     Cosine function.
-    #
-    #     Cosine function with parameter x has following computation rules.
-    #         1. If x is +-inf or nan, the result is nan.
-    #         2. If x is finite, the result is ``math.cos(x)``.
-    #
-    #     This method is private and called internally as a helper of ``Tri.simplify``.
-    #     For detailed description for simplification, refer to the comments of ``Tri.simplify``.
-    #
-    #     :param x: Point where cosine function is to be computed.
-    #     :type x: float
-    #
-    #     :return: Computed value of cosine function.
-    #     :rtype: float
-    #     """
-    #     return math.nan if math.isinf(x) else math.cos(x)
-    #
-    # @classmethod
-    # def __tan(cls, x: float) -> float:
-    #     """
-    #     Tangent function.
-    #
-    #     Tangent function with parameter x has following computation rules.
-    #         1. If x is +-inf or nan, the result is nan.
-    #         2. If x is finite which is (integer multiple of pi)+pi/2, the result is nan.
-    #         3. If x is finite which is not (integer multiple of pi)+pi/2, the result is ``math.tan(x)``.
-    #
-    #     This method is private and called internally as a helper of ``Tri.simplify``.
-    #     For detailed description for simplification, refer to the comments of ``Tri.simplify``.
-    #
-    #     :param x: Point where tangent function is to be computed.
-    #     :type x: float
-    #
-    #     :return: Computed value of tangent function.
-    #     :rtype: float
-    #     """
-    #     return math.nan if math.isinf(x) or (x - math.pi / 2) % math.pi == 0 else math.tan(x)
-    #
-    # @classmethod
-    # def __csc(cls, x: float) -> float:
-    #     """
-    #     Cosecant function.
-    #
-    #     Cosecant function with parameter x has following computation rules.
-    #         1. If x is +-inf or nan, the result is nan.
-    #         2. If x is finite which is integer multiple of pi, the result is nan.
-    #         3. If x is finite which is not integer multiple of pi, the result is ``1 / math.sin(x)``.
-    #
-    #     This method is private and called internally as a helper of ``Tri.simplify``.
-    #     For detailed description for simplification, refer to the comments of ``Tri.simplify``.
-    #
-    #     :param x: Point where cosecant function is to be computed.
-    #     :type x: float
-    #
-    #     :return: Computed value of cosecant function.
-    #     :rtype: float
-    #     """
-    #     return math.nan if math.isinf(x) or x % math.pi == 0 else 1 / math.sin(x)
-    #
-    # @classmethod
-    # def __sec(cls, x: float) -> float:
-    #     """
-    #     Secant function.
-    #
-    #     Secant function with parameter x has following computation rules.
-    #         1. If x is +-inf or nan, the result is nan.
-    #         2. If x is finite which is (integer multiple of pi)+pi/2, the result is nan.
-    #         3. If x is finite which is not (integer multiple of pi)+pi/2, the result is ``1 / math.cos(x)``.
-    #
-    #     This method is private and called internally as a helper of ``Tri.simplify``.
-    #     For detailed description for simplification, refer to the comments of ``Tri.simplify``.
-    #
-    #     :param x: Point where secant function is to be computed.
-    #     :type x: float
-    #
-    #     :return: Computed value of secant function.
-    #     :rtype: float
-    #     """
-    #     return math.nan if math.isinf(x) or (x - math.pi / 2) % math.pi == 0 else 1 / math.cos(x)
-    #
-    # @classmethod
-    # def __cot(cls, x: float) -> float:
-    #     """
-    #     Cotangent function.
-    #
-    #     Secant function with parameter x has following computation rules.
-    #         1. If x is +-inf or nan, the result is nan.
-    #         2. If x is finite which is integer multiple of pi, the result is nan.
-    #         3. If x is finite which is not integer multiple of pi, the result is ``1 / math.tan(x)``.
-    #
-    #     This method is private and called internally as a helper of ``Tri.simplify``.
-    #     For detailed description for simplification, refer to the comments of ``Tri.simplify``.
-    #
-    #     :param x: Point where cotangent function is to be computed.
-    #     :type x: float
-    #
-    #     :return: Computed value of cotangent function.
-    #     :rtype: float
-    #     """
-    #     return math.nan if math.isinf(x) or x % math.pi == 0 else 1 / math.tan(x)
-    #
-    # @classmethod
-    # def __asin(cls, x: float) -> float:
-    #     """
-    #     Arcsine function.
-    #
-    #     Arcsine function with parameter x has following computation rules.
-    #         1. If x is +-inf or nan, the result is nan.
-    #         2. If x is finite which is not in [-1, 1], the result is nan.
-    #         3. If x is finite which is in [-1. 1], the result is ``math.asin(x)``.
-    #
-    #     This method is private and called internally as a helper of ``Tri.simplify``.
-    #     For detailed description for simplification, refer to the comments of ``Tri.simplify``.
-    #
-    #     :param x: Point where arcsine function is to be computed.
-    #     :type x: float
-    #
-    #     :return: Computed value of arcsine function.
-    #     :rtype: float
-    #     """
-    #     return math.nan if math.isinf(x) or not (-1 <= x <= 1) else math.asin(x)
-    #
-    # @classmethod
-    # def __acos(cls, x: float) -> float:
-    #     """
-    #     Arccosine function.
-    #
-    #     Arccosine function with parameter x has following computation rules.
-    #         1. If x is +-inf or nan, the result is nan.
-    #         2. If x is finite which is not in [-1, 1], the result is nan.
-    #         3. If x is finite which is in [-1. 1], the result is ``math.acos(x)``.
-    #
-    #     This method is private and called internally as a helper of ``Tri.simplify``.
-    #     For detailed description for simplification, refer to the comments of ``Tri.simplify``.
-    #
-    #     :param x: Point where arccosine function is to be computed.
-    #     :type x: float
-    #
-    #     :return: Computed value of arccosine function.
-    #     :rtype: float
-    #     """
-    #     return math.nan if math.isinf(x) or not (-1 <= x <= 1) else math.acos(x)
-    #
-    # @classmethod
-    # def __atan(cls, x: float) -> float:
-    #     """
-    #     Arctangent function.
-    #
-    #     Arctangent function with parameter x has following computation rules.
-    #         1. If x is nan, the result is nan.
-    #         2. If x is +-inf, the result is +-pi/2, resp.
-    #         3. If x is finite, the result is ``math.atan(x)``.
-    #
-    #     This method is private and called internally as a helper of ``Tri.simplify``.
-    #     For detailed description for simplification, refer to the comments of ``Tri.simplify``.
-    #
-    #     :param x: Point where arctangent function is to be computed.
-    #     :type x: float
-    #
-    #     :return: Computed value of arctangent function.
-    #     :rtype: float
-    #     """
-    #     return math.atan(x)
-    #
-    # @classmethod
-    # def __acsc(cls, x: float) -> float:
-    #     """
-    #     Arccosecant function.
-    #
-    #     Arccosecant function with parameter x has following computation rules.
-    #         1. If x is nan, the result is nan.
-    #         2. If x is +-inf, the result is 0.
-    #         3. If x is in (-1, 1), the result is nan.
-    #         4. If x is finite which is not in (-1, 1), the result is ``math.asin(1 / x)``.
-    #     Here, the rule 4 is based on identity ``asec(x) = acos(1 / x)``.
-    #     For detail and more identities, consult the reference below.
-    #
-    #     This method is private and called internally as a helper of ``Tri.simplify``.
-    #     For detailed description for simplification, refer to the comments of ``Tri.simplify``.
-    #
-    #     **Reference**
-    #         * https://en.wikipedia.org/wiki/Inverse_trigonometric_functions
-    #
-    #     :param x: Point where arccosecant function is to be computed.
-    #     :type x: float
-    #
-    #     :return: Computed value of arccosecant function.
-    #     :rtype: float
-    #     """
-    #     return math.nan if -1 < x < 1 else math.asin(1 / x)
-    #
-    # @classmethod
-    # def __asec(cls, x: float) -> float:
-    #     """
-    #     Arcsecant function.
-    #
-    #     Arcsecant function with parameter x has following computation rules.
-    #         1. If x is nan, the result is nan.
-    #         2. If x is +-inf, the result is pi/2.
-    #         3. If x is in (-1, 1), the result is nan.
-    #         4. If x is finite which is not in (-1, 1), the result is ``math.acos(1 / x)``.
-    #     Here, the rule 4 is based on identity ``asec(x) = acos(1 / x)``.
-    #     For detail and more identities, consult the reference below.
-    #
-    #     This method is private and called internally as a helper of ``Tri.simplify``.
-    #     For detailed description for simplification, refer to the comments of ``Tri.simplify``.
-    #
-    #     **Reference**
-    #         * https://en.wikipedia.org/wiki/Inverse_trigonometric_functions
-    #
-    #     :param x: Point where arcsecant function is to be computed.
-    #     :type x: float
-    #
-    #     :return: Computed value of arcsecant function.
-    #     :rtype: float
-    #     """
-    #     return math.nan if -1 < x < 1 else math.acos(1 / x)
-    #
-    # @classmethod
-    # def __acot(cls, x: float) -> float:
-    #     """
-    #     Arccotangent function.
-    #
-    #     Arccotangent function with parameter x has following computation rules.
-    #         1. If x is nan, the result is nan.
-    #         2. If x is +-inf, the result is 0.
-    #         3. If x is finite negative, the result is ``-(math.pi / 2 + math.atan(x))``.
-    #         4. If x is nonnegative, the result is ``math.pi / 2 - math.atan(x)``.
-    #     Here, the rule 3 and 4 are based on identity ``acot(x) = -pi / 2 - atan(x)`` for negative x and
-    #     ``acot(x) = pi / 2 - atan(x)`` for nonnegative x.
-    #     For detail and more identities, consult the reference below.
-    #
-    #     This method is private and called internally as a helper of ``Tri.simplify``.
-    #     For detailed description for simplification, refer to the comments of ``Tri.simplify``.
-    #
-    #     **Reference**
-    #         * https://en.wikipedia.org/wiki/Inverse_trigonometric_functions
-    #
-    #     :param x: Point where arccotangent function is to be computed.
-    #     :type x: float
-    #
-    #     :return: Computed value of arccotangent function.
-    #     :rtype: float
-    #     """
-    #     return -(math.pi / 2 + math.atan(x)) if x < 0 else math.pi / 2 - math.atan(x)
-    #
+    @classmethod
+    def eval(cls, x: Union[float, list]) -> Tuple[Union[float, list], List[Warning.InterpWarn]]:
+        """
+        Evaluate trigonometric function.
+
+        Parameter can be either real or tensor of reals, and the result has the same shape with the parameter.
+        The whole tensor is evaluated by chain of ``map`` calls.
+        If the parameter has no nan, inf, pole, or point out of domain, the chain is built only from ``math`` functions
+        and arithmetic operators, so the loop runs entirely in C.
+        Otherwise, it falls back to the private helper implementing the computation rules.
+
+        If arbitrary precision mode is on, it is evaluated by ``Precision.PrecFun.eval`` instead.
+
+        It generates warnings for followings cases, each at most once per call.
+            1. Some item exceeds floating point max/min size. (BIG_INT/SMALL_INT, resp.)
+            2. Some item is nan. (NAN_DETECT)
+            3. Some item is +-inf. (INF_DETECT)
+            4. Some item is mathematical pole. (POLE_DETECT)
+               Poles are integer multiple of pi + pi/2 for Tan and Sec, and integer multiple of pi for Csc and Cot.
+            5. Some finite item is not in domain. (DOMAIN_OUT)
+               Domains are [-1, 1] for ArcSin and ArcCos, (-inf, -1] and [1, inf) for ArcCsc and ArcSec, and [0, 1]
+               for InverseHaversine.
+
+        :param x: Point where function is to be computed.
+        :type x: Union[float, list]
+
+        :return: Computed value and list of generated warnings.
+        :rtype: Tuple[Union[float, list], List[Warning.InterpWarn]]
+        """
+        if Precision.PrecFun.prec():
+            return Precision.PrecFun.eval(cls, x)
+
+        x, shape = cls.flat(x)
+
+        # Empty batch has no item to check, and domain checks below do not accept it.
+        if not x:
+            return cls.unflat(x, shape), []
+
+        x, warn, fast = cls.chk_arg(x)
+
+        # Pole and domain checks run in C if the parameter is finite.
+        # Otherwise, they fall back to generator since remainder of inf and comparison with nan are not reliable.
+        if cls in [Tan, Sec]:
+            if (0.0 in map(math.remainder, map(sub, x, repeat(math.pi / 2)), repeat(math.pi))) if fast else \
+                    any((it - math.pi / 2) % math.pi == 0 for it in x):
+                warn.append(Warning.InterpWarn(Type.InterpWarnT.POLE_DETECT, 5 if cls == Tan else 27))
+                fast = False
+        elif cls in [Csc, Cot]:
+            if (0.0 in map(math.remainder, x, repeat(math.pi))) if fast else any(it % math.pi == 0 for it in x):
+                warn.append(Warning.InterpWarn(Type.InterpWarnT.POLE_DETECT, 26 if cls == Csc else 28))
+                fast = False
+        elif cls in [ArcSin, ArcCos]:
+            if (min(x) < -1 or max(x) > 1) if fast else any(1 < abs(it) < math.inf for it in x):
+                warn.append(Warning.InterpWarn(Type.InterpWarnT.DOMAIN_OUT, 3 if cls == ArcSin else 4))
+                fast = False
+        elif cls in [ArcCsc, ArcSec]:
+            if (min(map(abs, x)) < 1) if fast else any(-1 < it < 1 for it in x):
+                warn.append(Warning.InterpWarn(Type.InterpWarnT.DOMAIN_OUT, 29 if cls == ArcCsc else 30))
+                fast = False
+        elif cls == InverseHaversine:
+            if (min(x) < 0 or max(x) > 1) if fast else any(-math.inf < it < 0 or 1 < it < math.inf for it in x):
+                warn.append(Warning.InterpWarn(Type.InterpWarnT.DOMAIN_OUT, 60))
+                fast = False
+        elif cls in [ArcCot, Sinc]:
+            # Not a pole, but 0 is handled separately by the computation rules.
+            fast &= 0.0 not in x
+
+        if not fast:
+            res: list = list(map(cls.__kern(), x))
+        elif cls == Sin:
+            res: list = list(map(math.sin, x))
+        elif cls == Cos:
+            res: list = list(map(math.cos, x))
+        elif cls == Tan:
+            res: list = list(map(math.tan, x))
+        elif cls == Csc:
+            res: list = list(map(truediv, repeat(1.0), map(math.sin, x)))
+        elif cls == Sec:
+            res: list = list(map(truediv, repeat(1.0), map(math.cos, x)))
+        elif cls == Cot:
+            res: list = list(map(truediv, repeat(1.0), map(math.tan, x)))
+        elif cls == ArcSin:
+            res: list = list(map(math.asin, x))
+        elif cls == ArcCos:
+            res: list = list(map(math.acos, x))
+        elif cls == ArcTan:
+            res: list = list(map(math.atan, x))
+        elif cls == ArcCsc:
+            res: list = list(map(math.asin, map(truediv, repeat(1.0), x)))
+        elif cls == ArcSec:
+            res: list = list(map(math.acos, map(truediv, repeat(1.0), x)))
+        elif cls == ArcCot:
+            # Identity ``acot(x) = atan(1 / x)`` for nonzero x agrees with the rule in ``TriFun.__acot``.
+            res: list = list(map(math.atan, map(truediv, repeat(1.0), x)))
+        elif cls == Haversine:
+            res: list = list(map(pow, map(math.sin, map(mul, x, repeat(0.5))), repeat(2)))
+        elif cls == InverseHaversine:
+            res: list = list(map(mul, repeat(2.0), map(math.asin, map(math.sqrt, x))))
+        else:
+            res: list = list(map(truediv, map(math.sin, x), x))
+
+        return cls.unflat(res, shape), warn
+
+    @classmethod
+    def ival(cls, x: Interval.Ival) -> Tuple[Interval.Ival, List[Warning.InterpWarn]]:
+        """
+        Evaluate trigonometric function over intervals.
+
+        The result encloses all the values of the function over each interval.
+            1. ``Sin``, ``Cos`` and ``Haversine`` are bounded by their values at the end points, which are extended to
+               their extrema if the interval contains one of them.
+            2. ``Tan`` and ``Cot`` are monotone between poles.
+               If the interval contains a pole, the result is the entire line.
+            3. ``ArcSin``, ``ArcTan`` and ``InverseHaversine`` are increasing, and ``ArcCos`` is decreasing.
+            4. ``Csc`` and ``Sec`` are reciprocals of ``Sin`` and ``Cos``, and ``ArcCsc`` and ``ArcSec`` are ``ArcSin``
+               and ``ArcCos`` of reciprocal, resp.
+            5. ``ArcCot`` is decreasing except for the jump at 0.
+               If the interval contains 0 in its interior or as its upper bound, the result is ``[-pi/2, pi/2]``.
+            6. ``Sinc`` is the product of ``Sin`` and reciprocal, restricted to the range of sinc function.
+               If the interval contains 0, the result is the whole range.
+        Values at the end points are computed by ``TriFun.eval`` and moved outward by 2 ulps, or 4 ulps for
+        ``Haversine`` and ``InverseHaversine`` whose kernels are compositions.
+        Intervals are restricted to the domain of the function first.
+
+        It generates warnings for followings cases.
+            1. Some interval contains pole. (POLE_DETECT)
+            2. Some interval is not contained in domain. (DOMAIN_OUT)
+
+        :param x: Intervals where function is to be computed.
+        :type x: Interval.Ival
+
+        :return: Enclosure of the result and list of generated warnings.
+        :rtype: Tuple[Interval.Ival, List[Warning.InterpWarn]]
+        """
+        kern: Callable[[List[float]], List[float]] = lambda t: cls.eval(t)[0]
+        pole: bool = False
+        out: bool = False
+
+        if cls == Sin:
+            res: Interval.Ival = Interval.IvalArith.periodic(kern, x, math.pi / 2)
+        elif cls == Cos:
+            res: Interval.Ival = Interval.IvalArith.periodic(kern, x, 0.0)
+        elif cls == Tan:
+            res, pole = Interval.IvalArith.branch(kern, x, math.pi / 2)
+        elif cls == Csc:
+            res, pole = Interval.IvalArith.recip(Sin.ival(x)[0])
+        elif cls == Sec:
+            res, pole = Interval.IvalArith.recip(Cos.ival(x)[0])
+        elif cls == Cot:
+            res, pole = Interval.IvalArith.branch(kern, x, 0.0, False)
+        elif cls in [ArcSin, ArcCos]:
+            x, out = Interval.IvalArith.clip(x, -1.0, 1.0)
+            res: Interval.Ival = Interval.IvalArith.mono(kern, x, cls == ArcSin)
+        elif cls == ArcTan:
+            res: Interval.Ival = Interval.IvalArith.mono(kern, x)
+        elif cls in [ArcCsc, ArcSec]:
+            # Reciprocal of interval in the domain may exceed [-1, 1] by rounding, so domain is checked beforehand.
+            out = Interval.IvalArith.gap(x, 1.0)
+            res: Interval.Ival = (ArcSin if cls == ArcCsc else ArcCos).ival(Interval.IvalArith.recip(x)[0])[0]
+        elif cls == ArcCot:
+            jump: List[bool] = list(map(and_, map(lt, x.lo, repeat(0.0)), map(ge, x.hi, repeat(0.0))))
+            res: Interval.Ival = Interval.IvalArith.where(jump, Interval.IvalArith.mono(kern, x, False),
+                                                          Interval.Ival([-cls.__HALF_PI], [cls.__HALF_PI]))
+        elif cls == Haversine:
+            res: Interval.Ival = Interval.IvalArith.periodic(kern, x, math.pi, 4, (0.0, 1.0))
+        elif cls == InverseHaversine:
+            x, out = Interval.IvalArith.clip(x, 0.0, 1.0)
+            res: Interval.Ival = Interval.IvalArith.mono(kern, x, ulp=4)
+        else:
+            zero: List[bool] = list(map(and_, map(le, x.lo, repeat(0.0)), map(ge, x.hi, repeat(0.0))))
+            res: Interval.Ival = Interval.IvalArith.mul(Sin.ival(x)[0], Interval.IvalArith.recip(x)[0])
+            res = Interval.IvalArith.clip(res, cls.__SINC_MIN, 1.0)[0]
+            res = Interval.IvalArith.where(zero, res, Interval.Ival([cls.__SINC_MIN], [1.0]))
+
+        warn: List[Warning.InterpWarn] = []
+
+        if out:
+            warn.append(Warning.InterpWarn(Type.InterpWarnT.DOMAIN_OUT, 98, handle=cls.__name__))
+
+        if pole:
+            warn.append(Warning.InterpWarn(Type.InterpWarnT.POLE_DETECT, 99, handle=cls.__name__))
+
+        return res, warn
+
+    @classmethod
+    def __dsinc(cls, x: float) -> float:
+        """
+        Derivative of sinc function.
+
+        Derivative of sinc function with parameter x has following computation rules.
+            1. If x is +-inf or nan, the result is nan.
+            2. If |x| is less than 0.1, the result is Taylor polynomial of degree 9 at 0.
+            3. Otherwise, the result is ``(cos(x) - sinc(x)) / x``.
+        Taylor polynomial avoids both of division by 0 and cancellation near 0.
+
+        This method is private and called internally as a helper of ``TriFun.dual``.
+
+        :param x: Point where derivative of sinc function is to be computed.
+        :type x: float
+
+        :return: Computed value of derivative of sinc function.
+        :rtype: float
+        """
+        if not math.isfinite(x):
+            return math.nan
+        elif abs(x) < 0.1:
+            t: float = x * x
+
+            return x * (-1 / 3 + t * (1 / 30 + t * (-1 / 840 + t * (1 / 45360 - t / 3991680))))
+        else:
+            return (math.cos(x) - math.sin(x) / x) / x
+
+    @classmethod
+    def __deriv(cls) -> Callable[[list, list], list]:
+        """
+        Find chain computing derivative of function.
+
+        Derivatives are computed from the points and the values of function as follows.
+            1. ``Sin`` is ``cos(x)``, and ``Cos`` is ``-sin(x)``.
+            2. ``Tan`` is ``1 + tan(x)^2``, and ``Cot`` is ``-(1 + cot(x)^2)``.
+            3. ``Csc`` is ``-csc(x) / tan(x)``, and ``Sec`` is ``sec(x) * tan(x)``.
+            4. ``ArcSin`` and ``ArcCos`` are ``+-1 / sqrt(1 - x^2)``, resp.
+            5. ``ArcTan`` and ``ArcCot`` are ``+-1 / (1 + x^2)``, resp.
+            6. ``ArcCsc`` and ``ArcSec`` are ``-+1 / (|x| * sqrt(x^2 - 1))``, resp.
+            7. ``Haversine`` is ``sin(x) / 2``, and ``InverseHaversine`` is ``1 / sqrt(x * (1 - x))``.
+            8. ``Sinc`` follows the rules of ``TriFun.__dsinc``.
+
+        This method is private and called internally as a helper of ``TriFun.dual``.
+
+        :return: Chain computing derivative from points and values of function.
+        :rtype: Callable[[list, list], list]
+        """
+        if cls == Sin:
+            return lambda x, f: list(map(math.cos, x))
+        elif cls == Cos:
+            return lambda x, f: list(map(neg, map(math.sin, x)))
+        elif cls == Tan:
+            return lambda x, f: list(map(add, repeat(1.0), map(mul, f, f)))
+        elif cls == Csc:
+            return lambda x, f: list(map(neg, map(truediv, f, map(math.tan, x))))
+        elif cls == Sec:
+            return lambda x, f: list(map(mul, f, map(math.tan, x)))
+        elif cls == Cot:
+            return lambda x, f: list(map(neg, map(add, repeat(1.0), map(mul, f, f))))
+        elif cls in [ArcSin, ArcCos]:
+            return lambda x, f: list(map(truediv, repeat(1.0 if cls == ArcSin else -1.0),
+                                         map(math.sqrt, map(sub, repeat(1.0), map(mul, x, x)))))
+        elif cls in [ArcTan, ArcCot]:
+            return lambda x, f: list(map(truediv, repeat(1.0 if cls == ArcTan else -1.0),
+                                         map(add, repeat(1.0), map(mul, x, x))))
+        elif cls in [ArcCsc, ArcSec]:
+            return lambda x, f: list(map(truediv, repeat(-1.0 if cls == ArcCsc else 1.0),
+                                         map(mul, map(abs, x), map(math.sqrt, map(sub, map(mul, x, x), repeat(1.0))))))
+        elif cls == Haversine:
+            return lambda x, f: list(map(mul, map(math.sin, x), repeat(0.5)))
+        elif cls == InverseHaversine:
+            return lambda x, f: list(map(truediv, repeat(1.0),
+                                         map(math.sqrt, map(mul, x, map(sub, repeat(1.0), x)))))
+        else:
+            return lambda x, f: list(map(cls.__dsinc, x))
+
+    @classmethod
+    def dual(cls, x: Dual.Dual) -> Tuple[Dual.Dual, List[Warning.InterpWarn]]:
+        """
+        Evaluate trigonometric function over dual numbers.
+
+        Values are computed by ``TriFun.eval``, and tangents by the chain rule with the derivative found by
+        ``TriFun.__deriv``.
+        Derivative at the point out of domain or pole is nan.
+
+        :param x: Point where function is to be computed.
+        :type x: Dual.Dual
+
+        :return: Computed value with tangents and list of generated warnings.
+        :rtype: Tuple[Dual.Dual, List[Warning.InterpWarn]]
+        """
+        res, warn = cls.eval(x.v)
+
+        return Dual.DualArith.lift(x, res, cls.__deriv()), warn
+
+    @classmethod
+    def diff(cls, rt: Token.Fun, b: Symbolic.Builder) -> List[Optional[Token.Tok]]:
+        """
+        Build derivative of trigonometric function.
+
+        Derivatives follow the rules of ``TriFun.__deriv``, where f is the token itself so that it is shared.
+        ``Sinc`` is ``(Cos[x] - f) / x``, which is singular at 0 unlike ``TriFun.__dsinc``.
+
+        :param rt: Token whose derivative is to be built.
+        :type rt: Token.Fun
+        :param b: Builder of tokens.
+        :type b: Symbolic.Builder
+
+        :return: Derivative. None if identically 0.
+        :rtype: List[Optional[Token.Tok]]
+        """
+        x: Token.Tok = rt.chd[0]
+
+        if cls == Sin:
+            return [b.fun(Cos, x)]
+        elif cls == Cos:
+            return [b.neg(b.fun(Sin, x))]
+        elif cls in [Tan, Cot]:
+            df: Token.Tok = b.add(b.num(1), b.mul(rt, rt))
+
+            return [df if cls == Tan else b.neg(df)]
+        elif cls == Csc:
+            return [b.neg(b.div(rt, b.fun(Tan, x)))]
+        elif cls == Sec:
+            return [b.mul(rt, b.fun(Tan, x))]
+        elif cls in [ArcSin, ArcCos]:
+            return [b.div(b.num(1 if cls == ArcSin else -1), b.fun(Exponential.Sqrt, b.sub(b.num(1), b.mul(x, x))))]
+        elif cls in [ArcTan, ArcCot]:
+            return [b.div(b.num(1 if cls == ArcTan else -1), b.add(b.num(1), b.mul(x, x)))]
+        elif cls in [ArcCsc, ArcSec]:
+            return [b.div(b.num(-1 if cls == ArcCsc else 1),
+                          b.mul(b.fun(Integer.Abs, x), b.fun(Exponential.Sqrt, b.sub(b.mul(x, x), b.num(1)))))]
+        elif cls == Haversine:
+            return [b.mul(b.num(0.5), b.fun(Sin, x))]
+        elif cls == InverseHaversine:
+            return [b.div(b.num(1), b.fun(Exponential.Sqrt, b.mul(x, b.sub(b.num(1), x))))]
+        else:
+            return [b.div(b.sub(b.fun(Cos, x), rt), x)]
+
     # # @classmethod
     # # def chk_t(cls, rt: Token.Fun) -> Optional[List[Type.Sign]]:
     # #     """
@@ -836,7 +1296,8 @@ class TriFun(Function.Fun):
 
 @final
 class Sin(TriFun):
-    __SGN: Final[List[str]] = ['Sin[Real] -> Real', 'Sin[Sym] -> Sym']
+    __SGN: Final[List[str]] = ['Sin[Real] -> Real', 'Sin[Sym] -> Sym', 'Sin[Interval] -> Interval',
+                               'Sin[List of Real] -> List of Real']
 
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
@@ -844,7 +1305,8 @@ class Sin(TriFun):
 
 @final
 class Cos(TriFun):
-    __SGN: Final[List[str]] = ['Cos[Real] -> Real', 'Cos[Sym] -> Sym']
+    __SGN: Final[List[str]] = ['Cos[Real] -> Real', 'Cos[Sym] -> Sym', 'Cos[Interval] -> Interval',
+                               'Cos[List of Real] -> List of Real']
 
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
@@ -852,7 +1314,8 @@ class Cos(TriFun):
 
 @final
 class Tan(TriFun):
-    __SGN: Final[List[str]] = ['Tan[Real] -> Real', 'Tan[Sym] -> Sym']
+    __SGN: Final[List[str]] = ['Tan[Real] -> Real', 'Tan[Sym] -> Sym', 'Tan[Interval] -> Interval',
+                               'Tan[List of Real] -> List of Real']
 
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
@@ -860,7 +1323,8 @@ class Tan(TriFun):
 
 @final
 class Csc(TriFun):
-    __SGN: Final[List[str]] = ['Csc[Real] -> Real', 'Csc[Sym] -> Sym']
+    __SGN: Final[List[str]] = ['Csc[Real] -> Real', 'Csc[Sym] -> Sym', 'Csc[Interval] -> Interval',
+                               'Csc[List of Real] -> List of Real']
 
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
@@ -868,7 +1332,8 @@ class Csc(TriFun):
 
 @final
 class Sec(TriFun):
-    __SGN: Final[List[str]] = ['Csc[Real] -> Real', 'Csc[Sym] -> Sym']
+    __SGN: Final[List[str]] = ['Sec[Real] -> Real', 'Sec[Sym] -> Sym', 'Sec[Interval] -> Interval',
+                               'Sec[List of Real] -> List of Real']
 
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
@@ -876,7 +1341,8 @@ class Sec(TriFun):
 
 @final
 class Cot(TriFun):
-    __SGN: Final[List[str]] = ['Cot[Real] -> Real', 'Cot[Sym] -> Sym']
+    __SGN: Final[List[str]] = ['Cot[Real] -> Real', 'Cot[Sym] -> Sym', 'Cot[Interval] -> Interval',
+                               'Cot[List of Real] -> List of Real']
 
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
@@ -884,7 +1350,8 @@ class Cot(TriFun):
 
 @final
 class ArcSin(TriFun):
-    __SGN: Final[List[str]] = ['ArcSin[Real] -> Real', 'ArcSin[Sym] -> Sym']
+    __SGN: Final[List[str]] = ['ArcSin[Real] -> Real', 'ArcSin[Sym] -> Sym', 'ArcSin[Interval] -> Interval',
+                               'ArcSin[List of Real] -> List of Real']
 
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
@@ -892,7 +1359,8 @@ class ArcSin(TriFun):
 
 @final
 class ArcCos(TriFun):
-    __SGN: Final[List[str]] = ['ArcCos[Real] -> Real', 'ArcCos[Sym] -> Sym']
+    __SGN: Final[List[str]] = ['ArcCos[Real] -> Real', 'ArcCos[Sym] -> Sym', 'ArcCos[Interval] -> Interval',
+                               'ArcCos[List of Real] -> List of Real']
 
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
@@ -900,7 +1368,8 @@ class ArcCos(TriFun):
 
 @final
 class ArcTan(TriFun):
-    __SGN: Final[List[str]] = ['ArcTan[Real] -> Real', 'ArcTan[Sym] -> Sym']
+    __SGN: Final[List[str]] = ['ArcTan[Real] -> Real', 'ArcTan[Sym] -> Sym', 'ArcTan[Interval] -> Interval',
+                               'ArcTan[List of Real] -> List of Real']
 
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
@@ -908,7 +1377,8 @@ class ArcTan(TriFun):
 
 @final
 class ArcCsc(TriFun):
-    __SGN: Final[List[str]] = ['ArcCsc[Real] -> Real', 'ArcCsc[Sym] -> Sym']
+    __SGN: Final[List[str]] = ['ArcCsc[Real] -> Real', 'ArcCsc[Sym] -> Sym', 'ArcCsc[Interval] -> Interval',
+                               'ArcCsc[List of Real] -> List of Real']
 
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
@@ -916,7 +1386,8 @@ class ArcCsc(TriFun):
 
 @final
 class ArcSec(TriFun):
-    __SGN: Final[List[str]] = ['ArcSec[Real] -> Real', 'ArcSec[Sym] -> Sym']
+    __SGN: Final[List[str]] = ['ArcSec[Real] -> Real', 'ArcSec[Sym] -> Sym', 'ArcSec[Interval] -> Interval',
+                               'ArcSec[List of Real] -> List of Real']
 
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
@@ -924,7 +1395,8 @@ class ArcSec(TriFun):
 
 @final
 class ArcCot(TriFun):
-    __SGN: Final[List[str]] = ['ArcCot[Real] -> Real', 'ArcCot[Sym] -> Sym']
+    __SGN: Final[List[str]] = ['ArcCot[Real] -> Real', 'ArcCot[Sym] -> Sym', 'ArcCot[Interval] -> Interval',
+                               'ArcCot[List of Real] -> List of Real']
 
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
@@ -932,7 +1404,8 @@ class ArcCot(TriFun):
 
 @final
 class Haversine(TriFun):
-    __SGN: Final[List[str]] = ['Haversine[Real] -> Real', 'Haversine[Sym] -> Sym']
+    __SGN: Final[List[str]] = ['Haversine[Real] -> Real', 'Haversine[Sym] -> Sym', 'Haversine[Interval] -> Interval',
+                               'Haversine[List of Real] -> List of Real']
 
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
@@ -940,7 +1413,9 @@ class Haversine(TriFun):
 
 @final
 class InverseHaversine(TriFun):
-    __SGN: Final[List[str]] = ['InverseHaversine[Real] -> Real', 'InverseHaversine[Sym] -> Sym']
+    __SGN: Final[List[str]] = ['InverseHaversine[Real] -> Real', 'InverseHaversine[Sym] -> Sym',
+                               'InverseHaversine[Interval] -> Interval',
+                               'InverseHaversine[List of Real] -> List of Real']
 
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
@@ -948,7 +1423,8 @@ class InverseHaversine(TriFun):
 
 @final
 class Sinc(TriFun):
-    __SGN: Final[List[str]] = ['Sinc[Real] -> Real', 'Sinc[Sym] -> Sym']
+    __SGN: Final[List[str]] = ['Sinc[Real] -> Real', 'Sinc[Sym] -> Sym', 'Sinc[Interval] -> Interval',
+                               'Sinc[List of Real] -> List of Real']
 
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
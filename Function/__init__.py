@@ -1,2 +1,2 @@
 __all__ = ['Function', 'Integer', 'Division', 'Combination', 'Trigonometric', 'Hyperbolic', 'Exponential', 'Gamma',
-           'General', 'Link', 'Signal']
+           'General', 'Link', 'Signal', 'Precision', 'Root']
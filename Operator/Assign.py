@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import final, Final, Tuple, Dict, Optional, List
 
 from Core import Token, TypeSystem
-from Operator import Operator
+from Operator import Operator, Binary, Bool
 
 
 class AsgnOp(Operator.Op):
@@ -16,6 +16,38 @@ class AsgnOp(Operator.Op):
     def argc(cls) -> int:
         return cls.__ARGC
 
+    @classmethod
+    def op(cls) -> Optional[type]:
+        return None
+
+    @classmethod
+    def sgn(cls) -> List[str]:
+        return [sgn.replace(f' {cls.op().sym()} ', f' {cls.sym()} ', 1) for sgn in cls.op().sgn()]
+
+    @classmethod
+    def chk_t(cls, rt: Token.Tok, t_env: Dict[int, TypeSystem.T]) -> Optional[Dict[int, TypeSystem.T]]:
+        """
+        Type checker for compound assignments.
+
+        Compound assignment ``x op= y`` has the same type as ``x op y``, which is inferred by the type checker of
+        corresponding binary operator.
+        The inferred type is recorded in the type environment as the new type of ``x``.
+
+        :param rt: Token to be type checked.
+        :type rt: Token.Tok
+        :param t_env: Type environment.
+        :type t_env: Dict[int, TypeSystem.T]
+
+        :return: Updated type environment. None if type check fails.
+        :rtype: Optional[Dict[int, TypeSystem.T]]
+        """
+        if type(rt.chd[0]) != Token.Var or cls.op().chk_t(rt, t_env) is None:
+            return None
+
+        t_env[rt.chd[0].v] = rt.t
+
+        return t_env
+
 
 @final
 class Asgn(AsgnOp):
@@ -52,17 +84,14 @@ class Asgn(AsgnOp):
 
     @classmethod
     def chk_t(cls, rt: Token.Tok, t_env: Dict[int, TypeSystem.T]) -> Optional[Dict[int, TypeSystem.T]]:
-        t1: TypeSystem.T = rt.chd[0].t
-        t2: TypeSystem.T = rt.chd[1].t
-
-        if t1.base:
-            if not (type(t1) == TypeSystem.Sym) or type(t2) == TypeSystem.Void:
-                return None
-            else:
-                rt.t = t2
-        else:
+        t: TypeSystem.T = rt.chd[1].t
+
+        if type(rt.chd[0]) != Token.Var or type(t) == TypeSystem.Void:
             return None
 
+        rt.t = t
+        t_env[rt.chd[0].v] = t
+
         return t_env
 
 
@@ -70,6 +99,7 @@ class Asgn(AsgnOp):
 class AddAsgn(AsgnOp):
     __PRECD: Final[Tuple[int, int]] = (1, 2)
     __SYM: Final[str] = '+='
+    __OP: Final[type] = Binary.Add
 
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
@@ -87,14 +117,15 @@ class AddAsgn(AsgnOp):
         return cls.__SYM
 
     @classmethod
-    def sgn(cls) -> List[str]:
-        return cls.__SGN
+    def op(cls) -> type:
+        return cls.__OP
 
 
 @final
 class SubAsgn(AsgnOp):
     __PRECD: Final[Tuple[int, int]] = (1, 2)
     __SYM: Final[str] = '-='
+    __OP: Final[type] = Binary.Sub
 
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
@@ -112,14 +143,15 @@ class SubAsgn(AsgnOp):
         return cls.__SYM
 
     @classmethod
-    def sgn(cls) -> List[str]:
-        return cls.__SGN
+    def op(cls) -> type:
+        return cls.__OP
 
 
 @final
 class MulAsgn(AsgnOp):
     __PRECD: Final[Tuple[int, int]] = (1, 2)
     __SYM: Final[str] = '*='
+    __OP: Final[type] = Binary.Mul
 
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
@@ -137,14 +169,15 @@ class MulAsgn(AsgnOp):
         return cls.__SYM
 
     @classmethod
-    def sgn(cls) -> List[str]:
-        return cls.__SGN
+    def op(cls) -> type:
+        return cls.__OP
 
 
 @final
 class MatMulAsgn(AsgnOp):
     __PRECD: Final[Tuple[int, int]] = (1, 2)
     __SYM: Final[str] = '%*%='
+    __OP: Final[type] = Binary.MatMul
 
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
@@ -162,23 +195,41 @@ class MatMulAsgn(AsgnOp):
         return cls.__SYM
 
     @classmethod
-    def sgn(cls) -> List[str]:
-        return cls.__SGN
+    def op(cls) -> type:
+        return cls.__OP
 
 
 @final
 class DivAsgn(AsgnOp):
     __PRECD: Final[Tuple[int, int]] = (1, 2)
     __SYM: Final[str] = '/='
+    __OP: Final[type] = Binary.Div
 
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
 
+    @classmethod
+    def precd_in(cls) -> int:
+        return cls.__PRECD[0]
+
+    @classmethod
+    def precd_out(cls) -> int:
+        return cls.__PRECD[1]
+
+    @classmethod
+    def sym(cls) -> str:
+        return cls.__SYM
+
+    @classmethod
+    def op(cls) -> type:
+        return cls.__OP
+
 
 @final
 class RemAsgn(AsgnOp):
     __PRECD: Final[Tuple[int, int]] = (1, 2)
     __SYM: Final[str] = '%='
+    __OP: Final[type] = Binary.Rem
 
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
@@ -196,14 +247,15 @@ class RemAsgn(AsgnOp):
         return cls.__SYM
 
     @classmethod
-    def sgn(cls) -> List[str]:
-        return cls.__SGN
+    def op(cls) -> type:
+        return cls.__OP
 
 
 @final
 class QuotAsgn(AsgnOp):
     __PRECD: Final[Tuple[int, int]] = (1, 2)
     __SYM: Final[str] = '//='
+    __OP: Final[type] = Binary.Quot
 
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
@@ -221,14 +273,15 @@ class QuotAsgn(AsgnOp):
         return cls.__SYM
 
     @classmethod
-    def sgn(cls) -> List[str]:
-        return cls.__SGN
+    def op(cls) -> type:
+        return cls.__OP
 
 
 @final
 class PowAsgn(AsgnOp):
     __PRECD: Final[Tuple[int, int]] = (1, 2)
     __SYM: Final[str] = '**='
+    __OP: Final[type] = Binary.Pow
 
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
@@ -246,14 +299,15 @@ class PowAsgn(AsgnOp):
         return cls.__SYM
 
     @classmethod
-    def sgn(cls) -> List[str]:
-        return cls.__SGN
+    def op(cls) -> type:
+        return cls.__OP
 
 
 @final
 class AndAsgn(AsgnOp):
     __PRECD: Final[Tuple[int, int]] = (1, 2)
     __SYM: Final[str] = '&='
+    __OP: Final[type] = Bool.And
 
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
@@ -271,14 +325,15 @@ class AndAsgn(AsgnOp):
         return cls.__SYM
 
     @classmethod
-    def sgn(cls) -> List[str]:
-        return cls.__SGN
+    def op(cls) -> type:
+        return cls.__OP
 
 
 @final
 class OrAsgn(AsgnOp):
     __PRECD: Final[Tuple[int, int]] = (1, 2)
     __SYM: Final[str] = '|='
+    __OP: Final[type] = Bool.Or
 
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
@@ -296,14 +351,15 @@ class OrAsgn(AsgnOp):
         return cls.__SYM
 
     @classmethod
-    def sgn(cls) -> List[str]:
-        return cls.__SGN
+    def op(cls) -> type:
+        return cls.__OP
 
 
 @final
 class XorAsgn(AsgnOp):
     __PRECD: Final[Tuple[int, int]] = (1, 2)
     __SYM: Final[str] = '^='
+    __OP: Final[type] = Bool.Xor
 
     def __new__(cls, *args, **kwargs) -> None:
         raise NotImplementedError
@@ -321,5 +377,5 @@ class XorAsgn(AsgnOp):
         return cls.__SYM
 
     @classmethod
-    def sgn(cls) -> List[str]:
-        return cls.__SGN
+    def op(cls) -> type:
+        return cls.__OP
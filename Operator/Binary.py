@@ -2,8 +2,10 @@ from __future__ import annotations
 
 from typing import final, Final, Tuple, Dict, Optional, List
 
-from Core import Token, TypeSystem
+from Core import Dual, Interval, Symbolic, Token, TypeSystem, Type
+from Function import Exponential
 from Operator import Operator
+from Warning import Warning
 
 
 class BinOp(Operator.Op):
@@ -25,7 +27,7 @@ class BinOp(Operator.Op):
             if t2.base:
                 res_t: TypeSystem.T = TypeSystem.T.supt(t1, t2)
 
-                if type(res_t) in [TypeSystem.Real, TypeSystem.Cmplx, TypeSystem.Sym]:
+                if type(res_t) in [TypeSystem.Real, TypeSystem.Cmplx, TypeSystem.Interval, TypeSystem.Sym]:
                     rt.t = res_t
                 else:
                     return None
@@ -55,13 +57,140 @@ class BinOp(Operator.Op):
         return t_env
 
 
+class ArithOp(BinOp):
+    def __new__(cls, *args, **kwargs) -> None:
+        raise NotImplementedError
+
+    @classmethod
+    def ival(cls, x: Interval.Ival, y: Interval.Ival) -> Tuple[Interval.Ival, List[Warning.InterpWarn]]:
+        """
+        Evaluate binary operator over intervals.
+
+        Operands are batches of intervals, and batch of size 1 is broadcast.
+        The result encloses all the values of the operator over the operands.
+        For the rules of each operator, refer to the comments of ``Interval.IvalArith``.
+
+        It generates warnings for followings cases.
+            1. Some divisor contains 0, or some base containing 0 is raised to negative integer. (POLE_DETECT)
+            2. Some base with non-integer exponent is not contained in ``[0, inf]``. (DOMAIN_OUT)
+
+        :param x: Left operand.
+        :type x: Interval.Ival
+        :param y: Right operand.
+        :type y: Interval.Ival
+
+        :return: Enclosure of the result and list of generated warnings.
+        :rtype: Tuple[Interval.Ival, List[Warning.InterpWarn]]
+        """
+        if cls == Add:
+            return Interval.IvalArith.add(x, y), []
+        elif cls == Sub:
+            return Interval.IvalArith.sub(x, y), []
+        elif cls == Mul:
+            return Interval.IvalArith.mul(x, y), []
+        elif cls == Div:
+            res, pole = Interval.IvalArith.div(x, y)
+            out: bool = False
+        elif cls == Pow:
+            res, out, pole = Interval.IvalArith.pow(x, y)
+        else:
+            raise NotImplementedError
+
+        warn: List[Warning.InterpWarn] = []
+
+        if out:
+            warn.append(Warning.InterpWarn(Type.InterpWarnT.DOMAIN_OUT, 98, handle=cls.__name__))
+
+        if pole:
+            warn.append(Warning.InterpWarn(Type.InterpWarnT.POLE_DETECT, 99, handle=cls.__name__))
+
+        return res, warn
+
+    @classmethod
+    def dual(cls, x: Dual.Dual, y: Dual.Dual) -> Tuple[Dual.Dual, List[Warning.InterpWarn]]:
+        """
+        Evaluate binary operator over dual numbers.
+
+        Operands are batches of dual numbers, and batch of size 1 is broadcast.
+        Values are computed with tangents of each direction by the chain rule.
+        For the rules of each operator, refer to the comments of ``Dual.DualArith``.
+        Values of ``Pow`` follow the rules of ``Exponential.Power``.
+
+        It generates warnings for followings cases.
+            1. Some divisor is 0. (POLE_DETECT)
+            2. Warnings generated by ``Exponential.Power.eval`` for ``Pow``.
+
+        :param x: Left operand.
+        :type x: Dual.Dual
+        :param y: Right operand.
+        :type y: Dual.Dual
+
+        :return: Result with tangents and list of generated warnings.
+        :rtype: Tuple[Dual.Dual, List[Warning.InterpWarn]]
+        """
+        if cls == Add:
+            return Dual.DualArith.add(x, y), []
+        elif cls == Sub:
+            return Dual.DualArith.sub(x, y), []
+        elif cls == Mul:
+            return Dual.DualArith.mul(x, y), []
+        elif cls == Div:
+            res, pole = Dual.DualArith.div(x, y)
+
+            return res, [Warning.InterpWarn(Type.InterpWarnT.POLE_DETECT, 100, handle=cls.__name__)] if pole else []
+        elif cls == Pow:
+            v, warn = Exponential.Power.eval(*Dual.DualArith.bcast(x, y)[0])
+
+            return Dual.DualArith.pow(x, y, v), warn
+        else:
+            raise NotImplementedError
+
+    @classmethod
+    def diff(cls, rt: Token.Op, b: Symbolic.Builder) -> List[Optional[Token.Tok]]:
+        """
+        Build partial derivatives of binary operator wrt. its operands.
+
+        Partial derivatives are built as follows, where f is the token itself so that it is shared.
+            1. ``Add`` is 1 and 1, and ``Sub`` is 1 and -1.
+            2. ``Mul`` is the other operands.
+            3. ``Div`` is ``1 / y`` and ``-f / y``.
+            4. ``Pow`` is ``y * x ** (y - 1)`` and ``f * Log[x]``.
+               The latter one is None if y is number, so that power to constant exponent has no logarithm of base.
+
+        :param rt: Token whose partial derivatives are to be built.
+        :type rt: Token.Op
+        :param b: Builder of tokens.
+        :type b: Symbolic.Builder
+
+        :return: Partial derivatives. None if identically 0.
+        :rtype: List[Optional[Token.Tok]]
+        """
+        x, y = rt.chd
+
+        if cls == Add:
+            return [b.num(1), b.num(1)]
+        elif cls == Sub:
+            return [b.num(1), b.num(-1)]
+        elif cls == Mul:
+            return [y, x]
+        elif cls == Div:
+            return [b.div(b.num(1), y), b.neg(b.div(rt, y))]
+        elif cls == Pow:
+            dx: Token.Tok = b.mul(y, b.pow(x, b.sub(y, b.num(1))))
+
+            return [dx, None if b.is_num(y) else b.mul(rt, b.fun(Exponential.Log, x))]
+        else:
+            raise NotImplementedError
+
+
 @final
-class Add(BinOp):
+class Add(ArithOp):
     __PRECD: Final[Tuple[int, int]] = (12, 11)
     __SYM: Final[str] = '+'
     __SGN: Final[List[str]] = ['Real + Real -> Real',
                                'Cmplx + Cmplx -> Cmplx',
                                'Sym + Sym -> Sym',
+                               'Interval + Interval -> Interval',
                                'Real + List of Real (n fold) -> List of Real (n fold)',
                                'Cmplx + List of Cmplx (n fold) -> List of Cmplx (n fold)',
                                'List of Real (n fold) + Real -> List of Real (n fold)',
@@ -90,12 +219,13 @@ class Add(BinOp):
 
 
 @final
-class Sub(BinOp):
+class Sub(ArithOp):
     __PRECD: Final[Tuple[int, int]] = (12, 11)
     __SYM: Final[str] = '-'
     __SGN: Final[List[str]] = ['Real - Real -> Real',
                                'Cmplx - Cmplx -> Cmplx',
                                'Sym - Sym -> Sym',
+                               'Interval - Interval -> Interval',
                                'Real - List of Real (n fold) -> List of Real (n fold)',
                                'Cmplx - List of Cmplx (n fold) -> List of Cmplx (n fold)',
                                'List of Real (n fold) - Real -> List of Real (n fold)',
@@ -124,12 +254,13 @@ class Sub(BinOp):
 
 
 @final
-class Mul(BinOp):
+class Mul(ArithOp):
     __PRECD: Final[Tuple[int, int]] = (14, 13)
     __SYM: Final[str] = '*'
     __SGN: Final[List[str]] = ['Real * Real -> Real',
                                'Cmplx * Cmplx -> Cmplx',
                                'Sym * Sym -> Sym',
+                               'Interval * Interval -> Interval',
                                'Real * List of Real (n fold) -> List of Real (n fold)',
                                'Cmplx * List of Cmplx (n fold) -> List of Cmplx (n fold)',
                                'List of Real (n fold) * Real -> List of Real (n fold)',
@@ -237,12 +368,13 @@ class MatMul(BinOp):
 
 
 @final
-class Div(BinOp):
+class Div(ArithOp):
     __PRECD: Final[Tuple[int, int]] = (14, 13)
     __SYM: Final[str] = '/'
     __SGN: Final[List[str]] = ['Real / Real -> Real',
                                'Cmplx / Cmplx -> Cmplx',
                                'Sym / Sym -> Sym',
+                               'Interval / Interval -> Interval',
                                'Real / List of Real (n fold) -> List of Real (n fold)',
                                'Cmplx / List of Cmplx (n fold) -> List of Cmplx (n fold)',
                                'List of Real (n fold) / Real -> List of Real (n fold)',
@@ -407,12 +539,13 @@ class Quot(BinOp):
 
 
 @final
-class Pow(BinOp):
+class Pow(ArithOp):
     __PRECD: Final[Tuple[int, int]] = (17, 18)
     __SYM: Final[str] = '**'
     __SGN: Final[List[str]] = ['Real ** Real -> Real',
                                'Cmplx ** Cmplx -> Cmplx',
                                'Sym ** Sym -> Sym',
+                               'Interval ** Interval -> Interval',
                                'Real ** List of Real (n fold) -> List of Real (n fold)',
                                'Cmplx ** List of Cmplx (n fold) -> List of Cmplx (n fold)',
                                'List of Real (n fold) ** Real -> List of Real (n fold)',
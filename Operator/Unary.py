@@ -2,8 +2,9 @@ from __future__ import annotations
 
 from typing import final, Final, Tuple, Dict, Optional, List
 
-from Core import TypeSystem, Token
+from Core import Dual, Interval, Symbolic, TypeSystem, Token
 from Operator import Operator
+from Warning import Warning
 
 
 class UniOp(Operator.Op):
@@ -21,7 +22,7 @@ class UniOp(Operator.Op):
         t: TypeSystem.T = rt.chd[0].t
 
         if t.base:
-            if type(t) in [TypeSystem.Real, TypeSystem.Cmplx, TypeSystem.Sym]:
+            if type(t) in [TypeSystem.Real, TypeSystem.Cmplx, TypeSystem.Interval, TypeSystem.Sym]:
                 rt.t = t
 
                 return t_env
@@ -36,13 +37,81 @@ class UniOp(Operator.Op):
                 return None
 
 
+class SgnOp(UniOp):
+    def __new__(cls, *args, **kwargs) -> None:
+        raise NotImplementedError
+
+    @classmethod
+    def ival(cls, x: Interval.Ival) -> Tuple[Interval.Ival, List[Warning.InterpWarn]]:
+        """
+        Evaluate unary operator over intervals.
+
+        Both of ``Plus`` and ``Minus`` are exact, so no rounding is needed.
+
+        :param x: Operand.
+        :type x: Interval.Ival
+
+        :return: Enclosure of the result and list of generated warnings.
+        :rtype: Tuple[Interval.Ival, List[Warning.InterpWarn]]
+        """
+        if cls == Plus:
+            return x, []
+        elif cls == Minus:
+            return Interval.IvalArith.neg(x), []
+        else:
+            raise NotImplementedError
+
+    @classmethod
+    def dual(cls, x: Dual.Dual) -> Tuple[Dual.Dual, List[Warning.InterpWarn]]:
+        """
+        Evaluate unary operator over dual numbers.
+
+        ``Plus`` is identity, and ``Minus`` negates both of values and tangents.
+
+        :param x: Operand.
+        :type x: Dual.Dual
+
+        :return: Result with tangents and list of generated warnings.
+        :rtype: Tuple[Dual.Dual, List[Warning.InterpWarn]]
+        """
+        if cls == Plus:
+            return x, []
+        elif cls == Minus:
+            return Dual.DualArith.neg(x), []
+        else:
+            raise NotImplementedError
+
+    @classmethod
+    def diff(cls, rt: Token.Op, b: Symbolic.Builder) -> List[Optional[Token.Tok]]:
+        """
+        Build partial derivative of unary operator wrt. its operand.
+
+        ``Plus`` is 1, and ``Minus`` is -1.
+
+        :param rt: Token whose partial derivative is to be built.
+        :type rt: Token.Op
+        :param b: Builder of tokens.
+        :type b: Symbolic.Builder
+
+        :return: Partial derivative. None if identically 0.
+        :rtype: List[Optional[Token.Tok]]
+        """
+        if cls == Plus:
+            return [b.num(1)]
+        elif cls == Minus:
+            return [b.num(-1)]
+        else:
+            raise NotImplementedError
+
+
 @final
-class Plus(UniOp):
+class Plus(SgnOp):
     __PRECD: Final[Tuple[int, int]] = (19, 20)
     __SYM: Final[str] = '+'
     __SGN: Final[List[str]] = ['+Real -> Real',
                                '+Cmplx -> Cmplx',
                                '+Sym -> Sym',
+                               '+Interval -> Interval',
                                '+List of Real (n fold) -> List of Real (n fold)'
                                '+List of Cmplx (n fold) -> List of Cmplx (n fold)']
 
@@ -67,12 +136,13 @@ class Plus(UniOp):
 
 
 @final
-class Minus(UniOp):
+class Minus(SgnOp):
     __PRECD: Final[Tuple[int, int]] = (19, 20)
     __SYM: Final[str] = '-'
     __SGN: Final[List[str]] = ['-Real -> Real',
                                '-Cmplx -> Cmplx',
                                '-Sym -> Sym',
+                               '-Interval -> Interval',
                                '-List of Real (n fold) -> List of Real (n fold)'
                                '-List of Cmplx (n fold) -> List of Cmplx (n fold)']
 
@@ -0,0 +1,801 @@
+import random
+import statistics
+import time
+from decimal import Decimal
+from operator import sub, truediv
+from typing import final, Final, Dict, List, Tuple, Callable
+
+from Core import Type, Token, AST, Dual, Interpreter, Parser, Polynomial, Tape, TypeChecker, Interval
+from Function import Precision
+from Util import Printer
+
+
+@final
+class BenchManager:
+    """
+    Run performance benchmarks.
+
+    Unlike ``TestManager``, which checks numerical accuracy against MATLAB references, it measures how long each
+    component takes on large inputs.
+    Each benchmark repeats its target several times and reports the best elapsed time to reduce the noise from the
+    system.
+
+    This class is implemented as singleton.
+    For the concept of singleton pattern, consult the references below.
+
+    **Reference**
+        * https://en.wikipedia.org/wiki/Singleton_pattern
+
+    :cvar __REPEAT: # of repetitions for each benchmark.
+    :cvar __inst: Singleton object.
+    """
+    __REPEAT: Final[int] = 3
+
+    __inst = None
+
+    @classmethod
+    def inst(cls):
+        """
+        Getter for singleton object.
+
+        If it is the first time calling this, it initializes the singleton objects.
+        This automatically supports so called lazy initialization.
+
+        :return: Singleton object.
+        :rtype: BenchManager
+        """
+        if not cls.__inst:
+            cls.__inst = BenchManager()
+
+        return cls.__inst
+
+    def __report(self, title: str, col: List[str], row: List[List[str]]) -> None:
+        """
+        Buffer benchmark result as a table.
+
+        This method is private and called internally as a helper of each benchmark.
+
+        :param title: Title of benchmark.
+        :type title: str
+        :param col: Column names.
+        :type col: List[str]
+        :param row: Rows of table.
+        :type row: List[List[str]]
+        """
+        buf: Type.BufT = Type.BufT.DEBUG  # Debug buffer.
+
+        Printer.Printer.inst().buf(Printer.Printer.inst().f_title(title), buf)
+        Printer.Printer.inst().buf(Printer.Printer.inst().f_tb(col, 20), buf, indent=2)
+        Printer.Printer.inst().buf(Printer.Printer.inst().f_hline(20, len(col)), buf, indent=2)
+
+        for it in row:
+            Printer.Printer.inst().buf(Printer.Printer.inst().f_tb(it, 20), buf, indent=2)
+
+        Printer.Printer.inst().buf_newline(buf)
+
+    def __mat_lit(self, n: int, m: int) -> Token.List:
+        """
+        Generate AST of n by m matrix literal.
+
+        This method is private and called internally as a helper of ``BenchManager.bench_arr_t``.
+
+        :param n: # of rows.
+        :type n: int
+        :param m: # of columns.
+        :type m: int
+
+        :return: Root of generated AST.
+        :rtype: Token.List
+        """
+        rt: Token.List = Token.List(argc=n)
+
+        for i in range(n):
+            row: Token.List = Token.List(argc=m)
+
+            for j in range(m):
+                row.add_chd(Token.Num(float(i * m + j)))
+
+            rt.add_chd(row)
+
+        return rt
+
+    def bench_arr_t(self, sz: List[int] = None) -> None:
+        """
+        Benchmark type checking of large matrix literals.
+
+        Type checking of n by n matrix literal must be linear in the # of items.
+        That is, the elapsed time per item must stay flat as n grows.
+
+        :param sz: Sizes of matrix to be tested. (Default: [10, 100, 1000])
+        :type sz: List[int]
+        """
+        row: List[List[str]] = []
+
+        for n in sz if sz else [10, 100, 1000]:
+            expr: AST.AST = AST.AST(self.__mat_lit(n, n))
+            best: float = float('inf')
+
+            for _ in range(self.__REPEAT):
+                start: float = time.process_time()  # Start time stamp for elapsed time measure.
+                Interpreter.Interp.inst().interp(expr)
+                best = min(best, time.process_time() - start)
+
+            row.append([f'{n} x {n}', str(expr.rt.t), f'{best * 1000:.2f}ms', f'{best / (n * n) * 1e9:.1f}ns'])
+
+        self.__report('matrix literal type checking', ['SIZE', 'TYPE', 'ELAPSED', 'PER ITEM'], row)
+
+    def bench_chk_many(self, sz: int = 10000, proc: List[int] = None) -> None:
+        """
+        Benchmark batched type checking of formula library.
+
+        The library is generated by repeating a few small formulae.
+
+        :param sz: # of formulae in the library. (Default: 10000)
+        :type sz: int
+        :param proc: # of worker processes to be tested. (Default: [1, 4])
+        :type proc: List[int]
+        """
+        src: List[str] = ['1 + 2', '{1, 2}', '1 + {1, 2j}', '{"a", "b"}', '"a" + 1']
+        expr_l: List[AST.AST] = [Parser.Parser.inst().parse(src[i % len(src)]) for i in range(sz)]
+        row: List[List[str]] = []
+
+        for n in proc if proc else [1, 4]:
+            best: float = float('inf')
+
+            for _ in range(self.__REPEAT):
+                start: float = time.perf_counter()  # Start time stamp for elapsed time measure.
+                res: list = TypeChecker.TChker.inst().chk_many(expr_l, n)
+                best = min(best, time.perf_counter() - start)
+
+            err: int = sum(isinstance(it, Exception) for it in res)  # # of ASTs with type error.
+
+            row.append([str(n), str(sz), str(err), f'{best * 1000:.2f}ms', f'{best / sz * 1e6:.1f}us'])
+
+        self.__report('batched type checking', ['PROC', 'SIZE', 'ERROR', 'ELAPSED', 'PER FORMULA'], row)
+
+    def __tensor_lit(self, depth: int, wd: int) -> Token.List:
+        """
+        Generate AST of tensor literal.
+
+        This method is private and called internally as a helper of ``BenchManager.bench_deep_t``.
+
+        :param depth: Depth of tensor.
+        :type depth: int
+        :param wd: # of items along each axis.
+        :type wd: int
+
+        :return: Root of generated AST.
+        :rtype: Token.List
+        """
+        rt: Token.List = Token.List(argc=wd)
+
+        for i in range(wd):
+            rt.add_chd(self.__tensor_lit(depth - 1, wd) if depth > 1 else Token.Num(float(i)))
+
+        return rt
+
+    def bench_deep_t(self, depth: List[int] = None, wd: int = 2) -> None:
+        """
+        Benchmark type checking of deep tensor literals.
+
+        Unlike ``BenchManager.bench_arr_t``, tensors are type checked by ``TypeChecker.TChker``, which infers the depth
+        of nested lists by fold constraints.
+        Type checking must be linear in the # of items, that is, the elapsed time per item must stay flat as the
+        tensor gets deeper.
+
+        :param depth: Depths of tensor to be tested. (Default: [2, 4, 8, 12])
+        :type depth: List[int]
+        :param wd: # of items along each axis. (Default: 2)
+        :type wd: int
+        """
+        row: List[List[str]] = []
+
+        for d in depth if depth else [2, 4, 8, 12]:
+            expr_l: List[AST.AST] = [AST.AST(self.__tensor_lit(d, wd))]
+            best: float = float('inf')
+
+            for _ in range(self.__REPEAT):
+                start: float = time.perf_counter()  # Start time stamp for elapsed time measure.
+                res: list = TypeChecker.TChker.inst().chk_many(expr_l)
+                best = min(best, time.perf_counter() - start)
+
+            t: str = type(res[0]).__name__ if isinstance(res[0], Exception) else ' or '.join(map(str, res[0]))
+
+            row.append([str(d), t, f'{best * 1000:.2f}ms', f'{best / wd ** d * 1e6:.1f}us'])
+
+        self.__report('deep tensor type checking', ['DEPTH', 'TYPE', 'ELAPSED', 'PER ITEM'], row)
+
+    def bench_fun(self, fun: List[type], sz: int = 1000000, dom: Tuple[float, float] = (-1, 1)) -> None:
+        """
+        Benchmark throughput of vectorized functions.
+
+        Each function is evaluated on a flat tensor of reals drawn uniformly from the domain.
+        The same input is shared by all functions so that their throughputs are comparable.
+
+        :param fun: Functions to be tested.
+        :type fun: List[type]
+        :param sz: # of items in the input tensor. (Default: 1000000)
+        :type sz: int
+        :param dom: Domain where inputs are drawn. (Default: (-1, 1))
+        :type dom: Tuple[float, float]
+        """
+        x: List[float] = [random.uniform(*dom) for _ in range(sz)]
+        row: List[List[str]] = []
+
+        for f in fun:
+            best: float = float('inf')
+
+            for _ in range(self.__REPEAT):
+                start: float = time.perf_counter()  # Start time stamp for elapsed time measure.
+                f.eval(x)
+                best = min(best, time.perf_counter() - start)
+
+            row.append([f.__name__, str(sz), f'{best * 1000:.2f}ms', f'{best / sz * 1e9:.1f}ns'])
+
+        self.__report('function throughput', ['FUNCTION', 'SIZE', 'ELAPSED', 'PER ITEM'], row)
+
+    def bench_acc(self, fun: type, src: str, post: Callable[..., Decimal] = None) -> None:
+        """
+        Benchmark accuracy and throughput of vectorized function against MATLAB references.
+
+        Test inputs and references are read from ``../Test/In/Test_<src>_<size>.in`` and
+        ``../Test/Ref/Test_<src>_<size>.ref`` wrt. current working directory for small, medium, and large inputs.
+        Inputs of function with multiple parameters are interleaved, and they are split into one tensor per parameter.
+        Since the references are not always computed for the function itself, one can pass post processor which maps
+        computed value and parameters to the referenced quantity.
+        For example, ``Sinh`` is tested against ``Sinhc`` references with post processor ``lambda y, x: y / x``.
+        Errors are relative to the references and computed using arbitrary precision arithmetic.
+
+        :param fun: Function to be tested.
+        :type fun: type
+        :param src: Name of test data.
+        :type src: str
+        :param post: Post processor of computed values. (Default: Identity)
+        :type post: Callable[..., Decimal]
+        """
+        row: List[List[str]] = []
+
+        for sz in Type.TestSzT:
+            name: str = f'Test_{src}_{sz.name.capitalize()}'
+
+            with open(f'../Test/In/{name}.in') as f:
+                test_in: List[Decimal] = [Decimal(it) for it in f.read().split()]
+
+            with open(f'../Test/Ref/{name}.ref') as f:
+                test_ref: List[Decimal] = [Decimal(it) for it in f.read().split()]
+
+            argc: int = len(test_in) // len(test_ref)
+            arg: List[List[float]] = [list(map(float, test_in[i::argc])) for i in range(argc)]
+            best: float = float('inf')
+
+            for _ in range(self.__REPEAT):
+                start: float = time.perf_counter()  # Start time stamp for elapsed time measure.
+                out: List[float] = fun.eval(*arg)[0]
+                best = min(best, time.perf_counter() - start)
+
+            out: List[Decimal] = [post(Decimal(y), *map(Decimal, x)) if post else Decimal(y) for y, *x in
+                                  zip(out, *arg)]
+            err: List[float] = [float(abs(y - ref) / abs(ref)) if ref else float(abs(y)) for y, ref in
+                                zip(out, test_ref)]  # Relative error.
+
+            row.append([f'{fun.__name__} ({sz.name.lower()})', f'{max(err):.3e}', f'{statistics.fmean(err):.3e}',
+                        f'{best * 1000:.2f}ms', f'{best / len(test_ref) * 1e9:.1f}ns'])
+
+        self.__report('function accuracy', ['FUNCTION', 'MAX ERROR', 'MEAN ERROR', 'ELAPSED', 'PER ITEM'], row)
+
+    def bench_comb(self, fun: List[type], n: List[int] = None) -> None:
+        """
+        Benchmark combinatorial functions with huge parameters.
+
+        Each function is evaluated at a single huge parameter n.
+        For functions with two parameters, the second parameter is n/3 so that both k and n - k are large.
+        Since the results are exact integers, the elapsed time is dominated by big integer arithmetic and it is
+        reported with the size of the result in bits.
+
+        :param fun: Functions to be tested.
+        :type fun: List[type]
+        :param n: Parameters to be tested. (Default: [1000, 10000, 100000])
+        :type n: List[int]
+        """
+        row: List[List[str]] = []
+
+        for f in fun:
+            for it in n if n else [1000, 10000, 100000]:
+                arg: List[float] = [float(it), float(it // 3)] if f.__name__ in ['Binom', 'Stirling1', 'Stiling2'] \
+                    else [float(it)]
+                best: float = float('inf')
+
+                for _ in range(self.__REPEAT):
+                    start: float = time.perf_counter()  # Start time stamp for elapsed time measure.
+                    res: int = f.eval(*arg)[0]
+                    best = min(best, time.perf_counter() - start)
+
+                row.append([f.__name__, str(it), str(abs(res).bit_length()), f'{best * 1000:.2f}ms'])
+
+        self.__report('combinatorial function with huge parameter', ['FUNCTION', 'N', 'BITS', 'ELAPSED'], row)
+
+    def bench_link(self, fun: List[type], sz: int = 10000000) -> None:
+        """
+        Benchmark throughput of link functions and their inverses on large prediction vectors.
+
+        Each link is evaluated on a flat tensor of probabilities drawn uniformly from (0, 1), and its inverse is
+        evaluated on the result.
+        Power and shape of link functions with two parameters are fixed to 1/2.
+        The round trip error is the maximum relative error of the inverse wrt. the input.
+
+        :param fun: Functions to be tested.
+        :type fun: List[type]
+        :param sz: # of items in the input tensor. (Default: 10000000)
+        :type sz: int
+        """
+        p: List[float] = [random.random() or 0.5 for _ in range(sz)]
+        row: List[List[str]] = []
+
+        for f in fun:
+            arg: List[float] = [0.5] if f.__name__ in ['OddsPower', 'NegBinomLink', 'PowerLink'] else []
+            best: float = float('inf')
+            best_inv: float = float('inf')
+
+            for _ in range(self.__REPEAT):
+                start: float = time.perf_counter()  # Start time stamp for elapsed time measure.
+                y: List[float] = f.eval(p, *arg)[0]
+                best = min(best, time.perf_counter() - start)
+
+                start = time.perf_counter()
+                q: List[float] = f.eval(y, *arg, inv=True)[0]
+                best_inv = min(best_inv, time.perf_counter() - start)
+
+            err: float = max(abs(x - ref) / ref for x, ref in zip(q, p))  # Round trip error.
+            del y, q
+
+            row.append([f.__name__, str(sz), f'{best * 1000:.2f}ms', f'{best_inv * 1000:.2f}ms', f'{err:.3e}'])
+
+        self.__report('link function throughput', ['FUNCTION', 'SIZE', 'LINK', 'INVERSE', 'ROUND TRIP ERROR'], row)
+
+    def bench_prec(self, fun: type, src: str, prec: List[int] = None, sz: Type.TestSzT = Type.TestSzT.MEDIUM) -> None:
+        """
+        Benchmark accuracy and throughput of arbitrary precision evaluation against MATLAB references.
+
+        Test inputs and references are read as in ``BenchManager.bench_acc``, but inputs are passed as ``Decimal``
+        without rounding to float.
+        For each precision, the function is evaluated in arbitrary precision mode and the maximum relative error wrt.
+        the references is reported with the # of correct digits.
+        Note that the references have about 300 significant digits, and some of them have fewer, so the error cannot
+        be smaller than that.
+        Arbitrary precision mode is turned off after the benchmark.
+
+        :param fun: Function to be tested.
+        :type fun: type
+        :param src: Name of test data.
+        :type src: str
+        :param prec: Precisions to be tested. (Default: [50, 100, 500])
+        :type prec: List[int]
+        :param sz: Size of test data. (Default: Type.TestSzT.MEDIUM)
+        :type sz: Type.TestSzT
+        """
+        name: str = f'Test_{src}_{sz.name.capitalize()}'
+
+        with open(f'../Test/In/{name}.in') as f:
+            test_in: List[Decimal] = [Decimal(it) for it in f.read().split()]
+
+        with open(f'../Test/Ref/{name}.ref') as f:
+            test_ref: List[Decimal] = [Decimal(it) for it in f.read().split()]
+
+        argc: int = len(test_in) // len(test_ref)
+        arg: List[List[Decimal]] = [test_in[i::argc] for i in range(argc)]
+        row: List[List[str]] = []
+
+        for it in prec if prec else [50, 100, 500]:
+            Precision.PrecFun.set_prec(it)
+            best: float = float('inf')
+
+            for _ in range(self.__REPEAT):
+                start: float = time.perf_counter()  # Start time stamp for elapsed time measure.
+                out: List[Decimal] = fun.eval(*arg)[0]
+                best = min(best, time.perf_counter() - start)
+
+            err: Decimal = max(abs(y - ref) / abs(ref) if ref else abs(y) for y, ref in zip(out, test_ref))
+
+            row.append([f'{fun.__name__} ({it})', f'{err:.3e}', str(-err.adjusted() - 1) if err else 'EXACT',
+                        f'{best * 1000:.2f}ms', f'{best / len(test_ref) * 1e6:.1f}us'])
+
+        Precision.PrecFun.set_prec(None)
+
+        self.__report('arbitrary precision accuracy',
+                      ['FUNCTION', 'MAX ERROR', 'DIGITS', 'ELAPSED', 'PER ITEM'], row)
+
+    def bench_ival(self, expr: List[str] = None, sz: int = 1000000, wd: float = 1e-3) -> None:
+        """
+        Benchmark throughput of interval evaluation over large batches of boxes.
+
+        Each formula is a function of x and y, and boxes of width wd are placed uniformly at random in [-1, 1]^2.
+        The same boxes are shared by all formulae so that their throughputs are comparable.
+        The maximum width of the enclosures is reported with the elapsed time.
+
+        :param expr: Formulae to be tested. (Default: a few formulae of x and y)
+        :type expr: List[str]
+        :param sz: # of boxes. (Default: 1000000)
+        :type sz: int
+        :param wd: Width of boxes. (Default: 1e-3)
+        :type wd: float
+        """
+        lo_x: List[float] = [random.uniform(-1, 1) for _ in range(sz)]
+        lo_y: List[float] = [random.uniform(-1, 1) for _ in range(sz)]
+        env: Dict[str, Interval.Ival] = {'x': Interval.Ival(lo_x, [it + wd for it in lo_x]),
+                                         'y': Interval.Ival(lo_y, [it + wd for it in lo_y])}
+        row: List[List[str]] = []
+
+        for src in expr if expr else ['x * y + 1', 'Sin[x] ** 2 + Cos[y] ** 2', 'Exp[x] / (1 + y ** 2)',
+                                      'Sqrt[1 + x ** 2] - Tanh[y]']:
+            ast: AST.AST = Parser.Parser.inst().parse(src)
+            best: float = float('inf')
+
+            for _ in range(self.__REPEAT):
+                start: float = time.perf_counter()  # Start time stamp for elapsed time measure.
+                res: Interval.Ival = Interpreter.Interp.inst().eval_ival(ast, env)[0]
+                best = min(best, time.perf_counter() - start)
+
+            width: float = max(map(sub, res.hi, res.lo))  # Maximum width of enclosures.
+
+            row.append([src, str(sz), f'{width:.3e}', f'{best * 1000:.2f}ms', f'{best / sz * 1e9:.1f}ns'])
+
+        self.__report('interval evaluation throughput', ['FORMULA', 'SIZE', 'MAX WIDTH', 'ELAPSED', 'PER BOX'], row)
+
+    def bench_dual(self, n: List[int] = None, sz: int = 1000) -> None:
+        """
+        Benchmark gradient by forward mode automatic differentiation against central finite differences.
+
+        The formula is a chain ``Sin[x0] * Exp[x1 / 2] + Sin[x1] * Exp[x2 / 2] + ...`` of n variables, which are drawn
+        uniformly from [-1, 1] for each point of the batch.
+        Forward mode computes the gradient in a single pass of ``Interpreter.Interp.grad``, while finite differences
+        need 2n passes of evaluation.
+        The error is the maximum absolute difference of the two.
+
+        :param n: # of variables to be tested. (Default: [10, 50])
+        :type n: List[int]
+        :param sz: # of points in the batch. (Default: 1000)
+        :type sz: int
+        """
+        h: float = 1e-6  # Step size of finite differences.
+        row: List[List[str]] = []
+
+        for k in n if n else [10, 50]:
+            src: str = ' + '.join(f'Sin[x{i}] * Exp[x{i + 1} / 2]' for i in range(k - 1))
+            ast: AST.AST = Parser.Parser.inst().parse(src)
+            env: Dict[str, List[float]] = {f'x{i}': [random.uniform(-1, 1) for _ in range(sz)] for i in range(k)}
+            best: float = float('inf')
+            best_fd: float = float('inf')
+
+            for _ in range(self.__REPEAT):
+                start: float = time.perf_counter()  # Start time stamp for elapsed time measure.
+                res: Dual.Dual = Interpreter.Interp.inst().grad(ast, env)[0]
+                best = min(best, time.perf_counter() - start)
+
+                start = time.perf_counter()
+                fd: List[List[float]] = []
+
+                for var in env:
+                    pt: Dict[str, Dual.Dual] = {key: Dual.Dual(x, []) for key, x in env.items()}
+                    pt[var] = Dual.Dual([it + h for it in env[var]], [])
+                    up: list = Interpreter.Interp.inst().eval_dual(ast, pt)[0].v
+                    pt[var] = Dual.Dual([it - h for it in env[var]], [])
+                    dn: list = Interpreter.Interp.inst().eval_dual(ast, pt)[0].v
+                    fd.append([(a - b) / (2 * h) for a, b in zip(up, dn)])
+
+                best_fd = min(best_fd, time.perf_counter() - start)
+
+            err: float = max(max(map(abs, map(sub, res.tan(i), fd[i]))) for i in range(k))  # Gap of two gradients.
+
+            row.append([str(k), str(sz), f'{best * 1000:.2f}ms', f'{best_fd * 1000:.2f}ms', f'{err:.3e}'])
+
+        self.__report('gradient by forward mode', ['VARIABLE', 'SIZE', 'FORWARD', 'FINITE DIFF', 'GAP'], row)
+
+    def bench_tape(self, n: List[int] = None, sz: int = 1) -> None:
+        """
+        Benchmark gradient by reverse mode automatic differentiation against forward mode and finite differences.
+
+        The formula is the same chain of n variables as ``BenchManager.bench_dual``.
+        Reverse mode compiles the formula into tape once, and the gradient costs a forward and a backward sweep.
+        Forward mode needs a tangent direction for each variable, and central finite differences need 2n forward sweeps
+        without recording.
+        The error is the maximum absolute difference of the gradients by reverse mode and finite differences.
+
+        :param n: # of variables to be tested. (Default: [100, 500])
+        :type n: List[int]
+        :param sz: # of points in the batch. (Default: 1)
+        :type sz: int
+        """
+        h: float = 1e-6  # Step size of finite differences.
+        row: List[List[str]] = []
+
+        for k in n if n else [100, 500]:
+            src: str = ' + '.join(f'Sin[x{i}] * Exp[x{i + 1} / 2]' for i in range(k - 1))
+            ast: AST.AST = Parser.Parser.inst().parse(src)
+            env: Dict[str, List[float]] = {f'x{i}': [random.uniform(-1, 1) for _ in range(sz)] for i in range(k)}
+            tape: Tape.Tape = Interpreter.Interp.inst().compile(ast, list(env))
+            best: float = float('inf')
+            best_fwd: float = float('inf')
+            best_fd: float = float('inf')
+
+            for _ in range(self.__REPEAT):
+                start: float = time.perf_counter()  # Start time stamp for elapsed time measure.
+                tape.fwd(env)
+                res: Dict[str, List[float]] = tape.bwd()
+                best = min(best, time.perf_counter() - start)
+
+                start = time.perf_counter()
+                Interpreter.Interp.inst().grad(ast, env)
+                best_fwd = min(best_fwd, time.perf_counter() - start)
+
+                start = time.perf_counter()
+                fd: Dict[str, List[float]] = {}
+
+                for var in env:
+                    pt: Dict[str, List[float]] = dict(env)
+                    pt[var] = [it + h for it in env[var]]
+                    up: list = tape.fwd(pt, False)[0]
+                    pt[var] = [it - h for it in env[var]]
+                    dn: list = tape.fwd(pt, False)[0]
+                    fd[var] = [(a - b) / (2 * h) for a, b in zip(up, dn)]
+
+                best_fd = min(best_fd, time.perf_counter() - start)
+
+            err: float = max(max(map(abs, map(sub, res[var], fd[var]))) for var in env)  # Gap of two gradients.
+
+            row.append([str(k), str(len(tape)), f'{best * 1000:.2f}ms', f'{best_fwd * 1000:.2f}ms',
+                        f'{best_fd * 1000:.2f}ms', f'{err:.3e}'])
+
+        self.__report('gradient by reverse mode',
+                      ['VARIABLE', 'SLOT', 'REVERSE', 'FORWARD', 'FINITE DIFF', 'GAP'], row)
+
+    def bench_diff(self, n: List[int] = None, sz: int = 1000) -> None:
+        """
+        Benchmark symbolic derivative against the original formula.
+
+        The formula is a sum ``Sin[x] * Exp[x / 1] + Sin[2 * x] * Exp[x / 2] + ...`` of n terms.
+        Derivative is built once by ``Interpreter.Interp.diff``, and the second request hits the cache.
+        Both of the formula and its derivative are compiled into tapes and evaluated over a batch of points drawn
+        uniformly from [-1, 1] without recording.
+        The error is the maximum absolute difference of the derivative and the gradient by forward mode.
+
+        :param n: # of terms to be tested. (Default: [10, 100])
+        :type n: List[int]
+        :param sz: # of points in the batch. (Default: 1000)
+        :type sz: int
+        """
+        row: List[List[str]] = []
+
+        for k in n if n else [10, 100]:
+            src: str = ' + '.join(f'Sin[{i + 1} * x] * Exp[x / {i + 1}]' for i in range(k))
+            ast: AST.AST = Parser.Parser.inst().parse(src)
+            env: Dict[str, List[float]] = {'x': [random.uniform(-1, 1) for _ in range(sz)]}
+
+            start: float = time.perf_counter()  # Start time stamp for elapsed time measure.
+            d: AST.AST = Interpreter.Interp.inst().diff(ast, 'x')
+            build: float = time.perf_counter() - start
+
+            start = time.perf_counter()
+            Interpreter.Interp.inst().diff(ast, 'x')
+            hit: float = time.perf_counter() - start
+
+            tape: Tape.Tape = Interpreter.Interp.inst().compile(ast, ['x'])
+            d_tape: Tape.Tape = Interpreter.Interp.inst().compile(d, ['x'])
+            best: float = float('inf')
+            best_d: float = float('inf')
+
+            for _ in range(self.__REPEAT):
+                start = time.perf_counter()
+                tape.fwd(env, False)
+                best = min(best, time.perf_counter() - start)
+
+                start = time.perf_counter()
+                res: list = d_tape.fwd(env, False)[0]
+                best_d = min(best_d, time.perf_counter() - start)
+
+            ref: List[float] = Interpreter.Interp.inst().grad(ast, env)[0].tan(0)
+            err: float = max(map(abs, map(sub, res, ref)))  # Gap of symbolic and automatic derivatives.
+
+            row.append([str(k), f'{len(tape)}/{len(d_tape)}', f'{build * 1000:.2f}ms', f'{hit * 1000:.3f}ms',
+                        f'{best * 1000:.2f}ms', f'{best_d * 1000:.2f}ms', f'{err:.3e}'])
+
+        self.__report('symbolic derivative',
+                      ['TERM', 'SLOT', 'BUILD', 'CACHED', 'FORMULA', 'DERIVATIVE', 'GAP'], row)
+
+    def bench_poly(self, deg: List[int] = None, sz: int = 100000) -> None:
+        """
+        Benchmark polynomial tokens against the original formula.
+
+        The formula is ``1 + 2 * x ** 1 + 3 * x ** 2 + ...`` of degree n, which calls ``Pow`` for each term.
+        ``Interpreter.Interp.poly`` replaces it by a single polynomial token, which is evaluated by Horner's method.
+        Both are compiled into tapes and evaluated over a batch of points drawn uniformly from [-1, 1] without
+        recording.
+        Estrin's scheme is measured on the coefficients directly.
+        The error is the maximum absolute difference of the polynomial and the original formula.
+        Also, the tapes of factored formula ``(x + 1) ** n * (x - 1) ** n`` with and without polynomial tokens are
+        compared, since polynomial tokens must not change its values by expansion.
+        Its error is relative to the original formula.
+
+        :param deg: Degrees to be tested. (Default: [4, 16])
+        :type deg: List[int]
+        :param sz: # of points in the batch. (Default: 100000)
+        :type sz: int
+        """
+        row: List[List[str]] = []
+
+        for n in deg if deg else [4, 16]:
+            src: str = ' + '.join(f'{k + 1} * x ** {k}' for k in range(n + 1))
+            ast: AST.AST = Parser.Parser.inst().parse(src)
+            poly: AST.AST = Interpreter.Interp.inst().poly(ast)
+            env: Dict[str, List[float]] = {'x': [random.uniform(-1, 1) for _ in range(sz)]}
+            tape: Tape.Tape = Interpreter.Interp.inst().compile(ast, ['x'])
+            p_tape: Tape.Tape = Interpreter.Interp.inst().compile(poly, ['x'])
+            best: float = float('inf')
+            best_horner: float = float('inf')
+            best_estrin: float = float('inf')
+
+            for _ in range(self.__REPEAT):
+                start: float = time.perf_counter()  # Start time stamp for elapsed time measure.
+                ref: list = tape.fwd(env, False)[0]
+                best = min(best, time.perf_counter() - start)
+
+                start = time.perf_counter()
+                res: list = p_tape.fwd(env, False)[0]
+                best_horner = min(best_horner, time.perf_counter() - start)
+
+                start = time.perf_counter()
+                Polynomial.PolyArith.estrin(poly.rt.v.coef, env['x'])
+                best_estrin = min(best_estrin, time.perf_counter() - start)
+
+            err: float = max(map(abs, map(sub, res, ref)))  # Gap of polynomial and the formula.
+
+            fact: AST.AST = Parser.Parser.inst().parse(f'(x + 1) ** {n} * (x - 1) ** {n}')
+            ref = Interpreter.Interp.inst().compile(fact, ['x']).fwd(env, False)[0]
+            res = Interpreter.Interp.inst().compile(Interpreter.Interp.inst().poly(fact), ['x']).fwd(env, False)[0]
+            f_err: float = max(abs(y - r) / abs(r) if r else abs(y) for y, r in zip(res, ref))  # Gap of factored one.
+
+            row.append([str(n), f'{len(tape)}/{len(p_tape)}', f'{best * 1000:.2f}ms', f'{best_horner * 1000:.2f}ms',
+                        f'{best_estrin * 1000:.2f}ms', f'{err:.3e}', f'{f_err:.3e}'])
+
+        self.__report('polynomial token', ['DEGREE', 'SLOT', 'FORMULA', 'HORNER', 'ESTRIN', 'GAP', 'GAP(FACTORED)'],
+                      row)
+
+    def bench_polymul(self, deg: List[int] = None) -> None:
+        """
+        Benchmark algorithms of polynomial multiplication across crossovers.
+
+        Each algorithm multiplies two polynomials of degree n, whose coefficients are drawn uniformly from [-1, 1] for
+        floats and from [-99, 99] for integers.
+        Schoolbook and Karatsuba multiplication are measured on both, FFT on floats, and Kronecker substitution on
+        integers.
+        ``PolyArith.mul`` is the adaptive one, which should follow the fastest one at each degree.
+        The error is the maximum absolute difference of FFT and schoolbook multiplication on floats.
+
+        :param deg: Degrees to be tested. (Default: [8, 32, 64, 128, 512, 2048])
+        :type deg: List[int]
+        """
+        row: List[List[str]] = []
+
+        for n in deg if deg else [8, 32, 64, 128, 512, 2048]:
+            a: List[float] = [random.uniform(-1, 1) for _ in range(n + 1)]
+            b: List[float] = [random.uniform(-1, 1) for _ in range(n + 1)]
+            a_int: List[int] = [random.randint(-99, 99) for _ in range(n + 1)]
+            b_int: List[int] = [random.randint(-99, 99) for _ in range(n + 1)]
+            p: Polynomial.UniPoly = Polynomial.UniPoly(None, a)
+            q: Polynomial.UniPoly = Polynomial.UniPoly(None, b)
+            test: List[Tuple[Callable[[list, list], list], list, list]] = \
+                [(Polynomial.PolyArith.school, a, b), (Polynomial.PolyArith.karatsuba, a, b),
+                 (Polynomial.PolyArith.fft, a, b), (lambda s, t: Polynomial.PolyArith.mul(p, q).coef, a, b),
+                 (Polynomial.PolyArith.school, a_int, b_int), (Polynomial.PolyArith.karatsuba, a_int, b_int),
+                 (Polynomial.PolyArith.kronecker, a_int, b_int)]
+            best: List[float] = [float('inf')] * len(test)
+
+            for _ in range(self.__REPEAT):
+                for i, (f, s, t) in enumerate(test):
+                    start: float = time.perf_counter()  # Start time stamp for elapsed time measure.
+                    f(s, t)
+                    best[i] = min(best[i], time.perf_counter() - start)
+
+            err: float = max(map(abs, map(sub, Polynomial.PolyArith.fft(a, b), Polynomial.PolyArith.school(a, b))))
+
+            row.append([str(n)] + [f'{t * 1000:.2f}ms' for t in best] + [f'{err:.3e}'])
+
+        self.__report('polynomial multiplication', ['DEGREE', 'SCHOOL', 'KARATSUBA', 'FFT', 'ADAPTIVE', 'SCHOOL(Z)',
+                                                    'KARATSUBA(Z)', 'KRONECKER(Z)', 'GAP'], row)
+
+    def bench_sparpoly(self, n: List[int] = None, sz: int = 1000) -> None:
+        """
+        Benchmark sparse multivariate polynomials against the original formula.
+
+        The formula is a sum of n random terms ``c * x ** i * y ** j * z ** k`` with exponents in [0, 4], so that like
+        terms appear several times.
+        ``Interpreter.Interp.expand`` combines them into at most 125 terms of a sparse polynomial.
+        The formula is compiled into a tape and evaluated over a batch of points drawn uniformly from [-1, 1] without
+        recording, while the polynomial is evaluated by ``MultiSparPoly.eval``.
+        The error is the maximum absolute difference of the polynomial and the original formula.
+
+        :param n: # of terms to be tested. (Default: [50, 200])
+        :type n: List[int]
+        :param sz: # of points in the batch. (Default: 1000)
+        :type sz: int
+        """
+        row: List[List[str]] = []
+
+        for m in n if n else [50, 200]:
+            src: str = ' + '.join(f'{random.randint(1, 9)} * x ** {random.randint(0, 4)} * y ** {random.randint(0, 4)}'
+                                  f' * z ** {random.randint(0, 4)}' for _ in range(m))
+            ast: AST.AST = Parser.Parser.inst().parse(src)
+            env: Dict[str, List[float]] = {x: [random.uniform(-1, 1) for _ in range(sz)] for x in ['x', 'y', 'z']}
+            tape: Tape.Tape = Interpreter.Interp.inst().compile(ast, ['x', 'y', 'z'])
+            best: float = float('inf')
+            best_exp: float = float('inf')
+            best_eval: float = float('inf')
+
+            for _ in range(self.__REPEAT):
+                start: float = time.perf_counter()  # Start time stamp for elapsed time measure.
+                ref: list = tape.fwd(env, False)[0]
+                best = min(best, time.perf_counter() - start)
+
+                start = time.perf_counter()
+                poly: Polynomial.MultiSparPoly = Interpreter.Interp.inst().expand(ast)
+                best_exp = min(best_exp, time.perf_counter() - start)
+
+                start = time.perf_counter()
+                res: list = poly.eval(*[env[AST.AST.var_name(v)] for v in poly.var])[0]
+                best_eval = min(best_eval, time.perf_counter() - start)
+
+            err: float = max(map(abs, map(sub, res, ref)))  # Gap of polynomial and the formula.
+
+            row.append([str(m), f'{len(tape)}/{len(poly)}', f'{best_exp * 1000:.2f}ms', f'{best * 1000:.2f}ms',
+                        f'{best_eval * 1000:.2f}ms', f'{err:.3e}'])
+
+        self.__report('sparse polynomial', ['TERM', 'SLOT/TERM', 'EXPAND', 'FORMULA', 'SPARSE', 'GAP'], row)
+
+    def bench_roots(self, deg: List[int] = None, sz: int = 200) -> None:
+        """
+        Benchmark root finding of polynomials.
+
+        Coefficients of a batch of polynomials of degree n are drawn from the standard normal distribution.
+        Roots of the whole batch are found by ``PolyArith.eig`` and ``PolyArith.aberth`` in a single stacked
+        computation each, and by ``PolyArith.roots`` of each polynomial one by one.
+        The error is the maximum residual ``|p(z)| / sum(|c_k| |z|^k)`` of the roots found by
+        ``PolyArith.roots_batch``.
+
+        :param deg: Degrees to be tested. (Default: [2, 4, 16])
+        :type deg: List[int]
+        :param sz: # of polynomials in the batch. (Default: 200)
+        :type sz: int
+        """
+        row: List[List[str]] = []
+
+        for n in deg if deg else [2, 4, 16]:
+            coef: List[List[float]] = [[random.gauss(0, 1) for _ in range(n + 1)] for _ in range(sz)]
+            batch: List[List[float]] = [list(it) for it in zip(*coef)]
+            poly: List[Polynomial.UniPoly] = [Polynomial.UniPoly(None, c) for c in coef]
+            best_eig: float = float('inf')
+            best_aberth: float = float('inf')
+            best_loop: float = float('inf')
+
+            for _ in range(self.__REPEAT):
+                start: float = time.perf_counter()  # Start time stamp for elapsed time measure.
+                Polynomial.PolyArith.eig(batch)
+                best_eig = min(best_eig, time.perf_counter() - start)
+
+                start = time.perf_counter()
+                Polynomial.PolyArith.aberth(batch)
+                best_aberth = min(best_aberth, time.perf_counter() - start)
+
+                start = time.perf_counter()
+                [Polynomial.PolyArith.roots(p) for p in poly]
+                best_loop = min(best_loop, time.perf_counter() - start)
+
+            err: float = 0  # Maximum residual of roots.
+
+            for c, r in zip(coef, Polynomial.PolyArith.roots_batch(coef)):
+                val: list = Polynomial.PolyArith.horner(c, r)
+                scale: list = Polynomial.PolyArith.horner(list(map(abs, c)), list(map(abs, r)))
+                err = max(err, max(map(truediv, map(abs, val), scale)))
+
+            row.append([str(n), str(sz), f'{best_eig * 1000:.2f}ms', f'{best_aberth * 1000:.2f}ms',
+                        f'{best_loop * 1000:.2f}ms', f'{err:.3e}'])
+
+        self.__report('polynomial roots', ['DEGREE', 'BATCH', 'EIG', 'ABERTH', 'LOOP', 'RESIDUAL'], row)
@@ -28,7 +28,7 @@ class InterpWarn(Warn):
     """
 
     def __init__(self, warn_t: Type.InterpWarnT, warn_no: int, **kwargs: Any) -> None:
-        super().__init__()
+        super().__init__(warn_no)
         self.__warn_t: Type.InterpWarnT = warn_t
         self.__warn_no: int = warn_no
         self.__extra_info: Dict[str, Any] = kwargs
@@ -87,7 +87,7 @@ class UtilWarn(Warn):
     """
 
     def __init__(self, warn_t: Type.UtilWarnT, warn_no: int) -> None:
-        super().__init__()
+        super().__init__(warn_no)
         self.__warn_t: Type.UtilWarnT = warn_t
         self.__warn_no: int = warn_no
 